@@ -31,7 +31,32 @@ from charmarr_lib.core._arr import (
     sync_trash_profiles,
     update_api_key,
 )
+from charmarr_lib.core._crowsnest import (
+    CrowsnestFleetPoller,
+    FleetEdge,
+    FleetGraph,
+    FleetNode,
+    FleetRelation,
+    ProviderPollStats,
+)
+from charmarr_lib.core._exposition import (
+    ExpositionBuilder,
+    HistogramSample,
+    MetricFamily,
+    MetricSample,
+    SummarySample,
+)
+from charmarr_lib.core._instrumentation import (
+    Instrumentation,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+    instrument_container,
+)
 from charmarr_lib.core._juju import (
+    ReconcileGate,
+    ReconcileRouter,
+    ReconcileTriggers,
     all_events,
     ensure_pebble_user,
     get_config_hash,
@@ -42,23 +67,39 @@ from charmarr_lib.core._juju import (
     sync_secret_rotation_policy,
 )
 from charmarr_lib.core._k8s import (
+    AsyncK8sResourceManager,
     K8sResourceManager,
+    PatchConflictError,
     PermissionCheckResult,
     PermissionCheckStatus,
     ReconcileResult,
+    StatefulSetPatchPlan,
     check_storage_permissions,
+    check_storage_permissions_async,
     delete_permission_check_job,
     is_hardware_device_mounted,
     is_storage_mounted,
+    plan_hardware_transcoding,
+    plan_storage_volume,
     reconcile_hardware_transcoding,
+    reconcile_hardware_transcoding_async,
     reconcile_storage_volume,
+    reconcile_storage_volume_async,
 )
 from charmarr_lib.core._topology import (
     CharmarrChargedTopology,
     CharmarrTopology,
     CharmarrTopologyRelation,
-    MetricFamily,
-    MetricSample,
+)
+from charmarr_lib.core._tracing import (
+    Span,
+    Tracer,
+    disable_tracing,
+    enable_tracing,
+    get_tracer,
+    read_traces,
+    span,
+    traced,
 )
 from charmarr_lib.core._variant import (
     get_default_trash_profiles,
@@ -86,16 +127,25 @@ __all__ = [
     "ArrApiConnectionError",
     "ArrApiError",
     "ArrApiResponseError",
+    "AsyncK8sResourceManager",
     "BaseArrApiClient",
     "CharmarrChargedTopology",
     "CharmarrTopology",
     "CharmarrTopologyRelation",
     "ContentVariant",
+    "CrowsnestFleetPoller",
     "DownloadClient",
     "DownloadClientConfigBuilder",
     "DownloadClientResponse",
     "DownloadClientType",
+    "ExpositionBuilder",
+    "FleetEdge",
+    "FleetGraph",
+    "FleetNode",
+    "FleetRelation",
+    "HistogramSample",
     "HostConfigResponse",
+    "Instrumentation",
     "K8sResourceManager",
     "MediaIndexer",
     "MediaIndexerClient",
@@ -104,39 +154,63 @@ __all__ = [
     "MediaServer",
     "MetricFamily",
     "MetricSample",
+    "PatchConflictError",
     "PermissionCheckResult",
     "PermissionCheckStatus",
+    "ProviderPollStats",
     "QualityProfileResponse",
     "QueueItemResponse",
+    "ReconcileGate",
     "ReconcileResult",
+    "ReconcileRouter",
+    "ReconcileTriggers",
     "RecyclarrError",
     "RequestManager",
     "RootFolderResponse",
     "SecretGetter",
+    "Span",
+    "StatefulSetPatchPlan",
+    "SummarySample",
+    "Tracer",
     "all_events",
     "check_storage_permissions",
+    "check_storage_permissions_async",
     "config_has_api_key",
     "delete_permission_check_job",
+    "disable_instrumentation",
+    "disable_tracing",
+    "enable_instrumentation",
+    "enable_tracing",
     "ensure_pebble_user",
     "generate_api_key",
     "get_config_hash",
     "get_default_trash_profiles",
+    "get_instrumentation",
     "get_root_folder",
     "get_secret_rotation_policy",
+    "get_tracer",
+    "instrument_container",
     "is_hardware_device_mounted",
     "is_storage_mounted",
     "observe_events",
+    "plan_hardware_transcoding",
+    "plan_storage_volume",
     "read_api_key",
+    "read_traces",
     "reconcilable_events_k8s",
     "reconcilable_events_k8s_workloadless",
     "reconcile_config_xml",
     "reconcile_download_clients",
     "reconcile_external_url",
     "reconcile_hardware_transcoding",
+    "reconcile_hardware_transcoding_async",
     "reconcile_media_manager_connections",
     "reconcile_root_folder",
     "reconcile_storage_volume",
+    "reconcile_storage_volume_async",
+    "span",
     "sync_secret_rotation_policy",
     "sync_trash_profiles",
+    "traced",
     "update_api_key",
 ]
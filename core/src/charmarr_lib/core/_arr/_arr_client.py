@@ -5,6 +5,7 @@
 
 from typing import Any
 
+import httpx
 from pydantic import BaseModel, Field
 
 from charmarr_lib.core._arr._base_client import RESPONSE_MODEL_CONFIG, BaseArrApiClient
@@ -79,6 +80,7 @@ class ArrApiClient(BaseArrApiClient):
         *,
         timeout: float = 30.0,
         max_retries: int = 3,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         """Initialize the v3 API client.
 
@@ -87,6 +89,7 @@ class ArrApiClient(BaseArrApiClient):
             api_key: API key for authentication
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for transient failures
+            transport: Optional httpx transport (see BaseArrApiClient)
         """
         super().__init__(
             base_url=base_url,
@@ -94,6 +97,7 @@ class ArrApiClient(BaseArrApiClient):
             api_version="v3",
             timeout=timeout,
             max_retries=max_retries,
+            transport=transport,
         )
 
     # Download Clients
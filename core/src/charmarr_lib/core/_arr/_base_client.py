@@ -4,6 +4,7 @@
 """Base API client for *arr applications."""
 
 import logging
+import time
 from typing import Any, Self
 
 import httpx
@@ -15,6 +16,9 @@ from tenacity import (
     wait_exponential,
 )
 
+from charmarr_lib.core._instrumentation import get_instrumentation, normalize_endpoint
+from charmarr_lib.core._tracing import span
+
 logger = logging.getLogger(__name__)
 
 # Response models use extra="allow" to accept unknown fields from the API.
@@ -55,6 +59,7 @@ class BaseArrApiClient:
         *,
         timeout: float = 30.0,
         max_retries: int = 3,
+        transport: httpx.BaseTransport | None = None,
     ) -> None:
         """Initialize the API client.
 
@@ -64,12 +69,15 @@ class BaseArrApiClient:
             api_version: API version string (e.g., "v3" for Radarr, "v1" for Prowlarr)
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries for transient failures
+            transport: Optional httpx transport, e.g. an in-process fake API
+                for tests and benchmarks. Defaults to httpx's HTTP transport.
         """
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._api_version = api_version
         self._timeout = timeout
         self._max_retries = max_retries
+        self._transport = transport
         self._client: httpx.Client | None = None
 
     @property
@@ -79,6 +87,7 @@ class BaseArrApiClient:
             self._client = httpx.Client(
                 headers={"X-Api-Key": self._api_key},
                 timeout=self._timeout,
+                transport=self._transport,
             )
         return self._client
 
@@ -132,6 +141,7 @@ class BaseArrApiClient:
             ArrApiResponseError: If the API returns an error response
         """
         url = self._url(endpoint)
+        attempts = 0
 
         @retry(
             retry=retry_if_exception_type((httpx.ConnectError, httpx.TimeoutException)),
@@ -140,6 +150,8 @@ class BaseArrApiClient:
             reraise=True,
         )
         def _do_request() -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
             response = self.client.request(
                 method=method,
                 url=url,
@@ -149,8 +161,18 @@ class BaseArrApiClient:
             response.raise_for_status()
             return response
 
+        instrumentation = get_instrumentation()
+        started = time.perf_counter()
+        failed = True
         try:
-            return _do_request()
+            with span(
+                "arr.request", client=type(self).__name__, method=method, endpoint=endpoint
+            ) as current:
+                response = _do_request()
+                if current is not None:
+                    current.attributes["status"] = response.status_code
+            failed = False
+            return response
         except httpx.ConnectError as e:
             raise ArrApiConnectionError(
                 f"Failed to connect to {url} after {self._max_retries} attempts"
@@ -164,6 +186,19 @@ class BaseArrApiClient:
                 f"API request failed: {e.response.status_code} {e.response.reason_phrase}",
                 status_code=e.response.status_code,
             ) from e
+        finally:
+            if instrumentation is not None:
+                instrumentation.observe(
+                    "http",
+                    {
+                        "client": type(self).__name__,
+                        "method": method,
+                        "endpoint": normalize_endpoint(endpoint),
+                    },
+                    time.perf_counter() - started,
+                    error=failed,
+                    retries=attempts - 1,
+                )
 
     def _get(self, endpoint: str, *, params: dict[str, Any] | None = None) -> Any:
         """Make a GET request and return JSON response.
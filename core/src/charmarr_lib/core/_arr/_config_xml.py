@@ -11,6 +11,8 @@ import re
 import secrets
 import string
 
+from charmarr_lib.core._tracing import traced
+
 
 def read_api_key(config_content: str) -> str | None:
     """Extract API key from arr config.xml content.
@@ -79,6 +81,7 @@ def _remove_element(content: str, element: str) -> str:
     return re.sub(rf"\s*<{element}>[^<]*</{element}>\s*", "", content)
 
 
+@traced()
 def reconcile_config_xml(
     content: str | None,
     *,
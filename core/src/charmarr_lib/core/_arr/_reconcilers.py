@@ -16,6 +16,7 @@ from charmarr_lib.core._arr._config_builders import (
     SecretGetter,
 )
 from charmarr_lib.core._arr._protocols import MediaIndexerClient
+from charmarr_lib.core._tracing import traced
 from charmarr_lib.core.enums import MediaManager
 from charmarr_lib.core.interfaces import (
     DownloadClientProviderData,
@@ -160,6 +161,7 @@ class _ApplicationOps:
         return self._client.update_application(item_id, config)
 
 
+@traced()
 def reconcile_download_clients(
     api_client: ArrApiClient,
     desired_clients: list[DownloadClientProviderData],
@@ -198,6 +200,7 @@ def reconcile_download_clients(
     )
 
 
+@traced()
 def reconcile_media_manager_connections(
     api_client: MediaIndexerClient,
     desired_managers: list[MediaIndexerRequirerData],
@@ -233,6 +236,7 @@ def reconcile_media_manager_connections(
     )
 
 
+@traced()
 def reconcile_root_folder(
     api_client: ArrApiClient,
     path: str,
@@ -251,6 +255,7 @@ def reconcile_root_folder(
         api_client.add_root_folder(path)
 
 
+@traced()
 def reconcile_external_url(
     api_client: BaseArrApiClient,
     external_url: str,
@@ -14,6 +14,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from charmarr_lib.core._tracing import traced
 from charmarr_lib.core.enums import MediaManager
 
 if TYPE_CHECKING:
@@ -112,6 +113,7 @@ def _run_recyclarr_in_container(
         raise RecyclarrError(f"Recyclarr sync failed: {e}") from e
 
 
+@traced()
 def sync_trash_profiles(
     container: ops.Container,
     manager: MediaManager,
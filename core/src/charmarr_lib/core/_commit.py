@@ -0,0 +1,33 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Run a callback when the framework commits at the end of the hook."""
+
+from collections.abc import Callable
+
+import ops
+
+
+class CommitHook(ops.Object):
+    """Calls `callback` when the framework commits at the end of the hook.
+
+    Used by `enable_tracing` and `enable_instrumentation` to persist their
+    state once per dispatch.
+    """
+
+    def __init__(self, charm: ops.CharmBase, key: str, callback: Callable[[], None]) -> None:
+        """Observe the framework's commit event.
+
+        Args:
+            charm: The charm instance.
+            key: Handle key; also names the framework attribute holding the hook.
+            callback: Called on commit.
+        """
+        super().__init__(charm, key)
+        self._callback = callback
+        # The framework holds observers weakly; keep this one alive for the hook.
+        setattr(charm.framework, f"_{key.replace('-', '_')}", self)
+        self.framework.observe(self.framework.on.commit, self._on_commit)
+
+    def _on_commit(self, _event: ops.EventBase) -> None:
+        self._callback()
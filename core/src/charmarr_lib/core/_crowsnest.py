@@ -0,0 +1,335 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Fleet poller and graph aggregator for charmarr-crowsnest-k8s.
+
+`CrowsnestRequirer.get_providers()` tells crowsnest WHERE every fleet member
+serves its topology endpoint. `CrowsnestFleetPoller` does the gathering:
+
+1. Scrapes every provider's `topology_url` concurrently, bounded by a
+   semaphore, with a per-target timeout. Conditional GETs (`If-None-Match`)
+   mean an unchanged provider costs a bodyless 304.
+2. Parses `charmarr_relation_bound` / `charmarr_relation_edge` out of each
+   exposition and merges them into one node/edge graph keyed by
+   `(model_name, app_name)`.
+3. Keeps the last good scrape per provider. A provider that times out or
+   errors keeps contributing its previous data, flagged `stale`, until it
+   has been failing for longer than `max_stale_age`.
+4. Records per-provider latency and error counts so crowsnest can surface
+   slow or flapping members.
+
+Example::
+
+    poller = CrowsnestFleetPoller(timeout=3.0, max_concurrency=16)
+
+    async def refresh(self) -> FleetGraph:
+        return await poller.poll(self._crowsnest.get_providers())
+
+The poller is event-loop agnostic: it opens an `httpx.AsyncClient` per
+`poll()` unless one is injected, so it is safe to drive with a fresh
+`asyncio.run()` from each charm hook.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import re
+import time
+from collections.abc import Iterable
+
+import httpx
+from pydantic import BaseModel, Field
+
+from charmarr_lib.core.interfaces._crowsnest import (
+    CrowsnestProviderData,
+    ProviderKey,
+    provider_key,
+)
+
+logger = logging.getLogger(__name__)
+
+_LABEL_RE = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+_UNESCAPE = {"\\\\": "\\", '\\"': '"', "\\n": "\n"}
+
+
+@dataclasses.dataclass
+class ProviderPollStats:
+    """Polling health of a single provider."""
+
+    polls: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    not_modified: int = 0
+    last_latency: float | None = None
+    last_error: str | None = None
+    last_success: float | None = None
+
+
+class FleetRelation(BaseModel):
+    """A declared relation on a fleet node (from `charmarr_relation_bound`)."""
+
+    name: str
+    role: str
+    required: bool
+    bound: bool
+
+
+class FleetNode(BaseModel):
+    """One application in the fleet graph."""
+
+    model_name: str
+    app_name: str
+    topology_url: str | None = Field(
+        default=None,
+        description="Topology URL the node was polled from; None for peers that are not polled.",
+    )
+    relations: list[FleetRelation] = Field(default_factory=list)
+    stale: bool = Field(
+        default=False, description="True when the last poll failed and cached data is served."
+    )
+
+
+class FleetEdge(BaseModel):
+    """A bound relation between two fleet nodes."""
+
+    relation: str
+    source: ProviderKey
+    target: ProviderKey
+
+
+class FleetGraph(BaseModel):
+    """Merged node/edge graph across every polled provider."""
+
+    nodes: dict[str, FleetNode] = Field(
+        default_factory=dict, description="Nodes keyed by `<model_name>/<app_name>`."
+    )
+    edges: list[FleetEdge] = Field(default_factory=list)
+
+
+@dataclasses.dataclass(frozen=True)
+class _Scrape:
+    """Parsed topology series from one provider exposition."""
+
+    relations: tuple[FleetRelation, ...]
+    edges: tuple[tuple[str, str, str], ...]
+
+
+@dataclasses.dataclass
+class _CacheEntry:
+    provider: CrowsnestProviderData
+    scrape: _Scrape
+    etag: str | None
+    fetched_at: float
+    stale: bool = False
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\[\\\"n]", lambda m: _UNESCAPE[m.group(0)], value)
+
+
+def _split_series(line: str) -> tuple[str, dict[str, str], str] | None:
+    """Split an exposition sample line into (name, labels, value)."""
+    if not line or line.startswith("#"):
+        return None
+    if "{" in line:
+        name, _, rest = line.partition("{")
+        label_str, _, value = rest.rpartition("}")
+        labels = {k: _unescape(v) for k, v in _LABEL_RE.findall(label_str)}
+    else:
+        name, _, value = line.partition(" ")
+        labels = {}
+    return name.strip(), labels, value.strip().split(" ")[0]
+
+
+def _parse_topology_exposition(text: str) -> _Scrape:
+    """Extract relation state and edges from a topology exposition.
+
+    Lines for any other metric family (e.g. `CharmarrChargedTopology` extras)
+    are ignored.
+    """
+    relations: list[FleetRelation] = []
+    edges: list[tuple[str, str, str]] = []
+    for line in text.splitlines():
+        series = _split_series(line)
+        if series is None:
+            continue
+        name, labels, value = series
+        if name == "charmarr_relation_bound":
+            relations.append(
+                FleetRelation(
+                    name=labels.get("relation", ""),
+                    role=labels.get("role", ""),
+                    required=labels.get("required") == "true",
+                    bound=value not in ("0", "0.0"),
+                )
+            )
+        elif name == "charmarr_relation_edge":
+            edges.append(
+                (labels.get("relation", ""), labels.get("from_app", ""), labels.get("to_app", ""))
+            )
+    return _Scrape(relations=tuple(relations), edges=tuple(edges))
+
+
+def _node_id(key: ProviderKey) -> str:
+    return f"{key[0]}/{key[1]}"
+
+
+class CrowsnestFleetPoller:
+    """Concurrent, cache-backed poller that merges provider topology into one graph."""
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 5.0,
+        max_concurrency: int = 16,
+        max_stale_age: float = 600.0,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the poller.
+
+        Args:
+            timeout: Per-target timeout in seconds, covering connect and read.
+            max_concurrency: Maximum number of providers scraped at the same time.
+            max_stale_age: Seconds a failing provider keeps serving its last good
+                scrape before it is dropped from the graph.
+            http_client: Async HTTP client to reuse. If None, one is opened per poll.
+        """
+        self._timeout = timeout
+        self._max_concurrency = max_concurrency
+        self._max_stale_age = max_stale_age
+        self._http_client = http_client
+        self._cache: dict[ProviderKey, _CacheEntry] = {}
+        self._stats: dict[ProviderKey, ProviderPollStats] = {}
+
+    @property
+    def stats(self) -> dict[ProviderKey, ProviderPollStats]:
+        """Polling latency and error counters per provider."""
+        return dict(self._stats)
+
+    async def poll(self, providers: Iterable[CrowsnestProviderData]) -> FleetGraph:
+        """Scrape every provider concurrently and return the merged graph.
+
+        Args:
+            providers: Current providers, usually `CrowsnestRequirer.get_providers()`.
+
+        Returns:
+            The merged fleet graph, including stale data for failing providers.
+        """
+        targets = {provider_key(p): p for p in providers}
+        for key in set(self._cache) - set(targets):
+            del self._cache[key]
+        for key in set(self._stats) - set(targets):
+            del self._stats[key]
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        if self._http_client is not None:
+            await self._poll_all(self._http_client, targets, semaphore)
+        else:
+            async with httpx.AsyncClient(timeout=self._timeout) as client:
+                await self._poll_all(client, targets, semaphore)
+        return self.graph()
+
+    async def _poll_all(
+        self,
+        client: httpx.AsyncClient,
+        targets: dict[ProviderKey, CrowsnestProviderData],
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        await asyncio.gather(
+            *(self._poll_one(client, key, p, semaphore) for key, p in targets.items())
+        )
+
+    async def _poll_one(
+        self,
+        client: httpx.AsyncClient,
+        key: ProviderKey,
+        provider: CrowsnestProviderData,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        stats = self._stats.setdefault(key, ProviderPollStats())
+        cached = self._cache.get(key)
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else {}
+
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                response = await asyncio.wait_for(
+                    client.get(provider.topology_url, headers=headers), self._timeout
+                )
+                if response.status_code != 304:
+                    response.raise_for_status()
+            except (httpx.HTTPError, TimeoutError) as e:
+                self._record_failure(key, stats, f"{type(e).__name__}: {e}")
+                return
+            finally:
+                stats.polls += 1
+                stats.last_latency = time.perf_counter() - started
+
+        now = time.monotonic()
+        stats.consecutive_errors = 0
+        stats.last_error = None
+        stats.last_success = now
+        if response.status_code == 304 and cached is not None:
+            stats.not_modified += 1
+            cached.provider, cached.fetched_at, cached.stale = provider, now, False
+            return
+
+        self._cache[key] = _CacheEntry(
+            provider=provider,
+            scrape=_parse_topology_exposition(response.text),
+            etag=response.headers.get("ETag"),
+            fetched_at=now,
+        )
+
+    def _record_failure(self, key: ProviderKey, stats: ProviderPollStats, error: str) -> None:
+        stats.errors += 1
+        stats.consecutive_errors += 1
+        stats.last_error = error
+        logger.debug("Topology poll of %s failed: %s", _node_id(key), error)
+
+        cached = self._cache.get(key)
+        if cached is None:
+            return
+        if time.monotonic() - cached.fetched_at > self._max_stale_age:
+            del self._cache[key]
+        else:
+            cached.stale = True
+
+    def graph(self) -> FleetGraph:
+        """Build the merged graph from the current cache without polling."""
+        nodes: dict[ProviderKey, FleetNode] = {}
+        for key, entry in self._cache.items():
+            nodes[key] = FleetNode(
+                model_name=key[0],
+                app_name=entry.provider.app_name or key[1],
+                topology_url=entry.provider.topology_url,
+                relations=list(entry.scrape.relations),
+                stale=entry.stale,
+            )
+
+        by_app: dict[str, list[ProviderKey]] = {}
+        for key, node in nodes.items():
+            by_app.setdefault(node.app_name, []).append(key)
+
+        def resolve(app: str, model: str) -> ProviderKey:
+            if (model, app) in nodes:
+                return model, app
+            candidates = by_app.get(app, [])
+            return candidates[0] if len(candidates) == 1 else (model, app)
+
+        edges: dict[tuple[str, ProviderKey, ProviderKey], FleetEdge] = {}
+        for key, entry in self._cache.items():
+            for relation, from_app, to_app in entry.scrape.edges:
+                source, target = resolve(from_app, key[0]), resolve(to_app, key[0])
+                edges.setdefault(
+                    (relation, source, target),
+                    FleetEdge(relation=relation, source=source, target=target),
+                )
+                for peer in (source, target):
+                    if peer not in nodes:
+                        nodes[peer] = FleetNode(model_name=peer[0], app_name=peer[1])
+
+        return FleetGraph(
+            nodes={_node_id(key): node for key, node in nodes.items()},
+            edges=list(edges.values()),
+        )
@@ -0,0 +1,247 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Prometheus text exposition formatting for topology endpoints.
+
+Two ways to describe extra metrics for `CharmarrChargedTopology`:
+
+- `MetricFamily` models: validated, convenient for a handful of series.
+- `ExpositionBuilder`: streams escaped lines straight from tuples without
+  creating a pydantic object per sample. Use it for per-item families
+  (thousands of series) so formatting never becomes the hook hotspot.
+
+Both produce the same text and support gauge, counter, histogram and
+summary families. Label values and HELP text are escaped per the text
+format (backslash, double quote and newline).
+"""
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Literal, Self
+
+from pydantic import BaseModel, Field
+
+MetricType = Literal["gauge", "counter", "histogram", "summary"]
+
+_INF_LE = 'le="+Inf"'
+
+Labels = Mapping[str, str]
+HistogramBuckets = Sequence[tuple[float, float]]
+SummaryQuantiles = Sequence[tuple[float, float]]
+
+
+class MetricSample(BaseModel):
+    """A single Prometheus metric sample - labels + value."""
+
+    labels: dict[str, str] = Field(default_factory=dict)
+    value: float
+
+
+class HistogramSample(BaseModel):
+    """One histogram series: cumulative buckets plus sum and count.
+
+    `buckets` holds `(upper_bound, cumulative_count)` pairs in ascending
+    order. The `+Inf` bucket is emitted from `count` and may be omitted.
+    """
+
+    labels: dict[str, str] = Field(default_factory=dict)
+    buckets: list[tuple[float, float]] = Field(default_factory=list)
+    sum: float
+    count: float
+
+
+class SummarySample(BaseModel):
+    """One summary series: `(quantile, value)` pairs plus sum and count."""
+
+    labels: dict[str, str] = Field(default_factory=dict)
+    quantiles: list[tuple[float, float]] = Field(default_factory=list)
+    sum: float
+    count: float
+
+
+class MetricFamily(BaseModel):
+    """A Prometheus metric family - one HELP, one TYPE, N samples.
+
+    The helper formats this into valid Prometheus exposition format. Use this
+    via `CharmarrChargedTopology` when a charm wants to ship arbitrary
+    charm-state metrics alongside topology on the same daemon endpoint.
+    Gauges and counters take `MetricSample`, histograms `HistogramSample`
+    and summaries `SummarySample`.
+    """
+
+    name: str
+    help: str
+    type: MetricType = "gauge"
+    samples: list[MetricSample | HistogramSample | SummarySample] = Field(default_factory=list)
+
+
+def format_value(value: float) -> str:
+    """Format a sample value the way Prometheus writes it."""
+    if value != value:
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    if "\\" in value or '"' in value or "\n" in value:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return value
+
+
+def _escape_help(text: str) -> str:
+    if "\\" in text or "\n" in text:
+        return text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text
+
+
+def render_labels(labels: Labels, extra: str = "") -> str:
+    """Render `{k="v",...}` with escaped values; empty string for no labels.
+
+    Args:
+        labels: Label names to values.
+        extra: Pre-rendered trailing label (e.g. `le="0.5"`) appended last.
+    """
+    parts = [f'{k}="{_escape_label_value(v)}"' for k, v in labels.items()]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class ExpositionBuilder:
+    """Streaming exposition writer.
+
+    Each method writes one family's HELP/TYPE header and its series from
+    plain tuples, appending to an internal line buffer.
+
+    Example::
+
+        builder = ExpositionBuilder()
+        builder.gauge(
+            "charmarr_storage_pvc_mounted",
+            "Is the PVC mounted on each consumer (1/0)",
+            (({"consumer": name}, float(mounted)) for name, mounted in consumers),
+        )
+        builder.histogram(
+            "charmarr_item_latency_seconds",
+            "Per-item reconcile latency",
+            [({"item": "radarr"}, [(0.1, 3), (1.0, 5)], 1.7, 6)],
+        )
+        text = builder.render()
+    """
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def _header(self, name: str, help: str, type: MetricType) -> None:
+        self._lines.append(f"# HELP {name} {_escape_help(help)}")
+        self._lines.append(f"# TYPE {name} {type}")
+
+    def gauge(self, name: str, help: str, samples: Iterable[tuple[Labels, float]]) -> Self:
+        """Write a gauge family from `(labels, value)` tuples."""
+        return self._simple(name, help, "gauge", samples)
+
+    def counter(self, name: str, help: str, samples: Iterable[tuple[Labels, float]]) -> Self:
+        """Write a counter family from `(labels, value)` tuples."""
+        return self._simple(name, help, "counter", samples)
+
+    def _simple(
+        self, name: str, help: str, type: MetricType, samples: Iterable[tuple[Labels, float]]
+    ) -> Self:
+        self._header(name, help, type)
+        append = self._lines.append
+        for labels, value in samples:
+            append(f"{name}{render_labels(labels)} {format_value(value)}")
+        return self
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        samples: Iterable[tuple[Labels, HistogramBuckets, float, float]],
+    ) -> Self:
+        """Write a histogram family from `(labels, buckets, sum, count)` tuples.
+
+        Buckets are `(upper_bound, cumulative_count)` pairs; `+Inf` is added
+        from `count` unless already present.
+        """
+        self._header(name, help, "histogram")
+        append = self._lines.append
+        for labels, buckets, total, count in samples:
+            saw_inf = False
+            for bound, cumulative in buckets:
+                saw_inf = saw_inf or math.isinf(bound)
+                le = f'le="{format_value(bound)}"'
+                append(f"{name}_bucket{render_labels(labels, le)} {format_value(cumulative)}")
+            if not saw_inf:
+                append(f"{name}_bucket{render_labels(labels, _INF_LE)} {format_value(count)}")
+            rendered = render_labels(labels)
+            append(f"{name}_sum{rendered} {format_value(total)}")
+            append(f"{name}_count{rendered} {format_value(count)}")
+        return self
+
+    def summary(
+        self,
+        name: str,
+        help: str,
+        samples: Iterable[tuple[Labels, SummaryQuantiles, float, float]],
+    ) -> Self:
+        """Write a summary family from `(labels, quantiles, sum, count)` tuples."""
+        self._header(name, help, "summary")
+        append = self._lines.append
+        for labels, quantiles, total, count in samples:
+            for quantile, value in quantiles:
+                q = f'quantile="{format_value(quantile)}"'
+                append(f"{name}{render_labels(labels, q)} {format_value(value)}")
+            rendered = render_labels(labels)
+            append(f"{name}_sum{rendered} {format_value(total)}")
+            append(f"{name}_count{rendered} {format_value(count)}")
+        return self
+
+    def family(self, family: MetricFamily) -> Self:
+        """Write a `MetricFamily` model."""
+        samples = family.samples
+        match family.type:
+            case "histogram":
+                return self.histogram(
+                    family.name,
+                    family.help,
+                    (
+                        (s.labels, s.buckets, s.sum, s.count)
+                        for s in _only(samples, HistogramSample)
+                    ),
+                )
+            case "summary":
+                return self.summary(
+                    family.name,
+                    family.help,
+                    (
+                        (s.labels, s.quantiles, s.sum, s.count)
+                        for s in _only(samples, SummarySample)
+                    ),
+                )
+            case _:
+                return self._simple(
+                    family.name,
+                    family.help,
+                    family.type,
+                    ((s.labels, s.value) for s in _only(samples, MetricSample)),
+                )
+
+    def lines(self) -> list[str]:
+        """Return the lines written so far."""
+        return self._lines
+
+    def render(self) -> str:
+        """Return the exposition text, newline terminated."""
+        return "\n".join(self._lines) + "\n" if self._lines else ""
+
+
+def _only[T](samples: Iterable[object], kind: type[T]) -> Iterable[T]:
+    for sample in samples:
+        if not isinstance(sample, kind):
+            raise TypeError(f"{type(sample).__name__} is not valid in this family")
+        yield sample
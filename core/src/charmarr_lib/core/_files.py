@@ -0,0 +1,21 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""File helpers shared by the topology publisher, the tracer and instrumentation."""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def atomic_write(path: Path, content: bytes) -> None:
+    """Replace `path` with `content` so readers see either the old or new file, never a mix."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(content)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -0,0 +1,367 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Opt-in hook and library call instrumentation.
+
+Records where hook time goes and publishes it on the topology endpoint:
+
+- `charmarr_hook_duration_seconds{event}` - handlers registered through
+  `observe_events` (only those registered after instrumentation is enabled)
+- `charmarr_http_request_duration_seconds{client, method, endpoint}` -
+  `BaseArrApiClient` requests, numeric path segments collapsed to `{id}`
+- `charmarr_k8s_request_duration_seconds{verb, kind}` - `K8sResourceManager`
+- `charmarr_pebble_operation_duration_seconds{operation}` - exec/pull/push on
+  containers wrapped with `instrument_container` (which also emits spans when
+  tracing is enabled, see `_tracing`)
+
+Each family also gets `_errors_total` and `_retries_total` counters. The
+aggregates are cumulative histograms persisted in a small JSON file between
+hooks (written on framework commit), so Prometheus rates work across hooks.
+
+Example::
+
+    class MyCharm(ops.CharmBase):
+        def __init__(self, framework):
+            super().__init__(framework)
+            self._instrumentation = enable_instrumentation(self)
+            observe_events(self, reconcilable_events_k8s, self._reconcile)
+            self._topology = CharmarrChargedTopology(
+                self,
+                relations=[...],
+                extra_exposition=self._instrumentation.exposition,
+            )
+
+        def _reconcile(self, _event):
+            container = instrument_container(self.unit.get_container("radarr"))
+            ...
+
+The topology file is rendered inside the reconcile handler, so it shows the
+aggregates up to the previous hook.
+"""
+
+import dataclasses
+import json
+import logging
+import re
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import ops
+
+from charmarr_lib.core._commit import CommitHook
+from charmarr_lib.core._exposition import ExpositionBuilder
+from charmarr_lib.core._files import atomic_write
+from charmarr_lib.core._tracing import get_tracer, span
+from charmarr_lib.krm import K8sCall, add_call_observer, remove_call_observer
+
+if TYPE_CHECKING:
+    from ops import Container
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# family key -> (metric base name, HELP text)
+_FAMILIES: dict[str, tuple[str, str]] = {
+    "hook": ("charmarr_hook", "Duration of observe_events handlers per event kind"),
+    "http": ("charmarr_http_request", "Duration of *arr API requests per endpoint"),
+    "k8s": ("charmarr_k8s_request", "Duration of Kubernetes API calls per verb and kind"),
+    "pebble": ("charmarr_pebble_operation", "Duration of Pebble exec/pull/push operations"),
+}
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def normalize_endpoint(endpoint: str) -> str:
+    """Collapse numeric path segments so per-item endpoints share one series."""
+    return _NUMERIC_SEGMENT.sub("/{id}", "/" + endpoint.lstrip("/"))
+
+
+@dataclasses.dataclass
+class _Series:
+    """Per-bucket (non-cumulative) counts plus overflow, sum and counters."""
+
+    counts: list[int]
+    sum: float = 0.0
+    errors: int = 0
+    retries: int = 0
+
+
+class Instrumentation:
+    """Cumulative timing aggregates, loaded from and saved to a state file."""
+
+    STATE_FILE = Path("/tmp/charmarr-instrumentation.json")
+    MAX_SERIES = 1000
+
+    def __init__(
+        self,
+        state_file: Path | None = None,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize and load persisted aggregates.
+
+        Args:
+            state_file: Where aggregates persist between hooks. Defaults to STATE_FILE.
+            buckets: Histogram upper bounds in seconds. Persisted data recorded
+                with different buckets is discarded.
+        """
+        self._state_file = state_file if state_file is not None else self.STATE_FILE
+        self._buckets = tuple(buckets)
+        self._series: dict[str, dict[tuple[tuple[str, str], ...], _Series]] = {}
+        self._load()
+
+    def observe(
+        self,
+        family: str,
+        labels: Mapping[str, str],
+        seconds: float,
+        *,
+        error: bool = False,
+        retries: int = 0,
+    ) -> None:
+        """Record one timed operation.
+
+        Args:
+            family: One of "hook", "http", "k8s", "pebble".
+            labels: Series labels.
+            seconds: Operation duration.
+            error: Whether the operation failed.
+            retries: Retries performed beyond the first attempt.
+        """
+        series_by_labels = self._series.setdefault(family, {})
+        key = tuple(sorted(labels.items()))
+        series = series_by_labels.get(key)
+        if series is None:
+            if sum(len(s) for s in self._series.values()) >= self.MAX_SERIES:
+                return
+            series = series_by_labels[key] = _Series(counts=[0] * (len(self._buckets) + 1))
+        index = next((i for i, b in enumerate(self._buckets) if seconds <= b), -1)
+        series.counts[index] += 1
+        series.sum += seconds
+        series.errors += int(error)
+        series.retries += retries
+
+    @contextmanager
+    def timer(self, family: str, labels: Mapping[str, str]) -> Iterator[None]:
+        """Time the body and record it, flagging an error if it raises."""
+        started = time.perf_counter()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(family, labels, time.perf_counter() - started, error=error)
+
+    def exposition(self) -> ExpositionBuilder:
+        """Render every family as a histogram plus error/retry counters."""
+        builder = ExpositionBuilder()
+        for family, (base, help) in _FAMILIES.items():
+            series = self._series.get(family)
+            if not series:
+                continue
+            builder.histogram(
+                f"{base}_duration_seconds",
+                help,
+                (
+                    (dict(key), self._cumulative(s), s.sum, sum(s.counts))
+                    for key, s in series.items()
+                ),
+            )
+            builder.counter(
+                f"{base}_errors_total",
+                f"Failed operations counted in {base}_duration_seconds",
+                ((dict(key), s.errors) for key, s in series.items()),
+            )
+            builder.counter(
+                f"{base}_retries_total",
+                f"Retries performed by operations in {base}_duration_seconds",
+                ((dict(key), s.retries) for key, s in series.items()),
+            )
+        return builder
+
+    def _cumulative(self, series: _Series) -> list[tuple[float, float]]:
+        running = 0
+        buckets = []
+        for bound, count in zip(self._buckets, series.counts, strict=False):
+            running += count
+            buckets.append((bound, running))
+        return buckets
+
+    def save(self) -> None:
+        """Persist aggregates so the next hook continues from them."""
+        payload = {
+            "buckets": list(self._buckets),
+            "series": {
+                family: [
+                    [dict(key), s.counts, s.sum, s.errors, s.retries] for key, s in series.items()
+                ]
+                for family, series in self._series.items()
+            },
+        }
+        try:
+            atomic_write(self._state_file, json.dumps(payload, separators=(",", ":")).encode())
+        except OSError as e:
+            logger.warning("Could not persist instrumentation state: %s", e)
+
+    def _load(self) -> None:
+        try:
+            payload = json.loads(self._state_file.read_text())
+            if tuple(payload["buckets"]) != self._buckets:
+                return
+            for family, rows in payload["series"].items():
+                self._series[family] = {
+                    tuple(sorted(labels.items())): _Series(
+                        counts=[int(c) for c in counts],
+                        sum=float(total),
+                        errors=int(errors),
+                        retries=int(retries),
+                    )
+                    for labels, counts, total, errors, retries in rows
+                    if len(counts) == len(self._buckets) + 1
+                }
+        except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+            self._series.clear()
+
+    def record_k8s_call(self, call: K8sCall) -> None:
+        """Record a K8sResourceManager call (registered as a krm call observer)."""
+        self.observe(
+            "k8s",
+            {"verb": call.verb, "kind": call.kind},
+            call.duration,
+            error=call.error is not None,
+            retries=call.attempts - 1,
+        )
+
+
+_active: Instrumentation | None = None
+
+
+def get_instrumentation() -> Instrumentation | None:
+    """Return the active instrumentation, or None when it is not enabled."""
+    return _active
+
+
+def enable_instrumentation(
+    charm: ops.CharmBase, state_file: Path | None = None
+) -> Instrumentation:
+    """Turn on instrumentation for this hook and persist it on commit.
+
+    Call from the charm's `__init__` BEFORE `observe_events` so reconcile
+    handlers are timed.
+
+    Args:
+        charm: The charm instance.
+        state_file: Override for the aggregate state file.
+
+    Returns:
+        The active Instrumentation, whose `exposition` can be passed to
+        `CharmarrChargedTopology(extra_exposition=...)`.
+    """
+    global _active
+    disable_instrumentation()
+    _active = Instrumentation(state_file)
+    add_call_observer(_active.record_k8s_call)
+    CommitHook(charm, "charmarr-instrumentation", _active.save)
+    return _active
+
+
+def disable_instrumentation() -> None:
+    """Stop recording. Already-registered hook timers become no-ops."""
+    global _active
+    if _active is not None:
+        remove_call_observer(_active.record_k8s_call)
+    _active = None
+
+
+class _TimedProcess:
+    """ExecProcess proxy that records the exec once the caller waits on it."""
+
+    def __init__(self, process: Any, started: float) -> None:
+        self._process = process
+        self._started = started
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._process, name)
+
+    def wait(self) -> None:
+        with self._record():
+            self._process.wait()
+
+    def wait_output(self) -> Any:
+        with self._record():
+            return self._process.wait_output()
+
+    @contextmanager
+    def _record(self) -> Iterator[None]:
+        error = False
+        try:
+            with span("pebble.exec.wait"):
+                yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            if _active is not None:
+                elapsed = time.perf_counter() - self._started
+                _active.observe("pebble", {"operation": "exec"}, elapsed, error=error)
+
+
+class _InstrumentedContainer:
+    """Container proxy timing exec/pull/push; everything else passes through."""
+
+    def __init__(self, container: "Container") -> None:
+        self._container = container
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._container, name)
+
+    def exec(self, *args: Any, **kwargs: Any) -> Any:
+        command = args[0] if args else kwargs.get("command", [])
+        with span("pebble.exec", command=" ".join(command)[:200]):
+            process = self._container.exec(*args, **kwargs)
+        return _TimedProcess(process, time.perf_counter())
+
+    def pull(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed("pull", self._container.pull, *args, **kwargs)
+
+    def push(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed("push", self._container.push, *args, **kwargs)
+
+    @staticmethod
+    def _timed(operation: str, fn: Any, *args: Any, **kwargs: Any) -> Any:
+        path = str(args[0]) if args else str(kwargs.get("path", ""))
+        with span(f"pebble.{operation}", path=path):
+            if _active is None:
+                return fn(*args, **kwargs)
+            with _active.timer("pebble", {"operation": operation}):
+                return fn(*args, **kwargs)
+
+
+def instrument_container(container: "Container") -> "Container":
+    """Wrap a container so exec (until waited on), pull and push are timed and traced.
+
+    Returns the container unchanged when neither instrumentation nor tracing
+    is enabled.
+    """
+    if _active is None and get_tracer() is None:
+        return container
+    return _InstrumentedContainer(container)  # type: ignore[return-value]
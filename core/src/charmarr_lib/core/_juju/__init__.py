@@ -3,19 +3,25 @@
 
 """Juju-specific utilities for Charmarr charms."""
 
+from charmarr_lib.core._juju._gate import ReconcileGate
 from charmarr_lib.core._juju._pebble import ensure_pebble_user, get_config_hash
 from charmarr_lib.core._juju._reconciler import (
+    ReconcileTriggers,
     all_events,
     observe_events,
     reconcilable_events_k8s,
     reconcilable_events_k8s_workloadless,
 )
+from charmarr_lib.core._juju._router import ReconcileRouter
 from charmarr_lib.core._juju._secrets import (
     get_secret_rotation_policy,
     sync_secret_rotation_policy,
 )
 
 __all__ = [
+    "ReconcileGate",
+    "ReconcileRouter",
+    "ReconcileTriggers",
     "all_events",
     "ensure_pebble_user",
     "get_config_hash",
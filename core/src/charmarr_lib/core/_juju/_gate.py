@@ -0,0 +1,211 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Input fingerprint gate for skipping no-op reconciles.
+
+Most hooks of an idle charm are `update-status`, where nothing the reconcile
+reads has changed. `ReconcileGate` hashes the declared inputs (charm config,
+remote relation databags, secret revisions, leadership and optionally files
+in workload containers) and skips the handler when the hash matches the one
+stored after the last successful reconcile and `max_staleness` has not
+elapsed. Only events listed as skippable are ever skipped; install, start,
+pebble-ready, leader-elected and friends always run.
+
+Usage:
+    class MyCharm(ops.CharmBase):
+        def __init__(self, framework: ops.Framework):
+            super().__init__(framework)
+            self._gate = ReconcileGate(
+                self,
+                relations=["media-indexer", "download-client"],
+                secrets=["api-key"],
+                container_files={"radarr": ["/config/config.xml"]},
+            )
+            observe_events(self, reconcilable_events_k8s, self._gate.guard(self._reconcile))
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+import ops
+
+from charmarr_lib.core._exposition import ExpositionBuilder
+from charmarr_lib.core._juju._pebble import get_config_hash
+from charmarr_lib.core._juju._reconciler import ReconcileTriggers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SKIPPABLE_EVENTS: frozenset[type[ops.EventBase]] = frozenset(
+    {
+        ops.UpdateStatusEvent,
+        ops.ConfigChangedEvent,
+        ops.RelationChangedEvent,
+        ops.SecretChangedEvent,
+    }
+)
+
+
+class ReconcileGate(ops.Object):
+    """Skips reconciles whose inputs are unchanged since the last successful run."""
+
+    _stored = ops.StoredState()
+
+    def __init__(
+        self,
+        charm: ops.CharmBase,
+        *,
+        relations: Iterable[str] = (),
+        secrets: Iterable[str] = (),
+        container_files: Mapping[str, Iterable[str]] | None = None,
+        extra_inputs: Callable[[], Any] | None = None,
+        max_staleness: float = 3600.0,
+        skippable_events: Iterable[type[ops.EventBase]] = DEFAULT_SKIPPABLE_EVENTS,
+        key: str = "reconcile-gate",
+    ) -> None:
+        """Initialize the gate.
+
+        Args:
+            charm: The charm instance.
+            relations: Endpoint names whose remote app and unit databags are inputs.
+            secrets: Secret labels or IDs whose revisions are inputs.
+            container_files: Container name -> file paths whose content hashes
+                are inputs. Files are only read when the container is reachable.
+            extra_inputs: Callable returning additional JSON-serializable inputs.
+            max_staleness: Seconds after which the handler runs even when the
+                fingerprint is unchanged, to repair out-of-band drift.
+            skippable_events: Event types that may be skipped. Any other
+                trigger always runs the handler.
+            key: ops.Object key, needed when a charm uses several gates.
+        """
+        super().__init__(charm, key)
+        self._charm = charm
+        self._relations = tuple(relations)
+        self._secrets = tuple(secrets)
+        self._container_files = {
+            name: tuple(paths) for name, paths in (container_files or {}).items()
+        }
+        self._extra_inputs = extra_inputs
+        self._max_staleness = max_staleness
+        self._skippable = tuple(skippable_events)
+        self._pending: str | None = None
+        self._stored.set_default(fingerprint="", reconciled_at=0.0, runs=0, skips=0)
+
+    @property
+    def runs(self) -> int:
+        """Number of reconciles the gate let through (persisted across hooks)."""
+        return self._stored.runs
+
+    @property
+    def skips(self) -> int:
+        """Number of reconciles the gate skipped (persisted across hooks)."""
+        return self._stored.skips
+
+    def fingerprint(self) -> str:
+        """Compute the hash of all declared inputs."""
+        inputs = {
+            "config": dict(self._charm.config),
+            "leader": self._charm.unit.is_leader(),
+            "relations": {name: self._relation_inputs(name) for name in self._relations},
+            "secrets": {ref: self._secret_revision(ref) for ref in self._secrets},
+            "files": {
+                name: self._file_hashes(name, paths)
+                for name, paths in self._container_files.items()
+            },
+            "extra": self._extra_inputs() if self._extra_inputs is not None else None,
+        }
+        payload = json.dumps(inputs, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def should_run(self, trigger: ops.EventBase | ReconcileTriggers | None = None) -> bool:
+        """Decide whether the handler must run for this trigger.
+
+        Counts a skip when it returns False. When it returns True, call
+        `mark_reconciled` after the handler succeeded.
+        """
+        self._pending = self.fingerprint()
+        if not self._is_skippable(trigger):
+            return True
+        if self._pending != self._stored.fingerprint:
+            return True
+        if time.time() - self._stored.reconciled_at >= self._max_staleness:
+            return True
+        self._stored.skips += 1
+        logger.debug("Reconcile skipped: inputs unchanged (%s)", self._pending)
+        return False
+
+    def mark_reconciled(self) -> None:
+        """Record a successful reconcile of the inputs seen by `should_run`."""
+        self._stored.fingerprint = self._pending or self.fingerprint()
+        self._stored.reconciled_at = time.time()
+        self._stored.runs += 1
+        self._pending = None
+
+    def guard(self, handler: Callable[[Any], None] | Callable[[], None]) -> Callable[[Any], None]:
+        """Wrap a reconcile handler for use with `observe_events`.
+
+        The wrapper accepts an event or `ReconcileTriggers` (coalesced mode)
+        and calls the handler with it, or without arguments if the handler
+        takes none.
+        """
+        takes_event = bool(inspect.signature(handler).parameters)
+
+        def guarded(trigger: ops.EventBase | ReconcileTriggers) -> None:
+            if not self.should_run(trigger):
+                return
+            if takes_event:
+                handler(trigger)  # type: ignore[call-arg]
+            else:
+                handler()  # type: ignore[call-arg]
+            self.mark_reconciled()
+
+        return guarded
+
+    def exposition(self) -> ExpositionBuilder:
+        """Render the run/skip counters for `CharmarrChargedTopology`."""
+        return ExpositionBuilder().counter(
+            "charmarr_reconcile_total",
+            "Reconciles run or skipped by the input fingerprint gate",
+            [({"result": "run"}, self.runs), ({"result": "skip"}, self.skips)],
+        )
+
+    def _is_skippable(self, trigger: ops.EventBase | ReconcileTriggers | None) -> bool:
+        if trigger is None:
+            return True
+        if isinstance(trigger, ReconcileTriggers):
+            return all(isinstance(event, self._skippable) for event in trigger.events)
+        return isinstance(trigger, self._skippable)
+
+    def _relation_inputs(self, endpoint: str) -> list[Any]:
+        inputs = []
+        for relation in self._charm.model.relations.get(endpoint, []):
+            databags = {relation.app.name: dict(relation.data[relation.app])}
+            for unit in sorted(relation.units, key=lambda u: u.name):
+                databags[unit.name] = dict(relation.data[unit])
+            inputs.append([relation.id, databags])
+        return inputs
+
+    def _secret_revision(self, ref: str) -> str | int | None:
+        try:
+            if ref.startswith("secret:"):
+                secret = self._charm.model.get_secret(id=ref)
+            else:
+                secret = self._charm.model.get_secret(label=ref)
+        except ops.SecretNotFoundError:
+            return None
+        try:
+            return secret.get_info().revision
+        except (ops.SecretNotFoundError, ops.ModelError):
+            # Consumers can't read secret info; hash the latest content instead.
+            content = json.dumps(secret.peek_content(), sort_keys=True)
+            return hashlib.sha256(content.encode()).hexdigest()[:16]
+
+    def _file_hashes(self, container_name: str, paths: tuple[str, ...]) -> dict[str, str] | None:
+        container = self._charm.unit.get_container(container_name)
+        if not container.can_connect():
+            return None
+        return {path: get_config_hash(container, path) for path in paths}
@@ -12,6 +12,7 @@ Key components:
 - observe_events(): Register a handler for multiple event types at once
 - reconcilable_events_k8s: Default event set for K8s charms
 - reconcilable_events_k8s_workloadless: Event set for charms without containers
+- ReconcileTriggers: What triggered a coalesced (once-per-dispatch) reconcile
 
 Usage:
     class MyCharm(ops.CharmBase):
@@ -26,6 +27,7 @@ Usage:
 Based on: https://github.com/canonical/cos-lib/blob/main/src/cosl/reconciler.py
 """
 
+import dataclasses
 import inspect
 import itertools
 from collections.abc import Callable, Iterable
@@ -33,6 +35,9 @@ from typing import Any, Final, cast
 
 import ops
 
+from charmarr_lib.core._instrumentation import get_instrumentation
+from charmarr_lib.core._tracing import get_tracer, span
+
 _CTR = itertools.count()
 
 all_events: Final[set[type[ops.EventBase]]] = {
@@ -87,10 +92,40 @@ reconcilable_events_k8s_workloadless: Final[set[type[ops.EventBase]]] = (
 )
 
 
+@dataclasses.dataclass
+class ReconcileTriggers:
+    """Events that triggered a coalesced reconcile within one dispatch.
+
+    Passed to handlers registered with `observe_events(..., coalesce=True)`,
+    in emission order (re-emitted deferred events first).
+    """
+
+    events: list[ops.EventBase] = dataclasses.field(default_factory=list)
+
+    @property
+    def kinds(self) -> frozenset[str]:
+        """Event kinds seen, e.g. {"config_changed", "media_indexer_changed"}."""
+        return frozenset(event.handle.kind for event in self.events)
+
+    def any_of(self, *event_types: type[ops.EventBase]) -> bool:
+        """Return True if any trigger is an instance of the given event types."""
+        return any(isinstance(event, event_types) for event in self.events)
+
+    def __bool__(self) -> bool:
+        return bool(self.events)
+
+
+def _is_object_method(handler: Callable[..., None]) -> bool:
+    return inspect.ismethod(handler) and isinstance(handler.__self__, ops.Object)
+
+
 def observe_events[EventT: type[ops.EventBase]](
     charm: ops.CharmBase,
     events: Iterable[EventT],
     handler: Callable[[Any], None] | Callable[[], None],
+    *,
+    coalesce: bool = False,
+    extra_events: Iterable[ops.BoundEvent] = (),
 ) -> None:
     """Observe all events that are subtypes of a given list using the provided handler.
 
@@ -102,7 +137,23 @@ def observe_events[EventT: type[ops.EventBase]](
         events: Event types to observe (e.g., reconcilable_events_k8s).
         handler: The handler function. Can be either:
             - A method of an ops.Object that takes an event parameter
-            - A zero-argument callable (a proxy will be created)
+            - Any other callable, with or without an event parameter (a
+              proxy will be created)
+            When instrumentation or tracing is enabled (see
+            `enable_instrumentation` / `enable_tracing`), handlers are also
+            proxied so each call is timed and traced per event.
+        coalesce: Run the handler at most once per dispatch. Matching events
+            (including re-emitted deferred ones) only record themselves; the
+            handler runs once after all events were processed, on the first
+            collect-status event (or at commit when collect-status isn't
+            emitted, e.g. collect-metrics), and receives a `ReconcileTriggers`
+            instead of an event. Call `observe_events` before observing
+            `collect_unit_status`/`collect_app_status` so status handlers see
+            the reconciled state. Deferring is not possible in this mode: the
+            triggers are already handled when the handler runs.
+        extra_events: Additional bound events to observe regardless of type,
+            typically library custom events such as
+            `self._media_indexer.on.changed`.
 
     Examples:
         # Observe all reconcilable events with a method
@@ -113,10 +164,66 @@ def observe_events[EventT: type[ops.EventBase]](
 
         # For workload-less charms (no Pebble events)
         observe_events(self, reconcilable_events_k8s_workloadless, self._reconcile)
+
+        # One reconcile per dispatch, also for a library event
+        observe_events(
+            self,
+            reconcilable_events_k8s,
+            self._reconcile,
+            coalesce=True,
+            extra_events=[self._media_indexer.on.changed],
+        )
     """
     evthandler: Callable[[Any], None]
+    takes_event = bool(inspect.signature(handler).parameters)
+
+    def _call(arg: ops.EventBase | ReconcileTriggers) -> None:
+        if takes_event:
+            handler(arg)  # type: ignore[call-arg]
+        else:
+            handler()  # type: ignore[call-arg]
+
+    def _run(arg: ops.EventBase | ReconcileTriggers, kind: str) -> None:
+        instrumentation = get_instrumentation()
+        with span("handler", event=kind):
+            if instrumentation is None:
+                _call(arg)
+                return
+            with instrumentation.timer("hook", {"event": kind}):
+                _call(arg)
+
+    if coalesce:
 
-    if not inspect.signature(handler).parameters:
+        class _Coalescer(ops.Object):
+            _key = f"_observer_coalesce_{next(_CTR)}"
+
+            def __init__(self) -> None:
+                super().__init__(charm, key=self._key)
+                setattr(charm.framework, self._key, self)
+                self._triggers = ReconcileTriggers()
+                self._flushed = False
+                # Before status is evaluated; pre_commit covers dispatches without it.
+                self.framework.observe(charm.on.collect_app_status, self._flush)
+                self.framework.observe(charm.on.collect_unit_status, self._flush)
+                self.framework.observe(self.framework.on.pre_commit, self._flush)
+
+            def evt_handler(self, event: ops.EventBase) -> None:
+                self._triggers.events.append(event)
+
+            def _flush(self, _event: ops.EventBase) -> None:
+                if self._flushed:
+                    return
+                self._flushed = True
+                if self._triggers:
+                    _run(self._triggers, "coalesced")
+
+        evthandler = _Coalescer().evt_handler
+    elif (
+        not takes_event
+        or not _is_object_method(handler)
+        or get_instrumentation() is not None
+        or get_tracer() is not None
+    ):
 
         class _Observer(ops.Object):
             _key = f"_observer_proxy_{next(_CTR)}"
@@ -125,8 +232,8 @@ def observe_events[EventT: type[ops.EventBase]](
                 super().__init__(charm, key=self._key)
                 setattr(charm.framework, self._key, self)
 
-            def evt_handler(self, _: ops.EventBase) -> None:
-                handler()  # type: ignore[call-arg]
+            def evt_handler(self, event: ops.EventBase) -> None:
+                _run(event, event.handle.kind)
 
         evthandler = _Observer().evt_handler
     else:
@@ -135,3 +242,5 @@ def observe_events[EventT: type[ops.EventBase]](
     for bound_evt in charm.on.events().values():
         if any(issubclass(bound_evt.event_type, include_type) for include_type in events):
             charm.framework.observe(bound_evt, evthandler)
+    for bound_evt in extra_events:
+        charm.framework.observe(bound_evt, evthandler)
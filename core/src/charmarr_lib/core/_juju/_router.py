@@ -0,0 +1,104 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Route reconcile triggers to the reconcilers that need to run.
+
+The interfaces' `changed` events are `RelationDataChangedEvent`s that say
+which relation changed and whether its parsed remote data actually differs.
+`ReconcileRouter` maps event types to named reconcile steps so a charm only
+runs what a trigger affects:
+
+- a routed `changed` event runs its routed steps, or nothing when the
+  remote data is unchanged
+- any other routed event runs its routed steps
+- an unrouted trigger (config-changed, pebble-ready, ...) runs every step
+
+Usage:
+    class RadarrCharm(ops.CharmBase):
+        def __init__(self, framework: ops.Framework):
+            super().__init__(framework)
+            self._router = (
+                ReconcileRouter(
+                    {
+                        "storage": self._reconcile_storage,
+                        "download_clients": self._reconcile_download_clients,
+                        "indexers": self._reconcile_indexers,
+                    }
+                )
+                .route(DownloadClientChangedEvent, "download_clients")
+                .route(MediaStorageChangedEvent, "storage")
+                .route(MediaIndexerChangedEvent, "indexers")
+            )
+            observe_events(
+                self,
+                reconcilable_events_k8s,
+                self._router.run,
+                coalesce=True,
+                extra_events=[self._download_clients.on.changed, ...],
+            )
+"""
+
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from typing import Self
+
+import ops
+
+from charmarr_lib.core._juju._reconciler import ReconcileTriggers
+from charmarr_lib.core.interfaces._base import RelationDataChangedEvent
+
+logger = logging.getLogger(__name__)
+
+
+class ReconcileRouter:
+    """Maps trigger event types to the named reconcile steps they affect."""
+
+    def __init__(self, steps: Mapping[str, Callable[[], None]]) -> None:
+        """Initialize the router.
+
+        Args:
+            steps: Reconcile steps by name, in the order they should run.
+        """
+        self._steps = dict(steps)
+        self._routes: dict[type[ops.EventBase], tuple[str, ...]] = {}
+
+    def route(self, event_type: type[ops.EventBase], *steps: str) -> Self:
+        """Declare that `event_type` (and its subclasses) only affects `steps`.
+
+        Raises:
+            KeyError: If a step name is unknown.
+        """
+        for step in steps:
+            if step not in self._steps:
+                raise KeyError(f"Unknown reconcile step: {step}")
+        self._routes[event_type] = steps
+        return self
+
+    def select(self, trigger: ops.EventBase | ReconcileTriggers) -> list[str]:
+        """Return the steps to run for an event or coalesced triggers, in order."""
+        events: Iterable[ops.EventBase] = (
+            trigger.events if isinstance(trigger, ReconcileTriggers) else [trigger]
+        )
+        selected: set[str] = set()
+        for event in events:
+            steps = self._routed_steps(event)
+            if steps is None:
+                return list(self._steps)
+            selected.update(steps)
+        return [name for name in self._steps if name in selected]
+
+    def run(self, trigger: ops.EventBase | ReconcileTriggers) -> list[str]:
+        """Run the selected steps and return their names."""
+        selected = self.select(trigger)
+        logger.debug("Running reconcile steps: %s", ", ".join(selected) or "none")
+        for name in selected:
+            self._steps[name]()
+        return selected
+
+    def _routed_steps(self, event: ops.EventBase) -> tuple[str, ...] | None:
+        for event_type, steps in self._routes.items():
+            if isinstance(event, event_type):
+                if isinstance(event, RelationDataChangedEvent) and not event.data_changed:
+                    return ()
+                return steps
+        return None
@@ -8,36 +8,52 @@ via lightkube, with a focus on patching StatefulSets managed by Juju.
 
 Key components:
 - K8sResourceManager: Generic K8s resource operations with retry logic (from charmarr-lib-krm)
+- AsyncK8sResourceManager: Async counterpart; every reconciler has an `*_async` version
 - reconcile_storage_volume: Mount shared PVCs in StatefulSets
 - reconcile_hardware_transcoding: Mount hardware devices for GPU transcoding
 - check_storage_permissions: Verify puid/pgid can write to mounted storage
+- StatefulSetPatchPlan: Merge several pod template changes into one PATCH
 """
 
 from charmarr_lib.core._k8s._hardware import (
     is_hardware_device_mounted,
+    plan_hardware_transcoding,
     reconcile_hardware_transcoding,
+    reconcile_hardware_transcoding_async,
 )
+from charmarr_lib.core._k8s._patch_plan import PatchConflictError, StatefulSetPatchPlan
 from charmarr_lib.core._k8s._permission_check import (
     PermissionCheckResult,
     PermissionCheckStatus,
     check_storage_permissions,
+    check_storage_permissions_async,
     delete_permission_check_job,
 )
 from charmarr_lib.core._k8s._storage import (
     is_storage_mounted,
+    plan_storage_volume,
     reconcile_storage_volume,
+    reconcile_storage_volume_async,
 )
-from charmarr_lib.krm import K8sResourceManager, ReconcileResult
+from charmarr_lib.krm import AsyncK8sResourceManager, K8sResourceManager, ReconcileResult
 
 __all__ = [
+    "AsyncK8sResourceManager",
     "K8sResourceManager",
+    "PatchConflictError",
     "PermissionCheckResult",
     "PermissionCheckStatus",
     "ReconcileResult",
+    "StatefulSetPatchPlan",
     "check_storage_permissions",
+    "check_storage_permissions_async",
     "delete_permission_check_job",
     "is_hardware_device_mounted",
     "is_storage_mounted",
+    "plan_hardware_transcoding",
+    "plan_storage_volume",
     "reconcile_hardware_transcoding",
+    "reconcile_hardware_transcoding_async",
     "reconcile_storage_volume",
+    "reconcile_storage_volume_async",
 ]
@@ -21,8 +21,11 @@ from lightkube.models.core_v1 import (
     VolumeMount,
 )
 from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.types import PatchType
 
-from charmarr_lib.krm import K8sResourceManager, ReconcileResult
+from charmarr_lib.core._k8s._patch_plan import StatefulSetPatchPlan
+from charmarr_lib.core._tracing import traced
+from charmarr_lib.krm import AsyncK8sResourceManager, K8sResourceManager, ReconcileResult
 
 _DRI_VOLUME_NAME = "dev-dri"
 _DRI_HOST_PATH = "/dev/dri"
@@ -143,6 +146,7 @@ def _build_remove_hardware_device_json_patch(
     return operations
 
 
+@traced()
 def reconcile_hardware_transcoding(
     manager: K8sResourceManager,
     statefulset_name: str,
@@ -171,8 +175,6 @@ def reconcile_hardware_transcoding(
     Returns:
         ReconcileResult indicating if changes were made.
     """
-    from lightkube.types import PatchType
-
     sts = manager.get(StatefulSet, statefulset_name, namespace)
 
     if not enabled:
@@ -189,3 +191,59 @@ def reconcile_hardware_transcoding(
     patch = _build_hardware_device_patch(container_name, host_path, mount_path, volume_name)
     manager.patch(StatefulSet, statefulset_name, patch, namespace)
     return ReconcileResult(changed=True, message=f"Hardware device mounted at {mount_path}")
+
+
+@traced()
+async def reconcile_hardware_transcoding_async(
+    manager: AsyncK8sResourceManager,
+    statefulset_name: str,
+    namespace: str,
+    container_name: str,
+    enabled: bool,
+    host_path: str = _DRI_HOST_PATH,
+    mount_path: str = _DRI_MOUNT_PATH,
+    volume_name: str = _DRI_VOLUME_NAME,
+) -> ReconcileResult:
+    """Async version of `reconcile_hardware_transcoding`, using AsyncK8sResourceManager."""
+    sts = await manager.get(StatefulSet, statefulset_name, namespace)
+
+    if not enabled:
+        if not is_hardware_device_mounted(sts, container_name, volume_name):
+            return ReconcileResult(changed=False, message="Hardware device not mounted")
+        patch_ops = _build_remove_hardware_device_json_patch(sts, container_name, volume_name)
+        if patch_ops:
+            await manager.patch(
+                StatefulSet, statefulset_name, patch_ops, namespace, PatchType.JSON
+            )
+        return ReconcileResult(changed=True, message=f"Removed hardware device {volume_name}")
+
+    if is_hardware_device_mounted(sts, container_name, volume_name):
+        return ReconcileResult(changed=False, message="Hardware device already mounted")
+
+    patch = _build_hardware_device_patch(container_name, host_path, mount_path, volume_name)
+    await manager.patch(StatefulSet, statefulset_name, patch, namespace)
+    return ReconcileResult(changed=True, message=f"Hardware device mounted at {mount_path}")
+
+
+def plan_hardware_transcoding(
+    plan: StatefulSetPatchPlan,
+    container_name: str,
+    enabled: bool,
+    host_path: str = _DRI_HOST_PATH,
+    mount_path: str = _DRI_MOUNT_PATH,
+    volume_name: str = _DRI_VOLUME_NAME,
+) -> StatefulSetPatchPlan:
+    """Add the hardware device mount (or its removal) to a StatefulSetPatchPlan.
+
+    Same arguments and semantics as `reconcile_hardware_transcoding`, but
+    nothing is sent until `plan.apply()`.
+
+    Returns:
+        The plan, for chaining.
+    """
+    owner = "hardware-transcoding"
+    if not enabled:
+        plan.remove_volume(volume_name, owner)
+        return plan.remove_volume_mount(container_name, volume_name, owner)
+    patch = _build_hardware_device_patch(container_name, host_path, mount_path, volume_name)
+    return plan.merge(patch, owner)
@@ -0,0 +1,288 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Composable StatefulSet patch plan: one GET and at most one PATCH per reconcile.
+
+Calling `reconcile_storage_volume`, `reconcile_hardware_transcoding` and the
+VPN gateway client reconciler one after another patches the same Juju
+StatefulSet several times, and every pod template change rolls the pod
+(minutes of torrent re-checks or transcoder warmup each time).
+`StatefulSetPatchPlan` collects what each contributor wants on the pod
+template, merges it, fails loudly when two contributors disagree and sends a
+single strategic merge patch, which is skipped entirely when the live
+StatefulSet already matches.
+
+Removals are expressed as strategic merge delete directives computed from the
+live object, so adding and removing things still needs only one PATCH.
+
+Usage:
+    plan = StatefulSetPatchPlan(manager, self.app.name, self.model.name)
+    plan_storage_volume(plan, "radarr", pvc_name, mount_path, pgid=pgid)
+    plan_hardware_transcoding(plan, "plex", enabled=self.config["hw-transcoding"])
+    plan.merge(build_gateway_client_patch(self.app.name, vpn_data), owner="vpn-gateway")
+    result = plan.apply()
+"""
+
+import dataclasses
+from typing import Any, Self
+
+from lightkube.models.core_v1 import Container, PodSecurityContext, Volume, VolumeMount
+from lightkube.resources.apps_v1 import StatefulSet
+
+from charmarr_lib.core._tracing import traced
+from charmarr_lib.krm import K8sResourceManager, ReconcileResult
+
+_CONTAINER_LISTS = ("containers", "initContainers")
+_POD_SPEC_FIELDS = {"volumes", "securityContext", *_CONTAINER_LISTS}
+
+Slot = tuple[str, ...]
+
+
+class PatchConflictError(Exception):
+    """Two contributors want different values for the same part of the pod template."""
+
+
+@dataclasses.dataclass(frozen=True)
+class _Contribution:
+    owner: str
+    value: dict[str, Any] | str | None  # None means "remove"
+
+
+def _plain(obj: Any) -> dict[str, Any]:
+    return obj if isinstance(obj, dict) else obj.to_dict()
+
+
+class StatefulSetPatchPlan:
+    """Collects pod template changes from several contributors into one patch."""
+
+    def __init__(self, manager: K8sResourceManager, statefulset_name: str, namespace: str) -> None:
+        """Initialize an empty plan.
+
+        Args:
+            manager: K8sResourceManager instance.
+            statefulset_name: Name of the StatefulSet (usually self.app.name).
+            namespace: Kubernetes namespace (usually self.model.name).
+        """
+        self._manager = manager
+        self._name = statefulset_name
+        self._namespace = namespace
+        self._slots: dict[Slot, _Contribution] = {}
+
+    @property
+    def owners(self) -> list[str]:
+        """Contributors that added something to the plan, in order."""
+        return list(dict.fromkeys(c.owner for c in self._slots.values()))
+
+    def add_volume(self, volume: Volume | dict[str, Any], owner: str) -> Self:
+        """Add (or replace) a pod volume."""
+        value = _plain(volume)
+        return self._contribute(("volumes", value["name"]), owner, value)
+
+    def remove_volume(self, name: str, owner: str) -> Self:
+        """Remove a pod volume if present."""
+        return self._contribute(("volumes", name), owner, None)
+
+    def add_volume_mount(
+        self,
+        container_name: str,
+        mount: VolumeMount | dict[str, Any],
+        owner: str,
+        *,
+        init: bool = False,
+    ) -> Self:
+        """Mount a volume in a container (an init container when `init` is True)."""
+        value = _plain(mount)
+        slot = ("volumeMounts", _list_name(init), container_name, value["name"])
+        return self._contribute(slot, owner, value)
+
+    def remove_volume_mount(
+        self, container_name: str, name: str, owner: str, *, init: bool = False
+    ) -> Self:
+        """Remove a volume mount (by volume name) from a container if present."""
+        return self._contribute(
+            ("volumeMounts", _list_name(init), container_name, name), owner, None
+        )
+
+    def add_container(
+        self, container: Container | dict[str, Any], owner: str, *, init: bool = False
+    ) -> Self:
+        """Add (or update) a sidecar or init container.
+
+        The container's volumeMounts are tracked per mount, so other
+        contributors can still mount volumes into the same container.
+        """
+        value = dict(_plain(container))
+        name = value["name"]
+        for mount in value.pop("volumeMounts", None) or []:
+            self.add_volume_mount(name, mount, owner, init=init)
+        if len(value) > 1:
+            self._contribute((_list_name(init), name), owner, value)
+        return self
+
+    def remove_container(self, name: str, owner: str, *, init: bool = False) -> Self:
+        """Remove a sidecar or init container if present."""
+        return self._contribute((_list_name(init), name), owner, None)
+
+    def set_annotation(self, key: str, value: str | None, owner: str) -> Self:
+        """Set a pod template annotation, or remove it when `value` is None."""
+        return self._contribute(("annotations", key), owner, value)
+
+    def set_security_context(
+        self, context: PodSecurityContext | dict[str, Any] | None, owner: str
+    ) -> Self:
+        """Set the pod securityContext, or remove it when `context` is None."""
+        value = None if context is None else _plain(context)
+        return self._contribute(("securityContext",), owner, value)
+
+    def merge(self, patch: dict[str, Any], owner: str) -> Self:
+        """Add a strategic merge patch built for the StatefulSet pod template.
+
+        Accepts the patches the charmarr reconcilers build (annotations,
+        volumes, containers, initContainers and securityContext under
+        spec.template), including `$patch: delete` list entries.
+
+        Raises:
+            ValueError: If the patch touches anything else.
+        """
+        template = patch.get("spec", {}).get("template", {})
+        if set(patch) - {"spec"} or set(patch.get("spec", {})) - {"template"}:
+            raise ValueError("Only spec.template can be merged into a StatefulSetPatchPlan")
+        if set(template) - {"metadata", "spec"} or set(template.get("metadata", {})) - {
+            "annotations"
+        }:
+            raise ValueError("Only pod annotations and spec can be merged")
+        pod_spec = template.get("spec", {})
+        unsupported = set(pod_spec) - _POD_SPEC_FIELDS
+        if unsupported:
+            raise ValueError(f"Unsupported pod spec fields: {', '.join(sorted(unsupported))}")
+
+        for key, value in template.get("metadata", {}).get("annotations", {}).items():
+            self.set_annotation(key, value, owner)
+        for volume in pod_spec.get("volumes", []):
+            if volume.get("$patch") == "delete":
+                self.remove_volume(volume["name"], owner)
+            else:
+                self.add_volume(volume, owner)
+        for list_name in _CONTAINER_LISTS:
+            init = list_name == "initContainers"
+            for container in pod_spec.get(list_name, []):
+                if container.get("$patch") == "delete":
+                    self.remove_container(container["name"], owner, init=init)
+                else:
+                    self.add_container(container, owner, init=init)
+        if "securityContext" in pod_spec:
+            self.set_security_context(pod_spec["securityContext"], owner)
+        return self
+
+    def build(self, live: StatefulSet) -> dict[str, Any]:
+        """Render the strategic merge patch for the given live StatefulSet.
+
+        Returns:
+            The patch, or {} when the plan is empty.
+        """
+        live_spec = live.spec.template.spec if live.spec is not None else None
+        live_containers = {
+            list_name: {c.name: c for c in (getattr(live_spec, list_name, None) or [])}
+            for list_name in _CONTAINER_LISTS
+        }
+        live_volumes = {v.name for v in (live_spec.volumes if live_spec else None) or []}
+
+        pod_spec: dict[str, Any] = {}
+        annotations: dict[str, Any] = {}
+        entries: dict[str, dict[str, dict[str, Any]]] = {name: {} for name in _CONTAINER_LISTS}
+
+        for slot, contribution in self._slots.items():
+            kind, value = slot[0], contribution.value
+            if kind == "annotations":
+                annotations[slot[1]] = value
+            elif kind == "securityContext":
+                if value is not None or (live_spec is not None and live_spec.securityContext):
+                    pod_spec["securityContext"] = value
+            elif kind == "volumes":
+                if value is not None:
+                    pod_spec.setdefault("volumes", []).append(value)
+                elif slot[1] in live_volumes:
+                    pod_spec.setdefault("volumes", []).append(
+                        {"name": slot[1], "$patch": "delete"}
+                    )
+            elif kind in _CONTAINER_LISTS:
+                name = slot[1]
+                if value is not None:
+                    entries[kind].setdefault(name, {"name": name}).update(value)  # type: ignore[arg-type]
+                elif name in live_containers[kind]:
+                    entries[kind][name] = {"name": name, "$patch": "delete"}
+            else:
+                _, list_name, container_name, mount_name = slot
+                live_container = live_containers[list_name].get(container_name)
+                mounts = _mount_patch(live_container, mount_name, value)  # type: ignore[arg-type]
+                if mounts:
+                    entry = entries[list_name].setdefault(container_name, {"name": container_name})
+                    entry.setdefault("volumeMounts", []).extend(mounts)
+
+        for list_name in _CONTAINER_LISTS:
+            if entries[list_name]:
+                pod_spec[list_name] = list(entries[list_name].values())
+
+        template: dict[str, Any] = {}
+        if annotations:
+            template["metadata"] = {"annotations": annotations}
+        if pod_spec:
+            template["spec"] = pod_spec
+        return {"spec": {"template": template}} if template else {}
+
+    @traced("StatefulSetPatchPlan.apply")
+    def apply(self) -> ReconcileResult:
+        """GET the StatefulSet once and send the merged patch if it changes anything.
+
+        Returns:
+            ReconcileResult indicating if the pod template changed.
+
+        Raises:
+            ApiError: If the StatefulSet doesn't exist or the patch fails.
+        """
+        live = self._manager.get(StatefulSet, self._name, self._namespace)
+        patch = self.build(live)
+        contributors = ", ".join(self.owners) or "nothing"
+        if not patch or not self._manager.patch_if_changed(
+            StatefulSet, self._name, patch, self._namespace, live=live
+        ):
+            return ReconcileResult(
+                changed=False, message=f"{self._name} up to date ({contributors})"
+            )
+        return ReconcileResult(changed=True, message=f"Patched {self._name} ({contributors})")
+
+    def _contribute(self, slot: Slot, owner: str, value: dict[str, Any] | str | None) -> Self:
+        current = self._slots.get(slot)
+        if current is not None and current.owner != owner and current.value != value:
+            raise PatchConflictError(
+                f"{'/'.join(slot)}: {current.owner!r} and {owner!r} want different values"
+            )
+        self._slots[slot] = _Contribution(owner, value)
+        return self
+
+
+def _list_name(init: bool) -> str:
+    return "initContainers" if init else "containers"
+
+
+def _mount_patch(
+    live_container: Container | None, name: str, value: dict[str, Any] | None
+) -> list[dict[str, Any]]:
+    """Patch entries for one volume mount.
+
+    volumeMounts merge by mountPath, so a mount moved to a new path also needs
+    a delete directive for its old path.
+    """
+    live_paths = [
+        m.mountPath
+        for m in (live_container.volumeMounts if live_container else None) or []
+        if m.name == name
+    ]
+    entries: list[dict[str, Any]] = [
+        {"mountPath": path, "$patch": "delete"}
+        for path in live_paths
+        if value is None or path != value["mountPath"]
+    ]
+    if value is not None:
+        entries.append(value)
+    return entries
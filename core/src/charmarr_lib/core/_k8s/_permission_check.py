@@ -30,9 +30,14 @@ from lightkube.models.core_v1 import (
 )
 from lightkube.models.meta_v1 import ObjectMeta
 from lightkube.resources.batch_v1 import Job
-from tenacity import retry, retry_if_result, stop_after_delay, wait_fixed
 
-from charmarr_lib.krm import K8sResourceManager
+from charmarr_lib.core._tracing import traced
+from charmarr_lib.krm import (
+    AsyncK8sResourceManager,
+    K8sResourceManager,
+    job_finished,
+    ownership_labels,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +45,7 @@ _JOB_NAME_PREFIX = "charmarr-permission-check"
 _TEST_FILE = ".charmarr-permission-test"
 _LABEL_PUID = "charmarr.io/puid"
 _LABEL_PGID = "charmarr.io/pgid"
+_WAIT_TIMEOUT = 30.0
 
 
 class PermissionCheckStatus(str, Enum):
@@ -106,6 +112,7 @@ def _build_permission_check_job(
                 "app.kubernetes.io/managed-by": "charmarr-storage",
                 _LABEL_PUID: str(puid),
                 _LABEL_PGID: str(pgid),
+                **ownership_labels(component=_JOB_NAME_PREFIX),
             },
         ),
         spec=JobSpec(
@@ -152,48 +159,66 @@ def _job_config_matches(job: Job, puid: int, pgid: int) -> bool:
     return job_puid == str(puid) and job_pgid == str(pgid)
 
 
+def _result_for_status(
+    status: PermissionCheckStatus, puid: int, pgid: int
+) -> PermissionCheckResult:
+    """Build the PermissionCheckResult reported for a Job status."""
+    if status == PermissionCheckStatus.PASSED:
+        return PermissionCheckResult(
+            status=PermissionCheckStatus.PASSED,
+            message="Storage permissions OK",
+        )
+    if status == PermissionCheckStatus.FAILED:
+        return PermissionCheckResult(
+            status=PermissionCheckStatus.FAILED,
+            message=f"Storage permission denied for puid={puid} pgid={pgid}. "
+            "Check ownership on storage backend.",
+        )
+    return PermissionCheckResult(
+        status=PermissionCheckStatus.PENDING,
+        message="Permission check in progress",
+    )
+
+
 def _is_pending(result: PermissionCheckResult) -> bool:
-    """Check if result is still pending (used for retry condition)."""
+    """Check if result is still pending."""
     return result.status == PermissionCheckStatus.PENDING
 
 
-def _make_poll_job_status(
-    manager: "K8sResourceManager",
-    job_name: str,
-    namespace: str,
-    puid: int,
-    pgid: int,
-):
-    """Create a polling function for Job status with tenacity retry."""
+def _job_result(job: Job, puid: int, pgid: int) -> PermissionCheckResult:
+    """Build the PermissionCheckResult reported for a Job."""
+    return _result_for_status(_get_job_status(job), puid, pgid)
+
 
-    @retry(
-        stop=stop_after_delay(30),
-        wait=wait_fixed(2),
-        retry=retry_if_result(_is_pending),
+def _is_stale(job: Job | None, job_name: str, puid: int, pgid: int) -> bool:
+    """Check if an existing Job was created for another puid/pgid and must be recreated."""
+    if job is None or _job_config_matches(job, puid, pgid):
+        return False
+    logger.info(
+        "Permission check Job %s config changed, recreating with puid=%d pgid=%d",
+        job_name,
+        puid,
+        pgid,
     )
-    def poll() -> PermissionCheckResult:
-        job = manager.get(Job, job_name, namespace)
-        status = _get_job_status(job)
-
-        if status == PermissionCheckStatus.PASSED:
-            return PermissionCheckResult(
-                status=PermissionCheckStatus.PASSED,
-                message="Storage permissions OK",
-            )
-        if status == PermissionCheckStatus.FAILED:
-            return PermissionCheckResult(
-                status=PermissionCheckStatus.FAILED,
-                message=f"Storage permission denied for puid={puid} pgid={pgid}. "
-                "Check ownership on storage backend.",
-            )
-        return PermissionCheckResult(
-            status=PermissionCheckStatus.PENDING,
-            message="Permission check in progress",
-        )
+    return True
 
-    return poll
 
+def _new_job(
+    job_name: str, namespace: str, pvc_name: str, puid: int, pgid: int, mount_path: str
+) -> Job:
+    """Build the permission check Job to create for a PVC."""
+    logger.info("Creating permission check Job %s for PVC %s", job_name, pvc_name)
+    return _build_permission_check_job(
+        job_name=job_name,
+        namespace=namespace,
+        pvc_name=pvc_name,
+        puid=puid,
+        pgid=pgid,
+        mount_path=mount_path,
+    )
 
+
+@traced()
 def check_storage_permissions(
     manager: K8sResourceManager,
     namespace: str,
@@ -208,8 +233,9 @@ def check_storage_permissions(
     a test file on the mounted storage as the specified user/group.
 
     The Job is created if it doesn't exist, and its status is checked on
-    subsequent calls. Jobs are automatically cleaned up after 5 minutes
-    via ttlSecondsAfterFinished.
+    subsequent calls. A pending Job is watched for up to 30 seconds; if it
+    is still running after that, a PENDING result is returned. Jobs are
+    automatically cleaned up after 5 minutes via ttlSecondsAfterFinished.
 
     Args:
         manager: K8sResourceManager instance.
@@ -243,47 +269,67 @@ def check_storage_permissions(
         job = None
 
     # If Job exists but config changed, delete it so we can create a new one
-    if job is not None and not _job_config_matches(job, puid, pgid):
-        logger.info(
-            "Permission check Job %s config changed, recreating with puid=%d pgid=%d",
-            job_name,
-            puid,
-            pgid,
-        )
+    if _is_stale(job, job_name, puid, pgid):
         manager.delete(Job, job_name, namespace)
         job = None
 
     if job is None:
-        job = _build_permission_check_job(
-            job_name=job_name,
-            namespace=namespace,
-            pvc_name=pvc_name,
-            puid=puid,
-            pgid=pgid,
-            mount_path=mount_path,
-        )
-        logger.info("Creating permission check Job %s for PVC %s", job_name, pvc_name)
+        job = _new_job(job_name, namespace, pvc_name, puid, pgid, mount_path)
         manager.apply(job)
 
-    status = _get_job_status(job)
+    result = _job_result(job, puid, pgid)
+    if not _is_pending(result):
+        return result
 
-    if status == PermissionCheckStatus.PASSED:
-        return PermissionCheckResult(
-            status=PermissionCheckStatus.PASSED,
-            message="Storage permissions OK",
-        )
+    # Job is PENDING - watch it until it finishes or the wait times out
+    logger.info("Waiting for permission check Job %s to complete", job_name)
+    try:
+        job = manager.wait_for(Job, job_name, job_finished, namespace, timeout=_WAIT_TIMEOUT)
+    except TimeoutError:
+        return result
+    return _job_result(job, puid, pgid)
 
-    if status == PermissionCheckStatus.FAILED:
-        return PermissionCheckResult(
-            status=PermissionCheckStatus.FAILED,
-            message=f"Storage permission denied for puid={puid} pgid={pgid}. "
-            "Check ownership on storage backend.",
-        )
 
-    # Job is PENDING - poll until it completes or times out
+@traced()
+async def check_storage_permissions_async(
+    manager: AsyncK8sResourceManager,
+    namespace: str,
+    pvc_name: str,
+    puid: int,
+    pgid: int,
+    mount_path: str = "/data",
+) -> PermissionCheckResult:
+    """Async version of `check_storage_permissions`, using AsyncK8sResourceManager.
+
+    Waiting for a pending Job doesn't block the event loop.
+    """
+    job_name = _get_job_name(pvc_name)
+
+    try:
+        job = await manager.get(Job, job_name, namespace)
+    except ApiError as e:
+        if e.status.code != 404:
+            raise
+        job = None
+
+    if _is_stale(job, job_name, puid, pgid):
+        await manager.delete(Job, job_name, namespace)
+        job = None
+
+    if job is None:
+        job = _new_job(job_name, namespace, pvc_name, puid, pgid, mount_path)
+        await manager.apply(job)
+
+    result = _job_result(job, puid, pgid)
+    if not _is_pending(result):
+        return result
+
     logger.info("Waiting for permission check Job %s to complete", job_name)
-    poll = _make_poll_job_status(manager, job_name, namespace, puid, pgid)
-    return poll()
+    try:
+        job = await manager.wait_for(Job, job_name, job_finished, namespace, timeout=_WAIT_TIMEOUT)
+    except TimeoutError:
+        return result
+    return _job_result(job, puid, pgid)
 
 
 def delete_permission_check_job(
@@ -46,7 +46,9 @@ from lightkube.models.core_v1 import (
 from lightkube.resources.apps_v1 import StatefulSet
 from lightkube.types import PatchType
 
-from charmarr_lib.krm import K8sResourceManager, ReconcileResult
+from charmarr_lib.core._k8s._patch_plan import StatefulSetPatchPlan
+from charmarr_lib.core._tracing import traced
+from charmarr_lib.krm import AsyncK8sResourceManager, K8sResourceManager, ReconcileResult
 
 _DEFAULT_VOLUME_NAME = "charmarr-shared-data"
 _DEFAULT_MOUNT_PATH = "/data"
@@ -191,6 +193,7 @@ def _build_remove_storage_json_patch(
     return operations
 
 
+@traced()
 def reconcile_storage_volume(
     manager: K8sResourceManager,
     statefulset_name: str,
@@ -204,7 +207,8 @@ def reconcile_storage_volume(
     """Reconcile shared storage PVC volume and mount on a StatefulSet.
 
     This function ensures a shared PVC is mounted (or unmounted) in a
-    Juju-managed StatefulSet. Uses strategic merge patch which is idempotent.
+    Juju-managed StatefulSet. Uses strategic merge patch which is idempotent,
+    and skips the patch when the live StatefulSet already matches it.
 
     If pvc_name is None, the volume is removed. If pvc_name is provided,
     the volume is mounted.
@@ -249,5 +253,64 @@ def reconcile_storage_volume(
         return ReconcileResult(changed=True, message=f"Removed volume {volume_name}")
 
     patch = _build_storage_patch(container_name, pvc_name, mount_path, volume_name, pgid)
-    manager.patch(StatefulSet, statefulset_name, patch, namespace)
+    if not manager.patch_if_changed(StatefulSet, statefulset_name, patch, namespace):
+        return ReconcileResult(
+            changed=False, message=f"Storage already configured at {mount_path}"
+        )
+    return ReconcileResult(changed=True, message=f"Storage configured at {mount_path}")
+
+
+@traced()
+async def reconcile_storage_volume_async(
+    manager: AsyncK8sResourceManager,
+    statefulset_name: str,
+    namespace: str,
+    container_name: str,
+    pvc_name: str | None,
+    mount_path: str = _DEFAULT_MOUNT_PATH,
+    volume_name: str = _DEFAULT_VOLUME_NAME,
+    pgid: int | None = None,
+) -> ReconcileResult:
+    """Async version of `reconcile_storage_volume`, using AsyncK8sResourceManager."""
+    if pvc_name is None:
+        sts = await manager.get(StatefulSet, statefulset_name, namespace)
+        if not is_storage_mounted(sts, container_name, volume_name):
+            return ReconcileResult(changed=False, message="Storage not mounted")
+        patch_ops = _build_remove_storage_json_patch(sts, container_name, volume_name)
+        if patch_ops:
+            await manager.patch(
+                StatefulSet, statefulset_name, patch_ops, namespace, PatchType.JSON
+            )
+        return ReconcileResult(changed=True, message=f"Removed volume {volume_name}")
+
+    patch = _build_storage_patch(container_name, pvc_name, mount_path, volume_name, pgid)
+    if not await manager.patch_if_changed(StatefulSet, statefulset_name, patch, namespace):
+        return ReconcileResult(
+            changed=False, message=f"Storage already configured at {mount_path}"
+        )
     return ReconcileResult(changed=True, message=f"Storage configured at {mount_path}")
+
+
+def plan_storage_volume(
+    plan: StatefulSetPatchPlan,
+    container_name: str,
+    pvc_name: str | None,
+    mount_path: str = _DEFAULT_MOUNT_PATH,
+    volume_name: str = _DEFAULT_VOLUME_NAME,
+    pgid: int | None = None,
+) -> StatefulSetPatchPlan:
+    """Add the shared storage volume (or its removal) to a StatefulSetPatchPlan.
+
+    Same arguments and semantics as `reconcile_storage_volume`, but nothing is
+    sent until `plan.apply()`.
+
+    Returns:
+        The plan, for chaining.
+    """
+    owner = "storage"
+    if pvc_name is None:
+        plan.remove_volume(volume_name, owner)
+        plan.remove_volume_mount(container_name, volume_name, owner)
+        return plan.set_security_context(None, owner)
+    patch = _build_storage_patch(container_name, pvc_name, mount_path, volume_name, pgid)
+    return plan.merge(patch, owner)
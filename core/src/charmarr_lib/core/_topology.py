@@ -7,12 +7,28 @@ Charms instantiate `CharmarrTopology` with the list of relations they want
 to surface, then call `topology.reconcile()` from their own reconcile method.
 On each reconcile the helper:
 
-1. Writes a Prometheus exposition file under /tmp with two metric families:
+1. Renders a Prometheus exposition with two metric families:
    - `charmarr_relation_bound{relation, role, required}` (0/1) - is the relation bound at all
    - `charmarr_relation_edge{relation, from_app, to_app}` (1) - one series per bound peer
 
-2. Ensures a tiny detached HTTP server is running in the charm container,
-   serving that file at `/metrics` on the configured port (9099 by default).
+   The rendered bytes are hashed and compared with the last write. Only when
+   they differ is the file under /tmp replaced (temp file + `os.replace`, so a
+   concurrent scrape never sees a torn file).
+
+   A compact `/topology.json` document (generation, app/model identity, bound
+   relations and edges) is hashed separately, and only its changes bump the
+   generation and rewrite it. Extra series such as hook instrumentation move
+   on every hook without touching the document, so crowsnest's conditional
+   GET keeps getting 304 until the topology itself changes.
+
+2. Registers its port in a small registry file and ensures ONE detached
+   supervisor daemon is running in the charm container. The daemon serves
+   every registered port (`/metrics` and `/topology.json`, 9099 by default),
+   so a charm publishing several endpoints still runs a single interpreter.
+   `/debug/trace` serves the hook trace ring buffer written by `enable_tracing`.
+   The daemon's command line carries a hash of its script; a daemon started
+   from older library code is replaced on the next reconcile, so charm
+   upgrades take effect.
 
 The charm registers the helper's `scrape_job` with its MetricsEndpointProvider
 and adds the topology port to its mesh UnitPolicy. Prometheus/otelcol scrapes
@@ -41,7 +57,7 @@ We considered making this a Pebble service. We cannot:
 So the alternative would be: declare a dedicated `charmarr-topology`
 sidecar container in every charmarr charm, image pinned, Pebble layer
 pushed. That adds ~20MB of RAM per pod x N charms and one Renovate-tracked
-image per charm for what is structurally a 25-line static file server. Not
+image per charm for what is structurally a small static file server. Not
 worth the cost.
 
 If Pebble #118 lands, or if Juju ever exposes the charm container's
@@ -52,16 +68,27 @@ need to be touched.
 """
 
 import dataclasses
+import hashlib
+import json
 import logging
 import os
+import signal
 import subprocess
 import sys
+import time
 from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Literal
+from typing import Any, ClassVar
 
 import ops
-from pydantic import BaseModel, Field
+
+from charmarr_lib.core._exposition import (
+    ExpositionBuilder,
+    MetricFamily,
+    render_labels,
+)
+from charmarr_lib.core._files import atomic_write
+from charmarr_lib.core._tracing import Tracer
 
 logger = logging.getLogger(__name__)
 
@@ -75,36 +102,30 @@ class CharmarrTopologyRelation:
     required: bool
 
 
-class MetricSample(BaseModel):
-    """A single Prometheus metric sample - labels + value."""
-
-    labels: dict[str, str] = Field(default_factory=dict)
-    value: float
-
-
-class MetricFamily(BaseModel):
-    """A Prometheus metric family - one HELP, one TYPE, N samples.
-
-    The helper formats this into valid Prometheus exposition format. Use this
-    via `CharmarrChargedTopology` when a charm wants to ship arbitrary
-    charm-state metrics alongside topology on the same daemon endpoint.
-    """
+@dataclasses.dataclass(frozen=True)
+class _WriteState:
+    """Digests of the last metrics file and topology document writes."""
 
-    name: str
-    help: str
-    type: Literal["gauge", "counter"] = "gauge"
-    samples: list[MetricSample] = Field(default_factory=list)
+    digest: str
+    topology_digest: str
+    generation: int
 
 
-ExtraExpositionCallback = Callable[[], Iterable[MetricFamily]]
+ExtraExpositionCallback = Callable[[], Iterable[MetricFamily] | ExpositionBuilder]
 
 
 class CharmarrTopology(ops.Object):
     """Publishes charmarr_relation_bound + charmarr_relation_edge metrics.
 
     Hosted from inside the charm container - which always has Python - via a
-    detached subprocess. The metrics file is regenerated on each `reconcile()`
-    call; the HTTP server reads it on each scrape.
+    detached subprocess shared by every instance in the container. The metrics
+    file is regenerated on each `reconcile()` call; the HTTP server keeps it in
+    memory and reloads it when the file changes.
+
+    The default port keeps the historic file names under /tmp; any other port
+    gets its own `charmarr-topology-<port>.*` files. Create every instance in
+    the charm's `__init__`: registering an endpoint drops the registry entries
+    of ports no instance of the current dispatch serves anymore.
 
     Example::
 
@@ -142,7 +163,13 @@ class CharmarrTopology(ops.Object):
     DEFAULT_PORT = 9099
     PID_FILE = Path("/tmp/charmarr-topology.pid")
     METRICS_FILE = Path("/tmp/charmarr-topology.prom")
+    STATE_FILE = Path("/tmp/charmarr-topology.state")
+    TOPOLOGY_FILE = Path("/tmp/charmarr-topology.json")
     SERVER_SCRIPT = Path("/tmp/charmarr-topology-server.py")
+    REGISTRY_FILE = Path("/tmp/charmarr-topology.registry.json")
+    STOP_TIMEOUT = 5.0
+
+    _FRAMEWORK_ATTR: ClassVar[str] = "_charmarr_topology_ports"
 
     def __init__(
         self,
@@ -154,6 +181,10 @@ class CharmarrTopology(ops.Object):
         self._charm = charm
         self._relations = list(relations)
         self._port = port
+        # Ports of every instance created in this dispatch, shared via the framework.
+        self._live_ports: set[int] = getattr(charm.framework, self._FRAMEWORK_ATTR, None) or set()
+        self._live_ports.add(port)
+        setattr(charm.framework, self._FRAMEWORK_ATTR, self._live_ports)
 
     @property
     def port(self) -> int:
@@ -164,6 +195,11 @@ class CharmarrTopology(ops.Object):
         """Return the static scrape job spec to add to MetricsEndpointProvider."""
         return {"static_configs": [{"targets": [f"*:{self._port}"]}]}
 
+    @property
+    def generation(self) -> int:
+        """Monotonically increasing counter, bumped each time the topology document changes."""
+        return self._read_state().generation
+
     def reconcile(self) -> None:
         """Refresh the metrics file and ensure the daemon is running.
 
@@ -172,9 +208,77 @@ class CharmarrTopology(ops.Object):
         self._write_metrics_file()
         self._ensure_server_running()
 
-    def _write_metrics_file(self) -> None:
-        lines = list(self._exposition_lines())
-        self.METRICS_FILE.write_text("\n".join(lines) + "\n")
+    def _port_path(self, path: Path) -> Path:
+        if self._port == self.DEFAULT_PORT:
+            return path
+        return path.with_name(f"{path.stem}-{self._port}{path.suffix}")
+
+    @property
+    def _metrics_file(self) -> Path:
+        return self._port_path(self.METRICS_FILE)
+
+    @property
+    def _state_file(self) -> Path:
+        return self._port_path(self.STATE_FILE)
+
+    @property
+    def _topology_file(self) -> Path:
+        return self._port_path(self.TOPOLOGY_FILE)
+
+    def _write_metrics_file(self) -> bool:
+        """Write the exposition and topology document if they differ from the last write.
+
+        Returns:
+            True if the metrics file was (re)written, False if the content was unchanged.
+        """
+        content = ("\n".join(self._exposition_lines()) + "\n").encode()
+        digest = hashlib.sha256(content).hexdigest()
+        document = self._topology_document()
+        topology_digest = hashlib.sha256(
+            json.dumps(document, sort_keys=True, separators=(",", ":")).encode()
+        ).hexdigest()
+        state = self._read_state()
+
+        topology_changed = state.topology_digest != topology_digest
+        generation = state.generation + 1 if topology_changed else state.generation
+        if topology_changed or not self._topology_file.exists():
+            atomic_write(
+                self._topology_file,
+                json.dumps({"generation": generation, **document}, separators=(",", ":")).encode(),
+            )
+        metrics_changed = state.digest != digest or not self._metrics_file.exists()
+        if metrics_changed:
+            atomic_write(self._metrics_file, content)
+        if metrics_changed or topology_changed:
+            state = _WriteState(digest, topology_digest, generation)
+            atomic_write(self._state_file, json.dumps(dataclasses.asdict(state)).encode())
+        return metrics_changed
+
+    def _topology_document(self) -> dict[str, Any]:
+        """Identity, bound relations and edges: `/topology.json` without the generation."""
+        return {
+            "app_name": self._charm.app.name,
+            "model_name": self._charm.model.name,
+            "relations": [
+                {"name": rel.name, "role": rel.role, "required": rel.required, "bound": bound}
+                for rel, bound in self._bound_relations()
+            ],
+            "edges": [
+                {"relation": name, "from_app": from_app, "to_app": to_app}
+                for name, from_app, to_app in self._edges()
+            ],
+        }
+
+    def _read_state(self) -> _WriteState:
+        try:
+            raw = json.loads(self._state_file.read_text())
+            return _WriteState(
+                digest=str(raw["digest"]),
+                topology_digest=str(raw.get("topology_digest", "")),
+                generation=int(raw["generation"]),
+            )
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return _WriteState(digest="", topology_digest="", generation=0)
 
     def _exposition_lines(self) -> Iterable[str]:
         """Yield every line written to the metrics file.
@@ -184,34 +288,56 @@ class CharmarrTopology(ops.Object):
         """
         yield from self._topology_lines()
 
-    def _topology_lines(self) -> Iterable[str]:
-        yield "# HELP charmarr_relation_bound Is the named relation currently bound (1) or unbound (0)"
-        yield "# TYPE charmarr_relation_bound gauge"
+    def _bound_relations(self) -> Iterable[tuple[CharmarrTopologyRelation, bool]]:
         for rel in self._relations:
-            bound = 1 if self._charm.model.relations.get(rel.name) else 0
-            labels = (
-                f'relation="{rel.name}",role="{rel.role}",required="{str(rel.required).lower()}"'
-            )
-            yield f"charmarr_relation_bound{{{labels}}} {bound}"
+            yield rel, bool(self._charm.model.relations.get(rel.name))
 
-        yield "# HELP charmarr_relation_edge One series per bound (relation, from_app, to_app) peer"
-        yield "# TYPE charmarr_relation_edge gauge"
+    def _edges(self) -> Iterable[tuple[str, str, str]]:
+        """Yield (relation, from_app, to_app) for every bound peer."""
         for rel in self._relations:
             for relation in self._charm.model.relations.get(rel.name, []):
                 if rel.role == "provides":
-                    from_app, to_app = relation.app.name, self._charm.app.name
+                    yield rel.name, relation.app.name, self._charm.app.name
                 else:
-                    from_app, to_app = self._charm.app.name, relation.app.name
-                labels = f'relation="{rel.name}",from_app="{from_app}",to_app="{to_app}"'
-                yield f"charmarr_relation_edge{{{labels}}} 1"
+                    yield rel.name, self._charm.app.name, relation.app.name
+
+    def _topology_lines(self) -> Iterable[str]:
+        yield "# HELP charmarr_relation_bound Is the named relation currently bound (1) or unbound (0)"
+        yield "# TYPE charmarr_relation_bound gauge"
+        for rel, bound in self._bound_relations():
+            labels = {
+                "relation": rel.name,
+                "role": rel.role,
+                "required": str(rel.required).lower(),
+            }
+            yield f"charmarr_relation_bound{render_labels(labels)} {int(bound)}"
+
+        yield "# HELP charmarr_relation_edge One series per bound (relation, from_app, to_app) peer"
+        yield "# TYPE charmarr_relation_edge gauge"
+        for name, from_app, to_app in self._edges():
+            labels = {"relation": name, "from_app": from_app, "to_app": to_app}
+            yield f"charmarr_relation_edge{render_labels(labels)} 1"
 
     def _ensure_server_running(self) -> None:
+        registry_changed = self._register_endpoint()
         pid = self._read_pid()
-        if pid is not None and self._pid_alive(pid):
-            return
+        if pid is not None:
+            cmdline = _read_cmdline(pid)
+            if cmdline is not None and cmdline[1:2] == [str(self.SERVER_SCRIPT)]:
+                if cmdline[-1] != _SERVER_SCRIPT_VERSION:
+                    logger.info("Replacing outdated charmarr-topology daemon (pid=%d)", pid)
+                    self._stop_daemon(pid)
+                elif not registry_changed:
+                    return
+                else:
+                    try:
+                        os.kill(pid, signal.SIGHUP)
+                        return
+                    except ProcessLookupError:
+                        logger.info("charmarr-topology daemon (pid=%d) exited, respawning", pid)
 
-        if not self.SERVER_SCRIPT.exists():
-            self.SERVER_SCRIPT.write_text(_TOPOLOGY_SERVER_SCRIPT)
+        if _read_bytes(self.SERVER_SCRIPT) != _TOPOLOGY_SERVER_SCRIPT.encode():
+            atomic_write(self.SERVER_SCRIPT, _TOPOLOGY_SERVER_SCRIPT.encode())
 
         # `start_new_session=True` is LOAD-BEARING: it places the child in a
         # new session/process group so it is detached from the charm hook's
@@ -220,16 +346,50 @@ class CharmarrTopology(ops.Object):
         # remove this when refactoring (e.g. to asyncio or contextmanager-
         # based patterns) without a replacement detach mechanism.
         proc = subprocess.Popen(
-            [sys.executable, str(self.SERVER_SCRIPT), str(self._port), str(self.METRICS_FILE)],
+            [
+                sys.executable,
+                str(self.SERVER_SCRIPT),
+                str(self.REGISTRY_FILE),
+                _SERVER_SCRIPT_VERSION,
+            ],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             stdin=subprocess.DEVNULL,
             start_new_session=True,
         )
         self.PID_FILE.write_text(str(proc.pid))
-        logger.info(
-            "Spawned charmarr-topology HTTP server on port %d (pid=%d)", self._port, proc.pid
-        )
+        logger.info("Spawned charmarr-topology HTTP server (pid=%d)", proc.pid)
+
+    def _register_endpoint(self) -> bool:
+        """Add this instance's port and files to the daemon registry.
+
+        Entries of ports that no instance of this dispatch serves are removed,
+        so the daemon closes them.
+
+        Returns:
+            True if the registry changed and a running daemon must reload it.
+        """
+        try:
+            registry = json.loads(self.REGISTRY_FILE.read_text())
+            if not isinstance(registry, dict):
+                registry = {}
+        except (FileNotFoundError, ValueError):
+            registry = {}
+
+        routes = {
+            "/metrics": str(self._metrics_file),
+            "/topology.json": str(self._topology_file),
+            "/debug/trace": str(Tracer.TRACE_FILE),
+        }
+        live = {str(port) for port in self._live_ports}
+        stale = [port for port in registry if port not in live]
+        if registry.get(str(self._port)) == routes and not stale:
+            return False
+        for port in stale:
+            del registry[port]
+        registry[str(self._port)] = routes
+        atomic_write(self.REGISTRY_FILE, json.dumps(registry, sort_keys=True).encode())
+        return True
 
     def _read_pid(self) -> int | None:
         try:
@@ -237,12 +397,15 @@ class CharmarrTopology(ops.Object):
         except (FileNotFoundError, ValueError):
             return None
 
-    def _pid_alive(self, pid: int) -> bool:
+    def _stop_daemon(self, pid: int) -> None:
+        """SIGTERM the daemon and wait for it to release its ports."""
         try:
-            os.kill(pid, 0)
-        except (OSError, ProcessLookupError):
-            return False
-        return True
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+        deadline = time.monotonic() + self.STOP_TIMEOUT
+        while _read_cmdline(pid) is not None and time.monotonic() < deadline:
+            time.sleep(0.05)
 
 
 class CharmarrChargedTopology(CharmarrTopology):
@@ -254,9 +417,11 @@ class CharmarrChargedTopology(CharmarrTopology):
     device mount state via `extra_exposition`, served on the same port (9099)
     as the topology metrics.
 
-    The callback returns an iterable of `MetricFamily` models. Each call is
-    wrapped: any exception is logged and topology metrics still ship for
-    that cycle - the extras are silently dropped.
+    The callback returns an iterable of `MetricFamily` models, or an
+    `ExpositionBuilder` for large per-item families that should not pay for
+    a pydantic object per sample. Each call is wrapped: any exception is
+    logged and topology metrics still ship for that cycle - the extras are
+    silently dropped.
 
     Example::
 
@@ -293,54 +458,243 @@ class CharmarrChargedTopology(CharmarrTopology):
     def _exposition_lines(self) -> Iterable[str]:
         yield from super()._exposition_lines()
         try:
-            families = list(self._extra_exposition())
+            extras = self._extra_exposition()
+            if isinstance(extras, ExpositionBuilder):
+                lines = extras.lines()
+            else:
+                builder = ExpositionBuilder()
+                for family in extras:
+                    builder.family(family)
+                lines = builder.lines()
         except Exception:
             logger.exception("extra_exposition callback raised; topology metrics still shipped")
             return
-        for family in families:
-            yield from _format_metric_family(family)
+        yield from lines
 
 
-def _format_metric_family(family: MetricFamily) -> Iterable[str]:
-    yield f"# HELP {family.name} {family.help}"
-    yield f"# TYPE {family.name} {family.type}"
-    for sample in family.samples:
-        if sample.labels:
-            label_str = ",".join(f'{k}="{v}"' for k, v in sample.labels.items())
-            yield f"{family.name}{{{label_str}}} {sample.value}"
-        else:
-            yield f"{family.name} {sample.value}"
+def _read_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
 
 
-_TOPOLOGY_SERVER_SCRIPT = '''#!/usr/bin/env python3
-"""Detached HTTP server serving a single Prometheus exposition file."""
+def _read_cmdline(pid: int) -> list[str] | None:
+    """Return the argv of a live process, or None if it is gone or a zombie.
+
+    Unlike `os.kill(pid, 0)`, this tells a recycled pid apart from our daemon.
+    """
+    try:
+        raw = Path(f"/proc/{pid}/cmdline").read_bytes()
+    except OSError:
+        return None
+    args = [arg.decode(errors="replace") for arg in raw.split(b"\0") if arg]
+    return args or None
+
+
+# The daemon is written out as a standalone script and run with the charm
+# container's interpreter, so it must stay stdlib-only. One daemon per
+# container serves every port listed in the registry file, opening and closing
+# listeners as the registry changes (re-read on SIGHUP and on a short poll).
+# It serves scrapes from an in-memory copy of each file that is reloaded only
+# when the file's stat changes, handles scrapers concurrently (a hung otelcol
+# must not block Prometheus), keeps HTTP/1.1 connections alive, answers
+# conditional requests with 304 and gzips the body when the scraper asks for it.
+_TOPOLOGY_SERVER_SCRIPT = r'''#!/usr/bin/env python3
+"""Detached supervisor serving every registered charmarr topology endpoint."""
+import gzip
+import hashlib
+import json
+import os
+import signal
 import sys
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+JSON_CONTENT_TYPE = "application/json"
+IDLE_TIMEOUT = 30
+REGISTRY_POLL_INTERVAL = 5
+_RETRY = object()
+
+
+def stat_stamp(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class CachedFile:
+    """In-memory copy of a file, reloaded when its (mtime, size, inode) changes."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._entry = self._build(b"")
+
+    @staticmethod
+    def _build(body):
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        return body, gzip.compress(body, mtime=0), f'"{digest}"', f'"{digest}-gz"'
+
+    def get(self):
+        stamp = stat_stamp(self.path)
+        with self._lock:
+            if stamp != self._stamp:
+                try:
+                    with open(self.path, "rb") as fh:
+                        body = fh.read()
+                except FileNotFoundError:
+                    body = b""
+                self._entry = self._build(body)
+                self._stamp = stamp
+            return self._entry
+
+
+def accepts_gzip(header):
+    for token in header.split(","):
+        coding, _, params = token.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
 
+def content_type_for(path):
+    return JSON_CONTENT_TYPE if path.endswith(".json") else METRICS_CONTENT_TYPE
 
-METRICS_FILE = sys.argv[2]
 
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = IDLE_TIMEOUT
+    routes = {}
 
-class _Handler(BaseHTTPRequestHandler):
     def log_message(self, _fmt, *_args):
         return
 
     def do_GET(self):
-        if self.path != "/metrics":
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def _serve(self, send_body):
+        cached = self.routes.get(self.path.split("?", 1)[0])
+        if cached is None:
             self.send_error(404)
             return
-        try:
-            with open(METRICS_FILE, "rb") as fh:
-                body = fh.read()
-        except FileNotFoundError:
-            body = b""
+        body, gzipped, etag, gz_etag = cached.get()
+        use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        current = gz_etag if use_gzip else etag
+        if_none_match = self.headers.get("If-None-Match", "")
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if "*" in tags or etag in tags or gz_etag in tags:
+            self.send_response(304)
+            self.send_header("ETag", current)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+        payload = gzipped if use_gzip else body
         self.send_response(200)
-        self.send_header("Content-Type", "text/plain; version=0.0.4")
-        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Content-Type", content_type_for(cached.path))
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", current)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Cache-Control", "no-cache")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
         self.end_headers()
-        self.wfile.write(body)
+        if send_body:
+            self.wfile.write(payload)
+
+
+def build_routes(routes, previous=None):
+    """Map URL path -> CachedFile, reusing entries whose file did not change."""
+    previous = previous or {}
+    built = {}
+    for url_path, file_path in routes.items():
+        cached = previous.get(url_path)
+        built[url_path] = cached if cached and cached.path == file_path else CachedFile(file_path)
+    return built
+
+
+def build_server(port, routes, host="0.0.0.0"):
+    handler = type("PortHandler", (Handler,), {"routes": build_routes(routes)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+class Supervisor:
+    """Keeps one listener per registry port, in step with the registry file."""
+
+    def __init__(self, registry_file, host="0.0.0.0"):
+        self._registry_file = registry_file
+        self._host = host
+        self._stamp = _RETRY
+        self._wake = threading.Event()
+        self.servers = {}
+
+    def reload(self):
+        stamp = stat_stamp(self._registry_file)
+        if stamp == self._stamp:
+            return
+        self._stamp = stamp
+        try:
+            with open(self._registry_file) as fh:
+                registry = {int(port): routes for port, routes in json.load(fh).items()}
+        except (FileNotFoundError, ValueError, AttributeError):
+            registry = {}
+
+        for port in set(self.servers) - set(registry):
+            server = self.servers.pop(port)
+            server.shutdown()
+            server.server_close()
+        for port, routes in registry.items():
+            server = self.servers.get(port)
+            if server is not None:
+                handler = server.RequestHandlerClass
+                handler.routes = build_routes(routes, handler.routes)
+                continue
+            try:
+                server = build_server(port, routes, self._host)
+            except OSError:
+                # Port still held (e.g. by a daemon being replaced): retry next tick.
+                self._stamp = _RETRY
+                continue
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.servers[port] = server
+
+    def wake(self, *_args):
+        self._wake.set()
+
+    def run(self):
+        signal.signal(signal.SIGHUP, self.wake)
+        while True:
+            self.reload()
+            self._wake.wait(REGISTRY_POLL_INTERVAL)
+            self._wake.clear()
+
+    def shutdown(self):
+        for server in self.servers.values():
+            server.shutdown()
+            server.server_close()
+        self.servers.clear()
 
 
 if __name__ == "__main__":
-    HTTPServer(("0.0.0.0", int(sys.argv[1])), _Handler).serve_forever()
+    # argv[2] is the script version hash; it is only there so the charm can
+    # tell from /proc/<pid>/cmdline whether this daemon runs current code.
+    Supervisor(sys.argv[1]).run()
 '''
+
+_SERVER_SCRIPT_VERSION = hashlib.sha256(_TOPOLOGY_SERVER_SCRIPT.encode()).hexdigest()[:16]
@@ -0,0 +1,253 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Dependency-free span tracing for charm hooks.
+
+`enable_tracing(charm)` opens a root span for the current dispatch. Code
+then records nested spans with the `span()` context manager or the
+`traced()` decorator; both are no-ops when tracing is not enabled. On
+framework commit the finished trace is appended to a bounded on-disk ring
+buffer (the last `max_traces` hooks), which `CharmarrTopology`'s daemon
+serves as JSON at `/debug/trace`.
+
+Auto-instrumented when tracing is on:
+
+- handlers registered through `observe_events` (one span per event)
+- `BaseArrApiClient` requests
+- `K8sResourceManager` calls (via the krm call-observer hook)
+- the library reconcilers decorated with `traced()`
+- Pebble exec/pull/push on containers wrapped with `instrument_container`
+
+Example::
+
+    class MyCharm(ops.CharmBase):
+        def __init__(self, framework):
+            super().__init__(framework)
+            enable_tracing(self)
+            observe_events(self, reconcilable_events_k8s, self._reconcile)
+
+        def _reconcile(self, _event):
+            with span("prowlarr.sync", indexers=len(indexers)):
+                ...
+"""
+
+import contextvars
+import dataclasses
+import functools
+import inspect
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, cast
+
+import ops
+
+from charmarr_lib.core._commit import CommitHook
+from charmarr_lib.core._files import atomic_write
+from charmarr_lib.krm import K8sCall, add_call_observer, remove_call_observer
+
+logger = logging.getLogger(__name__)
+
+AttributeValue = str | int | float | bool | None
+
+
+@dataclasses.dataclass
+class Span:
+    """One timed operation. Times are seconds; `start` is a Unix timestamp."""
+
+    name: str
+    start: float
+    duration: float | None = None
+    attributes: dict[str, AttributeValue] = dataclasses.field(default_factory=dict)
+    error: str | None = None
+    children: list["Span"] = dataclasses.field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the span tree; durations are reported in milliseconds."""
+        return {
+            "name": self.name,
+            "start": round(self.start, 6),
+            "duration_ms": None if self.duration is None else round(self.duration * 1e3, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class Tracer:
+    """Collects the span tree of one hook and persists it to the ring buffer."""
+
+    TRACE_FILE = Path("/tmp/charmarr-trace.json")
+    MAX_SPANS = 2000
+
+    def __init__(self, name: str, trace_file: Path | None = None, max_traces: int = 20) -> None:
+        """Open the root span.
+
+        Args:
+            name: Root span name, usually the dispatched hook.
+            trace_file: Ring buffer location. Defaults to TRACE_FILE, which the
+                topology daemon serves at `/debug/trace`.
+            max_traces: Number of hook traces kept in the ring buffer.
+        """
+        self.root = Span(name=name, start=time.time())
+        self._started = time.perf_counter()
+        self._trace_file = trace_file if trace_file is not None else self.TRACE_FILE
+        self._max_traces = max_traces
+        self._spans = 1
+        self.dropped = 0
+
+    def attach(self, parent: Span | None, child: Span) -> bool:
+        """Attach `child` under `parent` (or the root), respecting MAX_SPANS."""
+        if self._spans >= self.MAX_SPANS:
+            self.dropped += 1
+            return False
+        self._spans += 1
+        (parent or self.root).children.append(child)
+        return True
+
+    def record_k8s_call(self, call: K8sCall) -> None:
+        """Add a completed K8sResourceManager call as a child span."""
+        child = Span(
+            name=f"k8s.{call.verb}",
+            start=time.time() - call.duration,
+            duration=call.duration,
+            attributes={"kind": call.kind, "attempts": call.attempts},
+            error=call.error,
+        )
+        self.attach(_current_span.get(), child)
+
+    def finish(self) -> None:
+        """Close the root span and append the trace to the ring buffer."""
+        self.root.duration = time.perf_counter() - self._started
+        if self.dropped:
+            self.root.attributes["dropped_spans"] = self.dropped
+        traces = read_traces(self._trace_file)
+        traces.append(self.root.to_dict())
+        payload = json.dumps({"traces": traces[-self._max_traces :]}, separators=(",", ":"))
+        try:
+            atomic_write(self._trace_file, payload.encode())
+        except OSError as e:
+            logger.warning("Could not persist hook trace: %s", e)
+
+
+def read_traces(trace_file: Path | None = None) -> list[dict[str, Any]]:
+    """Return the persisted traces, oldest first. Missing or corrupt files read as empty."""
+    if trace_file is None:
+        trace_file = Tracer.TRACE_FILE
+    try:
+        traces = json.loads(trace_file.read_text())["traces"]
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        return []
+    return traces if isinstance(traces, list) else []
+
+
+_tracer: Tracer | None = None
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar(
+    "charmarr_current_span", default=None
+)
+
+
+def get_tracer() -> Tracer | None:
+    """Return the active tracer, or None when tracing is not enabled."""
+    return _tracer
+
+
+@contextmanager
+def span(name: str, **attributes: AttributeValue) -> Iterator[Span | None]:
+    """Record a nested span around the body.
+
+    Yields the span (so callers can add attributes) or None when tracing is
+    off. Exceptions are recorded on the span and re-raised.
+    """
+    tracer = _tracer
+    if tracer is None:
+        yield None
+        return
+    current = Span(name=name, start=time.time(), attributes=dict(attributes))
+    attached = tracer.attach(_current_span.get(), current)
+    token = _current_span.set(current) if attached else None
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration = time.perf_counter() - started
+        if token is not None:
+            _current_span.reset(token)
+
+
+def traced[F: Callable[..., Any]](name: str | None = None) -> Callable[[F], F]:
+    """Decorate a function (or coroutine function) so each call is recorded as a span.
+
+    Args:
+        name: Span name. Defaults to the function's qualified name.
+    """
+
+    def decorator(fn: F) -> F:
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _tracer is None:
+                    return await fn(*args, **kwargs)
+                with span(span_name):
+                    return await fn(*args, **kwargs)
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with span(span_name):
+                return fn(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def enable_tracing(
+    charm: ops.CharmBase, *, trace_file: Path | None = None, max_traces: int = 20
+) -> Tracer:
+    """Start tracing the current dispatch; the trace is persisted on commit.
+
+    Call from the charm's `__init__` BEFORE `observe_events` so reconcile
+    handlers get their own spans.
+
+    Args:
+        charm: The charm instance.
+        trace_file: Ring buffer location. Defaults to Tracer.TRACE_FILE.
+        max_traces: Number of hook traces kept.
+
+    Returns:
+        The active Tracer.
+    """
+    global _tracer
+    disable_tracing()
+    dispatch = os.environ.get("JUJU_DISPATCH_PATH", "").rpartition("/")[2]
+    _tracer = Tracer(
+        dispatch or "dispatch",
+        trace_file=trace_file,
+        max_traces=max_traces,
+    )
+    _tracer.root.attributes["unit"] = charm.unit.name
+    add_call_observer(_tracer.record_k8s_call)
+    CommitHook(charm, "charmarr-tracing", _tracer.finish)
+    return _tracer
+
+
+def disable_tracing() -> None:
+    """Stop tracing. Spans opened afterwards are no-ops."""
+    global _tracer
+    if _tracer is not None:
+        remove_call_observer(_tracer.record_k8s_call)
+    _tracer = None
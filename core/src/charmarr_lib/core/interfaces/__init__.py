@@ -3,11 +3,16 @@
 
 """Juju relation interface implementations for Charmarr."""
 
+from charmarr_lib.core.interfaces._base import ChangeKind, RelationDataChangedEvent
 from charmarr_lib.core.interfaces._crowsnest import (
     CrowsnestChangedEvent,
     CrowsnestProvider,
     CrowsnestProviderData,
     CrowsnestRequirer,
+    CrowsnestTopologyClient,
+    TopologyDocument,
+    TopologyEdge,
+    TopologyRelation,
 )
 from charmarr_lib.core.interfaces._download_client import (
     DownloadClientChangedEvent,
@@ -50,12 +55,15 @@ from charmarr_lib.core.interfaces._media_storage import (
     MediaStorageRequirer,
     MediaStorageRequirerData,
 )
+from charmarr_lib.core.interfaces._snapshot import RelationSnapshot, SnapshotStats
 
 __all__ = [
+    "ChangeKind",
     "CrowsnestChangedEvent",
     "CrowsnestProvider",
     "CrowsnestProviderData",
     "CrowsnestRequirer",
+    "CrowsnestTopologyClient",
     "DownloadClientChangedEvent",
     "DownloadClientProvider",
     "DownloadClientProviderData",
@@ -85,4 +93,10 @@ __all__ = [
     "MediaStorageRequirer",
     "MediaStorageRequirerData",
     "QualityProfile",
+    "RelationDataChangedEvent",
+    "RelationSnapshot",
+    "SnapshotStats",
+    "TopologyDocument",
+    "TopologyEdge",
+    "TopologyRelation",
 ]
@@ -3,11 +3,27 @@
 
 """Base classes for Juju relation interfaces."""
 
+import hashlib
+import json
 from abc import abstractmethod
-from typing import Any
+from typing import Any, Literal
 
-from ops import EventBase, Object
-from pydantic import BaseModel, ValidationError
+from ops import EventBase, Object, Relation, RelationBrokenEvent, RelationEvent, StoredState
+from pydantic import BaseModel
+
+from charmarr_lib.core.interfaces._snapshot import RelationSnapshot
+
+ChangeKind = Literal["added", "updated", "unchanged", "removed"]
+
+
+def canonical_json(data: BaseModel) -> str:
+    """Serialize a model deterministically (sorted keys, compact separators).
+
+    Identical data always yields identical bytes, so publishing can skip
+    writes (and the relation-changed events they cause on every remote unit)
+    when nothing changed.
+    """
+    return json.dumps(data.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
 
 
 class RelationInterfaceBase[TData: BaseModel, TRemote: BaseModel](Object):
@@ -18,86 +34,190 @@ class RelationInterfaceBase[TData: BaseModel, TRemote: BaseModel](Object):
         self._charm = charm
         self._relation_name = relation_name
 
-    def _publish_to_all_relations(self, data: TData) -> None:
-        """Publish data to all relations on this endpoint."""
+    def _publish_to_all_relations(self, data: TData) -> int:
+        """Publish data to all relations on this endpoint.
+
+        Returns:
+            Number of relations whose databag was actually written.
+        """
         if not self._charm.unit.is_leader():
-            return
+            return 0
+
+        payload = canonical_json(data)
+        relations = self._charm.model.relations.get(self._relation_name, [])
+        return sum(self._write_config(relation, payload) for relation in relations)
 
-        for relation in self._charm.model.relations.get(self._relation_name, []):
-            relation.data[self._charm.app]["config"] = data.model_dump_json()
+    def _publish_to_single_relation(self, data: TData) -> int:
+        """Publish data to the single relation on this endpoint.
 
-    def _publish_to_single_relation(self, data: TData) -> None:
-        """Publish data to the single relation on this endpoint."""
+        Returns:
+            1 if the databag was written, 0 if unchanged or not related.
+        """
         if not self._charm.unit.is_leader():
-            return
+            return 0
 
         relation = self._charm.model.get_relation(self._relation_name)
-        if relation:
-            relation.data[self._charm.app]["config"] = data.model_dump_json()
+        if not relation:
+            return 0
+        return int(self._write_config(relation, canonical_json(data)))
+
+    def _write_config(self, relation: Relation, payload: str) -> bool:
+        """Write `payload` as this app's `config` unless it is already there."""
+        databag = relation.data[self._charm.app]
+        if databag.get("config") == payload:
+            return False
+        databag["config"] = payload
+        return True
 
     @abstractmethod
     def _get_remote_data_model(self) -> type[TRemote]:
         """Return the Pydantic model class for parsing remote data."""
         ...
 
+    @property
+    def _snapshot(self) -> RelationSnapshot:
+        """Relation data and parsed models shared by all interfaces this dispatch."""
+        return RelationSnapshot.for_charm(self._charm)
+
     def _get_all_remote_app_data(self) -> list[TRemote]:
         """Get parsed data from all remote applications on this endpoint."""
         model_cls = self._get_remote_data_model()
+        snapshot = self._snapshot
         results: list[TRemote] = []
-        for relation in self._charm.model.relations.get(self._relation_name, []):
-            try:
-                app_data = relation.data[relation.app]
-                if app_data and "config" in app_data:
-                    results.append(model_cls.model_validate_json(app_data["config"]))
-            except (ValidationError, KeyError):
-                continue
+        for relation in snapshot.relations(self._relation_name):
+            parsed = snapshot.remote_config(relation, model_cls)
+            if parsed is not None:
+                results.append(parsed)
         return results
 
     def _get_all_provider_data(self) -> list[TRemote]:
         """Get parsed data from all provider applications (for requirers with multiple relations)."""
-        model_cls = self._get_remote_data_model()
-        results: list[TRemote] = []
-        for relation in self._charm.model.relations.get(self._relation_name, []):
-            try:
-                provider_app = relation.app
-                if provider_app:
-                    app_data = relation.data[provider_app]
-                    if app_data and "config" in app_data:
-                        results.append(model_cls.model_validate_json(app_data["config"]))
-            except (ValidationError, KeyError):
-                continue
-        return results
+        return self._get_all_remote_app_data()
 
     def _get_single_provider_data(self) -> TRemote | None:
         """Get parsed data from a single provider (for single-relation requirers)."""
-        model_cls = self._get_remote_data_model()
         relation = self._charm.model.get_relation(self._relation_name)
         if not relation:
             return None
-
-        try:
-            provider_app = relation.app
-            if provider_app:
-                app_data = relation.data[provider_app]
-                if app_data and "config" in app_data:
-                    return model_cls.model_validate_json(app_data["config"])
-        except (ValidationError, KeyError):
-            pass
-        return None
-
-
-class EventObservingMixin:
-    """Mixin for interfaces that observe relation events and emit custom events."""
+        return self._snapshot.remote_config(relation, self._get_remote_data_model())
+
+    def _has_valid_published_data(self, model_cls: type[TData]) -> bool:
+        """Check that this app published valid data on the first relation."""
+        relations = self._snapshot.relations(self._relation_name)
+        if not relations:
+            return False
+        return self._snapshot.local_config(relations[0], model_cls) is not None
+
+
+class RelationDataChangedEvent(EventBase):
+    """Base for the interfaces' `changed` events, describing what changed.
+
+    Attributes:
+        relation_id: ID of the relation that changed, or None when emitted
+            without a payload.
+        app_name: Remote application name, if known.
+        change: "added" (first data seen for this relation), "updated",
+            "unchanged" (databag event without a change in the parsed remote
+            data) or "removed" (relation broken).
+        before: Fingerprint of the parsed remote data before the change
+            ("" for no valid data, None if never seen).
+        after: Fingerprint after the change (None when removed).
+    """
+
+    def __init__(
+        self,
+        handle: Any,
+        relation_id: int | None = None,
+        app_name: str | None = None,
+        change: ChangeKind = "updated",
+        before: str | None = None,
+        after: str | None = None,
+    ) -> None:
+        super().__init__(handle)
+        self.relation_id = relation_id
+        self.app_name = app_name
+        self.change: ChangeKind = change
+        self.before = before
+        self.after = after
+
+    @property
+    def data_changed(self) -> bool:
+        """Whether the parsed remote data differs from before."""
+        return self.change != "unchanged"
+
+    def snapshot(self) -> dict[str, Any]:
+        """Save the payload so deferred events keep it."""
+        return {
+            "relation_id": self.relation_id,
+            "app_name": self.app_name,
+            "change": self.change,
+            "before": self.before,
+            "after": self.after,
+        }
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Restore the payload of a deferred event.
+
+        Events deferred by an older library version have an empty snapshot
+        and restore with the defaults.
+        """
+        super().restore(snapshot)
+        self.relation_id = snapshot.get("relation_id")
+        self.app_name = snapshot.get("app_name")
+        self.change = snapshot.get("change", "updated")
+        self.before = snapshot.get("before")
+        self.after = snapshot.get("after")
+
+
+class EventObservingMixin(Object):
+    """Mixin for interfaces that observe relation events and emit custom events.
+
+    The emitted `changed` event is a `RelationDataChangedEvent` carrying the
+    relation, remote app and a fingerprint of the parsed remote data before
+    and after the change. Fingerprints persist in StoredState between hooks.
+    """
 
     _charm: Any
     _relation_name: str
+    _remote_fingerprints = StoredState()
 
     def _setup_event_observation(self) -> None:
         """Set up observation of relation_changed and relation_broken events."""
+        self._remote_fingerprints.set_default(by_relation={})
         events = self._charm.on[self._relation_name]
-        self.framework.observe(events.relation_changed, self._emit_changed)  # type: ignore[attr-defined]
-        self.framework.observe(events.relation_broken, self._emit_changed)  # type: ignore[attr-defined]
-
-    def _emit_changed(self, event: EventBase) -> None:
-        """Emit the custom 'changed' event."""
-        self.on.changed.emit()  # type: ignore[attr-defined]
+        self.framework.observe(events.relation_changed, self._emit_changed)
+        self.framework.observe(events.relation_broken, self._emit_changed)
+
+    def _emit_changed(self, event: RelationEvent) -> None:
+        """Emit the custom 'changed' event with what changed."""
+        relation = event.relation
+        fingerprints = self._remote_fingerprints.by_relation
+        key = str(relation.id)
+        before: str | None = fingerprints.get(key)
+        after: str | None
+        change: ChangeKind
+        if isinstance(event, RelationBrokenEvent):
+            after, change = None, "removed"
+            fingerprints.pop(key, None)
+        else:
+            self._snapshot.invalidate(relation)  # type: ignore[attr-defined]
+            after = self._fingerprint_remote_data(relation)
+            change = "added" if before is None else "updated"
+            if before == after:
+                change = "unchanged"
+            fingerprints[key] = after
+        self.on.changed.emit(  # type: ignore[attr-defined]
+            relation_id=relation.id,
+            app_name=relation.app.name if relation.app else None,
+            change=change,
+            before=before,
+            after=after,
+        )
+
+    def _fingerprint_remote_data(self, relation: Relation) -> str:
+        """Hash the parsed remote app data, or "" if absent or invalid."""
+        model_cls = self._get_remote_data_model()  # type: ignore[attr-defined]
+        parsed = self._snapshot.remote_config(relation, model_cls)  # type: ignore[attr-defined]
+        if parsed is None:
+            return ""
+        return hashlib.sha256(parsed.model_dump_json().encode()).hexdigest()[:16]
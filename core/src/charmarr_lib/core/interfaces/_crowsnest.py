@@ -13,18 +13,30 @@ For v1 the provider side carries one field (`topology_url`). The interface
 is intentionally scoped broadly (`crowsnest`, not `topology_poll`) so
 future cross-cutting needs - action dispatch, config queries, SLI feedback
 - can extend the payload without a new relation.
+
+Alongside `/metrics`, every provider's topology daemon serves a compact
+`/topology.json` document carrying a generation counter. `CrowsnestTopologyClient`
+polls those documents with `If-None-Match`, so an unchanged provider costs a
+bodyless 304 and only providers whose topology moved are downloaded and parsed.
 """
 
+import logging
+from collections.abc import Iterable
 from typing import Any
+from urllib.parse import urljoin
 
-from ops import EventBase, EventSource, ObjectEvents
-from pydantic import BaseModel, Field
+import httpx
+from ops import EventSource, ObjectEvents
+from pydantic import BaseModel, Field, ValidationError
 
 from charmarr_lib.core.interfaces._base import (
     EventObservingMixin,
+    RelationDataChangedEvent,
     RelationInterfaceBase,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class CrowsnestProviderData(BaseModel):
     """Data published by a charmarr charm to crowsnest."""
@@ -55,7 +67,7 @@ class CrowsnestProviderData(BaseModel):
     )
 
 
-class CrowsnestChangedEvent(EventBase):
+class CrowsnestChangedEvent(RelationDataChangedEvent):
     """Event emitted when the crowsnest relation state changes."""
 
 
@@ -68,17 +80,18 @@ class CrowsnestProvider(RelationInterfaceBase[CrowsnestProviderData, BaseModel])
     def _get_remote_data_model(self) -> type[BaseModel]:
         return BaseModel
 
-    def publish_data(self, data: CrowsnestProviderData) -> None:
+    def publish_data(self, data: CrowsnestProviderData) -> int:
         """Publish provider data to every related crowsnest unit.
 
         `app_name` and `model_name` are auto-populated from the charm if the
         caller left them blank, so providers only need to supply `topology_url`.
+        Returns the number of relation databags actually written.
         """
         if not data.app_name:
             data = data.model_copy(update={"app_name": self._charm.app.name})
         if not data.model_name:
             data = data.model_copy(update={"model_name": self._charm.model.name})
-        self._publish_to_all_relations(data)
+        return self._publish_to_all_relations(data)
 
 
 class CrowsnestRequirerEvents(ObjectEvents):
@@ -108,3 +121,148 @@ class CrowsnestRequirer(
     def is_ready(self) -> bool:
         """At least one provider is wired and publishing."""
         return len(self.get_providers()) > 0
+
+
+class TopologyRelation(BaseModel):
+    """One declared relation in a provider's topology document."""
+
+    name: str
+    role: str
+    required: bool
+    bound: bool
+
+
+class TopologyEdge(BaseModel):
+    """One bound peer in a provider's topology document."""
+
+    relation: str
+    from_app: str
+    to_app: str
+
+
+class TopologyDocument(BaseModel):
+    """The `/topology.json` document served by a provider's topology daemon."""
+
+    generation: int
+    app_name: str
+    model_name: str
+    relations: list[TopologyRelation] = Field(default_factory=list)
+    edges: list[TopologyEdge] = Field(default_factory=list)
+
+
+ProviderKey = tuple[str, str]
+
+
+def provider_key(provider: CrowsnestProviderData) -> ProviderKey:
+    """Stable `(model_name, app_name)` key for a provider.
+
+    Providers from before `app_name`/`model_name` were published fall back to
+    their topology URL so they still get a unique key.
+    """
+    return provider.model_name, provider.app_name or provider.topology_url
+
+
+def topology_document_url(topology_url: str) -> str:
+    """Derive the `/topology.json` URL from a provider's `/metrics` topology URL."""
+    return urljoin(topology_url, "/topology.json")
+
+
+class CrowsnestTopologyClient:
+    """Conditional poller for provider `/topology.json` documents.
+
+    Remembers the ETag and generation last seen for every provider and sends
+    `If-None-Match` on the next poll. Providers answering 304, or returning a
+    document identical to the one already held, are reported as unchanged; the caller
+    only has to rebuild graph state for what `fetch_changed()` returns.
+
+    Example::
+
+        client = CrowsnestTopologyClient()
+        changed = client.fetch_changed(self._crowsnest.get_providers())
+        if changed:
+            self._rebuild_graph(client.documents)
+    """
+
+    def __init__(self, http_client: httpx.Client | None = None, timeout: float = 5.0) -> None:
+        """Initialize the client.
+
+        Args:
+            http_client: HTTP client to poll with. If None, one is created lazily.
+            timeout: Per-request timeout in seconds for the lazily created client.
+        """
+        self._http_client = http_client
+        self._timeout = timeout
+        self._etags: dict[ProviderKey, str] = {}
+        self._documents: dict[ProviderKey, TopologyDocument] = {}
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """Get or create the HTTP client."""
+        if self._http_client is None:
+            self._http_client = httpx.Client(timeout=self._timeout)
+        return self._http_client
+
+    @property
+    def documents(self) -> dict[ProviderKey, TopologyDocument]:
+        """Last known document for every provider seen in the latest poll."""
+        return dict(self._documents)
+
+    def generation(self, key: ProviderKey) -> int | None:
+        """Last seen generation for a provider, or None if never fetched."""
+        document = self._documents.get(key)
+        return document.generation if document else None
+
+    def fetch_changed(
+        self, providers: Iterable[CrowsnestProviderData]
+    ) -> dict[ProviderKey, TopologyDocument]:
+        """Poll every provider and return only the documents that changed.
+
+        Providers that fail to answer keep their last known document. Providers
+        no longer in `providers` are forgotten.
+
+        Args:
+            providers: Current providers, usually `CrowsnestRequirer.get_providers()`.
+
+        Returns:
+            Mapping of provider key to its new document, for changed providers only.
+        """
+        changed: dict[ProviderKey, TopologyDocument] = {}
+        seen: set[ProviderKey] = set()
+        for provider in providers:
+            key = provider_key(provider)
+            seen.add(key)
+            document = self._fetch(key, topology_document_url(provider.topology_url))
+            if document is not None:
+                changed[key] = document
+
+        for key in set(self._documents) - seen:
+            self._documents.pop(key, None)
+            self._etags.pop(key, None)
+        return changed
+
+    def _fetch(self, key: ProviderKey, url: str) -> TopologyDocument | None:
+        headers = {"If-None-Match": self._etags[key]} if key in self._etags else {}
+        try:
+            response = self.http_client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            logger.debug("Topology poll of %s failed: %s", url, e)
+            return None
+
+        if response.status_code == 304:
+            return None
+        if response.status_code != 200:
+            logger.debug("Topology poll of %s returned %d", url, response.status_code)
+            return None
+
+        try:
+            document = TopologyDocument.model_validate_json(response.content)
+        except ValidationError as e:
+            logger.debug("Invalid topology document from %s: %s", url, e)
+            return None
+
+        if etag := response.headers.get("ETag"):
+            self._etags[key] = etag
+        if self._documents.get(key) == document:
+            return None
+        self._documents[key] = document
+        return document
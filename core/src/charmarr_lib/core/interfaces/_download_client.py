@@ -5,12 +5,13 @@
 
 from typing import Any
 
-from ops import EventBase, EventSource, ObjectEvents
-from pydantic import BaseModel, ValidationError, model_validator
+from ops import EventSource, ObjectEvents
+from pydantic import BaseModel, model_validator
 
 from charmarr_lib.core.enums import DownloadClient, DownloadClientType, MediaManager
 from charmarr_lib.core.interfaces._base import (
     EventObservingMixin,
+    RelationDataChangedEvent,
     RelationInterfaceBase,
 )
 
@@ -52,7 +53,7 @@ class DownloadClientRequirerData(BaseModel):
     instance_name: str
 
 
-class DownloadClientChangedEvent(EventBase):
+class DownloadClientChangedEvent(RelationDataChangedEvent):
     """Event emitted when download-client relation state changes."""
 
     pass
@@ -69,9 +70,9 @@ class DownloadClientProvider(
     def _get_remote_data_model(self) -> type[DownloadClientRequirerData]:
         return DownloadClientRequirerData
 
-    def publish_data(self, data: DownloadClientProviderData) -> None:
-        """Publish provider data to all relations."""
-        self._publish_to_all_relations(data)
+    def publish_data(self, data: DownloadClientProviderData) -> int:
+        """Publish provider data to all relations; returns the number of databags written."""
+        return self._publish_to_all_relations(data)
 
     def get_requirers(self) -> list[DownloadClientRequirerData]:
         """Get all connected requirers with valid data."""
@@ -99,9 +100,9 @@ class DownloadClientRequirer(
     def _get_remote_data_model(self) -> type[DownloadClientProviderData]:
         return DownloadClientProviderData
 
-    def publish_data(self, data: DownloadClientRequirerData) -> None:
-        """Publish requirer data to all relations."""
-        self._publish_to_all_relations(data)
+    def publish_data(self, data: DownloadClientRequirerData) -> int:
+        """Publish requirer data to all relations; returns the number of databags written."""
+        return self._publish_to_all_relations(data)
 
     def get_providers(self) -> list[DownloadClientProviderData]:
         """Get all connected download clients with valid data."""
@@ -109,17 +110,6 @@ class DownloadClientRequirer(
 
     def is_ready(self) -> bool:
         """Check if requirer has published data and has >=1 valid provider."""
-        relations = self._charm.model.relations.get(self._relation_name, [])
-        if not relations:
+        if not self._has_valid_published_data(DownloadClientRequirerData):
             return False
-
-        try:
-            first_relation = relations[0]
-            published_data = first_relation.data[self._charm.app]
-            if not published_data or "config" not in published_data:
-                return False
-            DownloadClientRequirerData.model_validate_json(published_data["config"])
-        except (ValidationError, KeyError):
-            return False
-
         return len(self.get_providers()) > 0
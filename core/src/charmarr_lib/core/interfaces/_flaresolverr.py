@@ -5,11 +5,12 @@
 
 from typing import Any
 
-from ops import EventBase, EventSource, ObjectEvents
+from ops import EventSource, ObjectEvents
 from pydantic import BaseModel, Field
 
 from charmarr_lib.core.interfaces._base import (
     EventObservingMixin,
+    RelationDataChangedEvent,
     RelationInterfaceBase,
 )
 
@@ -20,7 +21,7 @@ class FlareSolverrProviderData(BaseModel):
     url: str = Field(description="FlareSolverr API URL (e.g., http://host:8191)")
 
 
-class FlareSolverrChangedEvent(EventBase):
+class FlareSolverrChangedEvent(RelationDataChangedEvent):
     """Event emitted when flaresolverr relation state changes."""
 
     pass
@@ -35,9 +36,9 @@ class FlareSolverrProvider(RelationInterfaceBase[FlareSolverrProviderData, BaseM
     def _get_remote_data_model(self) -> type[BaseModel]:
         return BaseModel
 
-    def publish_data(self, data: FlareSolverrProviderData) -> None:
-        """Publish provider data to all relations."""
-        self._publish_to_all_relations(data)
+    def publish_data(self, data: FlareSolverrProviderData) -> int:
+        """Publish provider data to all relations; returns the number of databags written."""
+        return self._publish_to_all_relations(data)
 
 
 class FlareSolverrRequirerEvents(ObjectEvents):
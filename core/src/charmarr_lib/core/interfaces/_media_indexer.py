@@ -5,12 +5,13 @@
 
 from typing import Any
 
-from ops import EventBase, EventSource, ObjectEvents
-from pydantic import BaseModel, ValidationError
+from ops import EventSource, ObjectEvents
+from pydantic import BaseModel
 
 from charmarr_lib.core.enums import MediaIndexer, MediaManager
 from charmarr_lib.core.interfaces._base import (
     EventObservingMixin,
+    RelationDataChangedEvent,
     RelationInterfaceBase,
 )
 
@@ -34,7 +35,7 @@ class MediaIndexerRequirerData(BaseModel):
     base_path: str | None = None
 
 
-class MediaIndexerChangedEvent(EventBase):
+class MediaIndexerChangedEvent(RelationDataChangedEvent):
     """Event emitted when media-indexer relation state changes."""
 
     pass
@@ -60,9 +61,9 @@ class MediaIndexerProvider(
     def _get_remote_data_model(self) -> type[MediaIndexerRequirerData]:
         return MediaIndexerRequirerData
 
-    def publish_data(self, data: MediaIndexerProviderData) -> None:
-        """Publish provider data to all relations."""
-        self._publish_to_all_relations(data)
+    def publish_data(self, data: MediaIndexerProviderData) -> int:
+        """Publish provider data to all relations; returns the number of databags written."""
+        return self._publish_to_all_relations(data)
 
     def get_requirers(self) -> list[MediaIndexerRequirerData]:
         """Get all connected requirers with valid data."""
@@ -70,19 +71,8 @@ class MediaIndexerProvider(
 
     def is_ready(self) -> bool:
         """Check if provider has published data and has >=1 valid requirer."""
-        relations = self._charm.model.relations.get(self._relation_name, [])
-        if not relations:
+        if not self._has_valid_published_data(MediaIndexerProviderData):
             return False
-
-        try:
-            first_relation = relations[0]
-            published_data = first_relation.data[self._charm.app]
-            if not published_data or "config" not in published_data:
-                return False
-            MediaIndexerProviderData.model_validate_json(published_data["config"])
-        except (ValidationError, KeyError):
-            return False
-
         return len(self.get_requirers()) > 0
 
 
@@ -106,9 +96,9 @@ class MediaIndexerRequirer(
     def _get_remote_data_model(self) -> type[MediaIndexerProviderData]:
         return MediaIndexerProviderData
 
-    def publish_data(self, data: MediaIndexerRequirerData) -> None:
-        """Publish requirer data to relation."""
-        self._publish_to_single_relation(data)
+    def publish_data(self, data: MediaIndexerRequirerData) -> int:
+        """Publish requirer data to relation; returns the number of databags written."""
+        return self._publish_to_single_relation(data)
 
     def get_provider_data(self) -> MediaIndexerProviderData | None:
         """Get provider data if available."""
@@ -120,12 +110,7 @@ class MediaIndexerRequirer(
         if not relation:
             return False
 
-        try:
-            published_data = relation.data[self._charm.app]
-            if not published_data or "config" not in published_data:
-                return False
-            MediaIndexerRequirerData.model_validate_json(published_data["config"])
-        except (ValidationError, KeyError):
+        if self._snapshot.local_config(relation, MediaIndexerRequirerData) is None:
             return False
 
         return self.get_provider_data() is not None
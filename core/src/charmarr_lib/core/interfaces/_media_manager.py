@@ -5,12 +5,13 @@
 
 from typing import Any
 
-from ops import EventBase, EventSource, ObjectEvents
-from pydantic import BaseModel, Field
+from ops import EventSource, ObjectEvents
+from pydantic import BaseModel, Field, field_validator
 
 from charmarr_lib.core.enums import ContentVariant, MediaManager, RequestManager
 from charmarr_lib.core.interfaces._base import (
     EventObservingMixin,
+    RelationDataChangedEvent,
     RelationInterfaceBase,
 )
 
@@ -44,6 +45,12 @@ class MediaManagerProviderData(BaseModel):
         description="Content variant: standard (catch-all), 4k, or anime",
     )
 
+    @field_validator("quality_profiles")
+    @classmethod
+    def sort_quality_profiles(cls, profiles: list[QualityProfile]) -> list[QualityProfile]:
+        """Order profiles by ID so data rebuilt from API responses serializes identically."""
+        return sorted(profiles, key=lambda p: p.id)
+
 
 class MediaManagerRequirerData(BaseModel):
     """Data published by request manager charms (Overseerr, Jellyseerr)."""
@@ -52,7 +59,7 @@ class MediaManagerRequirerData(BaseModel):
     instance_name: str = Field(description="Juju application name")
 
 
-class MediaManagerChangedEvent(EventBase):
+class MediaManagerChangedEvent(RelationDataChangedEvent):
     """Event emitted when media-manager relation state changes."""
 
     pass
@@ -69,9 +76,9 @@ class MediaManagerProvider(
     def _get_remote_data_model(self) -> type[MediaManagerRequirerData]:
         return MediaManagerRequirerData
 
-    def publish_data(self, data: MediaManagerProviderData) -> None:
-        """Publish provider data to all relations."""
-        self._publish_to_all_relations(data)
+    def publish_data(self, data: MediaManagerProviderData) -> int:
+        """Publish provider data to all relations; returns the number of databags written."""
+        return self._publish_to_all_relations(data)
 
     def get_requirers(self) -> list[MediaManagerRequirerData]:
         """Get data from all connected requirer applications."""
@@ -98,9 +105,9 @@ class MediaManagerRequirer(
     def _get_remote_data_model(self) -> type[MediaManagerProviderData]:
         return MediaManagerProviderData
 
-    def publish_data(self, data: MediaManagerRequirerData) -> None:
-        """Publish requirer data to all relations."""
-        self._publish_to_all_relations(data)
+    def publish_data(self, data: MediaManagerRequirerData) -> int:
+        """Publish requirer data to all relations; returns the number of databags written."""
+        return self._publish_to_all_relations(data)
 
     def get_providers(self) -> list[MediaManagerProviderData]:
         """Get data from all connected provider applications."""
@@ -5,12 +5,13 @@
 
 from typing import Any
 
-from ops import EventBase, EventSource, ObjectEvents
+from ops import EventSource, ObjectEvents
 from pydantic import BaseModel, Field
 
 from charmarr_lib.core.enums import MediaServer
 from charmarr_lib.core.interfaces._base import (
     EventObservingMixin,
+    RelationDataChangedEvent,
     RelationInterfaceBase,
 )
 
@@ -34,7 +35,7 @@ class MediaServerProviderData(BaseModel):
     )
 
 
-class MediaServerChangedEvent(EventBase):
+class MediaServerChangedEvent(RelationDataChangedEvent):
     """Event emitted when media-server relation state changes."""
 
     pass
@@ -49,9 +50,9 @@ class MediaServerProvider(RelationInterfaceBase[MediaServerProviderData, BaseMod
     def _get_remote_data_model(self) -> type[BaseModel]:
         return BaseModel
 
-    def publish_data(self, data: MediaServerProviderData) -> None:
-        """Publish provider data to all relations."""
-        self._publish_to_all_relations(data)
+    def publish_data(self, data: MediaServerProviderData) -> int:
+        """Publish provider data to all relations; returns the number of databags written."""
+        return self._publish_to_all_relations(data)
 
 
 class MediaServerRequirerEvents(ObjectEvents):
@@ -5,11 +5,12 @@
 
 from typing import Any
 
-from ops import EventBase, EventSource, ObjectEvents
+from ops import EventSource, ObjectEvents
 from pydantic import BaseModel, Field
 
 from charmarr_lib.core.interfaces._base import (
     EventObservingMixin,
+    RelationDataChangedEvent,
     RelationInterfaceBase,
 )
 
@@ -31,7 +32,7 @@ class MediaStorageRequirerData(BaseModel):
     instance_name: str = Field(description="Juju application name")
 
 
-class MediaStorageChangedEvent(EventBase):
+class MediaStorageChangedEvent(RelationDataChangedEvent):
     """Event emitted when media-storage relation state changes."""
 
     pass
@@ -48,9 +49,9 @@ class MediaStorageProvider(
     def _get_remote_data_model(self) -> type[MediaStorageRequirerData]:
         return MediaStorageRequirerData
 
-    def publish_data(self, data: MediaStorageProviderData) -> None:
-        """Publish provider data to all relations."""
-        self._publish_to_all_relations(data)
+    def publish_data(self, data: MediaStorageProviderData) -> int:
+        """Publish provider data to all relations; returns the number of databags written."""
+        return self._publish_to_all_relations(data)
 
     def clear_data(self) -> None:
         """Clear provider data from all relations."""
@@ -86,9 +87,9 @@ class MediaStorageRequirer(
     def _get_remote_data_model(self) -> type[MediaStorageProviderData]:
         return MediaStorageProviderData
 
-    def publish_data(self, data: MediaStorageRequirerData) -> None:
-        """Publish requirer data to the relation."""
-        self._publish_to_single_relation(data)
+    def publish_data(self, data: MediaStorageRequirerData) -> int:
+        """Publish requirer data to the relation; returns the number of databags written."""
+        return self._publish_to_single_relation(data)
 
     def get_provider(self) -> MediaStorageProviderData | None:
         """Get storage provider data if available."""
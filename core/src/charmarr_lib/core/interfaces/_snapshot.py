@@ -0,0 +1,123 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Per-dispatch relation data snapshot with memoized parsing.
+
+A charm typically calls `get_providers()`, `is_ready()` and friends several
+times per reconcile, and each call used to walk the relations and re-run
+`model_validate_json` on the same payloads. `RelationSnapshot` is created
+once per framework (i.e. per dispatch) and shared by every interface:
+
+- remote app databags are read into a dict once per relation and reused,
+  and `prefetch()` does that for every declared endpoint up front, so the
+  `relation-get` calls happen once at a predictable point
+- `parse()` memoizes validated models by (model class, raw JSON string)
+
+Remote data doesn't change within a real dispatch. In-process test drivers
+that change it between events (e.g. Harness) are covered by `invalidate()`,
+which the interfaces call on relation-changed before reading. Parsed models
+are shared between callers and must be treated as read-only.
+"""
+
+import dataclasses
+from collections.abc import Iterable, Mapping
+from typing import Any, ClassVar
+
+import ops
+from pydantic import BaseModel, ValidationError
+
+
+@dataclasses.dataclass
+class SnapshotStats:
+    """Cache statistics of a RelationSnapshot."""
+
+    databags_loaded: int = 0
+    parse_hits: int = 0
+    parse_misses: int = 0
+
+
+class RelationSnapshot:
+    """Relation databag reads and parsed models shared within one dispatch."""
+
+    _FRAMEWORK_ATTR: ClassVar[str] = "_charmarr_relation_snapshot"
+
+    def __init__(self, charm: Any) -> None:
+        self._charm = charm
+        self._databags: dict[tuple[int, str], dict[str, str]] = {}
+        self._parsed: dict[tuple[type[BaseModel], str], BaseModel | ValidationError] = {}
+        self.stats = SnapshotStats()
+
+    @classmethod
+    def for_charm(cls, charm: Any) -> "RelationSnapshot":
+        """Return the snapshot of the current dispatch, creating it on first use."""
+        framework = charm.framework
+        snapshot = getattr(framework, cls._FRAMEWORK_ATTR, None)
+        if snapshot is None or snapshot._charm is not charm:
+            snapshot = cls(charm)
+            setattr(framework, cls._FRAMEWORK_ATTR, snapshot)
+        return snapshot
+
+    def prefetch(self, endpoints: Iterable[str] | None = None) -> None:
+        """Load the remote app databags of the given (default: all declared) endpoints."""
+        names = self._charm.meta.relations if endpoints is None else endpoints
+        for name in names:
+            for relation in self.relations(name):
+                self.remote_app_data(relation)
+
+    def relations(self, endpoint: str) -> list[ops.Relation]:
+        """Return the relations of an endpoint (empty for unknown endpoints)."""
+        return list(self._charm.model.relations.get(endpoint, []))
+
+    def remote_app_data(self, relation: ops.Relation) -> Mapping[str, str]:
+        """Return the remote application databag, read once and then served from the cache."""
+        key = (relation.id, relation.app.name)
+        databag = self._databags.get(key)
+        if databag is None:
+            databag = self._databags[key] = dict(relation.data[relation.app])
+            self.stats.databags_loaded += 1
+        return databag
+
+    def invalidate(self, relation: ops.Relation) -> None:
+        """Drop the cached remote databag of `relation`; the next read loads it again."""
+        self._databags.pop((relation.id, relation.app.name), None)
+
+    def parse[M: BaseModel](self, model_cls: type[M], raw: str) -> M:
+        """Validate `raw` JSON as `model_cls`, memoized by the raw string.
+
+        Raises:
+            ValidationError: If the payload is invalid (also memoized).
+        """
+        key = (model_cls, raw)
+        cached = self._parsed.get(key)
+        if cached is None:
+            self.stats.parse_misses += 1
+            try:
+                cached = model_cls.model_validate_json(raw)
+            except ValidationError as e:
+                cached = e
+            self._parsed[key] = cached
+        else:
+            self.stats.parse_hits += 1
+        if isinstance(cached, ValidationError):
+            raise cached
+        return cached  # type: ignore[return-value]
+
+    def remote_config[M: BaseModel](self, relation: ops.Relation, model_cls: type[M]) -> M | None:
+        """Return the parsed remote `config` payload, or None if absent or invalid."""
+        raw = self.remote_app_data(relation).get("config")
+        if not raw:
+            return None
+        try:
+            return self.parse(model_cls, raw)
+        except ValidationError:
+            return None
+
+    def local_config[M: BaseModel](self, relation: ops.Relation, model_cls: type[M]) -> M | None:
+        """Return the parsed `config` payload this app published, or None."""
+        raw = relation.data[self._charm.app].get("config")
+        if not raw:
+            return None
+        try:
+            return self.parse(model_cls, raw)
+        except ValidationError:
+            return None
@@ -0,0 +1,22 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""In-process *arr API for unit tests and benchmarks.
+
+Pass a `FakeArrServer` as the `transport` of an ArrApiClient (or any
+BaseArrApiClient) to run reconcilers against stateful Radarr/Sonarr/Prowlarr
+endpoints without a network, and count the requests they make.
+
+Key components:
+- FakeArrServer: Stateful Radarr/Sonarr v3 and Prowlarr v1 API as an httpx transport
+- ArrFault: An error response or connection failure injected into requests
+- ArrCall: One recorded request
+"""
+
+from charmarr_lib.core.testing._arr_server import ArrCall, ArrFault, FakeArrServer
+
+__all__ = [
+    "ArrCall",
+    "ArrFault",
+    "FakeArrServer",
+]
@@ -0,0 +1,257 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""In-process stand-in for the Radarr/Sonarr (v3) and Prowlarr (v1) APIs."""
+
+import copy
+import dataclasses
+import itertools
+import json
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+import httpx
+
+from charmarr_lib.core._instrumentation import normalize_endpoint
+
+_PATH = re.compile(r"^/api/v[13]/(?P<endpoint>[^?]*?)/?$")
+# Collections with full CRUD, and the field that must be unique in each.
+_CRUD = {"downloadclient": "name", "applications": "name", "rootfolder": "path"}
+_READ_ONLY = ("qualityprofile",)
+_DEFAULT_PAGE_SIZE = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class ArrCall:
+    """One request received by FakeArrServer.
+
+    Attributes:
+        method: HTTP method.
+        endpoint: Path after `/api/<version>`, ids collapsed to `{id}`.
+    """
+
+    method: str
+    endpoint: str
+
+
+@dataclasses.dataclass
+class ArrFault:
+    """A failure injected into matching requests.
+
+    Attributes:
+        status: HTTP status of the error response (e.g. 500, 503).
+        method: Only fail this method; None fails any method.
+        endpoint: Only fail this normalized endpoint (e.g. "/downloadclient/{id}").
+        times: How many matching requests fail; None fails all of them.
+        connect_error: Raise httpx.ConnectError instead of responding.
+    """
+
+    status: int = 500
+    method: str | None = None
+    endpoint: str | None = None
+    times: int | None = 1
+    connect_error: bool = False
+
+    def matches(self, call: ArrCall) -> bool:
+        """Whether this fault applies to `call`."""
+        return (
+            (self.times is None or self.times > 0)
+            and self.method in (None, call.method)
+            and self.endpoint in (None, call.endpoint)
+        )
+
+
+def _json(status: int, body: Any) -> httpx.Response:
+    return httpx.Response(status, json=body)
+
+
+def _error(status: int, message: str) -> httpx.Response:
+    return _json(status, {"message": message})
+
+
+class FakeArrServer(httpx.BaseTransport):
+    """Stateful in-process *arr API, usable as the transport of an arr client.
+
+    Serves the endpoints ArrApiClient and MediaIndexerClient implementations
+    use: `/downloadclient`, `/applications` and `/rootfolder` with full CRUD
+    (names/paths must be unique, like the real validators), read-only
+    `/qualityprofile`, `/config/host` and the paginated `/queue`. Both
+    `/api/v3` and `/api/v1` are routed to the same store, so one server
+    stands in for one application. Requests without the right `X-Api-Key`
+    get 401.
+
+    Every request is recorded in `calls`, takes `latency` seconds and can be
+    failed with `inject`.
+
+    Example:
+        server = FakeArrServer(api_key="key", latency=0.001)
+        client = ArrApiClient("http://radarr:7878", "key", transport=server)
+        reconcile_root_folder(client, "/data/movies")
+        assert server.count("POST", "/rootfolder") == 1
+    """
+
+    def __init__(
+        self,
+        api_key: str = "test-api-key",
+        *,
+        latency: float = 0.0,
+        port: int = 7878,
+        quality_profiles: tuple[str, ...] = ("Any", "HD-1080p"),
+    ) -> None:
+        """Initialize an empty application.
+
+        Args:
+            api_key: Key expected in the X-Api-Key header.
+            latency: Seconds every request takes.
+            port: Port reported by `/config/host`.
+            quality_profiles: Names of the predefined quality profiles.
+        """
+        self.api_key = api_key
+        self.latency = latency
+        self.calls: list[ArrCall] = []
+        self.faults: list[ArrFault] = []
+        self.collections: dict[str, dict[int, dict[str, Any]]] = {
+            name: {} for name in (*_CRUD, *_READ_ONLY, "queue")
+        }
+        self.host_config: dict[str, Any] = {
+            "id": 1,
+            "bindAddress": "*",
+            "port": port,
+            "urlBase": "",
+            "applicationUrl": "",
+        }
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        for name in quality_profiles:
+            self.add("qualityprofile", {"name": name})
+
+    def add(self, collection: str, item: dict[str, Any]) -> dict[str, Any]:
+        """Store an item without recording a request; returns it with its id."""
+        with self._lock:
+            return self._insert(collection, item)
+
+    def inject(self, fault: ArrFault) -> ArrFault:
+        """Fail the next matching request(s); returns the fault for inspection."""
+        with self._lock:
+            self.faults.append(fault)
+        return fault
+
+    def count(self, method: str | None = None, endpoint: str | None = None) -> int:
+        """Number of recorded requests, optionally of one method and/or endpoint."""
+        return sum(
+            1 for c in self.calls if method in (None, c.method) and endpoint in (None, c.endpoint)
+        )
+
+    def stats(self) -> Counter[str]:
+        """Recorded requests per `METHOD /endpoint`."""
+        return Counter(f"{c.method} {c.endpoint}" for c in self.calls)
+
+    def reset_calls(self) -> None:
+        """Forget the recorded requests (e.g. after seeding a scenario)."""
+        self.calls.clear()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve one request (httpx.BaseTransport interface)."""
+        match = _PATH.match(request.url.path)
+        endpoint = match["endpoint"] if match else request.url.path
+        call = ArrCall(request.method, normalize_endpoint(endpoint))
+        with self._lock:
+            self.calls.append(call)
+            fault = next((f for f in self.faults if f.matches(call)), None)
+            if fault is not None and fault.times is not None:
+                fault.times -= 1
+        if self.latency:
+            time.sleep(self.latency)
+        if fault is not None:
+            if fault.connect_error:
+                raise httpx.ConnectError("injected connection failure", request=request)
+            return _error(fault.status, f"injected {fault.status}")
+        if request.headers.get("X-Api-Key") != self.api_key:
+            return _error(401, "Unauthorized")
+        if match is None:
+            return _error(404, "Not Found")
+        body = json.loads(request.content) if request.content else None
+        with self._lock:
+            return self._route(request.method, endpoint.split("/"), request.url.params, body)
+
+    def _route(
+        self, method: str, parts: list[str], params: httpx.QueryParams, body: Any
+    ) -> httpx.Response:
+        if parts == ["config", "host"]:
+            if method == "PUT":
+                self.host_config = {**body, "id": self.host_config["id"]}
+            elif method != "GET":
+                return _error(405, "Method Not Allowed")
+            return _json(200 if method == "GET" else 202, self.host_config)
+        name = parts[0]
+        if name not in self.collections or len(parts) > 2:
+            return _error(404, "Not Found")
+        if name == "queue" and len(parts) == 1 and method == "GET":
+            return _json(200, self._queue_page(params))
+        writable = name in _CRUD
+        if len(parts) == 1:
+            if method == "GET":
+                return _json(200, list(self.collections[name].values()))
+            if method == "POST" and writable:
+                return self._create(name, body)
+            return _error(405, "Method Not Allowed")
+        if not parts[1].isdigit() or int(parts[1]) not in self.collections[name]:
+            return _error(404, "Not Found")
+        item_id = int(parts[1])
+        if method == "GET":
+            return _json(200, self.collections[name][item_id])
+        if method == "PUT" and writable:
+            return self._update(name, item_id, body)
+        if method == "DELETE" and writable:
+            del self.collections[name][item_id]
+            return _json(200, {})
+        return _error(405, "Method Not Allowed")
+
+    def _duplicate(self, collection: str, item: dict[str, Any], item_id: int | None) -> bool:
+        field = _CRUD[collection]
+        return any(
+            other.get(field) == item.get(field)
+            for other_id, other in self.collections[collection].items()
+            if other_id != item_id
+        )
+
+    def _create(self, collection: str, body: Any) -> httpx.Response:
+        field = _CRUD[collection]
+        if not isinstance(body, dict) or not body.get(field):
+            return _error(400, f"'{field}' must not be empty")
+        if self._duplicate(collection, body, None):
+            return _error(400, f"'{field}' should be unique")
+        return _json(201, self._insert(collection, body))
+
+    def _update(self, collection: str, item_id: int, body: Any) -> httpx.Response:
+        if not isinstance(body, dict):
+            return _error(400, "Invalid body")
+        if self._duplicate(collection, body, item_id):
+            return _error(400, f"'{_CRUD[collection]}' should be unique")
+        self.collections[collection][item_id] = {**copy.deepcopy(body), "id": item_id}
+        return _json(202, self.collections[collection][item_id])
+
+    def _insert(self, collection: str, item: dict[str, Any]) -> dict[str, Any]:
+        stored = {**copy.deepcopy(item), "id": next(self._ids)}
+        if collection == "rootfolder":
+            stored.setdefault("accessible", True)
+            stored.setdefault("unmappedFolders", [])
+        self.collections[collection][stored["id"]] = stored
+        return stored
+
+    def _queue_page(self, params: httpx.QueryParams) -> dict[str, Any]:
+        page = max(int(params.get("page", 1)), 1)
+        page_size = max(int(params.get("pageSize", _DEFAULT_PAGE_SIZE)), 1)
+        records = list(self.collections["queue"].values())
+        start = (page - 1) * page_size
+        return {
+            "page": page,
+            "pageSize": page_size,
+            "sortKey": "timeleft",
+            "sortDirection": "ascending",
+            "totalRecords": len(records),
+            "records": records[start : start + page_size],
+        }
@@ -0,0 +1,58 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Shared fixtures for the reconciler benchmarks."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+from lightkube.models.apps_v1 import StatefulSetSpec
+from lightkube.models.core_v1 import Container, PodSpec, PodTemplateSpec
+from lightkube.models.meta_v1 import LabelSelector, ObjectMeta
+from lightkube.resources.apps_v1 import StatefulSet
+
+from charmarr_lib.core import ReconcileResult
+from charmarr_lib.krm.testing import FakeK8sClient
+
+
+@pytest.fixture
+def make_statefulset():
+    """Return a factory function to create minimal StatefulSets."""
+
+    def _make_statefulset(name: str, namespace: str) -> StatefulSet:
+        return StatefulSet(
+            metadata=ObjectMeta(name=name, namespace=namespace),
+            spec=StatefulSetSpec(
+                selector=LabelSelector(matchLabels={"app": name}),
+                serviceName=name,
+                template=PodTemplateSpec(spec=PodSpec(containers=[Container(name=name)])),
+            ),
+        )
+
+    return _make_statefulset
+
+
+@pytest.fixture
+def measure():
+    """Return a function that runs reconcile steps against a fake client.
+
+    Each step runs with reset call counters. The function prints the request
+    counts and wall time of every step and returns `(result, counts)` pairs.
+    """
+
+    def _measure(
+        name: str, client: FakeK8sClient, steps: list[Callable[[], ReconcileResult]]
+    ) -> list[tuple[ReconcileResult, dict[str, int]]]:
+        runs = []
+        for i, step in enumerate(steps):
+            client.reset_calls()
+            start = time.perf_counter()
+            result = step()
+            elapsed = time.perf_counter() - start
+            counts = dict(client.stats())
+            print(f"\n{name}[{i}]: {sum(counts.values())} calls {elapsed * 1e3:.1f}ms {counts}")
+            runs.append((result, counts))
+        return runs
+
+    return _measure
@@ -0,0 +1,169 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Benchmarks for the *arr API reconcilers against FakeArrServer.
+
+Download clients and media manager connections are reconciled from N
+desired entries into an empty application, so request counts should grow
+by one call per item and never by one list call per item. Root folder and
+external URL reconcile a single object next to N unrelated ones and must
+stay constant. The converge and steady-state HTTP counts are asserted.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from charmarr_lib.core import (
+    ArrApiClient,
+    BaseArrApiClient,
+    DownloadClient,
+    DownloadClientType,
+    MediaManager,
+    MediaManagerConnection,
+    reconcile_download_clients,
+    reconcile_external_url,
+    reconcile_media_manager_connections,
+    reconcile_root_folder,
+)
+from charmarr_lib.core.interfaces import DownloadClientProviderData, MediaIndexerRequirerData
+from charmarr_lib.core.testing import FakeArrServer
+
+LATENCY = 0.001
+API_KEY = "bench-api-key"
+SIZES = [1, 10, 100]
+
+
+class _ProwlarrClient(BaseArrApiClient):
+    """Minimal MediaIndexerClient on Prowlarr's /api/v1, as charms implement it."""
+
+    def __init__(self, server: FakeArrServer) -> None:
+        super().__init__("http://prowlarr:9696", API_KEY, "v1", transport=server)
+
+    def get_applications(self) -> list[MediaManagerConnection]:
+        return [MediaManagerConnection.model_validate(a) for a in self._get("/applications")]
+
+    def get_application(self, app_id: int) -> dict[str, Any]:
+        return self._get(f"/applications/{app_id}")
+
+    def add_application(self, config: dict[str, Any]) -> dict[str, Any]:
+        return self._post("/applications", config)
+
+    def update_application(self, app_id: int, config: dict[str, Any]) -> dict[str, Any]:
+        return self._put(f"/applications/{app_id}", {**config, "id": app_id})
+
+    def delete_application(self, app_id: int) -> None:
+        self._delete(f"/applications/{app_id}")
+
+
+def _secret(secret_id: str) -> dict[str, str]:
+    return {"username": "admin", "password": "hunter2", "api-key": "downstream-key"}
+
+
+def _download_clients(n: int) -> list[DownloadClientProviderData]:
+    return [
+        DownloadClientProviderData(
+            api_url=f"http://qbittorrent-{i}:8080",
+            credentials_secret_id=f"secret:qbit-{i}",
+            client=DownloadClient.QBITTORRENT,
+            client_type=DownloadClientType.TORRENT,
+            instance_name=f"qbittorrent-{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def _media_managers(n: int) -> list[MediaIndexerRequirerData]:
+    return [
+        MediaIndexerRequirerData(
+            api_url=f"http://radarr-{i}:7878",
+            api_key_secret_id=f"secret:radarr-{i}",
+            manager=MediaManager.RADARR,
+            instance_name=f"radarr-{i}",
+        )
+        for i in range(n)
+    ]
+
+
+def _run(name: str, server: FakeArrServer, reconcile: Callable[[], None]) -> list[int]:
+    """Converge, then reconcile again; returns the request counts of both runs."""
+    counts = []
+    for run in ("converge", "steady"):
+        server.reset_calls()
+        start = time.perf_counter()
+        reconcile()
+        elapsed = time.perf_counter() - start
+        counts.append(server.count())
+        print(f"\n{name} {run}: {counts[-1]} calls {elapsed * 1e3:.1f}ms {dict(server.stats())}")
+    return counts
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_reconcile_download_clients(n: int):
+    server = FakeArrServer(API_KEY, latency=LATENCY)
+    desired = _download_clients(n)
+
+    with ArrApiClient("http://radarr:7878", API_KEY, transport=server) as client:
+        counts = _run(
+            f"download_clients[{n}]",
+            server,
+            lambda: reconcile_download_clients(
+                client, desired, "radarr", MediaManager.RADARR, _secret
+            ),
+        )
+
+    assert len(server.collections["downloadclient"]) == n
+    assert counts == [1 + n, 1 + n]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_reconcile_media_manager_connections(n: int):
+    server = FakeArrServer(API_KEY, latency=LATENCY, port=9696)
+    desired = _media_managers(n)
+
+    with _ProwlarrClient(server) as client:
+        counts = _run(
+            f"media_manager_connections[{n}]",
+            server,
+            lambda: reconcile_media_manager_connections(
+                client, desired, "http://prowlarr:9696", _secret
+            ),
+        )
+
+    assert len(server.collections["applications"]) == n
+    assert counts == [1 + n, 1 + n]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_reconcile_root_folder(n: int):
+    server = FakeArrServer(API_KEY, latency=LATENCY)
+    for i in range(n - 1):
+        server.add("rootfolder", {"path": f"/data/library-{i}"})
+
+    with ArrApiClient("http://radarr:7878", API_KEY, transport=server) as client:
+        counts = _run(
+            f"root_folder[{n}]", server, lambda: reconcile_root_folder(client, "/data/movies")
+        )
+
+    assert len(server.collections["rootfolder"]) == n
+    assert counts == [2, 1]
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_reconcile_external_url(n: int):
+    """Host config is a single object; N download clients are stored alongside it."""
+    server = FakeArrServer(API_KEY, latency=LATENCY)
+    for provider in _download_clients(n):
+        server.add("downloadclient", {"name": provider.instance_name})
+
+    with ArrApiClient("http://radarr:7878", API_KEY, transport=server) as client:
+        counts = _run(
+            f"external_url[{n}]",
+            server,
+            lambda: reconcile_external_url(client, "https://media.example.com/radarr"),
+        )
+
+    assert server.host_config["applicationUrl"] == "https://media.example.com/radarr"
+    assert counts == [3, 1]
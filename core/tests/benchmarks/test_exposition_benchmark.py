@@ -0,0 +1,75 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Benchmarks for exposition formatting.
+
+Run with `tox -e bench`. Timings are printed; the assertions only guard
+against order-of-magnitude regressions so the suite stays stable on slow CI.
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+
+from charmarr_lib.core import ExpositionBuilder, MetricFamily, MetricSample
+
+SAMPLES = 10_000
+ROUNDS = 5
+
+
+def _median_seconds(fn: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _consumers() -> list[tuple[str, int]]:
+    return [(f"consumer-{i}", i % 2) for i in range(SAMPLES)]
+
+
+def test_gauge_family_10k_samples():
+    consumers = _consumers()
+
+    def via_models() -> list[str]:
+        family = MetricFamily(
+            name="charmarr_storage_pvc_mounted",
+            help="Is the PVC mounted on each consumer (1/0)",
+            samples=[MetricSample(labels={"consumer": n}, value=v) for n, v in consumers],
+        )
+        return ExpositionBuilder().family(family).lines()
+
+    def via_builder() -> list[str]:
+        return (
+            ExpositionBuilder()
+            .gauge(
+                "charmarr_storage_pvc_mounted",
+                "Is the PVC mounted on each consumer (1/0)",
+                (({"consumer": n}, v) for n, v in consumers),
+            )
+            .lines()
+        )
+
+    assert via_models() == via_builder()
+    models, builder = _median_seconds(via_models), _median_seconds(via_builder)
+    print(f"\ngauge x{SAMPLES}: models {models * 1e3:.1f}ms, builder {builder * 1e3:.1f}ms")
+    assert builder < 1.0
+
+
+def test_histogram_family_10k_series():
+    buckets = [(0.005, 1), (0.05, 4), (0.5, 9), (5.0, 10)]
+    series = [({"item": f"item-{i}"}, buckets, 1.25, 10) for i in range(SAMPLES)]
+
+    def build() -> list[str]:
+        return (
+            ExpositionBuilder()
+            .histogram("charmarr_item_latency_seconds", "Per-item latency", series)
+            .lines()
+        )
+
+    assert len(build()) == 2 + SAMPLES * (len(buckets) + 3)
+    elapsed = _median_seconds(build)
+    print(f"\nhistogram x{SAMPLES}: {elapsed * 1e3:.1f}ms")
+    assert elapsed < 5.0
@@ -0,0 +1,69 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Benchmarks for the StatefulSet patch reconcilers (storage, hardware).
+
+Both reconcilers mount something into the pod template, keep it mounted and
+then take it out again. The steady-state pass must be a single GET; mounting
+and unmounting must each cost one GET plus one PATCH.
+"""
+
+from collections.abc import Callable
+from typing import cast
+
+from lightkube import Client
+from lightkube.resources.apps_v1 import StatefulSet
+
+from charmarr_lib.core import (
+    K8sResourceManager,
+    ReconcileResult,
+    reconcile_hardware_transcoding,
+    reconcile_storage_volume,
+)
+from charmarr_lib.krm.testing import FakeK8sClient
+
+LATENCY = 0.002
+NAMESPACE = "media"
+
+
+def test_storage_reconcile(make_statefulset, measure):
+    client = FakeK8sClient([make_statefulset("radarr", NAMESPACE)], NAMESPACE, LATENCY)
+    manager = K8sResourceManager(client=cast(Client, client))
+
+    def mount() -> ReconcileResult:
+        return reconcile_storage_volume(
+            manager, "radarr", NAMESPACE, "radarr", "charmarr-shared-media", pgid=1000
+        )
+
+    (_, converge), (_, steady), (_, unmount) = measure(
+        "storage",
+        client,
+        [
+            mount,
+            mount,
+            lambda: reconcile_storage_volume(manager, "radarr", NAMESPACE, "radarr", None),
+        ],
+    )
+
+    assert converge == {"get": 1, "patch": 1}
+    assert steady == {"get": 1}
+    assert unmount == {"get": 1, "patch": 1}
+    assert not client.get(StatefulSet, "radarr").spec.template.spec.volumes
+
+
+def test_hardware_reconcile(make_statefulset, measure):
+    client = FakeK8sClient([make_statefulset("radarr", NAMESPACE)], NAMESPACE, LATENCY)
+    manager = K8sResourceManager(client=cast(Client, client))
+
+    def reconcile(enabled: bool) -> Callable[[], ReconcileResult]:
+        return lambda: reconcile_hardware_transcoding(
+            manager, "radarr", NAMESPACE, "radarr", enabled
+        )
+
+    (_, converge), (_, steady), (_, disable) = measure(
+        "hardware", client, [reconcile(True), reconcile(True), reconcile(False)]
+    )
+
+    assert converge == {"get": 1, "patch": 1}
+    assert steady == {"get": 1}
+    assert disable == {"get": 1, "patch": 1}
@@ -0,0 +1,72 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the in-process FakeArrServer."""
+
+import pytest
+
+from charmarr_lib.core import ArrApiClient, ArrApiConnectionError, ArrApiResponseError
+from charmarr_lib.core.testing import ArrFault, FakeArrServer
+
+
+@pytest.fixture
+def server():
+    return FakeArrServer("key")
+
+
+@pytest.fixture
+def client(server):
+    with ArrApiClient("http://radarr:7878", "key", max_retries=1, transport=server) as client:
+        yield client
+
+
+def test_download_client_crud_is_stateful(server, client):
+    """Added clients get ids, updates replace them, duplicate names are rejected."""
+    config = {"name": "qbit", "enable": True, "protocol": "torrent", "implementation": "QBit"}
+    added = client.add_download_client(config)
+    client.update_download_client(added.id, {**config, "enable": False})
+
+    with pytest.raises(ArrApiResponseError) as duplicate:
+        client.add_download_client(config)
+
+    assert client.get_download_client(added.id)["enable"] is False
+    assert [c.name for c in client.get_download_clients()] == ["qbit"]
+    assert duplicate.value.status_code == 400
+    client.delete_download_client(added.id)
+    assert client.get_download_clients() == []
+    assert server.count("GET", "/downloadclient/{id}") == 1
+
+
+def test_queue_is_paginated_and_api_key_checked(server):
+    """The queue returns one page with totalRecords; a wrong API key gets 401."""
+    for i in range(15):
+        server.add("queue", {"title": f"movie-{i}", "status": "downloading"})
+
+    with ArrApiClient("http://radarr:7878", "key", transport=server) as client:
+        first_page = client.get_queue()
+        page_two = client._get("/queue", params={"page": 2})  # pyright: ignore[reportPrivateUsage]
+    with (
+        ArrApiClient("http://radarr:7878", "wrong", transport=server) as stranger,
+        pytest.raises(ArrApiResponseError) as unauthorized,
+    ):
+        stranger.get_root_folders()
+
+    assert len(first_page) == 10
+    assert page_two["totalRecords"] == 15
+    assert len(page_two["records"]) == 5
+    assert unauthorized.value.status_code == 401
+
+
+def test_injected_faults(server, client):
+    """Faults fail matching requests as error responses or connection failures."""
+    server.inject(ArrFault(503, method="GET", endpoint="/rootfolder"))
+    server.inject(ArrFault(connect_error=True, endpoint="/qualityprofile"))
+
+    with pytest.raises(ArrApiResponseError) as unavailable:
+        client.get_root_folders()
+    with pytest.raises(ArrApiConnectionError):
+        client.get_quality_profiles()
+
+    assert unavailable.value.status_code == 503
+    assert client.get_root_folders() == []
+    assert [p.name for p in client.get_quality_profiles()] == ["Any", "HD-1080p"]
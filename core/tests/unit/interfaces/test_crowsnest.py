@@ -5,13 +5,17 @@
 
 from typing import ClassVar
 
+import httpx
 from ops import CharmBase
+from pytest_httpx import HTTPXMock
 from scenario import Context, Relation, State
 
 from charmarr_lib.core.interfaces import (
     CrowsnestProvider,
     CrowsnestProviderData,
     CrowsnestRequirer,
+    CrowsnestTopologyClient,
+    TopologyDocument,
 )
 
 
@@ -87,3 +91,56 @@ def test_requirer_not_ready_without_providers():
     ctx = Context(RequirerCharm, meta=RequirerCharm.META)
     with ctx(ctx.on.start(), State(leader=True, relations=[])) as mgr:
         assert mgr.charm.requirer.is_ready() is False
+
+
+def _provider(app: str) -> CrowsnestProviderData:
+    return CrowsnestProviderData(
+        topology_url=f"http://{app}.charmarr.svc:9099/metrics",
+        app_name=app,
+        model_name="charmarr",
+    )
+
+
+def _document(app: str, generation: int) -> dict:
+    return TopologyDocument(
+        generation=generation, app_name=app, model_name="charmarr"
+    ).model_dump()
+
+
+def test_topology_client_fetches_only_changed_providers(httpx_mock: HTTPXMock):
+    """304s and repeated documents are unchanged; a new generation is reported."""
+    radarr_url = "http://radarr.charmarr.svc:9099/topology.json"
+    sonarr_url = "http://sonarr.charmarr.svc:9099/topology.json"
+    providers = [_provider("radarr"), _provider("sonarr")]
+    client = CrowsnestTopologyClient(http_client=httpx.Client())
+
+    httpx_mock.add_response(url=radarr_url, json=_document("radarr", 1), headers={"ETag": '"r1"'})
+    httpx_mock.add_response(url=sonarr_url, json=_document("sonarr", 4), headers={"ETag": '"s4"'})
+    first = client.fetch_changed(providers)
+    assert set(first) == {("charmarr", "radarr"), ("charmarr", "sonarr")}
+
+    httpx_mock.add_response(
+        url=radarr_url, status_code=304, match_headers={"If-None-Match": '"r1"'}
+    )
+    httpx_mock.add_response(url=sonarr_url, json=_document("sonarr", 5), headers={"ETag": '"s5"'})
+    second = client.fetch_changed(providers)
+    assert list(second) == [("charmarr", "sonarr")]
+    assert client.generation(("charmarr", "sonarr")) == 5
+    assert client.generation(("charmarr", "radarr")) == 1
+
+
+def test_topology_client_keeps_last_document_on_error_and_forgets_removed(
+    httpx_mock: HTTPXMock,
+):
+    radarr_url = "http://radarr.charmarr.svc:9099/topology.json"
+    client = CrowsnestTopologyClient(http_client=httpx.Client())
+
+    httpx_mock.add_response(url=radarr_url, json=_document("radarr", 2))
+    client.fetch_changed([_provider("radarr")])
+
+    httpx_mock.add_exception(httpx.ConnectError("refused"), url=radarr_url)
+    assert client.fetch_changed([_provider("radarr")]) == {}
+    assert client.generation(("charmarr", "radarr")) == 2
+
+    assert client.fetch_changed([]) == {}
+    assert client.documents == {}
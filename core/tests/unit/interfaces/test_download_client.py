@@ -3,15 +3,17 @@
 
 """Scenario tests for download-client interface."""
 
+import dataclasses
 from typing import ClassVar
 
 import pytest
-from ops import CharmBase
+from ops import CharmBase, Handle
 from pydantic import ValidationError
 from scenario import Context, Relation, State
 
 from charmarr_lib.core import DownloadClient, DownloadClientType, MediaManager
 from charmarr_lib.core.interfaces import (
+    DownloadClientChangedEvent,
     DownloadClientProvider,
     DownloadClientProviderData,
     DownloadClientRequirer,
@@ -203,3 +205,67 @@ def test_requirer_publish_data_non_leader():
 
     relation_out = state_out.get_relations("download-client")[0]
     assert "config" not in relation_out.local_app_data
+
+
+class ObservingRequirerCharm(RequirerCharm):
+    """Requirer charm recording the payload of changed events."""
+
+    def __init__(self, framework):
+        super().__init__(framework)
+        self.changes: list[tuple[int | None, str | None, str]] = []
+        framework.observe(self.requirer.on.changed, self._on_changed)
+
+    def _on_changed(self, event: DownloadClientChangedEvent) -> None:
+        self.changes.append((event.relation_id, event.app_name, event.change))
+
+
+def test_changed_event_reports_relation_and_kind_of_change():
+    """Test changed events carry relation, remote app and whether data changed."""
+    ctx = Context(ObservingRequirerCharm, meta=RequirerCharm.META)
+    qbit = DownloadClientProviderData(
+        api_url="http://qbit:8080",
+        credentials_secret_id="secret://1",
+        client=DownloadClient.QBITTORRENT,
+        client_type=DownloadClientType.TORRENT,
+        instance_name="qbit",
+    )
+    relation = Relation(
+        endpoint="download-client",
+        remote_app_name="qbittorrent",
+        remote_app_data={"config": qbit.model_dump_json()},
+    )
+    state = State(relations=[relation])
+
+    changes = []
+    for event in ("changed", "changed", "updated", "broken"):
+        if event == "updated":
+            moved = qbit.model_copy(update={"api_url": "http://qbit:9090"})
+            relation = dataclasses.replace(
+                relation, remote_app_data={"config": moved.model_dump_json()}
+            )
+            state = dataclasses.replace(state, relations=[relation])
+        trigger = (
+            ctx.on.relation_broken(relation)
+            if event == "broken"
+            else ctx.on.relation_changed(relation, remote_unit=0)
+        )
+        with ctx(trigger, state) as mgr:
+            state = mgr.run()
+            changes.extend(mgr.charm.changes)
+
+    assert changes == [
+        (relation.id, "qbittorrent", "added"),
+        (relation.id, "qbittorrent", "unchanged"),
+        (relation.id, "qbittorrent", "updated"),
+        (relation.id, "qbittorrent", "removed"),
+    ]
+
+
+def test_changed_event_deferred_without_payload_restores_defaults():
+    """Test events deferred by older library versions (empty snapshot) still restore."""
+    event = DownloadClientChangedEvent(Handle(None, "changed", "1"))
+
+    event.restore({})
+
+    assert (event.relation_id, event.app_name, event.change) == (None, None, "updated")
+    assert event.data_changed
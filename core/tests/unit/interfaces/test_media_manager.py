@@ -241,3 +241,32 @@ def test_requirer_publish_data_non_leader():
 
     relation_out = state_out.get_relations("media-manager")[0]
     assert "config" not in relation_out.local_app_data
+
+
+def test_provider_skips_identical_writes():
+    """Test republishing equal data (even reordered profiles) writes nothing."""
+    ctx = Context(ProviderCharm, meta=ProviderCharm.META)
+    relations = [
+        Relation(endpoint="media-manager", interface="media_manager"),
+        Relation(endpoint="media-manager", interface="media_manager"),
+    ]
+    profiles = [QualityProfile(id=2, name="UHD-Bluray+WEB"), QualityProfile(id=1, name="HD")]
+
+    def provider_data(quality_profiles: list[QualityProfile]) -> MediaManagerProviderData:
+        return MediaManagerProviderData(
+            api_url="http://radarr:7878",
+            api_key_secret_id="secret:abc123",
+            manager=MediaManager.RADARR,
+            instance_name="radarr",
+            quality_profiles=quality_profiles,
+            root_folders=["/data/media/movies"],
+        )
+
+    with ctx(ctx.on.start(), State(leader=True, relations=relations)) as mgr:
+        assert mgr.charm.provider.publish_data(provider_data(profiles)) == 2
+        assert mgr.charm.provider.publish_data(provider_data(profiles[::-1])) == 0
+        state_out = mgr.run()
+
+    with ctx(ctx.on.update_status(), state_out) as mgr:
+        assert mgr.charm.provider.publish_data(provider_data(profiles)) == 0
+        assert mgr.charm.provider.publish_data(provider_data(profiles[:1])) == 2
@@ -0,0 +1,109 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Scenario tests for the per-dispatch relation snapshot."""
+
+from typing import ClassVar
+
+import pytest
+from ops import CharmBase
+from pydantic import ValidationError
+from scenario import Context, Relation, State
+
+from charmarr_lib.core import MediaIndexer, MediaManager
+from charmarr_lib.core.interfaces import (
+    MediaIndexerProvider,
+    MediaIndexerProviderData,
+    MediaIndexerRequirerData,
+    RelationSnapshot,
+)
+
+
+class ProviderCharm(CharmBase):
+    """Prowlarr-like charm with a media-indexer provider and an unused endpoint."""
+
+    META: ClassVar[dict[str, object]] = {
+        "name": "prowlarr-k8s",
+        "provides": {"media-indexer": {"interface": "media_indexer"}},
+        "requires": {"flaresolverr": {"interface": "flaresolverr"}},
+    }
+
+    def __init__(self, framework):
+        super().__init__(framework)
+        self.provider = MediaIndexerProvider(self, "media-indexer")
+
+
+def _requirer_relation(instance_name: str) -> Relation:
+    data = MediaIndexerRequirerData(
+        api_url=f"http://{instance_name}:7878",
+        api_key_secret_id="secret:abc",
+        manager=MediaManager.RADARR,
+        instance_name=instance_name,
+    )
+    return Relation(
+        endpoint="media-indexer",
+        interface="media_indexer",
+        remote_app_name=instance_name,
+        remote_app_data={"config": data.model_dump_json()},
+        local_app_data={
+            "config": MediaIndexerProviderData(
+                api_url="http://prowlarr:9696",
+                api_key_secret_id="secret:def",
+                indexer=MediaIndexer.PROWLARR,
+            ).model_dump_json()
+        },
+    )
+
+
+def test_repeated_reads_parse_each_payload_once():
+    """get_requirers() and is_ready() share parsed models within a dispatch."""
+    ctx = Context(ProviderCharm, meta=ProviderCharm.META)
+    relations = [_requirer_relation("radarr"), _requirer_relation("sonarr")]
+
+    with ctx(ctx.on.update_status(), State(leader=True, relations=relations)) as mgr:
+        provider = mgr.charm.provider
+        first = provider.get_requirers()
+        assert provider.is_ready()
+        second = provider.get_requirers()
+        stats = RelationSnapshot.for_charm(mgr.charm).stats
+
+    assert sorted(r.instance_name for r in second) == ["radarr", "sonarr"]
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert stats.parse_misses == 3
+    assert stats.parse_hits == 4
+    assert stats.databags_loaded == 2
+
+
+def test_prefetch_loads_every_declared_endpoint():
+    """prefetch() reads the remote databags of all endpoints up front."""
+    ctx = Context(ProviderCharm, meta=ProviderCharm.META)
+    flaresolverr = Relation(endpoint="flaresolverr", interface="flaresolverr")
+    state = State(relations=[_requirer_relation("radarr"), flaresolverr])
+
+    with ctx(ctx.on.update_status(), state) as mgr:
+        snapshot = RelationSnapshot.for_charm(mgr.charm)
+        snapshot.prefetch()
+        mgr.charm.provider.get_requirers()
+        [relation] = snapshot.relations("media-indexer")
+        cached = snapshot.remote_app_data(relation)
+        snapshot.invalidate(relation)
+        reloaded = snapshot.remote_app_data(relation)
+
+    assert type(cached) is dict
+    assert cached == reloaded
+    assert cached is not reloaded
+    assert snapshot.stats.databags_loaded == 3
+
+
+def test_invalid_payloads_are_memoized_and_new_payloads_reparsed():
+    """Failures are cached by raw string; a different string is parsed again."""
+    ctx = Context(ProviderCharm, meta=ProviderCharm.META)
+
+    with ctx(ctx.on.update_status(), State()) as mgr:
+        snapshot = RelationSnapshot.for_charm(mgr.charm)
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                snapshot.parse(MediaIndexerRequirerData, "{}")
+        snapshot.parse(MediaIndexerRequirerData, _requirer_relation("a").remote_app_data["config"])
+
+    assert (snapshot.stats.parse_misses, snapshot.stats.parse_hits) == (2, 1)
@@ -0,0 +1,105 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for hardware device reconciliation."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from lightkube.models.core_v1 import HostPathVolumeSource, Volume, VolumeMount
+from lightkube.types import PatchType
+
+from charmarr_lib.core import (
+    AsyncK8sResourceManager,
+    reconcile_hardware_transcoding,
+    reconcile_hardware_transcoding_async,
+)
+
+
+def _mounted(make_statefulset):
+    return make_statefulset(
+        name="plex",
+        volumes=[Volume(name="dev-dri", hostPath=HostPathVolumeSource(path="/dev/dri"))],
+        container_mounts=[VolumeMount(name="dev-dri", mountPath="/dev/dri")],
+    )
+
+
+# reconcile_hardware_transcoding
+
+
+def test_reconcile_patches_when_not_mounted(manager, mock_client, make_statefulset):
+    """Adds the hostPath volume and mount with a strategic merge patch."""
+    mock_client.get.return_value = make_statefulset(name="plex")
+
+    result = reconcile_hardware_transcoding(manager, "plex", "media", "plex", enabled=True)
+
+    assert result.changed is True
+    patch = mock_client.patch.call_args[0][2]
+    volume = patch["spec"]["template"]["spec"]["volumes"][0]
+    assert volume == {"name": "dev-dri", "hostPath": {"path": "/dev/dri", "type": "Directory"}}
+
+
+def test_reconcile_skips_patch_when_already_mounted(manager, mock_client, make_statefulset):
+    """No patch when the device is already mounted."""
+    mock_client.get.return_value = _mounted(make_statefulset)
+
+    result = reconcile_hardware_transcoding(manager, "plex", "media", "plex", enabled=True)
+
+    assert result.changed is False
+    mock_client.patch.assert_not_called()
+
+
+def test_reconcile_removes_when_disabled(manager, mock_client, make_statefulset):
+    """Removes the volume and mount with a JSON patch when disabled."""
+    mock_client.get.return_value = _mounted(make_statefulset)
+
+    result = reconcile_hardware_transcoding(manager, "plex", "media", "plex", enabled=False)
+
+    assert result.changed is True
+    assert mock_client.patch.call_args.kwargs["patch_type"] == PatchType.JSON
+
+
+# reconcile_hardware_transcoding_async
+
+
+def _async_manager(sts):
+    client = MagicMock(get=AsyncMock(return_value=sts), patch=AsyncMock())
+    return AsyncK8sResourceManager(client=client), client
+
+
+def test_reconcile_async_patches_when_not_mounted(make_statefulset):
+    """The async reconciler sends the same patch through the async client."""
+    manager, client = _async_manager(make_statefulset(name="plex"))
+
+    result = asyncio.run(
+        reconcile_hardware_transcoding_async(manager, "plex", "media", "plex", enabled=True)
+    )
+
+    assert result.changed is True
+    patch = client.patch.await_args[0][2]
+    mount = patch["spec"]["template"]["spec"]["containers"][0]["volumeMounts"][0]
+    assert mount == {"name": "dev-dri", "mountPath": "/dev/dri"}
+
+
+def test_reconcile_async_skips_patch_when_already_mounted(make_statefulset):
+    """No patch when the device is already mounted."""
+    manager, client = _async_manager(_mounted(make_statefulset))
+
+    result = asyncio.run(
+        reconcile_hardware_transcoding_async(manager, "plex", "media", "plex", enabled=True)
+    )
+
+    assert result.changed is False
+    client.patch.assert_not_awaited()
+
+
+def test_reconcile_async_removes_when_disabled(make_statefulset):
+    """Removes the volume and mount with a JSON patch when disabled."""
+    manager, client = _async_manager(_mounted(make_statefulset))
+
+    result = asyncio.run(
+        reconcile_hardware_transcoding_async(manager, "plex", "media", "plex", enabled=False)
+    )
+
+    assert result.changed is True
+    assert client.patch.await_args.kwargs["patch_type"] == PatchType.JSON
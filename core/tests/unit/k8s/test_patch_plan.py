@@ -0,0 +1,139 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for StatefulSetPatchPlan."""
+
+import pytest
+from lightkube.models.core_v1 import (
+    Container,
+    PersistentVolumeClaimVolumeSource,
+    PodSecurityContext,
+    Volume,
+    VolumeMount,
+)
+
+from charmarr_lib.core import (
+    PatchConflictError,
+    StatefulSetPatchPlan,
+    plan_hardware_transcoding,
+    plan_storage_volume,
+)
+
+
+def _storage_volume() -> Volume:
+    return Volume(
+        name="charmarr-shared-data",
+        persistentVolumeClaim=PersistentVolumeClaimVolumeSource(claimName="charmarr-media"),
+    )
+
+
+def test_plan_merges_contributors_into_one_patch(manager, mock_client, make_statefulset):
+    """Storage, hardware and a sidecar fragment are sent as a single PATCH after one GET."""
+    mock_client.get.return_value = make_statefulset(name="plex")
+    plan = StatefulSetPatchPlan(manager, "plex", "media")
+    plan_storage_volume(plan, "plex", "charmarr-media", pgid=1000)
+    plan_hardware_transcoding(plan, "plex", enabled=True)
+    plan.merge(
+        {
+            "spec": {
+                "template": {
+                    "metadata": {"annotations": {"charmarr.io/hash": "abc"}},
+                    "spec": {"containers": [{"name": "sidecar", "image": "gw:1"}]},
+                }
+            }
+        },
+        owner="vpn",
+    )
+
+    result = plan.apply()
+
+    assert result.changed is True
+    assert "storage" in result.message and "vpn" in result.message
+    mock_client.get.assert_called_once()
+    mock_client.patch.assert_called_once()
+    patch = mock_client.patch.call_args[0][2]
+    template = patch["spec"]["template"]
+    assert template["metadata"]["annotations"] == {"charmarr.io/hash": "abc"}
+    assert {v["name"] for v in template["spec"]["volumes"]} == {"charmarr-shared-data", "dev-dri"}
+    assert template["spec"]["securityContext"] == {"fsGroup": 1000}
+    containers = {c["name"]: c for c in template["spec"]["containers"]}
+    assert [m["mountPath"] for m in containers["plex"]["volumeMounts"]] == ["/data", "/dev/dri"]
+    assert containers["sidecar"] == {"name": "sidecar", "image": "gw:1"}
+
+
+def test_plan_skips_patch_when_live_matches(manager, mock_client, make_statefulset):
+    """No PATCH is sent when the merged patch is already reflected in the StatefulSet."""
+    mount = VolumeMount(name="charmarr-shared-data", mountPath="/data")
+    mock_client.get.return_value = make_statefulset(
+        volumes=[_storage_volume()], container_mounts=[mount]
+    )
+    plan = plan_storage_volume(
+        StatefulSetPatchPlan(manager, "radarr", "media"), "radarr", "charmarr-media"
+    )
+    plan_hardware_transcoding(plan, "radarr", enabled=False)
+
+    result = plan.apply()
+
+    assert result.changed is False
+    mock_client.patch.assert_not_called()
+
+
+def test_plan_removals_use_live_state(manager, mock_client, make_statefulset):
+    """Removals become delete directives only for things that exist."""
+    mount = VolumeMount(name="charmarr-shared-data", mountPath="/data")
+    mock_client.get.return_value = make_statefulset(
+        volumes=[_storage_volume()],
+        container_mounts=[mount],
+        security_context=PodSecurityContext(fsGroup=1000),
+    )
+    plan = StatefulSetPatchPlan(manager, "radarr", "media")
+    plan_storage_volume(plan, "radarr", None)
+    plan_hardware_transcoding(plan, "radarr", enabled=False)
+
+    plan.apply()
+
+    pod_spec = mock_client.patch.call_args[0][2]["spec"]["template"]["spec"]
+    assert pod_spec["volumes"] == [{"name": "charmarr-shared-data", "$patch": "delete"}]
+    assert pod_spec["containers"] == [
+        {"name": "radarr", "volumeMounts": [{"mountPath": "/data", "$patch": "delete"}]}
+    ]
+    assert pod_spec["securityContext"] is None
+
+
+def test_plan_moves_mount_to_new_path(manager, make_statefulset):
+    """A mount at a different path is deleted at the old path and added at the new one."""
+    mount = VolumeMount(name="charmarr-shared-data", mountPath="/media")
+    live = make_statefulset(volumes=[_storage_volume()], container_mounts=[mount])
+    plan = plan_storage_volume(
+        StatefulSetPatchPlan(manager, "radarr", "media"), "radarr", "charmarr-media"
+    )
+
+    patch = plan.build(live)
+
+    assert patch["spec"]["template"]["spec"]["containers"][0]["volumeMounts"] == [
+        {"mountPath": "/media", "$patch": "delete"},
+        {"name": "charmarr-shared-data", "mountPath": "/data"},
+    ]
+
+
+def test_plan_detects_conflicts(manager):
+    """Different owners asking for different values of the same field conflict."""
+    plan = StatefulSetPatchPlan(manager, "radarr", "media")
+    plan.set_security_context(PodSecurityContext(fsGroup=1000), owner="storage")
+    plan.set_security_context(PodSecurityContext(fsGroup=1000), owner="other")
+    plan.add_container(Container(name="sidecar", image="a"), owner="vpn")
+
+    with pytest.raises(PatchConflictError, match="securityContext"):
+        plan.set_security_context(None, owner="hardware")
+    with pytest.raises(PatchConflictError, match="sidecar"):
+        plan.add_container(Container(name="sidecar", image="b"), owner="other")
+
+
+def test_plan_merge_rejects_unsupported_fields(manager):
+    """Only pod template annotations, volumes, containers and securityContext can be merged."""
+    plan = StatefulSetPatchPlan(manager, "radarr", "media")
+
+    with pytest.raises(ValueError, match="Only spec"):
+        plan.merge({"spec": {"replicas": 2}}, owner="x")
+    with pytest.raises(ValueError, match="hostNetwork"):
+        plan.merge({"spec": {"template": {"spec": {"hostNetwork": True}}}}, owner="x")
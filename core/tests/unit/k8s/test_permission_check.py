@@ -3,13 +3,22 @@
 
 """Unit tests for the storage permission check Job."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 import httpx
 import pytest
 from lightkube import ApiError
 from lightkube.models.batch_v1 import JobStatus
+from lightkube.models.meta_v1 import ObjectMeta
 from lightkube.resources.batch_v1 import Job
 
-from charmarr_lib.core import check_storage_permissions
+from charmarr_lib.core import (
+    AsyncK8sResourceManager,
+    PermissionCheckStatus,
+    check_storage_permissions,
+    check_storage_permissions_async,
+)
 
 
 @pytest.fixture
@@ -42,3 +51,33 @@ def test_job_runs_as_the_configured_user(applied_job):
 def test_job_sets_fs_group(applied_job):
     """Block-backed CSI volumes arrive root-owned; fsGroup makes them writable."""
     assert applied_job.securityContext.fsGroup == 1000
+
+
+def test_async_check_recreates_job_for_changed_ids():
+    """A Job created for another puid/pgid is deleted and submitted again."""
+    stale = Job(
+        metadata=ObjectMeta(
+            name="charmarr-permission-check-charmarr-shared-medi",
+            labels={"charmarr.io/puid": "0", "charmarr.io/pgid": "0"},
+        ),
+        status=JobStatus(succeeded=1),
+    )
+    client = MagicMock(
+        get=AsyncMock(side_effect=[stale, Job(status=JobStatus(failed=1))]),
+        delete=AsyncMock(),
+        apply=AsyncMock(),
+    )
+
+    result = asyncio.run(
+        check_storage_permissions_async(
+            manager=AsyncK8sResourceManager(client=client),
+            namespace="charmarr",
+            pvc_name="charmarr-shared-media",
+            puid=1000,
+            pgid=1000,
+        )
+    )
+
+    assert result.status == PermissionCheckStatus.FAILED
+    client.delete.assert_awaited_once()
+    assert client.apply.await_args.args[0].metadata.labels["charmarr.io/puid"] == "1000"
@@ -3,6 +3,9 @@
 
 """Unit tests for storage volume reconciliation."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 from lightkube.models.core_v1 import (
     PersistentVolumeClaimVolumeSource,
     PodSecurityContext,
@@ -10,7 +13,12 @@ from lightkube.models.core_v1 import (
     VolumeMount,
 )
 
-from charmarr_lib.core import is_storage_mounted, reconcile_storage_volume
+from charmarr_lib.core import (
+    AsyncK8sResourceManager,
+    is_storage_mounted,
+    reconcile_storage_volume,
+    reconcile_storage_volume_async,
+)
 
 # is_storage_mounted
 
@@ -77,8 +85,8 @@ def test_reconcile_patches_when_not_mounted(manager, mock_client, make_statefuls
     mock_client.patch.assert_called_once()
 
 
-def test_reconcile_patches_even_when_already_mounted(manager, mock_client, make_statefulset):
-    """Strategic merge patch is idempotent, so we always apply it."""
+def test_reconcile_skips_patch_when_already_mounted(manager, mock_client, make_statefulset):
+    """No patch is sent when the live StatefulSet already matches."""
     volume = Volume(
         name="charmarr-shared-data",
         persistentVolumeClaim=PersistentVolumeClaimVolumeSource(claimName="charmarr-media"),
@@ -94,6 +102,27 @@ def test_reconcile_patches_even_when_already_mounted(manager, mock_client, make_
         pvc_name="charmarr-media",
     )
 
+    assert result.changed is False
+    mock_client.patch.assert_not_called()
+
+
+def test_reconcile_patches_when_mount_path_differs(manager, mock_client, make_statefulset):
+    """A mounted volume at a different path still gets patched."""
+    volume = Volume(
+        name="charmarr-shared-data",
+        persistentVolumeClaim=PersistentVolumeClaimVolumeSource(claimName="charmarr-media"),
+    )
+    mount = VolumeMount(name="charmarr-shared-data", mountPath="/media")
+    mock_client.get.return_value = make_statefulset(volumes=[volume], container_mounts=[mount])
+
+    result = reconcile_storage_volume(
+        manager,
+        statefulset_name="radarr",
+        namespace="media",
+        container_name="radarr",
+        pvc_name="charmarr-media",
+    )
+
     assert result.changed is True
     mock_client.patch.assert_called_once()
 
@@ -269,3 +298,27 @@ def test_reconcile_remove_includes_security_context(manager, mock_client, make_s
     assert len(patch_ops) == 3
     paths = [op["path"] for op in patch_ops]
     assert "/spec/template/spec/securityContext" in paths
+
+
+# reconcile_storage_volume_async
+
+
+def test_reconcile_async_patches_when_not_mounted(make_statefulset):
+    """The async reconciler sends the same patch through the async client."""
+    client = MagicMock(get=AsyncMock(return_value=make_statefulset()), patch=AsyncMock())
+    manager = AsyncK8sResourceManager(client=client)
+
+    result = asyncio.run(
+        reconcile_storage_volume_async(
+            manager,
+            statefulset_name="radarr",
+            namespace="media",
+            container_name="radarr",
+            pvc_name="charmarr-media",
+            pgid=1000,
+        )
+    )
+
+    assert result.changed is True
+    patch = client.patch.await_args[0][2]
+    assert patch["spec"]["template"]["spec"]["securityContext"] == {"fsGroup": 1000}
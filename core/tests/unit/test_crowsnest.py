@@ -0,0 +1,111 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the crowsnest fleet poller."""
+
+import asyncio
+
+import httpx
+from pytest_httpx import HTTPXMock
+
+from charmarr_lib.core import CrowsnestFleetPoller
+from charmarr_lib.core.interfaces import CrowsnestProviderData
+
+
+def _provider(app: str, model: str = "media") -> CrowsnestProviderData:
+    return CrowsnestProviderData(
+        topology_url=f"http://{app}.{model}.svc:9099/metrics",
+        app_name=app,
+        model_name=model,
+    )
+
+
+def _exposition(app: str, relation: str, peer: str) -> str:
+    return (
+        "# TYPE charmarr_relation_bound gauge\n"
+        f'charmarr_relation_bound{{app="{app}",model="media",relation="{relation}",'
+        'role="requirer",required="true"} 1\n'
+        "# TYPE charmarr_relation_edge gauge\n"
+        f'charmarr_relation_edge{{relation="{relation}",from_app="{app}",to_app="{peer}"}} 1\n'
+        "charmarr_custom_total 3\n"
+    )
+
+
+def test_poll_merges_providers_into_deduplicated_graph(httpx_mock: HTTPXMock):
+    """Both ends of a relation publish the same edge; the graph keeps it once."""
+    httpx_mock.add_response(
+        url="http://radarr.media.svc:9099/metrics",
+        text=_exposition("radarr", "download-client", "qbittorrent"),
+    )
+    httpx_mock.add_response(
+        url="http://qbittorrent.media.svc:9099/metrics",
+        text=_exposition("radarr", "download-client", "qbittorrent"),
+    )
+    poller = CrowsnestFleetPoller()
+
+    graph = asyncio.run(poller.poll([_provider("radarr"), _provider("qbittorrent")]))
+
+    assert set(graph.nodes) == {"media/radarr", "media/qbittorrent"}
+    assert graph.nodes["media/radarr"].relations[0].required is True
+    assert len(graph.edges) == 1
+    assert graph.edges[0].source == ("media", "radarr")
+    assert graph.edges[0].target == ("media", "qbittorrent")
+
+
+def test_poll_resolves_cross_model_peers_and_adds_unpolled_nodes(httpx_mock: HTTPXMock):
+    httpx_mock.add_response(text=_exposition("overseerr", "media-manager", "plex"))
+    httpx_mock.add_response(text=_exposition("plex", "media-server", "otelcol"))
+    poller = CrowsnestFleetPoller()
+
+    graph = asyncio.run(poller.poll([_provider("overseerr"), _provider("plex", model="edge")]))
+
+    edges = {(e.source, e.target) for e in graph.edges}
+    assert (("media", "overseerr"), ("edge", "plex")) in edges
+    assert (("edge", "plex"), ("edge", "otelcol")) in edges
+    assert graph.nodes["edge/otelcol"].topology_url is None
+
+
+def test_poll_serves_stale_data_and_counts_errors(httpx_mock: HTTPXMock):
+    url = "http://radarr.media.svc:9099/metrics"
+    httpx_mock.add_response(url=url, text=_exposition("radarr", "x", "y"), headers={"ETag": '"a"'})
+    httpx_mock.add_exception(httpx.ReadTimeout("slow"), url=url)
+    httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": '"a"'})
+    poller = CrowsnestFleetPoller()
+    providers = [_provider("radarr")]
+
+    asyncio.run(poller.poll(providers))
+    stale = asyncio.run(poller.poll(providers))
+    fresh = asyncio.run(poller.poll(providers))
+
+    assert stale.nodes["media/radarr"].stale is True
+    assert fresh.nodes["media/radarr"].stale is False
+    assert len(fresh.edges) == 1
+    stats = poller.stats[("media", "radarr")]
+    assert (stats.polls, stats.errors, stats.not_modified) == (3, 1, 1)
+    assert stats.consecutive_errors == 0
+    assert stats.last_latency is not None
+
+
+def test_poll_bounds_concurrency_and_times_out_slow_targets():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(1.0 if request.url.host.startswith("slow") else 0.01)
+        in_flight -= 1
+        return httpx.Response(200, text="")
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            poller = CrowsnestFleetPoller(timeout=0.2, max_concurrency=3, http_client=client)
+            providers = [_provider(f"app{i}") for i in range(10)] + [_provider("slow")]
+            graph = await poller.poll(providers)
+            assert "media/slow" not in graph.nodes
+            assert len(graph.nodes) == 10
+            assert poller.stats[("media", "slow")].errors == 1
+
+    asyncio.run(run())
+    assert peak <= 3
@@ -0,0 +1,105 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for Prometheus exposition formatting."""
+
+import math
+
+import pytest
+
+from charmarr_lib.core import (
+    ExpositionBuilder,
+    HistogramSample,
+    MetricFamily,
+    MetricSample,
+    SummarySample,
+)
+
+
+def test_label_values_and_help_are_escaped():
+    text = (
+        ExpositionBuilder()
+        .gauge("app_up", 'Help with "quotes" and \\ and\nnewline', [({"app": 'pl"ex\n\\'}, 1)])
+        .render()
+    )
+
+    assert '# HELP app_up Help with "quotes" and \\\\ and\\nnewline' in text
+    assert 'app_up{app="pl\\"ex\\n\\\\"} 1' in text
+    assert text.count("\n") == 3
+
+
+def test_histogram_emits_buckets_inf_sum_and_count():
+    lines = (
+        ExpositionBuilder()
+        .histogram(
+            "hook_seconds",
+            "Hook duration",
+            [({"event": "config_changed"}, [(0.1, 2), (1.0, 5)], 2.5, 6)],
+        )
+        .lines()
+    )
+
+    assert lines == [
+        "# HELP hook_seconds Hook duration",
+        "# TYPE hook_seconds histogram",
+        'hook_seconds_bucket{event="config_changed",le="0.1"} 2',
+        'hook_seconds_bucket{event="config_changed",le="1"} 5',
+        'hook_seconds_bucket{event="config_changed",le="+Inf"} 6',
+        'hook_seconds_sum{event="config_changed"} 2.5',
+        'hook_seconds_count{event="config_changed"} 6',
+    ]
+
+
+def test_histogram_does_not_duplicate_explicit_inf_bucket():
+    lines = ExpositionBuilder().histogram("h", "h", [({}, [(math.inf, 3)], 1.0, 3)]).lines()
+
+    assert [line for line in lines if "+Inf" in line] == ['h_bucket{le="+Inf"} 3']
+
+
+def test_summary_emits_quantiles_sum_and_count():
+    lines = ExpositionBuilder().summary("s", "s", [({}, [(0.5, 0.2), (0.99, 1.5)], 3, 4)]).lines()
+
+    assert lines[2:] == ['s{quantile="0.5"} 0.2', 's{quantile="0.99"} 1.5', "s_sum 3", "s_count 4"]
+
+
+def test_family_models_render_like_the_builder():
+    family = MetricFamily(
+        name="item_seconds",
+        help="Per-item latency",
+        type="histogram",
+        samples=[HistogramSample(labels={"item": "a"}, buckets=[(0.5, 1)], sum=0.3, count=1)],
+    )
+    builder = ExpositionBuilder().histogram(
+        "item_seconds", "Per-item latency", [({"item": "a"}, [(0.5, 1)], 0.3, 1)]
+    )
+
+    assert ExpositionBuilder().family(family).lines() == builder.lines()
+
+
+def test_family_rejects_samples_of_the_wrong_kind():
+    family = MetricFamily(
+        name="s",
+        help="s",
+        type="summary",
+        samples=[MetricSample(value=1)],
+    )
+
+    with pytest.raises(TypeError):
+        ExpositionBuilder().family(family)
+
+
+def test_special_values_use_prometheus_spelling():
+    text = ExpositionBuilder().gauge("g", "g", [({}, math.nan), ({}, -math.inf), ({}, 0.25)])
+
+    assert text.lines()[2:] == ["g NaN", "g -Inf", "g 0.25"]
+
+
+def test_summary_family_accepts_summary_samples():
+    family = MetricFamily(
+        name="s",
+        help="s",
+        type="summary",
+        samples=[SummarySample(quantiles=[(0.5, 1)], sum=1, count=1)],
+    )
+
+    assert ExpositionBuilder().family(family).lines()[-1] == "s_count 1"
@@ -0,0 +1,102 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Scenario tests for the reconcile input fingerprint gate."""
+
+import dataclasses
+from typing import ClassVar
+
+import ops
+import pytest
+from scenario import Context, Relation, State, StoredState
+
+from charmarr_lib.core import ReconcileGate, observe_events, reconcilable_events_k8s
+
+_STORED_OWNER = "GatedCharm/ReconcileGate[reconcile-gate]"
+
+
+class GatedCharm(ops.CharmBase):
+    META: ClassVar[dict[str, object]] = {
+        "name": "radarr-k8s",
+        "requires": {"download-client": {"interface": "download_client"}},
+    }
+    CONFIG: ClassVar[dict[str, object]] = {"options": {"port": {"type": "int", "default": 7878}}}
+
+    def __init__(self, framework: ops.Framework):
+        super().__init__(framework)
+        self.reconciled = 0
+        self.gate = ReconcileGate(self, relations=["download-client"], max_staleness=600)
+        observe_events(self, reconcilable_events_k8s, self.gate.guard(self._reconcile))
+
+    def _reconcile(self) -> None:
+        self.reconciled += 1
+
+
+@pytest.fixture
+def ctx() -> Context[GatedCharm]:
+    return Context(GatedCharm, meta=GatedCharm.META, config=GatedCharm.CONFIG)
+
+
+def _run(ctx: Context[GatedCharm], event, state: State) -> tuple[State, int]:
+    with ctx(event, state) as mgr:
+        state_out = mgr.run()
+        return state_out, mgr.charm.reconciled
+
+
+def _stored(state: State) -> dict:
+    return dict(next(s for s in state.stored_states if s.owner_path == _STORED_OWNER).content)
+
+
+def test_unchanged_inputs_skip_update_status(ctx: Context[GatedCharm]):
+    state, reconciled = _run(ctx, ctx.on.config_changed(), State())
+    assert reconciled == 1
+
+    state, reconciled = _run(ctx, ctx.on.update_status(), state)
+
+    assert reconciled == 0
+    assert (_stored(state)["runs"], _stored(state)["skips"]) == (1, 1)
+
+
+def test_changed_inputs_run(ctx: Context[GatedCharm]):
+    relation = Relation("download-client", remote_app_data={"url": "http://qbit:8080"})
+    state, _ = _run(ctx, ctx.on.config_changed(), State(relations=[relation]))
+
+    changed = dataclasses.replace(relation, remote_app_data={"url": "http://qbit:8081"})
+    state = dataclasses.replace(state, relations=[changed])
+    _, reconciled = _run(ctx, ctx.on.update_status(), state)
+    assert reconciled == 1
+
+    _, reconciled = _run(
+        ctx, ctx.on.update_status(), dataclasses.replace(state, config={"port": 1})
+    )
+    assert reconciled == 1
+
+
+def test_stale_fingerprint_runs_anyway(ctx: Context[GatedCharm]):
+    state, _ = _run(ctx, ctx.on.config_changed(), State())
+    content = {**_stored(state), "reconciled_at": 0.0}
+    state = dataclasses.replace(
+        state, stored_states=[StoredState(owner_path=_STORED_OWNER, content=content)]
+    )
+
+    _, reconciled = _run(ctx, ctx.on.update_status(), state)
+
+    assert reconciled == 1
+
+
+def test_non_skippable_events_always_run(ctx: Context[GatedCharm]):
+    state, _ = _run(ctx, ctx.on.config_changed(), State())
+
+    _, reconciled = _run(ctx, ctx.on.start(), state)
+
+    assert reconciled == 1
+
+
+def test_exposition_reports_counters(ctx: Context[GatedCharm]):
+    state, _ = _run(ctx, ctx.on.config_changed(), State())
+    with ctx(ctx.on.update_status(), state) as mgr:
+        mgr.run()
+        text = mgr.charm.gate.exposition().render()
+
+    assert 'charmarr_reconcile_total{result="run"} 1' in text
+    assert 'charmarr_reconcile_total{result="skip"} 1' in text
@@ -0,0 +1,151 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for opt-in hook and library call instrumentation."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+import ops
+import pytest
+from pytest_httpx import HTTPXMock
+from scenario import Context, State
+
+from charmarr_lib.core import (
+    ArrApiClient,
+    Instrumentation,
+    disable_instrumentation,
+    enable_instrumentation,
+    get_instrumentation,
+    instrument_container,
+    observe_events,
+)
+from charmarr_lib.krm import K8sCall
+
+
+@pytest.fixture(autouse=True)
+def _state_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    state_file = tmp_path / "instrumentation.json"
+    monkeypatch.setattr(Instrumentation, "STATE_FILE", state_file)
+    yield state_file
+    disable_instrumentation()
+
+
+class InstrumentedCharm(ops.CharmBase):
+    def __init__(self, framework: ops.Framework):
+        super().__init__(framework)
+        self.instrumentation = enable_instrumentation(self)
+        observe_events(self, {ops.ConfigChangedEvent, ops.UpdateStatusEvent}, self._reconcile)
+
+    def _reconcile(self, event: ops.EventBase) -> None:
+        if isinstance(event, ops.UpdateStatusEvent):
+            raise RuntimeError("boom")
+
+
+def _hook_counts(state_file: Path) -> dict[str, int]:
+    rows = json.loads(state_file.read_text())["series"]["hook"]
+    return {labels["event"]: sum(counts) for labels, counts, *_ in rows}
+
+
+def test_hook_durations_persist_across_hooks(_state_file: Path):
+    ctx = Context(InstrumentedCharm, meta={"name": "radarr"})
+
+    ctx.run(ctx.on.config_changed(), State())
+    ctx.run(ctx.on.config_changed(), State())
+
+    assert _hook_counts(_state_file) == {"config_changed": 2}
+
+
+def test_failed_handler_is_counted_as_error(_state_file: Path):
+    ctx = Context(InstrumentedCharm, meta={"name": "radarr"})
+    with pytest.raises(Exception, match="boom"):
+        ctx.run(ctx.on.update_status(), State())
+
+    instrumentation = get_instrumentation()
+    assert instrumentation is not None
+    text = instrumentation.exposition().render()
+    assert 'charmarr_hook_errors_total{event="update_status"} 1' in text
+
+
+def test_http_requests_are_recorded_per_normalized_endpoint(
+    _state_file: Path, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+):
+    instrumentation = Instrumentation()
+    monkeypatch.setattr("charmarr_lib.core._instrumentation._active", instrumentation)
+    httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+    httpx_mock.add_response(json={"id": 12})
+    httpx_mock.add_response(json={"id": 13})
+
+    with ArrApiClient("http://radarr:7878", "key") as client:
+        client._put("/downloadclient/12", {"id": 12})  # pyright: ignore[reportPrivateUsage]
+        client._put("/downloadclient/13", {"id": 13})  # pyright: ignore[reportPrivateUsage]
+
+    text = instrumentation.exposition().render()
+    labels = 'client="ArrApiClient",endpoint="/downloadclient/{id}",method="PUT"'
+    assert f"charmarr_http_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f"charmarr_http_request_errors_total{{{labels}}} 0" in text
+    assert f"charmarr_http_request_retries_total{{{labels}}} 1" in text
+
+
+def test_k8s_calls_and_retries_are_recorded():
+    instrumentation = Instrumentation()
+
+    instrumentation.record_k8s_call(K8sCall("patch", "StatefulSet", 0.2, attempts=3))
+    instrumentation.record_k8s_call(K8sCall("get", "Service", 0.01, attempts=1, error="404"))
+
+    text = instrumentation.exposition().render()
+    assert 'charmarr_k8s_request_retries_total{kind="StatefulSet",verb="patch"} 2' in text
+    assert 'charmarr_k8s_request_errors_total{kind="Service",verb="get"} 1' in text
+    assert (
+        'charmarr_k8s_request_duration_seconds_bucket{kind="StatefulSet",verb="patch",le="0.25"} 1'
+        in text
+    )
+
+
+def test_instrumented_container_times_exec_pull_and_push(monkeypatch: pytest.MonkeyPatch):
+    instrumentation = Instrumentation()
+    container = MagicMock()
+    assert instrument_container(container) is container
+
+    monkeypatch.setattr("charmarr_lib.core._instrumentation._active", instrumentation)
+    wrapped = instrument_container(container)
+    wrapped.pull("/etc/passwd")
+    wrapped.push("/etc/passwd", "x")
+    wrapped.exec(["true"]).wait_output()
+    wrapped.can_connect()
+
+    text = instrumentation.exposition().render()
+    for operation in ("exec", "pull", "push"):
+        assert (
+            f'charmarr_pebble_operation_duration_seconds_count{{operation="{operation}"}} 1'
+            in text
+        )
+    container.can_connect.assert_called_once()
+
+
+def test_state_with_other_buckets_is_discarded(_state_file: Path):
+    first = Instrumentation(buckets=(1.0,))
+    first.observe("hook", {"event": "install"}, 0.5)
+    first.save()
+
+    assert Instrumentation(buckets=(1.0,)).exposition().lines()
+    assert Instrumentation().exposition().lines() == []
+
+
+def test_failed_save_keeps_previous_state(_state_file: Path, monkeypatch: pytest.MonkeyPatch):
+    instrumentation = Instrumentation()
+    instrumentation.observe("hook", {"event": "install"}, 0.5)
+    instrumentation.save()
+    saved = _state_file.read_text()
+
+    def interrupted(src: str, dst: Path) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr("os.replace", interrupted)
+    instrumentation.observe("hook", {"event": "install"}, 0.5)
+    instrumentation.save()
+
+    assert _state_file.read_text() == saved
+    assert [p.name for p in _state_file.parent.iterdir()] == [_state_file.name]
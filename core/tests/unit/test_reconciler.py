@@ -0,0 +1,120 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Scenario tests for observe_events."""
+
+from typing import ClassVar
+
+import ops
+import pytest
+from scenario import Context, Relation, State
+
+from charmarr_lib.core import ReconcileTriggers, observe_events, reconcilable_events_k8s
+from charmarr_lib.core.interfaces import FlareSolverrChangedEvent, FlareSolverrRequirer
+
+
+class ReconcilingCharm(ops.CharmBase):
+    """Charm reconciling on core events and the flaresolverr library event."""
+
+    META: ClassVar[dict[str, object]] = {
+        "name": "prowlarr-k8s",
+        "requires": {"flaresolverr": {"interface": "flaresolverr"}},
+    }
+    COALESCE: ClassVar[bool] = False
+
+    def __init__(self, framework: ops.Framework):
+        super().__init__(framework)
+        self.calls: list[ops.EventBase | ReconcileTriggers] = []
+        self.flaresolverr = FlareSolverrRequirer(self, "flaresolverr")
+        observe_events(
+            self,
+            reconcilable_events_k8s,
+            self._reconcile,
+            coalesce=self.COALESCE,
+            extra_events=[self.flaresolverr.on.changed],
+        )
+
+    def _reconcile(self, trigger: ops.EventBase | ReconcileTriggers) -> None:
+        self.calls.append(trigger)
+
+
+class CoalescingCharm(ReconcilingCharm):
+    COALESCE: ClassVar[bool] = True
+
+
+def _relation_changed(charm_type: type[ReconcilingCharm]) -> list:
+    ctx = Context(charm_type, meta=charm_type.META)
+    relation = Relation(endpoint="flaresolverr", interface="flaresolverr")
+    with ctx(ctx.on.relation_changed(relation), State(relations=[relation])) as mgr:
+        mgr.run()
+        return mgr.charm.calls
+
+
+def test_without_coalesce_each_trigger_reconciles():
+    calls = _relation_changed(ReconcilingCharm)
+
+    assert len(calls) == 2
+    assert {type(call) for call in calls} == {ops.RelationChangedEvent, FlareSolverrChangedEvent}
+
+
+def test_coalesce_reconciles_once_with_all_triggers():
+    [triggers] = _relation_changed(CoalescingCharm)
+
+    assert isinstance(triggers, ReconcileTriggers)
+    assert triggers.kinds == {"flaresolverr_relation_changed", "changed"}
+    assert triggers.any_of(FlareSolverrChangedEvent)
+    assert not triggers.any_of(ops.ConfigChangedEvent)
+
+
+def test_coalesce_skips_dispatch_without_triggers():
+    ctx = Context(CoalescingCharm, meta=CoalescingCharm.META)
+    with ctx(ctx.on.remove(), State()) as mgr:
+        mgr.run()
+        assert mgr.charm.calls == []
+
+
+@pytest.mark.parametrize("charm_type", [ReconcilingCharm, CoalescingCharm])
+def test_zero_argument_handler(charm_type: type[ReconcilingCharm]):
+    calls: list[None] = []
+
+    class Charm(ops.CharmBase):
+        def __init__(self, framework: ops.Framework):
+            super().__init__(framework)
+            observe_events(
+                self,
+                {ops.ConfigChangedEvent},
+                lambda: calls.append(None),
+                coalesce=charm_type.COALESCE,
+            )
+
+    ctx = Context(Charm, meta={"name": "radarr"})
+    ctx.run(ctx.on.config_changed(), State())
+
+    assert calls == [None]
+
+
+class StatusCharm(ops.CharmBase):
+    """Coalesced reconcile whose result is reported by a collect-status handler."""
+
+    def __init__(self, framework: ops.Framework):
+        super().__init__(framework)
+        self.reconciled = False
+        observe_events(self, {ops.ConfigChangedEvent}, self._reconcile, coalesce=True)
+        framework.observe(self.on.collect_unit_status, self._on_collect_unit_status)
+
+    def _reconcile(self) -> None:
+        self.reconciled = True
+
+    def _on_collect_unit_status(self, event: ops.CollectStatusEvent) -> None:
+        if self.reconciled:
+            event.add_status(ops.ActiveStatus())
+        else:
+            event.add_status(ops.WaitingStatus("reconcile pending"))
+
+
+def test_coalesced_reconcile_runs_before_status_is_collected():
+    ctx = Context(StatusCharm, meta={"name": "radarr"})
+
+    state = ctx.run(ctx.on.config_changed(), State())
+
+    assert state.unit_status == ops.ActiveStatus()
@@ -0,0 +1,64 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for ReconcileRouter."""
+
+from unittest.mock import MagicMock
+
+import ops
+import pytest
+
+from charmarr_lib.core import ReconcileRouter, ReconcileTriggers
+from charmarr_lib.core.interfaces import (
+    ChangeKind,
+    DownloadClientChangedEvent,
+    MediaStorageChangedEvent,
+    RelationDataChangedEvent,
+)
+
+
+def _changed(
+    event_type: type[RelationDataChangedEvent], change: ChangeKind = "updated"
+) -> RelationDataChangedEvent:
+    return event_type(MagicMock(), relation_id=1, app_name="remote", change=change)
+
+
+@pytest.fixture
+def router() -> ReconcileRouter:
+    steps = {name: MagicMock() for name in ("storage", "statefulset", "download_clients")}
+    return (
+        ReconcileRouter(steps)
+        .route(MediaStorageChangedEvent, "storage", "statefulset")
+        .route(DownloadClientChangedEvent, "download_clients")
+    )
+
+
+def test_routed_event_runs_only_its_steps(router: ReconcileRouter):
+    assert router.run(_changed(DownloadClientChangedEvent)) == ["download_clients"]
+
+
+def test_unchanged_remote_data_runs_nothing(router: ReconcileRouter):
+    assert router.select(_changed(DownloadClientChangedEvent, "unchanged")) == []
+
+
+def test_unrouted_trigger_runs_everything(router: ReconcileRouter):
+    triggers = ReconcileTriggers([_changed(DownloadClientChangedEvent), MagicMock(ops.StartEvent)])
+
+    assert router.select(triggers) == ["storage", "statefulset", "download_clients"]
+
+
+def test_coalesced_triggers_union_steps_in_declaration_order(router: ReconcileRouter):
+    triggers = ReconcileTriggers(
+        [_changed(DownloadClientChangedEvent), _changed(MediaStorageChangedEvent, "removed")]
+    )
+
+    assert router.select(triggers) == ["storage", "statefulset", "download_clients"]
+    assert router.select(ReconcileTriggers([_changed(MediaStorageChangedEvent)])) == [
+        "storage",
+        "statefulset",
+    ]
+
+
+def test_unknown_step_is_rejected(router: ReconcileRouter):
+    with pytest.raises(KeyError, match="vpn"):
+        router.route(ops.ConfigChangedEvent, "vpn")
@@ -3,10 +3,16 @@
 
 """Unit tests for CharmarrTopology helper."""
 
+import importlib.util
+import json
+import signal
+import socket
+import threading
 from pathlib import Path
 from typing import ClassVar
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 from ops import CharmBase
 from scenario import Context, Relation, State
@@ -15,9 +21,14 @@ from charmarr_lib.core import (
     CharmarrChargedTopology,
     CharmarrTopology,
     CharmarrTopologyRelation,
+    ExpositionBuilder,
     MetricFamily,
     MetricSample,
 )
+from charmarr_lib.core._topology import (
+    _SERVER_SCRIPT_VERSION,  # pyright: ignore[reportPrivateUsage]
+    _TOPOLOGY_SERVER_SCRIPT,  # pyright: ignore[reportPrivateUsage]
+)
 
 
 class TopologyCharm(CharmBase):
@@ -51,7 +62,10 @@ def _isolate_tmp_paths(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Redirect topology paths into tmp_path so tests never touch /tmp."""
     monkeypatch.setattr(CharmarrTopology, "PID_FILE", tmp_path / "topology.pid")
     monkeypatch.setattr(CharmarrTopology, "METRICS_FILE", tmp_path / "topology.prom")
+    monkeypatch.setattr(CharmarrTopology, "STATE_FILE", tmp_path / "topology.state")
+    monkeypatch.setattr(CharmarrTopology, "TOPOLOGY_FILE", tmp_path / "topology.json")
     monkeypatch.setattr(CharmarrTopology, "SERVER_SCRIPT", tmp_path / "server.py")
+    monkeypatch.setattr(CharmarrTopology, "REGISTRY_FILE", tmp_path / "registry.json")
     return tmp_path
 
 
@@ -65,6 +79,27 @@ def fake_popen(monkeypatch: pytest.MonkeyPatch):
     return factory
 
 
+@pytest.fixture
+def processes(monkeypatch: pytest.MonkeyPatch, fake_popen: MagicMock):
+    """Fake process table: pid -> argv, fed by fake_popen and read via /proc cmdline."""
+    table: dict[int, list[str]] = {}
+    signals: list[tuple[int, int]] = []
+
+    def _popen(args, **_kwargs):
+        table[12345] = list(args)
+        return fake_popen.return_value
+
+    def _kill(pid: int, sig: int) -> None:
+        signals.append((pid, sig))
+        if sig == signal.SIGTERM:
+            table.pop(pid, None)
+
+    fake_popen.side_effect = _popen
+    monkeypatch.setattr("charmarr_lib.core._topology._read_cmdline", table.get)
+    monkeypatch.setattr("charmarr_lib.core._topology.os.kill", _kill)
+    return table, signals
+
+
 def test_metrics_output_shape(_isolate_tmp_paths: Path, fake_popen: MagicMock):
     """One required relation bound, one required unbound, one provides bound.
 
@@ -117,11 +152,8 @@ def test_metrics_output_shape(_isolate_tmp_paths: Path, fake_popen: MagicMock):
     assert "media-storage" not in text.split("charmarr_relation_edge")[1]
 
 
-def test_daemon_spawn_is_idempotent(
-    _isolate_tmp_paths: Path, fake_popen: MagicMock, monkeypatch: pytest.MonkeyPatch
-):
-    """First reconcile spawns; a subsequent reconcile with a live pid does NOT respawn."""
-    monkeypatch.setattr("charmarr_lib.core._topology.os.kill", lambda *_a, **_k: None)
+def test_daemon_spawn_is_idempotent(_isolate_tmp_paths: Path, fake_popen: MagicMock, processes):
+    """First reconcile spawns; a subsequent reconcile with a live daemon does NOT respawn."""
     ctx = Context(TopologyCharm, meta=TopologyCharm.META)
 
     with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
@@ -131,8 +163,108 @@ def test_daemon_spawn_is_idempotent(
 
     assert fake_popen.call_count == 1
     assert fake_popen.call_args.kwargs["start_new_session"] is True
-    assert (_isolate_tmp_paths / "server.py").exists()
+    assert fake_popen.call_args.args[0][-1] == _SERVER_SCRIPT_VERSION
+    assert (_isolate_tmp_paths / "server.py").read_text() == _TOPOLOGY_SERVER_SCRIPT
     assert (_isolate_tmp_paths / "topology.pid").read_text() == "12345"
+    assert processes[1] == []
+
+
+def test_unchanged_exposition_is_not_rewritten(_isolate_tmp_paths: Path, fake_popen: MagicMock):
+    """Identical renders skip the write; the generation only moves when content changes."""
+    ctx = Context(TopologyCharm, meta=TopologyCharm.META)
+    metrics = _isolate_tmp_paths / "topology.prom"
+
+    with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
+        topology = mgr.charm.topology
+        topology.reconcile()
+        first_stat = metrics.stat()
+        assert topology.generation == 1
+
+        topology.reconcile()
+        assert metrics.stat().st_mtime_ns == first_stat.st_mtime_ns
+        assert metrics.stat().st_ino == first_stat.st_ino
+        assert topology.generation == 1
+        mgr.run()
+
+    relation = Relation(endpoint="download-client", interface="download_client")
+    with ctx(ctx.on.update_status(), State(leader=True, relations=[relation])) as mgr:
+        mgr.charm.topology.reconcile()
+        assert mgr.charm.topology.generation == 2
+        mgr.run()
+
+    assert 'charmarr_relation_edge{relation="download-client"' in metrics.read_text()
+    assert sorted(p.name for p in _isolate_tmp_paths.iterdir() if p.name.startswith(".")) == []
+
+
+def test_extra_series_do_not_bump_the_generation(_isolate_tmp_paths: Path, fake_popen: MagicMock):
+    """Per-hook series rewrite the metrics file but leave the topology document alone."""
+    hooks = iter(range(1, 10))
+
+    class CountingCharm(CharmBase):
+        META: ClassVar[dict[str, object]] = {"name": "storage"}
+
+        def __init__(self, framework):
+            super().__init__(framework)
+            self.topology = CharmarrChargedTopology(
+                self, relations=[], extra_exposition=self._extras
+            )
+
+        def _extras(self) -> list[MetricFamily]:
+            sample = MetricSample(value=next(hooks))
+            return [MetricFamily(name="charmarr_hooks_total", help="Hooks", samples=[sample])]
+
+    ctx = Context(CountingCharm, meta=CountingCharm.META)
+    document = _isolate_tmp_paths / "topology.json"
+    state = State(leader=True)
+    mtimes = []
+    for _ in range(2):
+        with ctx(ctx.on.update_status(), state) as mgr:
+            mgr.charm.topology.reconcile()
+            mgr.run()
+        mtimes.append(document.stat().st_mtime_ns)
+
+    assert "charmarr_hooks_total 2" in (_isolate_tmp_paths / "topology.prom").read_text()
+    assert mtimes[0] == mtimes[1]
+    assert json.loads(document.read_text())["generation"] == 1
+
+
+def test_topology_document_tracks_generation(_isolate_tmp_paths: Path, fake_popen: MagicMock):
+    """The JSON document carries identity, relations, edges and the current generation."""
+    ctx = Context(TopologyCharm, meta=TopologyCharm.META)
+    relation = Relation(
+        endpoint="download-client", interface="download_client", remote_app_name="sabnzbd"
+    )
+    with ctx(ctx.on.update_status(), State(leader=True, relations=[relation])) as mgr:
+        mgr.charm.topology.reconcile()
+        mgr.run()
+
+    document = json.loads((_isolate_tmp_paths / "topology.json").read_text())
+    assert document["generation"] == 1
+    assert document["app_name"] == "radarr"
+    assert {r["name"]: r["bound"] for r in document["relations"]} == {
+        "download-client": True,
+        "media-storage": False,
+        "metrics-endpoint": False,
+    }
+    assert document["edges"] == [
+        {"relation": "download-client", "from_app": "radarr", "to_app": "sabnzbd"}
+    ]
+    registry = json.loads((_isolate_tmp_paths / "registry.json").read_text())
+    assert registry["9099"]["/topology.json"] == str(_isolate_tmp_paths / "topology.json")
+
+
+def test_deleted_metrics_file_is_rewritten(_isolate_tmp_paths: Path, fake_popen: MagicMock):
+    """A matching digest does not skip the write when the file itself is gone (e.g. /tmp wiped)."""
+    ctx = Context(TopologyCharm, meta=TopologyCharm.META)
+    metrics = _isolate_tmp_paths / "topology.prom"
+
+    with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
+        mgr.charm.topology.reconcile()
+        metrics.unlink()
+        mgr.charm.topology.reconcile()
+        mgr.run()
+
+    assert metrics.exists()
 
 
 class ChargedTopologyCharm(CharmBase):
@@ -188,6 +320,35 @@ def test_charged_topology_appends_extra_families(_isolate_tmp_paths: Path, fake_
     assert 'charmarr_storage_pvc_mounted{consumer="sonarr"} 0' in text
 
 
+def test_charged_topology_accepts_streaming_builder(
+    _isolate_tmp_paths: Path, fake_popen: MagicMock
+):
+    """A callback may return an ExpositionBuilder instead of MetricFamily models."""
+
+    class BuilderCharm(CharmBase):
+        META: ClassVar[dict[str, object]] = {"name": "storage"}
+
+        def __init__(self, framework):
+            super().__init__(framework)
+            self.topology = CharmarrChargedTopology(
+                self, relations=[], extra_exposition=self._extras
+            )
+
+        def _extras(self) -> ExpositionBuilder:
+            return ExpositionBuilder().histogram(
+                "charmarr_item_seconds", "Per-item latency", [({"item": "a"}, [(1.0, 2)], 0.5, 2)]
+            )
+
+    ctx = Context(BuilderCharm, meta=BuilderCharm.META)
+    with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
+        mgr.charm.topology.reconcile()
+        mgr.run()
+
+    text = (_isolate_tmp_paths / "topology.prom").read_text()
+    assert "# TYPE charmarr_item_seconds histogram" in text
+    assert 'charmarr_item_seconds_bucket{item="a",le="+Inf"} 2' in text
+
+
 def test_charged_topology_swallows_callback_errors(
     _isolate_tmp_paths: Path, fake_popen: MagicMock
 ):
@@ -224,16 +385,102 @@ def test_charged_topology_swallows_callback_errors(
 
 
 def test_daemon_respawns_when_pid_stale(
-    _isolate_tmp_paths: Path, fake_popen: MagicMock, monkeypatch: pytest.MonkeyPatch
+    _isolate_tmp_paths: Path, fake_popen: MagicMock, processes
 ):
-    """Stale pidfile (process no longer exists) triggers a respawn."""
+    """A pidfile whose pid is gone, or now belongs to another process, triggers a respawn."""
+    table, signals = processes
     (_isolate_tmp_paths / "topology.pid").write_text("999")
+    table[999] = ["/usr/bin/python3", "/usr/bin/some-other-daemon"]
+
+    ctx = Context(TopologyCharm, meta=TopologyCharm.META)
+    with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
+        mgr.charm.topology.reconcile()
+        mgr.run()
+
+    assert fake_popen.call_count == 1
+    assert signals == []
+    assert (_isolate_tmp_paths / "topology.pid").read_text() == "12345"
 
-    def _dead(*_a, **_k):
-        raise ProcessLookupError
 
-    monkeypatch.setattr("charmarr_lib.core._topology.os.kill", _dead)
+def test_outdated_daemon_is_replaced(_isolate_tmp_paths: Path, fake_popen: MagicMock, processes):
+    """A daemon running an older script version is stopped and the script is rewritten."""
+    table, signals = processes
+    script = _isolate_tmp_paths / "server.py"
+    script.write_text("# old daemon code")
+    (_isolate_tmp_paths / "topology.pid").write_text("777")
+    table[777] = ["python3", str(script), "9099", "/tmp/charmarr-topology.prom"]
 
+    ctx = Context(TopologyCharm, meta=TopologyCharm.META)
+    with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
+        mgr.charm.topology.reconcile()
+        mgr.run()
+
+    assert signals == [(777, signal.SIGTERM)]
+    assert fake_popen.call_count == 1
+    assert script.read_text() == _TOPOLOGY_SERVER_SCRIPT
+
+
+class MultiEndpointCharm(CharmBase):
+    META: ClassVar[dict[str, object]] = {
+        "name": "sonarr",
+        "requires": {"download-client": {"interface": "download_client"}},
+    }
+
+    def __init__(self, framework):
+        super().__init__(framework)
+        relations = [CharmarrTopologyRelation("download-client", role="requires", required=True)]
+        self.primary = CharmarrTopology(self, relations=relations)
+        self.secondary = CharmarrTopology(self, relations=relations, port=9100)
+
+
+def test_multiple_ports_share_one_daemon(
+    _isolate_tmp_paths: Path, fake_popen: MagicMock, processes
+):
+    """Each port gets its own files and registry entry; the live daemon is told to reload."""
+    _, signals = processes
+    ctx = Context(MultiEndpointCharm, meta=MultiEndpointCharm.META)
+    with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
+        mgr.charm.primary.reconcile()
+        mgr.charm.secondary.reconcile()
+        mgr.charm.secondary.reconcile()
+        mgr.run()
+
+    assert fake_popen.call_count == 1
+    assert signals == [(12345, signal.SIGHUP)]
+    registry = json.loads((_isolate_tmp_paths / "registry.json").read_text())
+    assert registry["9099"]["/metrics"] == str(_isolate_tmp_paths / "topology.prom")
+    assert registry["9100"]["/metrics"] == str(_isolate_tmp_paths / "topology-9100.prom")
+    assert (_isolate_tmp_paths / "topology-9100.prom").exists()
+    assert (_isolate_tmp_paths / "topology-9100.json").exists()
+
+
+def test_registry_drops_ports_no_longer_served(
+    _isolate_tmp_paths: Path, fake_popen: MagicMock, processes
+):
+    """Ports registered by earlier dispatches but not served anymore are removed."""
+    registry_file = _isolate_tmp_paths / "registry.json"
+    registry_file.write_text(json.dumps({"9101": {"/metrics": "/tmp/gone.prom"}}))
+
+    ctx = Context(MultiEndpointCharm, meta=MultiEndpointCharm.META)
+    with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
+        mgr.charm.primary.reconcile()
+        mgr.run()
+
+    assert set(json.loads(registry_file.read_text())) == {"9099"}
+
+
+def test_daemon_exiting_before_reload_is_respawned(
+    _isolate_tmp_paths: Path, fake_popen: MagicMock, processes, monkeypatch: pytest.MonkeyPatch
+):
+    """A daemon that exits between the cmdline check and SIGHUP is respawned."""
+    table, _ = processes
+    (_isolate_tmp_paths / "topology.pid").write_text("777")
+    table[777] = ["python3", str(_isolate_tmp_paths / "server.py"), "r", _SERVER_SCRIPT_VERSION]
+
+    def _exited(pid: int, sig: int) -> None:
+        raise ProcessLookupError(pid)
+
+    monkeypatch.setattr("charmarr_lib.core._topology.os.kill", _exited)
     ctx = Context(TopologyCharm, meta=TopologyCharm.META)
     with ctx(ctx.on.update_status(), State(leader=True)) as mgr:
         mgr.charm.topology.reconcile()
@@ -241,3 +488,138 @@ def test_daemon_respawns_when_pid_stale(
 
     assert fake_popen.call_count == 1
     assert (_isolate_tmp_paths / "topology.pid").read_text() == "12345"
+
+
+@pytest.fixture
+def server_module(tmp_path: Path):
+    """Import the generated daemon script as a module."""
+    script = tmp_path / "server_script.py"
+    script.write_text(_TOPOLOGY_SERVER_SCRIPT)
+    spec = importlib.util.spec_from_file_location("topology_server_script", script)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def topology_server(tmp_path: Path, server_module):
+    """Run the generated daemon's HTTP server in-process on an ephemeral port."""
+    module = server_module
+
+    metrics = tmp_path / "served.prom"
+    metrics.write_text("charmarr_relation_bound 1\n")
+    document = tmp_path / "served.json"
+    document.write_text('{"generation": 1}')
+    routes = {"/metrics": str(metrics), "/topology.json": str(document)}
+    server = module.build_server(0, routes, host="127.0.0.1")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", metrics
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_conditional_get_returns_304_until_file_changes(topology_server):
+    """ETag round-trips to a 304; rewriting the file invalidates the cached body."""
+    base_url, metrics = topology_server
+    with httpx.Client(base_url=base_url) as client:
+        first = client.get("/metrics")
+        assert first.status_code == 200
+        assert first.text == "charmarr_relation_bound 1\n"
+        assert first.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+        etag = first.headers["etag"]
+        assert client.get("/metrics", headers={"If-None-Match": etag}).status_code == 304
+
+        metrics.write_text("charmarr_relation_bound 0\n")
+        changed = client.get("/metrics", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.text == "charmarr_relation_bound 0\n"
+        assert changed.headers["etag"] != etag
+
+
+def test_server_serves_topology_document(topology_server):
+    base_url, _ = topology_server
+    with httpx.Client(base_url=base_url) as client:
+        response = client.get("/topology.json")
+        not_modified = client.get(
+            "/topology.json", headers={"If-None-Match": response.headers["etag"]}
+        )
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"generation": 1}
+    assert not_modified.status_code == 304
+
+
+def test_server_gzips_when_accepted(topology_server):
+    base_url, _ = topology_server
+    with httpx.Client(base_url=base_url) as client:
+        raw = client.get("/metrics", headers={"Accept-Encoding": "gzip"})
+        plain = client.get("/metrics", headers={"Accept-Encoding": "identity"})
+
+    assert raw.headers["content-encoding"] == "gzip"
+    assert raw.text == "charmarr_relation_bound 1\n"
+    assert "content-encoding" not in plain.headers
+    assert raw.headers["etag"] != plain.headers["etag"]
+
+
+def test_server_keeps_connection_alive_and_404s_unknown_paths(topology_server):
+    base_url, _ = topology_server
+    with httpx.Client(base_url=base_url) as client:
+        responses = [client.get("/metrics") for _ in range(3)]
+        missing = client.get("/nope")
+
+    assert all(r.http_version == "HTTP/1.1" for r in responses)
+    assert all(r.headers.get("connection", "keep-alive") != "close" for r in responses)
+    assert missing.status_code == 404
+
+
+def test_server_serves_concurrent_scrapers_while_one_hangs(topology_server):
+    """A client that opens a connection and never sends a request must not block others."""
+    base_url, _ = topology_server
+    host, port = base_url.removeprefix("http://").split(":")
+    with socket.create_connection((host, int(port))):
+        response = httpx.get(f"{base_url}/metrics", timeout=2)
+    assert response.status_code == 200
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_supervisor_follows_registry(tmp_path: Path, server_module):
+    """Ports are opened, re-routed and closed as the registry file changes."""
+    first, second = tmp_path / "a.prom", tmp_path / "b.prom"
+    first.write_text("first 1\n")
+    second.write_text("second 1\n")
+    registry = tmp_path / "registry.json"
+    port_a, port_b = _free_port(), _free_port()
+    registry.write_text(json.dumps({str(port_a): {"/metrics": str(first)}}))
+
+    supervisor = server_module.Supervisor(str(registry), host="127.0.0.1")
+    try:
+        supervisor.reload()
+        assert httpx.get(f"http://127.0.0.1:{port_a}/metrics").text == "first 1\n"
+
+        registry.write_text(
+            json.dumps(
+                {
+                    str(port_a): {"/metrics": str(second)},
+                    str(port_b): {"/topology.json": str(first)},
+                }
+            )
+        )
+        supervisor.reload()
+        assert httpx.get(f"http://127.0.0.1:{port_a}/metrics").text == "second 1\n"
+        assert httpx.get(f"http://127.0.0.1:{port_b}/topology.json").status_code == 200
+
+        registry.write_text(json.dumps({str(port_b): {"/topology.json": str(first)}}))
+        supervisor.reload()
+        assert set(supervisor.servers) == {port_b}
+        with pytest.raises(httpx.ConnectError):
+            httpx.get(f"http://127.0.0.1:{port_a}/metrics")
+    finally:
+        supervisor.shutdown()
@@ -0,0 +1,109 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for hook span tracing."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import ops
+import pytest
+from lightkube.resources.apps_v1 import StatefulSet
+from pytest_httpx import HTTPXMock
+from scenario import Context, State
+
+from charmarr_lib.core import (
+    ArrApiClient,
+    K8sResourceManager,
+    Tracer,
+    disable_tracing,
+    enable_tracing,
+    observe_events,
+    read_traces,
+    span,
+    traced,
+)
+
+
+@pytest.fixture(autouse=True)
+def trace_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "trace.json"
+    monkeypatch.setattr(Tracer, "TRACE_FILE", path)
+    yield path
+    disable_tracing()
+
+
+class TracedCharm(ops.CharmBase):
+    def __init__(self, framework: ops.Framework):
+        super().__init__(framework)
+        enable_tracing(self, max_traces=2)
+        observe_events(self, {ops.ConfigChangedEvent}, self._reconcile)
+
+    def _reconcile(self, _event: ops.EventBase) -> None:
+        with span("sync", items=1):
+            manager = K8sResourceManager(client=MagicMock())
+            manager.patch(StatefulSet, "radarr", {"spec": {}}, "media")
+            with ArrApiClient("http://radarr:7878", "key") as client:
+                client.get_download_clients()
+
+
+def _names(node: dict[str, Any]) -> list[str]:
+    return [child["name"] for child in node["children"]]
+
+
+def test_hook_trace_nests_library_calls(trace_file: Path, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json=[])
+    ctx = Context(TracedCharm, meta={"name": "radarr"})
+
+    ctx.run(ctx.on.config_changed(), State())
+
+    [trace] = read_traces()
+    assert trace["name"] == "config_changed"
+    assert trace["attributes"]["unit"] == "radarr/0"
+    [handler] = trace["children"]
+    assert handler["name"] == "handler"
+    assert handler["attributes"] == {"event": "config_changed"}
+    [sync] = handler["children"]
+    assert _names(sync) == ["k8s.patch", "arr.request"]
+    assert sync["children"][0]["attributes"] == {"kind": "StatefulSet", "attempts": 1}
+    assert sync["children"][1]["attributes"]["status"] == 200
+    assert trace["duration_ms"] >= sync["duration_ms"] >= 0
+
+
+def test_ring_buffer_keeps_last_traces(trace_file: Path, httpx_mock: HTTPXMock):
+    httpx_mock.add_response(json=[], is_reusable=True)
+    ctx = Context(TracedCharm, meta={"name": "radarr"})
+
+    for _ in range(3):
+        ctx.run(ctx.on.config_changed(), State())
+
+    traces = read_traces(trace_file)
+    assert len(traces) == 2
+    assert traces[0]["start"] < traces[1]["start"]
+
+
+def test_spans_are_noops_without_tracer():
+    @traced()
+    def work() -> int:
+        with span("inner") as current:
+            assert current is None
+        return 42
+
+    assert work() == 42
+
+
+def test_span_records_errors_and_respects_span_cap(monkeypatch: pytest.MonkeyPatch):
+    tracer = Tracer("manual")
+    monkeypatch.setattr("charmarr_lib.core._tracing._tracer", tracer)
+    monkeypatch.setattr(Tracer, "MAX_SPANS", 3)
+
+    with pytest.raises(ValueError), span("failing"):
+        raise ValueError("bad")
+    for _ in range(3):
+        with span("extra"):
+            pass
+
+    assert tracer.root.children[0].error == "ValueError: bad"
+    assert len(tracer.root.children) == 2
+    assert tracer.dropped == 2
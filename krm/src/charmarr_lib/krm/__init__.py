@@ -8,13 +8,66 @@ via lightkube, with automatic retry on transient errors.
 
 Key components:
 - K8sResourceManager: Generic K8s resource operations (get/patch/apply/delete)
+- AsyncK8sResourceManager: The same operations on lightkube's AsyncClient
+- RetryPolicy / TokenBucket: Retry backoff (jitter, Retry-After) and client-side rate limiting
+- ObjectCache: Opt-in read-through cache for get/exists (per-kind TTL, watch)
+- LeaseLock: Serialize concurrent writers to one object with a Lease
 - ReconcileResult: Return type for idempotent reconciliation operations
+- DesiredPatch / ApplyResult: Input and per-resource result of reconcile_set/apply_many
+- ownership_labels: App/component labels that inventory/prune select on
+- job_finished / statefulset_rolled_out: Predicates for K8sResourceManager.wait_for
+- add_call_observer: Opt-in timing of every manager call (verb, kind, retries)
 """
 
+from charmarr_lib.krm._async_manager import AsyncK8sResourceManager
+from charmarr_lib.krm._cache import CacheStats, ObjectCache
+from charmarr_lib.krm._inventory import (
+    APP_LABEL,
+    COMPONENT_LABEL,
+    MANAGED_BY_LABEL,
+    VERSION_LABEL,
+    ownership_labels,
+)
+from charmarr_lib.krm._lease import LeaseLock
 from charmarr_lib.krm._manager import K8sResourceManager
-from charmarr_lib.krm._models import ReconcileResult
+from charmarr_lib.krm._models import (
+    ApplyResult,
+    DesiredPatch,
+    ReconcileResult,
+    raise_first_error,
+)
+from charmarr_lib.krm._observability import (
+    CallObserver,
+    K8sCall,
+    add_call_observer,
+    remove_call_observer,
+)
+from charmarr_lib.krm._retry import RequestStats, RetryPolicy, TokenBucket
+from charmarr_lib.krm._wait import Predicate, job_finished, statefulset_rolled_out
 
 __all__ = [
+    "APP_LABEL",
+    "COMPONENT_LABEL",
+    "MANAGED_BY_LABEL",
+    "VERSION_LABEL",
+    "ApplyResult",
+    "AsyncK8sResourceManager",
+    "CacheStats",
+    "CallObserver",
+    "DesiredPatch",
+    "K8sCall",
     "K8sResourceManager",
+    "LeaseLock",
+    "ObjectCache",
+    "Predicate",
     "ReconcileResult",
+    "RequestStats",
+    "RetryPolicy",
+    "TokenBucket",
+    "add_call_observer",
+    "job_finished",
+    "ownership_labels",
+    "raise_first_error",
+    "remove_call_observer",
+    "statefulset_rolled_out",
 ]
@@ -0,0 +1,483 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Async Kubernetes resource operations via lightkube's AsyncClient."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import httpx
+from lightkube import ApiError, AsyncClient
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.types import CascadeType, PatchType
+
+from charmarr_lib.krm._batch import resource_keys, run_tiered_async
+from charmarr_lib.krm._cache import MISSING, ObjectCache
+from charmarr_lib.krm._diff import (
+    apply_is_noop,
+    local_patch_is_noop,
+    same_object,
+    with_applied_hash,
+)
+from charmarr_lib.krm._inventory import owned_selector, stamp_ownership
+from charmarr_lib.krm._metadata import get_metadata_async, list_metadata_async
+from charmarr_lib.krm._models import ApplyResult, DesiredPatch
+from charmarr_lib.krm._observability import observed
+from charmarr_lib.krm._retry import (
+    RequestStats,
+    RetryPolicy,
+    TokenBucket,
+    retry_on_transient,
+    retry_unless_conflict,
+)
+from charmarr_lib.krm._wait import Predicate, WatchUnsupportedError, watch_until_async
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncK8sResourceManager:
+    """Async counterpart of K8sResourceManager.
+
+    Same operations, return values, retry policy and rate limiting as
+    K8sResourceManager, but every method is a coroutine, so charms can
+    overlap Kubernetes calls with other async work (e.g. arr API calls) in
+    one event loop.
+
+    Example:
+        manager = AsyncK8sResourceManager()
+        sts, _ = await asyncio.gather(
+            manager.get(StatefulSet, "radarr", "media"),
+            arr_client.get_status(),
+        )
+    """
+
+    def __init__(
+        self,
+        client: AsyncClient | None = None,
+        field_manager: str = "charmarr-lib",
+        cache: ObjectCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+    ) -> None:
+        """Initialize the resource manager.
+
+        Args:
+            client: Lightkube async client. If None, creates a new client using
+                    in-cluster config or kubeconfig.
+            field_manager: Field manager name for server-side apply operations.
+            cache: Optional read-through object cache. Disabled by default.
+            retry_policy: Retry attempts, backoff and jitter. Defaults to
+                RetryPolicy().
+            rate_limiter: Optional client-side rate limiter. Disabled by default.
+        """
+        self._client = client if client is not None else AsyncClient()
+        self._field_manager = field_manager
+        self._cache = cache
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._rate_limiter = rate_limiter
+        self._request_stats = RequestStats()
+
+    @property
+    def client(self) -> AsyncClient:
+        """Access the underlying lightkube async client."""
+        return self._client
+
+    @property
+    def cache(self) -> ObjectCache | None:
+        """The object cache, if enabled."""
+        return self._cache
+
+    @property
+    def request_stats(self) -> RequestStats:
+        """Retry and throttling counters for this manager's API calls."""
+        return self._request_stats
+
+    async def get(
+        self,
+        resource_type: type[Any],
+        name: str,
+        namespace: str | None = None,
+        *,
+        fresh: bool = False,
+    ) -> Any:
+        """Fetch a resource by name; `fresh` bypasses the cache.
+
+        Raises:
+            ApiError: If the resource doesn't exist or other API errors.
+        """
+        if self._cache is None or fresh:
+            return await self._get(resource_type, name, namespace)
+        cached = self._cache.lookup(resource_type, name, namespace)
+        if cached is MISSING:
+            return await self._get(resource_type, name, namespace)
+        if cached is not None:
+            return cached
+        obj = await self._get(resource_type, name, namespace)
+        self._cache.store(obj, resource_type)
+        return obj
+
+    @observed("get")
+    @retry_on_transient
+    async def _get(self, resource_type: type[Any], name: str, namespace: str | None) -> Any:
+        return await self._client.get(resource_type, name, namespace=namespace)  # type: ignore[arg-type]
+
+    async def get_metadata(
+        self, resource_type: type[Any], name: str, namespace: str | None = None
+    ) -> ObjectMeta:
+        """Fetch only the metadata (labels, annotations, ...) of a resource.
+
+        Raises:
+            ApiError: If the resource doesn't exist or other API errors.
+        """
+        if self._cache is not None:
+            cached = self._cache.lookup(resource_type, name, namespace)
+            if cached is not None and cached is not MISSING:
+                return cached.metadata
+        return await self._get_metadata(resource_type, name, namespace)
+
+    @observed("get_metadata")
+    @retry_on_transient
+    async def _get_metadata(
+        self, resource_type: type[Any], name: str, namespace: str | None
+    ) -> ObjectMeta:
+        return await get_metadata_async(self._client, resource_type, name, namespace)
+
+    @observed("patch")
+    @retry_on_transient
+    async def patch(
+        self,
+        resource_type: type[Any],
+        name: str,
+        obj: dict[str, Any] | Any,
+        namespace: str | None = None,
+        patch_type: PatchType = PatchType.STRATEGIC,
+    ) -> Any:
+        """Patch an existing resource, retrying on conflict and transient errors.
+
+        Raises:
+            ApiError: If the resource doesn't exist or patch fails after retries.
+        """
+        result = await self._client.patch(  # type: ignore[arg-type]
+            resource_type,
+            name,
+            obj,
+            namespace=namespace,
+            patch_type=patch_type,
+        )
+        if self._cache is not None:
+            self._cache.store(result, resource_type)
+        return result
+
+    @observed("apply")
+    @retry_on_transient
+    async def apply(self, resource: Any, force: bool = False) -> Any:
+        """Create or update a resource using server-side apply.
+
+        Raises:
+            ApiError: If the apply fails after retries.
+        """
+        result = await self._client.apply(  # type: ignore[arg-type]
+            stamp_ownership(resource, self._field_manager),
+            field_manager=self._field_manager,
+            force=force,
+        )
+        if self._cache is not None:
+            self._cache.store(result, type(resource))
+        return result
+
+    @observed("create")
+    @retry_unless_conflict
+    async def create(self, resource: Any) -> Any:
+        """Create a resource with ownership labels; a 409 (exists) is raised without retrying.
+
+        Raises:
+            ApiError: If the resource exists or the create fails after retries.
+        """
+        result = await self._client.create(
+            stamp_ownership(resource, self._field_manager)  # type: ignore[arg-type]
+        )
+        if self._cache is not None:
+            self._cache.store(result, type(resource))
+        return result
+
+    @observed("replace")
+    @retry_unless_conflict
+    async def replace(self, resource: Any) -> Any:
+        """Replace a resource by resourceVersion, with ownership labels; a 409 is not retried.
+
+        Raises:
+            ApiError: If the object changed or the replace fails after retries.
+        """
+        result = await self._client.replace(
+            stamp_ownership(resource, self._field_manager)  # type: ignore[arg-type]
+        )
+        if self._cache is not None:
+            self._cache.store(result, type(resource))
+        return result
+
+    async def patch_if_changed(
+        self,
+        resource_type: type[Any],
+        name: str,
+        obj: dict[str, Any] | list[dict[str, Any]],
+        namespace: str | None = None,
+        patch_type: PatchType = PatchType.STRATEGIC,
+        *,
+        live: Any = None,
+    ) -> bool:
+        """Patch a resource only if the patch would change it.
+
+        Returns:
+            True if the patch was sent, False if it was a no-op.
+        """
+        if live is None:
+            live = await self.get(resource_type, name, namespace)
+        if patch_type == PatchType.JSON:
+            if not obj:
+                return False
+            preview = await self._dry_run_patch(resource_type, name, obj, namespace, patch_type)
+            noop = same_object(preview, live)
+        else:
+            noop = local_patch_is_noop(live, obj, patch_type)
+        if noop:
+            return False
+        await self.patch(resource_type, name, obj, namespace, patch_type)
+        return True
+
+    async def apply_if_changed(self, resource: Any, force: bool = False) -> bool:
+        """Server-side apply a resource only if the apply would change it.
+
+        Returns:
+            True if the resource was applied, False if it was a no-op.
+        """
+        desired = with_applied_hash(stamp_ownership(resource, self._field_manager))
+        metadata = resource.metadata
+        try:
+            live = await self.get(type(resource), metadata.name, metadata.namespace)
+        except ApiError as e:
+            if e.status.code != 404:
+                raise
+        else:
+            if apply_is_noop(live, desired):
+                return False
+        await self.apply(desired, force)
+        return True
+
+    async def apply_many(
+        self, resources: Sequence[Any], force: bool = False, max_concurrency: int = 4
+    ) -> list[ApplyResult]:
+        """Server-side apply several resources in dependency order.
+
+        Returns:
+            One ApplyResult per resource, in input order.
+        """
+
+        async def action(resource: Any) -> bool:
+            await self.apply(resource, force)
+            return True
+
+        return await run_tiered_async(resources, action, max_concurrency)
+
+    async def reconcile_set(
+        self,
+        desired: Sequence[Any | DesiredPatch],
+        force: bool = False,
+        max_concurrency: int = 4,
+    ) -> list[ApplyResult]:
+        """Reconcile several resources and patches in dependency order, skipping no-ops.
+
+        Returns:
+            One ApplyResult per item, in input order.
+        """
+
+        async def action(item: Any) -> bool:
+            if isinstance(item, DesiredPatch):
+                return await self.patch_if_changed(
+                    item.resource_type, item.name, item.obj, item.namespace, item.patch_type
+                )
+            return await self.apply_if_changed(item, force)
+
+        return await run_tiered_async(desired, action, max_concurrency)
+
+    async def inventory(
+        self,
+        kinds: Iterable[type[Any]],
+        namespace: str | None = None,
+        app: str | None = None,
+        component: str | None = None,
+    ) -> list[Any]:
+        """List charmarr-managed objects with one label-selector LIST per kind."""
+        selector = owned_selector(app, component)
+        owned: list[Any] = []
+        for kind in kinds:
+            owned.extend(await self._list(kind, namespace, selector))
+        return owned
+
+    async def prune(
+        self,
+        desired: Iterable[Any],
+        kinds: Iterable[type[Any]],
+        namespace: str | None = None,
+        app: str | None = None,
+        component: str | None = None,
+    ) -> list[ApplyResult]:
+        """Delete owned objects of `kinds` that are not in `desired`.
+
+        Returns:
+            One ApplyResult per deleted object.
+        """
+        keep = resource_keys(desired, namespace)
+        selector = owned_selector(app, component)
+        results: list[ApplyResult] = []
+        for kind in kinds:
+            for metadata in await self._list_metadata(kind, namespace, selector):
+                name = metadata.name
+                if name is None or (kind.__name__, name, metadata.namespace) in keep:
+                    continue
+                deleted = await self.delete(kind, name, metadata.namespace)
+                results.append(
+                    ApplyResult(kind.__name__, name, metadata.namespace, changed=deleted)
+                )
+        return results
+
+    @observed("list")
+    @retry_on_transient
+    async def _list(
+        self, resource_type: type[Any], namespace: str | None, selector: dict[str, Any]
+    ) -> list[Any]:
+        listing = self._client.list(resource_type, namespace=namespace, labels=selector)  # type: ignore[arg-type]
+        return [obj async for obj in listing]
+
+    @observed("list_metadata")
+    @retry_on_transient
+    async def _list_metadata(
+        self, resource_type: type[Any], namespace: str | None, selector: dict[str, Any]
+    ) -> list[ObjectMeta]:
+        return await list_metadata_async(self._client, resource_type, namespace, selector)
+
+    @observed("dry_run_patch")
+    @retry_on_transient
+    async def _dry_run_patch(
+        self,
+        resource_type: type[Any],
+        name: str,
+        obj: dict[str, Any] | list[dict[str, Any]],
+        namespace: str | None,
+        patch_type: PatchType,
+    ) -> Any:
+        return await self._client.patch(  # type: ignore[call-overload]
+            resource_type, name, obj, namespace=namespace, patch_type=patch_type, dry_run=True
+        )
+
+    async def wait_for(
+        self,
+        resource_type: type[Any],
+        name: str,
+        predicate: Predicate,
+        namespace: str | None = None,
+        timeout: float = 60.0,
+        poll_interval: float = 2.0,
+    ) -> Any:
+        """Wait until a resource satisfies `predicate`, via watch with a polling fallback.
+
+        Returns:
+            The resource as of the moment it satisfied the predicate.
+
+        Raises:
+            TimeoutError: If the predicate is not satisfied within `timeout`.
+            ApiError: If the initial read fails.
+        """
+        deadline = time.monotonic() + timeout
+        obj = await self._get(resource_type, name, namespace)
+        if predicate(obj):
+            return obj
+        try:
+            found = await watch_until_async(
+                self._client,
+                resource_type,
+                name,
+                namespace,
+                predicate,
+                obj.metadata.resourceVersion,
+                deadline,
+            )
+        except (WatchUnsupportedError, httpx.HTTPError, OSError) as e:
+            logger.debug("Watch on %s %s failed (%s), polling", resource_type.__name__, name, e)
+            found = await self._poll_until(
+                resource_type, name, namespace, predicate, deadline, poll_interval
+            )
+        if found is None:
+            raise TimeoutError(f"{resource_type.__name__} {name} not ready after {timeout:g}s")
+        return found
+
+    async def _poll_until(
+        self,
+        resource_type: type[Any],
+        name: str,
+        namespace: str | None,
+        predicate: Predicate,
+        deadline: float,
+        poll_interval: float,
+    ) -> Any:
+        while (remaining := deadline - time.monotonic()) > 0:
+            await asyncio.sleep(min(poll_interval, remaining))
+            obj = await self._get(resource_type, name, namespace)
+            if predicate(obj):
+                return obj
+        return None
+
+    @observed("delete")
+    @retry_on_transient
+    async def delete(
+        self,
+        resource_type: type[Any],
+        name: str,
+        namespace: str | None = None,
+        cascade: CascadeType = CascadeType.BACKGROUND,
+    ) -> bool:
+        """Delete a resource.
+
+        Returns:
+            True if the resource was deleted, False if it didn't exist.
+
+        Raises:
+            ApiError: For errors other than 404 (not found), after retries.
+        """
+        if self._cache is not None:
+            self._cache.invalidate(resource_type, name, namespace)
+        try:
+            await self._client.delete(resource_type, name, namespace=namespace, cascade=cascade)
+            return True
+        except ApiError as e:
+            if e.status.code == 404:
+                return False
+            raise
+
+    async def exists(
+        self,
+        resource_type: type[Any],
+        name: str,
+        namespace: str | None = None,
+    ) -> bool:
+        """Check if a resource exists."""
+        if self._cache is not None:
+            cached = self._cache.lookup(resource_type, name, namespace)
+            if cached is not None:
+                return cached is not MISSING
+        return await self._exists(resource_type, name, namespace)
+
+    @observed("exists")
+    @retry_on_transient
+    async def _exists(self, resource_type: type[Any], name: str, namespace: str | None) -> bool:
+        try:
+            await get_metadata_async(self._client, resource_type, name, namespace)
+        except ApiError as e:
+            if e.status.code == 404:
+                if self._cache is not None:
+                    self._cache.store_missing(resource_type, name, namespace)
+                return False
+            raise
+        return True
@@ -0,0 +1,145 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Dependency-ordered, concurrent execution of multi-resource reconciles.
+
+Resources are grouped into tiers by kind: namespaces and CRDs first, then
+configuration and policy objects (ConfigMaps, Secrets, ServiceAccounts,
+NetworkPolicies, ...), then role bindings, then workloads. Resources within
+a tier are independent and run concurrently on a bounded thread pool; a tier
+only starts once the previous one finished. When a resource fails, later
+tiers are skipped since they may depend on it.
+
+Calls run in a copy of the caller's context, so tracing spans opened by the
+caller still parent the K8s calls made on pool threads. The async variant
+runs each tier with `asyncio.gather` under a semaphore instead of threads.
+"""
+
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Any
+
+from charmarr_lib.krm._models import ApplyResult, DesiredPatch
+
+_TIERS: dict[str, int] = {
+    "Namespace": 0,
+    "CustomResourceDefinition": 0,
+    "ConfigMap": 1,
+    "Secret": 1,
+    "ServiceAccount": 1,
+    "PersistentVolumeClaim": 1,
+    "Service": 1,
+    "NetworkPolicy": 1,
+    "Role": 1,
+    "ClusterRole": 1,
+    "RoleBinding": 2,
+    "ClusterRoleBinding": 2,
+    "StatefulSet": 3,
+    "Deployment": 3,
+    "DaemonSet": 3,
+    "Job": 3,
+    "CronJob": 3,
+    "Pod": 3,
+}
+_DEFAULT_TIER = 1
+
+
+def describe(item: Any) -> tuple[str, str, str | None]:
+    """Return (kind, name, namespace) for a resource or DesiredPatch."""
+    if isinstance(item, DesiredPatch):
+        return item.resource_type.__name__, item.name, item.namespace
+    metadata = item.metadata
+    return type(item).__name__, metadata.name, metadata.namespace
+
+
+def resource_keys(items: Iterable[Any], namespace: str | None) -> set[tuple[str, str, str | None]]:
+    """Return (kind, name, namespace) of each item; items without a namespace get `namespace`."""
+    keys: set[tuple[str, str, str | None]] = set()
+    for item in items:
+        kind, name, item_namespace = describe(item)
+        keys.add((kind, name, namespace if item_namespace is None else item_namespace))
+    return keys
+
+
+def tier_of(item: Any) -> int:
+    """Dependency tier of a resource or DesiredPatch (lower runs first)."""
+    return _TIERS.get(describe(item)[0], _DEFAULT_TIER)
+
+
+def run_tiered(
+    items: Sequence[Any],
+    action: Callable[[Any], bool],
+    max_workers: int,
+) -> list[ApplyResult]:
+    """Run `action` on every item tier by tier; results are in input order.
+
+    `action` returns whether it changed anything. Exceptions are captured in
+    the item's result rather than raised.
+    """
+    results: list[ApplyResult | None] = [None] * len(items)
+    order = sorted(range(len(items)), key=lambda i: tier_of(items[i]))
+    failed = False
+
+    def run_one(index: int) -> ApplyResult:
+        kind, name, namespace = describe(items[index])
+        try:
+            changed = action(items[index])
+        except Exception as e:
+            return ApplyResult(kind, name, namespace, error=e)
+        return ApplyResult(kind, name, namespace, changed=changed)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        for _, group in groupby(order, key=lambda i: tier_of(items[i])):
+            indexes = list(group)
+            if failed:
+                for index in indexes:
+                    results[index] = ApplyResult(*describe(items[index]), skipped=True)
+                continue
+            if len(indexes) == 1:
+                outcomes = [run_one(indexes[0])]
+            else:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, run_one, index)
+                    for index in indexes
+                ]
+                outcomes = [future.result() for future in futures]
+            for index, outcome in zip(indexes, outcomes, strict=True):
+                results[index] = outcome
+                failed = failed or outcome.error is not None
+    return [result for result in results if result is not None]
+
+
+async def run_tiered_async(
+    items: Sequence[Any],
+    action: Callable[[Any], Awaitable[bool]],
+    max_concurrency: int,
+) -> list[ApplyResult]:
+    """Async counterpart of `run_tiered`."""
+    results: list[ApplyResult | None] = [None] * len(items)
+    order = sorted(range(len(items)), key=lambda i: tier_of(items[i]))
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    failed = False
+
+    async def run_one(index: int) -> ApplyResult:
+        kind, name, namespace = describe(items[index])
+        async with semaphore:
+            try:
+                changed = await action(items[index])
+            except Exception as e:
+                return ApplyResult(kind, name, namespace, error=e)
+        return ApplyResult(kind, name, namespace, changed=changed)
+
+    for _, group in groupby(order, key=lambda i: tier_of(items[i])):
+        indexes = list(group)
+        if failed:
+            for index in indexes:
+                results[index] = ApplyResult(*describe(items[index]), skipped=True)
+            continue
+        outcomes = await asyncio.gather(*(run_one(index) for index in indexes))
+        for index, outcome in zip(indexes, outcomes, strict=True):
+            results[index] = outcome
+            failed = failed or outcome.error is not None
+    return [result for result in results if result is not None]
@@ -0,0 +1,211 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Opt-in read-through object cache for K8sResourceManager.
+
+Entries are keyed by (resource type, namespace, name) and expire after a
+per-kind TTL. The manager fills the cache from GET results and from the
+objects returned by patch/apply, invalidates on delete, and also caches
+404s so `exists()` checks are cheap. Writes never overwrite an entry with an
+older resourceVersion, so a late watch event cannot roll back a patch result.
+
+For long-running processes, `watch()` keeps a resource type fresh from a
+short-lived watch: while it runs, watched entries are served regardless of
+TTL and updated from ADDED/MODIFIED/DELETED events.
+
+Example:
+    cache = ObjectCache(default_ttl=30, ttl_by_kind={"Service": 300})
+    manager = K8sResourceManager(cache=cache)
+    manager.get(StatefulSet, "radarr", "media")  # API call
+    manager.get(StatefulSet, "radarr", "media")  # cache hit
+"""
+
+import copy
+import dataclasses
+import logging
+import threading
+import time
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from lightkube import Client
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[type[Any], str, str]
+
+MISSING: Any = object()
+"""Cached marker for objects known not to exist (404)."""
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Counters of an ObjectCache."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    invalidations: int = 0
+    watch_events: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclasses.dataclass
+class _Entry:
+    value: Any
+    stored_at: float
+
+
+def _resource_version(obj: Any) -> int | None:
+    metadata = getattr(obj, "metadata", None)
+    version = getattr(metadata, "resourceVersion", None)
+    return int(version) if isinstance(version, str) and version.isdigit() else None
+
+
+class ObjectCache:
+    """TTL cache of Kubernetes objects shared by a K8sResourceManager."""
+
+    def __init__(
+        self,
+        default_ttl: float = 30.0,
+        ttl_by_kind: Mapping[type[Any] | str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            default_ttl: Seconds an entry stays valid. 0 disables caching.
+            ttl_by_kind: Per-kind overrides, keyed by resource type or kind
+                name (e.g. {"Service": 300, StatefulSet: 5}).
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._default_ttl = default_ttl
+        self._ttl_by_kind = {
+            kind if isinstance(kind, str) else kind.__name__: ttl
+            for kind, ttl in (ttl_by_kind or {}).items()
+        }
+        self._clock = clock
+        self._entries: dict[CacheKey, _Entry] = {}
+        self._watched: dict[tuple[type[Any], str], float] = {}
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def ttl(self, resource_type: type[Any]) -> float:
+        """Return the TTL for a resource type."""
+        return self._ttl_by_kind.get(resource_type.__name__, self._default_ttl)
+
+    def lookup(self, resource_type: type[Any], name: str, namespace: str | None) -> Any:
+        """Return a copy of the cached object, MISSING for a cached 404, or None on miss."""
+        key = (resource_type, namespace or "", name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if not self._is_fresh(key, entry):
+                del self._entries[key]
+                self.stats.expired += 1
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+            value = entry.value
+        return value if value is MISSING else copy.deepcopy(value)
+
+    def store(self, obj: Any, resource_type: type[Any] | None = None) -> None:
+        """Cache an object returned by the API (ignored if an entry is newer)."""
+        metadata = getattr(obj, "metadata", None)
+        name = getattr(metadata, "name", None)
+        if not name:
+            return
+        rtype = resource_type if resource_type is not None else type(obj)
+        key = (rtype, getattr(metadata, "namespace", None) or "", name)
+        if self.ttl(rtype) <= 0 and key[:2] not in self._watched:
+            return
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current.value is not MISSING:
+                old, new = _resource_version(current.value), _resource_version(obj)
+                if old is not None and new is not None and new < old:
+                    return
+            self._entries[key] = _Entry(copy.deepcopy(obj), self._clock())
+
+    def store_missing(self, resource_type: type[Any], name: str, namespace: str | None) -> None:
+        """Cache that an object does not exist."""
+        if self.ttl(resource_type) <= 0:
+            return
+        with self._lock:
+            self._entries[(resource_type, namespace or "", name)] = _Entry(MISSING, self._clock())
+
+    def invalidate(self, resource_type: type[Any], name: str, namespace: str | None) -> None:
+        """Drop one entry."""
+        with self._lock:
+            if self._entries.pop((resource_type, namespace or "", name), None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def watch(
+        self,
+        client: Client,
+        resource_type: type[Any],
+        namespace: str | None = None,
+        duration: float = 300.0,
+    ) -> threading.Thread:
+        """Keep `resource_type` fresh from a watch for `duration` seconds.
+
+        Runs in a daemon thread. While the watch is active, entries of this
+        type (and namespace) are served regardless of TTL. Afterwards they
+        fall back to normal TTL expiry.
+
+        Returns:
+            The started watch thread.
+        """
+        scope = (resource_type, namespace or "")
+        deadline = self._clock() + duration
+        with self._lock:
+            self._watched[scope] = deadline
+
+        def run() -> None:
+            try:
+                events = client.watch(  # type: ignore[call-overload]
+                    resource_type, namespace=namespace, server_timeout=max(1, int(duration))
+                )
+                for event_type, obj in events:
+                    if self._clock() >= deadline:
+                        break
+                    self.stats.watch_events += 1
+                    if event_type == "DELETED":
+                        self.store_missing(
+                            resource_type, obj.metadata.name, obj.metadata.namespace
+                        )
+                    else:
+                        self.store(obj, resource_type)
+            except Exception as e:
+                logger.warning("Cache watch for %s ended: %s", resource_type.__name__, e)
+            finally:
+                with self._lock:
+                    if self._watched.get(scope) == deadline:
+                        del self._watched[scope]
+
+        thread = threading.Thread(
+            target=run, name=f"krm-cache-watch-{resource_type.__name__}", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def _is_fresh(self, key: CacheKey, entry: _Entry) -> bool:
+        now = self._clock()
+        for scope in (key[:2], (key[0], "")):
+            deadline = self._watched.get(scope)
+            if deadline is not None and now < deadline:
+                return True
+        return now - entry.stored_at < self.ttl(key[0])
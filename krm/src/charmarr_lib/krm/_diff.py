@@ -0,0 +1,205 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""No-op detection for patches and server-side applies.
+
+Used by `K8sResourceManager.patch_if_changed` / `apply_if_changed` to skip
+writes that would not change the live object:
+
+- strategic merge and merge patches are checked locally: a patch is a no-op
+  when every value it sets already matches the live object and every key
+  or list entry it deletes is already absent
+- applies are checked against the live object without an extra request:
+  `with_applied_hash` records a hash of the applied configuration in an
+  annotation, and an apply is a no-op when the live object carries the same
+  hash and still holds every applied value. Dropping a field changes the
+  hash, so it still counts as a change
+- JSON patches are previewed with `dryRun=All` and the result is compared
+  with the live object
+
+Every check errs on the side of "changed": anything it cannot interpret
+(unknown `$` directives, objects without `to_dict()`, ...) triggers a write.
+"""
+
+import copy
+import hashlib
+import json
+from typing import Any
+
+from lightkube.types import PatchType
+
+# Strategic merge patch merges lists of objects by a per-field key: `name`
+# for containers, volumes and env, and the path for mounts and devices.
+_MERGE_KEY = "name"
+_MERGE_KEYS = {"volumeMounts": "mountPath", "volumeDevices": "devicePath"}
+
+_VOLATILE_METADATA = ("resourceVersion", "generation", "creationTimestamp")
+
+APPLIED_HASH_ANNOTATION = "charmarr.io/applied-hash"
+
+
+def to_plain(obj: Any) -> dict[str, Any] | None:
+    """Return the dict form of a lightkube object or dict, or None if unknown."""
+    if isinstance(obj, dict):
+        return obj
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is None:
+        return None
+    plain = to_dict()
+    return plain if isinstance(plain, dict) else None
+
+
+def strategic_patch_is_noop(live: Any, patch: Any, merge_key: str = _MERGE_KEY) -> bool:
+    """Check whether a strategic merge patch would leave `live` unchanged."""
+    if isinstance(patch, dict):
+        if live is not None and not isinstance(live, dict):
+            return False
+        current = live or {}
+        for key, value in patch.items():
+            if key.startswith("$"):
+                return False
+            if value is None:
+                if current.get(key) is not None:
+                    return False
+            elif not strategic_patch_is_noop(current.get(key), value, _merge_key(key)):
+                return False
+        return True
+    if isinstance(patch, list) and _is_keyed_list(patch, merge_key):
+        if live is None:
+            live = []
+        if not isinstance(live, list):
+            return False
+        by_key = {item.get(merge_key): item for item in live if isinstance(item, dict)}
+        for item in patch:
+            existing = by_key.get(item[merge_key])
+            if item.get("$patch") == "delete":
+                if existing is not None:
+                    return False
+                continue
+            if existing is None:
+                return False
+            if not strategic_patch_is_noop(existing, item):
+                return False
+        return True
+    return live == patch
+
+
+def merge_patch_is_noop(live: Any, patch: Any) -> bool:
+    """Check whether an RFC 7386 merge patch would leave `live` unchanged."""
+    if not isinstance(patch, dict):
+        return live == patch
+    if live is not None and not isinstance(live, dict):
+        return False
+    current = live or {}
+    for key, value in patch.items():
+        if value is None:
+            if key in current:
+                return False
+        elif not merge_patch_is_noop(current.get(key), value):
+            return False
+    return True
+
+
+def local_patch_is_noop(live: Any, patch: Any, patch_type: PatchType) -> bool:
+    """Check a strategic merge or merge patch against the live object locally.
+
+    Other patch types cannot be checked locally and always count as changes.
+    """
+    plain = to_plain(live)
+    if plain is None:
+        return False
+    if patch_type == PatchType.MERGE:
+        return merge_patch_is_noop(plain, patch)
+    if patch_type == PatchType.STRATEGIC:
+        return strategic_patch_is_noop(plain, patch)
+    return False
+
+
+def with_applied_hash(resource: Any) -> Any:
+    """Return a copy of `resource` annotated with a hash of its configuration.
+
+    Resources without `to_dict()`/`from_dict()` are returned unchanged.
+    """
+    plain = to_plain(resource)
+    from_dict = getattr(type(resource), "from_dict", None)
+    if plain is None or from_dict is None or isinstance(resource, dict):
+        return resource
+    metadata = dict(plain.get("metadata") or {})
+    annotations = {
+        k: v
+        for k, v in (metadata.get("annotations") or {}).items()
+        if k != APPLIED_HASH_ANNOTATION
+    }
+    digest = hashlib.sha256(
+        json.dumps(
+            {**plain, "metadata": {**metadata, "annotations": annotations}}, sort_keys=True
+        ).encode()
+    ).hexdigest()[:16]
+    metadata["annotations"] = {**annotations, APPLIED_HASH_ANNOTATION: digest}
+    # to_dict() may share nested dicts with `resource`; don't let the copy alias them.
+    return from_dict(copy.deepcopy({**plain, "metadata": metadata}))
+
+
+def apply_is_noop(live: Any, applied: Any) -> bool:
+    """Check whether applying `applied` (from `with_applied_hash`) would leave `live` unchanged."""
+    plain_live, plain_applied = to_plain(live), to_plain(applied)
+    if plain_live is None or plain_applied is None:
+        return False
+    annotations = (plain_live.get("metadata") or {}).get("annotations") or {}
+    wanted = (plain_applied.get("metadata") or {}).get("annotations") or {}
+    if annotations.get(APPLIED_HASH_ANNOTATION) != wanted.get(APPLIED_HASH_ANNOTATION):
+        return False
+    metadata = {
+        k: v
+        for k, v in plain_applied["metadata"].items()
+        if k not in (*_VOLATILE_METADATA, "managedFields")
+    }
+    # The server owns status; only the applied configuration has to match.
+    configuration = {k: v for k, v in plain_applied.items() if k != "status"}
+    return _contains(plain_live, {**configuration, "metadata": metadata})
+
+
+def same_object(a: Any, b: Any) -> bool:
+    """Compare two objects, ignoring metadata the API server bumps on every write."""
+    plain_a, plain_b = to_plain(a), to_plain(b)
+    if plain_a is None or plain_b is None:
+        return False
+    return _normalized(plain_a) == _normalized(plain_b)
+
+
+def _contains(live: Any, applied: Any, merge_key: str = _MERGE_KEY) -> bool:
+    """Whether every value set in `applied` is present in `live`.
+
+    Fields only `live` has (defaults added by the server) are ignored.
+    """
+    if isinstance(applied, dict):
+        return isinstance(live, dict) and all(
+            _contains(live.get(key), value, _merge_key(key)) for key, value in applied.items()
+        )
+    if isinstance(applied, list):
+        if not isinstance(live, list):
+            return False
+        if _is_keyed_list(applied, merge_key):
+            by_key = {item.get(merge_key): item for item in live if isinstance(item, dict)}
+            return all(_contains(by_key.get(item[merge_key]), item) for item in applied)
+        return len(live) == len(applied) and all(map(_contains, live, applied))
+    return live == applied
+
+
+def _merge_key(field: str) -> str:
+    return _MERGE_KEYS.get(field, _MERGE_KEY)
+
+
+def _is_keyed_list(items: list[Any], merge_key: str) -> bool:
+    return bool(items) and all(isinstance(i, dict) and merge_key in i for i in items)
+
+
+def _normalized(obj: dict[str, Any]) -> dict[str, Any]:
+    metadata = dict(obj.get("metadata") or {})
+    for key in _VOLATILE_METADATA:
+        metadata.pop(key, None)
+    if "managedFields" in metadata:
+        metadata["managedFields"] = [
+            {k: v for k, v in entry.items() if k != "time"} for entry in metadata["managedFields"]
+        ]
+    return {**obj, "metadata": metadata, "status": None}
@@ -0,0 +1,62 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Ownership labels for charmarr-managed objects.
+
+Every object applied through K8sResourceManager carries the library version
+label (and a managed-by label), so all objects the library ever created can
+be found again with a label selector, even after a rename. Reconcilers add
+the owning app and a component name with `ownership_labels`, which is what
+`inventory`/`prune` select on.
+"""
+
+import dataclasses
+from typing import Any
+
+from lightkube import operators
+
+from charmarr_lib.krm._version import __version__
+
+APP_LABEL = "app.kubernetes.io/instance"
+COMPONENT_LABEL = "app.kubernetes.io/component"
+MANAGED_BY_LABEL = "app.kubernetes.io/managed-by"
+VERSION_LABEL = "charmarr.io/lib-version"
+
+
+def ownership_labels(app: str | None = None, component: str | None = None) -> dict[str, str]:
+    """Labels identifying the app and component that own an object.
+
+    Args:
+        app: Owning Juju application (usually self.app.name).
+        component: What created the object (e.g. "vpn-gateway-client").
+
+    Returns:
+        The labels to put on the object's metadata.
+    """
+    labels: dict[str, str] = {}
+    if app is not None:
+        labels[APP_LABEL] = app
+    if component is not None:
+        labels[COMPONENT_LABEL] = component
+    return labels
+
+
+def stamp_ownership(resource: Any, field_manager: str) -> Any:
+    """Return a copy of `resource` with the managed-by and version labels set.
+
+    Labels already present on the resource win, except the version label
+    which always reflects the library that applied the object.
+    """
+    metadata = getattr(resource, "metadata", None)
+    if metadata is None or not dataclasses.is_dataclass(resource) or isinstance(resource, type):
+        return resource
+    labels = {MANAGED_BY_LABEL: field_manager, **(metadata.labels or {})}
+    labels[VERSION_LABEL] = __version__
+    return dataclasses.replace(resource, metadata=dataclasses.replace(metadata, labels=labels))
+
+
+def owned_selector(app: str | None, component: str | None) -> dict[str, Any]:
+    """Label selector matching charmarr-managed objects of an app/component."""
+    selector: dict[str, Any] = {VERSION_LABEL: operators.exists()}
+    selector.update(ownership_labels(app, component))
+    return selector
@@ -0,0 +1,202 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Lease-based mutual exclusion for writers to the same object.
+
+Units of an application (or a charm and its helper) that patch the same
+StatefulSet or ConfigMap at once make each other's writes fail with 409
+Conflict, which the manager can only retry after a backoff. Holding a
+`coordination.k8s.io/v1` Lease keyed by the target object around the write
+queues them instead: a waiting writer watches the Lease and takes it as soon
+as it is released, or once the holder's lease duration has expired (e.g. the
+holder's pod died).
+
+Leases are short-lived and not renewed, so the guarded block must finish
+within `lease_duration`.
+"""
+
+import datetime
+import hashlib
+import socket
+import time
+import uuid
+from typing import Any, Self
+
+from lightkube import ApiError
+from lightkube.models.coordination_v1 import LeaseSpec
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.coordination_v1 import Lease
+
+from charmarr_lib.krm._manager import K8sResourceManager
+
+_MAX_NAME_LENGTH = 63
+
+
+def lease_name(resource_type: type[Any], name: str) -> str:
+    """Name of the Lease guarding writes to one object."""
+    full = f"charmarr-{resource_type.__name__.lower()}-{name}"
+    if len(full) <= _MAX_NAME_LENGTH:
+        return full
+    digest = hashlib.sha256(full.encode()).hexdigest()[:8]
+    return f"{full[: _MAX_NAME_LENGTH - 9]}-{digest}"
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC)
+
+
+def _expires_in(lease: Any) -> float:
+    """Seconds until the current holder's lease expires (<= 0 if expired)."""
+    spec = lease.spec
+    if spec is None or spec.renewTime is None or spec.leaseDurationSeconds is None:
+        return 0.0
+    expiry = spec.renewTime + datetime.timedelta(seconds=spec.leaseDurationSeconds)
+    return (expiry - _now()).total_seconds()
+
+
+def _available(lease: Any, holder: str) -> bool:
+    spec = lease.spec
+    if spec is None or not spec.holderIdentity or spec.holderIdentity == holder:
+        return True
+    return _expires_in(lease) <= 0
+
+
+class LeaseLock:
+    """Serialize writers to one object with a coordination.k8s.io/v1 Lease.
+
+    Example:
+        with LeaseLock(manager, StatefulSet, "radarr", "media"):
+            manager.patch(StatefulSet, "radarr", patch, "media")
+    """
+
+    def __init__(
+        self,
+        manager: K8sResourceManager,
+        resource_type: type[Any],
+        name: str,
+        namespace: str,
+        *,
+        holder: str | None = None,
+        lease_duration: int = 15,
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize the lock (nothing is acquired yet).
+
+        Args:
+            manager: Manager that reads and writes the Lease (with its retry
+                policy, rate limiter and request counters).
+            resource_type: Type of the object being guarded.
+            name: Name of the object being guarded.
+            namespace: Namespace of the object (and of the Lease).
+            holder: Identity recorded in the Lease. Defaults to the host name
+                plus a random suffix, unique per LeaseLock.
+            lease_duration: Seconds after which an unreleased lease may be
+                taken over.
+            timeout: Seconds to wait for the lease before giving up.
+        """
+        self._manager = manager
+        self._namespace = namespace
+        self._duration = lease_duration
+        self._timeout = timeout
+        self._lease: Any = None
+        self.name = lease_name(resource_type, name)
+        self.holder = holder or f"{socket.gethostname()}-{uuid.uuid4().hex[:8]}"
+
+    @property
+    def held(self) -> bool:
+        """Whether this lock currently holds the lease."""
+        return self._lease is not None
+
+    def acquire(self) -> None:
+        """Take the lease, waiting while another holder has it.
+
+        Raises:
+            TimeoutError: If the lease could not be taken within `timeout`.
+            ApiError: For API errors other than conflicts on the Lease.
+        """
+        deadline = time.monotonic() + self._timeout
+        while True:
+            current = self._try_acquire()
+            if self._lease is not None:
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Lease {self.name} still held after {self._timeout:g}s")
+            if current is None:
+                # Lost a create/replace race; re-read who holds it now.
+                continue
+            try:
+                self._manager.wait_for(
+                    Lease,
+                    self.name,
+                    lambda lease: _available(lease, self.holder),
+                    self._namespace,
+                    timeout=max(min(remaining, _expires_in(current)), 0.05),
+                    poll_interval=0.2,
+                )
+            except TimeoutError:
+                pass
+            except ApiError as e:
+                if e.status.code != 404:
+                    raise
+
+    def release(self) -> None:
+        """Give the lease up so the next writer can take it immediately."""
+        lease, self._lease = self._lease, None
+        if lease is None:
+            return
+        lease.spec.holderIdentity = None
+        try:
+            self._manager.replace(lease)
+        except ApiError as e:
+            # 409: our lease expired and someone else took it; 404: deleted.
+            if e.status.code not in (404, 409):
+                raise
+
+    def __enter__(self) -> Self:
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release()
+
+    def _try_acquire(self) -> Any:
+        """Try to take the lease once; returns the current Lease if it is held."""
+        now = _now()
+        try:
+            current = self._manager.get(Lease, self.name, self._namespace, fresh=True)
+        except ApiError as e:
+            if e.status.code != 404:
+                raise
+            lease = Lease(
+                metadata=ObjectMeta(name=self.name, namespace=self._namespace),
+                spec=self._spec(now, transitions=0),
+            )
+            return self._write(self._manager.create, lease)
+        if not _available(current, self.holder):
+            return current
+        spec = current.spec
+        previous = spec.holderIdentity if spec is not None else None
+        transitions = (spec.leaseTransitions or 0) if spec is not None else 0
+        if previous and previous != self.holder:
+            transitions += 1
+        current.spec = self._spec(now, transitions)
+        return self._write(self._manager.replace, current)
+
+    def _write(self, write: Any, lease: Any) -> Any:
+        """Create/replace the Lease; a 409 means another writer won the race."""
+        try:
+            self._lease = write(lease)
+        except ApiError as e:
+            if e.status.code != 409:
+                raise
+        return None
+
+    def _spec(self, now: datetime.datetime, transitions: int) -> LeaseSpec:
+        return LeaseSpec(
+            holderIdentity=self.holder,
+            leaseDurationSeconds=self._duration,
+            acquireTime=now,
+            renewTime=now,
+            leaseTransitions=transitions,
+        )
@@ -3,39 +3,38 @@
 
 """Generic Kubernetes resource operations via lightkube."""
 
+import logging
+import time
+from collections.abc import Iterable, Sequence
 from typing import Any
 
+import httpx
 from lightkube import ApiError, Client
+from lightkube.models.meta_v1 import ObjectMeta
 from lightkube.types import CascadeType, PatchType
-from tenacity import (
-    retry,
-    retry_if_exception,
-    stop_after_attempt,
-    wait_exponential,
-)
-
-
-def _is_retriable_error(exc: BaseException) -> bool:
-    """Check if an error is retriable.
-
-    Retriable errors:
-    - 409 Conflict: Resource was modified between get and patch
-    - 429 Too Many Requests: Rate limiting
-    - 500 Internal Server Error: Transient server issues
-    - 502/503/504: Gateway errors, service unavailable
-    - Connection errors: Network issues
-    """
-    if isinstance(exc, ApiError):
-        return exc.status.code in (409, 429, 500, 502, 503, 504)
-    return isinstance(exc, OSError)
-
 
-_retry_on_transient = retry(
-    retry=retry_if_exception(_is_retriable_error),
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
-    reraise=True,
+from charmarr_lib.krm._batch import resource_keys, run_tiered
+from charmarr_lib.krm._cache import MISSING, ObjectCache
+from charmarr_lib.krm._diff import (
+    apply_is_noop,
+    local_patch_is_noop,
+    same_object,
+    with_applied_hash,
 )
+from charmarr_lib.krm._inventory import owned_selector, stamp_ownership
+from charmarr_lib.krm._metadata import get_metadata, list_metadata
+from charmarr_lib.krm._models import ApplyResult, DesiredPatch
+from charmarr_lib.krm._observability import observed
+from charmarr_lib.krm._retry import (
+    RequestStats,
+    RetryPolicy,
+    TokenBucket,
+    retry_on_transient,
+    retry_unless_conflict,
+)
+from charmarr_lib.krm._wait import Predicate, WatchUnsupportedError, watch_until
+
+logger = logging.getLogger(__name__)
 
 
 class K8sResourceManager:
@@ -43,17 +42,32 @@ class K8sResourceManager:
 
     Provides a simplified interface for common K8s operations:
     - get: Fetch a resource by name
+    - get_metadata: Fetch only a resource's metadata (PartialObjectMetadata)
     - patch: Modify an existing resource (strategic merge by default)
     - apply: Create or update a resource (server-side apply)
     - delete: Remove a resource
     - exists: Check if a resource exists
+    - wait_for: Wait for a condition (watch with polling fallback)
+    - patch_if_changed / apply_if_changed: Skip writes that would be no-ops
+    - apply_many / reconcile_set: Dependency-ordered, concurrent multi-resource writes
+    - inventory / prune: List and garbage-collect charmarr-managed objects by label
 
-    All mutating operations (patch, apply, delete) automatically retry on:
+    All API calls automatically retry, as configured by a RetryPolicy, on:
     - 409 Conflict (optimistic locking failure)
-    - 429 Too Many Requests (rate limiting)
+    - 429 Too Many Requests (rate limiting; Retry-After is honored)
     - 5xx Server errors (transient failures)
     - Network/connection errors
 
+    With a `TokenBucket` rate limiter, every attempt waits for a token, so
+    many units reconciling at once don't trip API Priority and Fairness.
+    Retries and throttling are counted in `request_stats`.
+
+    With an `ObjectCache`, get/exists are served from the cache when fresh,
+    and patch/apply/delete results keep it up to date.
+
+    Applied objects are stamped with the managed-by and library version
+    labels (see `ownership_labels` for the app/component labels).
+
     Example:
         manager = K8sResourceManager()
         sts = manager.get(StatefulSet, "radarr", "media")
@@ -64,6 +78,9 @@ class K8sResourceManager:
         self,
         client: Client | None = None,
         field_manager: str = "charmarr-lib",
+        cache: ObjectCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
     ) -> None:
         """Initialize the resource manager.
 
@@ -71,22 +88,49 @@ class K8sResourceManager:
             client: Lightkube client. If None, creates a new client using
                     in-cluster config or kubeconfig.
             field_manager: Field manager name for server-side apply operations.
+            cache: Optional read-through object cache. Disabled by default.
+            retry_policy: Retry attempts, backoff and jitter. Defaults to
+                RetryPolicy().
+            rate_limiter: Optional client-side rate limiter, shareable
+                between managers. Disabled by default.
         """
         self._client = client if client is not None else Client()
         self._field_manager = field_manager
+        self._cache = cache
+        self._retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._rate_limiter = rate_limiter
+        self._request_stats = RequestStats()
 
     @property
     def client(self) -> Client:
         """Access the underlying lightkube client."""
         return self._client
 
-    def get(self, resource_type: type[Any], name: str, namespace: str | None = None) -> Any:
+    @property
+    def cache(self) -> ObjectCache | None:
+        """The object cache, if enabled."""
+        return self._cache
+
+    @property
+    def request_stats(self) -> RequestStats:
+        """Retry and throttling counters for this manager's API calls."""
+        return self._request_stats
+
+    def get(
+        self,
+        resource_type: type[Any],
+        name: str,
+        namespace: str | None = None,
+        *,
+        fresh: bool = False,
+    ) -> Any:
         """Fetch a resource by name.
 
         Args:
             resource_type: The resource type (e.g., StatefulSet, NetworkPolicy).
             name: Resource name.
             namespace: Namespace (required for namespaced resources).
+            fresh: Read from the API server even if the object is cached.
 
         Returns:
             The requested resource.
@@ -94,9 +138,57 @@ class K8sResourceManager:
         Raises:
             ApiError: If the resource doesn't exist or other API errors.
         """
+        if self._cache is None or fresh:
+            return self._get(resource_type, name, namespace)
+        cached = self._cache.lookup(resource_type, name, namespace)
+        if cached is MISSING:
+            return self._get(resource_type, name, namespace)
+        if cached is not None:
+            return cached
+        obj = self._get(resource_type, name, namespace)
+        self._cache.store(obj, resource_type)
+        return obj
+
+    @observed("get")
+    @retry_on_transient
+    def _get(self, resource_type: type[Any], name: str, namespace: str | None) -> Any:
         return self._client.get(resource_type, name, namespace=namespace)  # type: ignore[arg-type]
 
-    @_retry_on_transient
+    def get_metadata(
+        self, resource_type: type[Any], name: str, namespace: str | None = None
+    ) -> ObjectMeta:
+        """Fetch only the metadata (labels, annotations, ...) of a resource.
+
+        Uses a `PartialObjectMetadata` GET, so the spec, status and the rest
+        of the object are neither transferred nor deserialized. Served from
+        the cache when a fresh full object is cached.
+
+        Args:
+            resource_type: The resource type (e.g., StatefulSet, Job).
+            name: Resource name.
+            namespace: Namespace (required for namespaced resources).
+
+        Returns:
+            The resource's ObjectMeta.
+
+        Raises:
+            ApiError: If the resource doesn't exist or other API errors.
+        """
+        if self._cache is not None:
+            cached = self._cache.lookup(resource_type, name, namespace)
+            if cached is not None and cached is not MISSING:
+                return cached.metadata
+        return self._get_metadata(resource_type, name, namespace)
+
+    @observed("get_metadata")
+    @retry_on_transient
+    def _get_metadata(
+        self, resource_type: type[Any], name: str, namespace: str | None
+    ) -> ObjectMeta:
+        return get_metadata(self._client, resource_type, name, namespace)
+
+    @observed("patch")
+    @retry_on_transient
     def patch(
         self,
         resource_type: type[Any],
@@ -122,21 +214,26 @@ class K8sResourceManager:
         Raises:
             ApiError: If the resource doesn't exist or patch fails after retries.
         """
-        return self._client.patch(  # type: ignore[arg-type]
+        result = self._client.patch(  # type: ignore[arg-type]
             resource_type,
             name,
             obj,
             namespace=namespace,
             patch_type=patch_type,
         )
+        if self._cache is not None:
+            self._cache.store(result, resource_type)
+        return result
 
-    @_retry_on_transient
+    @observed("apply")
+    @retry_on_transient
     def apply(self, resource: Any, force: bool = False) -> Any:
         """Create or update a resource using server-side apply.
 
         Server-side apply is idempotent - applying the same resource
         multiple times has no effect. Use this for resources you own
-        and want to manage declaratively.
+        and want to manage declaratively. The applied copy carries the
+        managed-by and library version labels; `resource` is not modified.
 
         Automatically retries on conflict and transient errors.
 
@@ -150,11 +247,381 @@ class K8sResourceManager:
         Raises:
             ApiError: If the apply fails after retries.
         """
-        return self._client.apply(  # type: ignore[arg-type]
-            resource, field_manager=self._field_manager, force=force
+        result = self._client.apply(  # type: ignore[arg-type]
+            stamp_ownership(resource, self._field_manager),
+            field_manager=self._field_manager,
+            force=force,
+        )
+        if self._cache is not None:
+            self._cache.store(result, type(resource))
+        return result
+
+    @observed("create")
+    @retry_unless_conflict
+    def create(self, resource: Any) -> Any:
+        """Create a resource.
+
+        The managed-by and version labels are set as by `apply`, so the object
+        shows up in `inventory`. Transient errors are retried; a 409 (already
+        exists) is raised at once.
+
+        Args:
+            resource: The resource to create.
+
+        Returns:
+            The created resource.
+
+        Raises:
+            ApiError: If the resource exists or the create fails after retries.
+        """
+        result = self._client.create(
+            stamp_ownership(resource, self._field_manager)  # type: ignore[arg-type]
+        )
+        if self._cache is not None:
+            self._cache.store(result, type(resource))
+        return result
+
+    @observed("replace")
+    @retry_unless_conflict
+    def replace(self, resource: Any) -> Any:
+        """Replace a resource, guarded by its metadata.resourceVersion.
+
+        The managed-by and version labels are set as by `apply`. Transient
+        errors are retried; a 409 (the object changed since it was read) is
+        raised at once.
+
+        Args:
+            resource: The resource to write, as read (and then modified).
+
+        Returns:
+            The replaced resource.
+
+        Raises:
+            ApiError: If the object changed or the replace fails after retries.
+        """
+        result = self._client.replace(
+            stamp_ownership(resource, self._field_manager)  # type: ignore[arg-type]
+        )
+        if self._cache is not None:
+            self._cache.store(result, type(resource))
+        return result
+
+    def patch_if_changed(
+        self,
+        resource_type: type[Any],
+        name: str,
+        obj: dict[str, Any] | list[dict[str, Any]],
+        namespace: str | None = None,
+        patch_type: PatchType = PatchType.STRATEGIC,
+        *,
+        live: Any = None,
+    ) -> bool:
+        """Patch a resource only if the patch would change it.
+
+        Strategic merge and merge patches are compared locally against the
+        live object (served from the cache when enabled). JSON patches are
+        previewed with a server-side dry run.
+
+        Args:
+            resource_type: The resource type to patch.
+            name: Resource name.
+            obj: Patch content as a dict (or a list of operations for JSON patch).
+            namespace: Namespace (required for namespaced resources).
+            patch_type: Patch strategy. Defaults to strategic merge patch.
+            live: The live object if the caller just fetched it. Fetched
+                when None.
+
+        Returns:
+            True if the patch was sent, False if it was a no-op.
+
+        Raises:
+            ApiError: If the resource doesn't exist or patch fails after retries.
+        """
+        if live is None:
+            live = self.get(resource_type, name, namespace)
+        if self._is_noop_patch(resource_type, name, obj, namespace, patch_type, live):
+            return False
+        self.patch(resource_type, name, obj, namespace, patch_type)
+        return True
+
+    def apply_if_changed(self, resource: Any, force: bool = False) -> bool:
+        """Server-side apply a resource only if the apply would change it.
+
+        The resource is applied with a hash of its configuration in the
+        `charmarr.io/applied-hash` annotation. It is skipped when the live
+        object (served from the cache when enabled) carries the same hash and
+        still holds every applied value, so this costs one GET and no dry
+        run. Dropping a field changes the hash, so it still counts as a
+        change. Missing resources are always applied.
+
+        Args:
+            resource: The resource to apply.
+            force: Force apply even if there are conflicts.
+
+        Returns:
+            True if the resource was applied, False if it was a no-op.
+
+        Raises:
+            ApiError: If the apply fails after retries.
+        """
+        desired = with_applied_hash(stamp_ownership(resource, self._field_manager))
+        metadata = resource.metadata
+        try:
+            live = self.get(type(resource), metadata.name, metadata.namespace)
+        except ApiError as e:
+            if e.status.code != 404:
+                raise
+        else:
+            if apply_is_noop(live, desired):
+                return False
+        self.apply(desired, force)
+        return True
+
+    def apply_many(
+        self, resources: Sequence[Any], force: bool = False, max_workers: int = 4
+    ) -> list[ApplyResult]:
+        """Server-side apply several resources in dependency order.
+
+        Resources are grouped into dependency tiers by kind (ConfigMaps and
+        Secrets before workloads, ...). Resources of the same tier are
+        applied concurrently on a pool of `max_workers` threads. If any
+        resource fails, later tiers are skipped.
+
+        Args:
+            resources: The resources to apply.
+            force: Force apply even if there are conflicts.
+            max_workers: Maximum number of concurrent API calls.
+
+        Returns:
+            One ApplyResult per resource, in input order. Errors are reported
+            in the results rather than raised.
+        """
+
+        def action(resource: Any) -> bool:
+            self.apply(resource, force)
+            return True
+
+        return run_tiered(resources, action, max_workers)
+
+    def reconcile_set(
+        self,
+        desired: Sequence[Any | DesiredPatch],
+        force: bool = False,
+        max_workers: int = 4,
+    ) -> list[ApplyResult]:
+        """Reconcile several resources and patches in dependency order, skipping no-ops.
+
+        Like `apply_many`, but resources go through `apply_if_changed` and
+        `DesiredPatch` items through `patch_if_changed`, so each result's
+        `changed` says whether a write was actually made.
+
+        Args:
+            desired: Resources to apply and DesiredPatch items to send.
+            force: Force apply even if there are conflicts.
+            max_workers: Maximum number of concurrent API calls.
+
+        Returns:
+            One ApplyResult per item, in input order.
+        """
+
+        def action(item: Any) -> bool:
+            if isinstance(item, DesiredPatch):
+                return self.patch_if_changed(
+                    item.resource_type, item.name, item.obj, item.namespace, item.patch_type
+                )
+            return self.apply_if_changed(item, force)
+
+        return run_tiered(desired, action, max_workers)
+
+    def inventory(
+        self,
+        kinds: Iterable[type[Any]],
+        namespace: str | None = None,
+        app: str | None = None,
+        component: str | None = None,
+    ) -> list[Any]:
+        """List charmarr-managed objects with one label-selector LIST per kind.
+
+        Only objects applied through this library (they carry the library
+        version label) are returned, narrowed to `app`/`component` when given.
+
+        Args:
+            kinds: Resource types to list (e.g. [ConfigMap, NetworkPolicy]).
+            namespace: Namespace to list in (required for namespaced kinds).
+            app: Only objects labelled with this owning app.
+            component: Only objects labelled with this component.
+
+        Returns:
+            The owned objects, grouped by kind in the order given.
+        """
+        selector = owned_selector(app, component)
+        owned: list[Any] = []
+        for kind in kinds:
+            owned.extend(self._list(kind, namespace, selector))
+        return owned
+
+    def prune(
+        self,
+        desired: Iterable[Any],
+        kinds: Iterable[type[Any]],
+        namespace: str | None = None,
+        app: str | None = None,
+        component: str | None = None,
+    ) -> list[ApplyResult]:
+        """Delete owned objects of `kinds` that are not in `desired`.
+
+        Finds leftovers regardless of their name (e.g. objects created under
+        an older naming scheme) using `inventory`.
+
+        Args:
+            desired: Resources that should be kept (kind, namespace and name are
+                compared; a resource without a namespace counts as `namespace`).
+            kinds: Resource types to prune.
+            namespace: Namespace to prune in (required for namespaced kinds).
+            app: Only prune objects labelled with this owning app.
+            component: Only prune objects labelled with this component.
+
+        Returns:
+            One ApplyResult per deleted object (`changed` is False if it was
+            already gone).
+
+        Raises:
+            ApiError: If a LIST or DELETE fails after retries.
+        """
+        keep = resource_keys(desired, namespace)
+        selector = owned_selector(app, component)
+        results: list[ApplyResult] = []
+        for kind in kinds:
+            for metadata in self._list_metadata(kind, namespace, selector):
+                name = metadata.name
+                if name is None or (kind.__name__, name, metadata.namespace) in keep:
+                    continue
+                deleted = self.delete(kind, name, metadata.namespace)
+                results.append(
+                    ApplyResult(kind.__name__, name, metadata.namespace, changed=deleted)
+                )
+        return results
+
+    @observed("list")
+    @retry_on_transient
+    def _list(
+        self, resource_type: type[Any], namespace: str | None, selector: dict[str, Any]
+    ) -> list[Any]:
+        return list(
+            self._client.list(resource_type, namespace=namespace, labels=selector)  # type: ignore[arg-type]
         )
 
-    @_retry_on_transient
+    @observed("list_metadata")
+    @retry_on_transient
+    def _list_metadata(
+        self, resource_type: type[Any], namespace: str | None, selector: dict[str, Any]
+    ) -> list[ObjectMeta]:
+        return list_metadata(self._client, resource_type, namespace, selector)
+
+    def _is_noop_patch(
+        self,
+        resource_type: type[Any],
+        name: str,
+        obj: dict[str, Any] | list[dict[str, Any]],
+        namespace: str | None,
+        patch_type: PatchType,
+        live: Any,
+    ) -> bool:
+        if patch_type == PatchType.JSON:
+            if not obj:
+                return True
+            preview = self._dry_run_patch(resource_type, name, obj, namespace, patch_type)
+            return same_object(preview, live)
+        return local_patch_is_noop(live, obj, patch_type)
+
+    @observed("dry_run_patch")
+    @retry_on_transient
+    def _dry_run_patch(
+        self,
+        resource_type: type[Any],
+        name: str,
+        obj: dict[str, Any] | list[dict[str, Any]],
+        namespace: str | None,
+        patch_type: PatchType,
+    ) -> Any:
+        return self._client.patch(  # type: ignore[call-overload]
+            resource_type, name, obj, namespace=namespace, patch_type=patch_type, dry_run=True
+        )
+
+    def wait_for(
+        self,
+        resource_type: type[Any],
+        name: str,
+        predicate: Predicate,
+        namespace: str | None = None,
+        timeout: float = 60.0,
+        poll_interval: float = 2.0,
+    ) -> Any:
+        """Wait until a resource satisfies `predicate`.
+
+        Reads the resource once, then watches it from that resourceVersion
+        and returns as soon as an event satisfies the predicate. If the
+        watch can't be used (client without watch support, watch not
+        permitted, connection errors) the resource is polled every
+        `poll_interval` seconds instead.
+
+        Args:
+            resource_type: The resource type (e.g., Job, StatefulSet).
+            name: Resource name.
+            predicate: Condition on the resource, e.g. `job_finished` or
+                `statefulset_rolled_out`.
+            namespace: Namespace (required for namespaced resources).
+            timeout: Seconds to wait before giving up.
+            poll_interval: Seconds between reads when polling.
+
+        Returns:
+            The resource as of the moment it satisfied the predicate.
+
+        Raises:
+            TimeoutError: If the predicate is not satisfied within `timeout`.
+            ApiError: If the initial read fails.
+        """
+        deadline = time.monotonic() + timeout
+        obj = self._get(resource_type, name, namespace)
+        if predicate(obj):
+            return obj
+        try:
+            found = watch_until(
+                self._client,
+                resource_type,
+                name,
+                namespace,
+                predicate,
+                obj.metadata.resourceVersion,
+                deadline,
+            )
+        except (WatchUnsupportedError, httpx.HTTPError, OSError) as e:
+            logger.debug("Watch on %s %s failed (%s), polling", resource_type.__name__, name, e)
+            found = self._poll_until(
+                resource_type, name, namespace, predicate, deadline, poll_interval
+            )
+        if found is None:
+            raise TimeoutError(f"{resource_type.__name__} {name} not ready after {timeout:g}s")
+        return found
+
+    def _poll_until(
+        self,
+        resource_type: type[Any],
+        name: str,
+        namespace: str | None,
+        predicate: Predicate,
+        deadline: float,
+        poll_interval: float,
+    ) -> Any:
+        while (remaining := deadline - time.monotonic()) > 0:
+            time.sleep(min(poll_interval, remaining))
+            obj = self._get(resource_type, name, namespace)
+            if predicate(obj):
+                return obj
+        return None
+
+    @observed("delete")
+    @retry_on_transient
     def delete(
         self,
         resource_type: type[Any],
@@ -178,6 +645,8 @@ class K8sResourceManager:
         Raises:
             ApiError: For errors other than 404 (not found), after retries.
         """
+        if self._cache is not None:
+            self._cache.invalidate(resource_type, name, namespace)
         try:
             self._client.delete(
                 resource_type,
@@ -197,7 +666,7 @@ class K8sResourceManager:
         name: str,
         namespace: str | None = None,
     ) -> bool:
-        """Check if a resource exists.
+        """Check if a resource exists, with a metadata-only GET.
 
         Args:
             resource_type: The resource type to check.
@@ -207,10 +676,21 @@ class K8sResourceManager:
         Returns:
             True if the resource exists, False otherwise.
         """
+        if self._cache is not None:
+            cached = self._cache.lookup(resource_type, name, namespace)
+            if cached is not None:
+                return cached is not MISSING
+        return self._exists(resource_type, name, namespace)
+
+    @observed("exists")
+    @retry_on_transient
+    def _exists(self, resource_type: type[Any], name: str, namespace: str | None) -> bool:
         try:
-            self._client.get(resource_type, name, namespace=namespace)  # type: ignore[arg-type]
-            return True
+            get_metadata(self._client, resource_type, name, namespace)
         except ApiError as e:
             if e.status.code == 404:
+                if self._cache is not None:
+                    self._cache.store_missing(resource_type, name, namespace)
                 return False
             raise
+        return True
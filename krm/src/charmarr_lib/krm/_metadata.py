@@ -0,0 +1,163 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Metadata-only GET/LIST via the PartialObjectMetadata Accept header.
+
+Asking the API server for `PartialObjectMetadata` returns only an object's
+metadata (name, labels, annotations, resourceVersion, ...), so existence and
+label checks don't transfer and deserialize whole StatefulSets with their
+pod templates and managedFields.
+
+lightkube has no public option for the Accept header, so requests are built
+on the client's generic request layer. Any other client object (e.g. a test
+double) falls back to a full read and returns its metadata.
+
+`generic_client` and `stream_request` are the only places that reach into
+lightkube's private attributes; `_wait` uses them for raw watch requests.
+"""
+
+from typing import Any
+
+from lightkube import AsyncClient, Client
+from lightkube.core.generic_client import BasicRequest, GenericAsyncClient, GenericSyncClient
+from lightkube.core.selector import build_selector
+from lightkube.models.meta_v1 import ObjectMeta
+
+_ACCEPT = "application/json;as={kind};g=meta.k8s.io;v=v1,application/json"
+PARTIAL_METADATA_ACCEPT = _ACCEPT.format(kind="PartialObjectMetadata")
+PARTIAL_METADATA_LIST_ACCEPT = _ACCEPT.format(kind="PartialObjectMetadataList")
+
+
+def generic_client[T](client: Any, generic_type: type[T]) -> T | None:
+    """Return the generic request layer of a lightkube client, or None for other clients."""
+    generic = getattr(client, "_client", None)
+    return generic if isinstance(generic, generic_type) else None
+
+
+def stream_request(generic: GenericSyncClient | GenericAsyncClient, request: BasicRequest) -> Any:
+    """Build a streaming HTTP request, with lightkube's watch timeouts (no read timeout)."""
+    return generic._client.build_request(  # pyright: ignore[reportPrivateUsage]
+        request.method,
+        request.url,
+        params=request.params,
+        timeout=generic._watch_timeout,  # pyright: ignore[reportPrivateUsage]
+    )
+
+
+def _list_params(labels: dict[str, Any] | None, continue_token: str | None) -> dict[str, Any]:
+    return {
+        "labelSelector": build_selector(labels) if labels else None,
+        "continue": continue_token,
+    }
+
+
+def _continue_token(body: dict[str, Any]) -> str | None:
+    """The token of the next page of a LIST response, or None on the last page."""
+    return (body.get("metadata") or {}).get("continue") or None
+
+
+def _metadata_of(item: dict[str, Any]) -> ObjectMeta:
+    return ObjectMeta.from_dict(item["metadata"])
+
+
+def get_metadata(
+    client: Client, resource_type: type[Any], name: str, namespace: str | None
+) -> ObjectMeta:
+    """GET only the metadata of one object.
+
+    Raises:
+        ApiError: If the object doesn't exist or other API errors.
+    """
+    generic = generic_client(client, GenericSyncClient)
+    if generic is None:
+        return client.get(resource_type, name, namespace=namespace).metadata  # type: ignore[arg-type]
+    request = generic.prepare_request(
+        "get",
+        resource_type,
+        name=name,
+        namespace=namespace,
+        headers={"Accept": PARTIAL_METADATA_ACCEPT},
+    )
+    response = generic.send(generic.build_adapter_request(request))
+    generic.raise_for_status(response)
+    return _metadata_of(response.json())
+
+
+def list_metadata(
+    client: Client,
+    resource_type: type[Any],
+    namespace: str | None,
+    labels: dict[str, Any] | None = None,
+) -> list[ObjectMeta]:
+    """LIST only the metadata of the objects matching `labels`."""
+    generic = generic_client(client, GenericSyncClient)
+    if generic is None:
+        listing = client.list(resource_type, namespace=namespace, labels=labels)  # type: ignore[arg-type]
+        return [obj.metadata for obj in listing]
+    items: list[ObjectMeta] = []
+    continue_token = None
+    while True:
+        request = generic.prepare_request(
+            "list",
+            resource_type,
+            namespace=namespace,
+            params=_list_params(labels, continue_token),
+            headers={"Accept": PARTIAL_METADATA_LIST_ACCEPT},
+        )
+        response = generic.send(generic.build_adapter_request(request))
+        generic.raise_for_status(response)
+        body = response.json()
+        items += [_metadata_of(item) for item in body["items"]]
+        continue_token = _continue_token(body)
+        if continue_token is None:
+            return items
+
+
+async def get_metadata_async(
+    client: AsyncClient, resource_type: type[Any], name: str, namespace: str | None
+) -> ObjectMeta:
+    """Async counterpart of `get_metadata`."""
+    generic = generic_client(client, GenericAsyncClient)
+    if generic is None:
+        obj = await client.get(resource_type, name, namespace=namespace)  # type: ignore[arg-type]
+        return obj.metadata
+    request = generic.prepare_request(
+        "get",
+        resource_type,
+        name=name,
+        namespace=namespace,
+        headers={"Accept": PARTIAL_METADATA_ACCEPT},
+    )
+    response = await generic.send(generic.build_adapter_request(request))
+    generic.raise_for_status(response)
+    return _metadata_of(response.json())
+
+
+async def list_metadata_async(
+    client: AsyncClient,
+    resource_type: type[Any],
+    namespace: str | None,
+    labels: dict[str, Any] | None = None,
+) -> list[ObjectMeta]:
+    """Async counterpart of `list_metadata`."""
+    generic = generic_client(client, GenericAsyncClient)
+    if generic is None:
+        listing = client.list(resource_type, namespace=namespace, labels=labels)  # type: ignore[arg-type]
+        return [obj.metadata async for obj in listing]
+    items: list[ObjectMeta] = []
+    continue_token = None
+    while True:
+        request = generic.prepare_request(
+            "list",
+            resource_type,
+            namespace=namespace,
+            params=_list_params(labels, continue_token),
+            headers={"Accept": PARTIAL_METADATA_LIST_ACCEPT},
+        )
+        response = await generic.send(generic.build_adapter_request(request))
+        generic.raise_for_status(response)
+        body = response.json()
+        items += [_metadata_of(item) for item in body["items"]]
+        continue_token = _continue_token(body)
+        if continue_token is None:
+            return items
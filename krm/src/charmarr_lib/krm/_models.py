@@ -3,7 +3,11 @@
 
 """Data models for K8s reconciliation operations."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass
+from typing import Any
+
+from lightkube.types import PatchType
 
 
 @dataclass(frozen=True)
@@ -17,3 +21,56 @@ class ReconcileResult:
 
     changed: bool
     message: str
+
+
+@dataclass(frozen=True)
+class DesiredPatch:
+    """A patch to send as part of `K8sResourceManager.reconcile_set`.
+
+    Attributes:
+        resource_type: The resource type to patch.
+        name: Resource name.
+        obj: Patch content.
+        namespace: Namespace (required for namespaced resources).
+        patch_type: Patch strategy. Defaults to strategic merge patch.
+    """
+
+    resource_type: type[Any]
+    name: str
+    obj: dict[str, Any] | list[dict[str, Any]]
+    namespace: str | None = None
+    patch_type: PatchType = PatchType.STRATEGIC
+
+
+@dataclass(frozen=True)
+class ApplyResult:
+    """Outcome for one resource of `apply_many` / `reconcile_set`.
+
+    Attributes:
+        kind: Resource kind (e.g. "ConfigMap").
+        name: Resource name.
+        namespace: Resource namespace, if any.
+        changed: Whether a write was made.
+        error: The exception raised for this resource, if any.
+        skipped: True if the resource was not attempted because a resource
+            it depends on failed.
+    """
+
+    kind: str
+    name: str
+    namespace: str | None
+    changed: bool = False
+    error: BaseException | None = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True if the resource was reconciled without error."""
+        return self.error is None and not self.skipped
+
+
+def raise_first_error(results: Iterable[ApplyResult]) -> None:
+    """Re-raise the first error reported in `apply_many`/`reconcile_set` results."""
+    for result in results:
+        if result.error is not None:
+            raise result.error
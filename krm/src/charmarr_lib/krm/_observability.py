@@ -0,0 +1,153 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Call observers for K8sResourceManager.
+
+Observers are process-wide and opt-in: with none registered, manager calls
+skip timing entirely. charmarr-lib-core uses this to feed its hook
+instrumentation without krm depending on core.
+"""
+
+import contextvars
+import dataclasses
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, cast
+
+from lightkube import ApiError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class K8sCall:
+    """One completed K8sResourceManager call, including any retries."""
+
+    verb: str
+    kind: str
+    duration: float
+    attempts: int
+    error: str | None = None
+
+
+CallObserver = Callable[[K8sCall], None]
+
+_observers: list[CallObserver] = []
+
+# Attempt counter of the observed call running in this context. Each call sets
+# its own, so concurrent calls on threads or asyncio tasks don't share one.
+_attempts: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar(
+    "charmarr_krm_attempts", default=None
+)
+
+
+def add_call_observer(observer: CallObserver) -> None:
+    """Register an observer notified after every K8sResourceManager call."""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_call_observer(observer: CallObserver) -> None:
+    """Unregister an observer. Unknown observers are ignored."""
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def count_attempt() -> None:
+    """Count one attempt of the observed call running in this context.
+
+    Called by `retry_on_transient` before every attempt; a no-op outside
+    an observed call.
+    """
+    counter = _attempts.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def _kind_of(target: Any) -> str:
+    return target.__name__ if isinstance(target, type) else type(target).__name__
+
+
+def _error_label(exc: BaseException) -> str:
+    if isinstance(exc, ApiError):
+        return str(exc.status.code)
+    return type(exc).__name__
+
+
+def _notify(call: K8sCall) -> None:
+    for observer in list(_observers):
+        try:
+            observer(call)
+        except Exception:
+            logger.exception("K8s call observer %r failed", observer)
+
+
+def _report(
+    verb: str, args: tuple[Any, ...], started: float, attempts: int, error: str | None
+) -> None:
+    _notify(
+        K8sCall(
+            verb=verb,
+            kind=_kind_of(args[1]) if len(args) > 1 else "",
+            duration=time.perf_counter() - started,
+            attempts=max(attempts, 1),
+            error=error,
+        )
+    )
+
+
+def observed[F: Callable[..., Any]](verb: str) -> Callable[[F], F]:
+    """Time a manager method and report it to registered observers.
+
+    Apply OUTSIDE the retry decorator so the reported duration and attempt
+    count cover every retry. Attempts are counted per call in a context
+    variable, so concurrent calls of the same method are reported apart.
+    The kind is taken from the first argument after `self` (a resource type
+    or a resource object). Coroutine functions are timed until they complete.
+    """
+
+    def decorator(fn: F) -> F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _observers:
+                    return await fn(*args, **kwargs)
+                started = time.perf_counter()
+                error: str | None = None
+                counter = [0]
+                token = _attempts.set(counter)
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    error = _error_label(e)
+                    raise
+                finally:
+                    _attempts.reset(token)
+                    _report(verb, args, started, counter[0], error)
+
+            return cast(F, async_wrapper)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _observers:
+                return fn(*args, **kwargs)
+            started = time.perf_counter()
+            error: str | None = None
+            counter = [0]
+            token = _attempts.set(counter)
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                error = _error_label(e)
+                raise
+            finally:
+                _attempts.reset(token)
+                _report(verb, args, started, counter[0], error)
+
+        return cast(F, wrapper)
+
+    return decorator
@@ -0,0 +1,253 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Retry policy, client-side rate limiting and request counters.
+
+Every API call a manager makes goes through `retry_on_transient`, which
+takes a token from the manager's rate limiter (if any) before each attempt
+and retries transient errors according to the manager's RetryPolicy. Delays
+grow exponentially with random jitter, so units that failed together don't
+retry together, and a 429/503 `Retry-After` from API Priority and Fairness
+is honored instead of guessed.
+"""
+
+import asyncio
+import dataclasses
+import email.utils
+import functools
+import inspect
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, cast
+
+from lightkube import ApiError
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+)
+
+from charmarr_lib.krm._observability import count_attempt
+
+
+def _is_retriable_error(exc: BaseException) -> bool:
+    """Check if an error is retriable.
+
+    Retriable errors:
+    - 409 Conflict: Resource was modified between get and patch
+    - 429 Too Many Requests: Rate limiting
+    - 500 Internal Server Error: Transient server issues
+    - 502/503/504: Gateway errors, service unavailable
+    - Connection errors: Network issues
+    """
+    if isinstance(exc, ApiError):
+        return exc.status.code in (409, 429, 500, 502, 503, 504)
+    return isinstance(exc, OSError)
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Seconds the server asked us to wait, from Retry-After or the Status details."""
+    if not isinstance(exc, ApiError):
+        return None
+    header = exc.response.headers.get("Retry-After")
+    if header:
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                return None
+            return max(0.0, when.timestamp() - time.time())
+    details = exc.status.details
+    seconds = getattr(details, "retryAfterSeconds", None) if details is not None else None
+    return float(seconds) if seconds else None
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    """How a manager retries transient API errors (409/429/5xx, connection errors).
+
+    Attributes:
+        attempts: Total attempts per call, including the first.
+        base_delay: Backoff before the first retry; doubles with every retry.
+        max_delay: Upper bound for any single delay, Retry-After included.
+        jitter: Up to this many seconds of random delay added to the backoff.
+        honor_retry_after: Wait as long as the server's Retry-After asks
+            instead of the computed backoff.
+    """
+
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 5.0
+    jitter: float = 0.5
+    honor_retry_after: bool = True
+
+    def delay(self, attempt: int, exc: BaseException | None) -> float:
+        """Seconds to wait after failed attempt number `attempt` (1-based)."""
+        if self.honor_retry_after and exc is not None:
+            requested = retry_after(exc)
+            if requested is not None:
+                return min(requested, self.max_delay)
+        backoff = self.base_delay * 2 ** (attempt - 1) + random.uniform(0, self.jitter)
+        return min(backoff, self.max_delay)
+
+
+class TokenBucket:
+    """Process-local token bucket limiting the API request rate.
+
+    Allows bursts of up to `burst` requests, refilled at `rate` requests per
+    second. Share one bucket between managers to limit the process as a
+    whole. Thread-safe; waiting callers reserve their token first, so they
+    are served in arrival order.
+
+    Example:
+        limiter = TokenBucket(rate=5, burst=10)
+        manager = K8sResourceManager(rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+        """
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    def acquire(self) -> float:
+        """Block until a token is available; returns the seconds waited."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Await a token without blocking the event loop; returns the seconds waited."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+
+@dataclasses.dataclass
+class RequestStats:
+    """Counters of a manager's API requests.
+
+    Attributes:
+        retries: Attempts that were retried after a transient error.
+        server_throttled: 429 responses from the API server.
+        client_throttled: Requests delayed by the rate limiter.
+        throttle_wait: Total seconds spent waiting for the rate limiter.
+    """
+
+    retries: int = 0
+    server_throttled: int = 0
+    client_throttled: int = 0
+    throttle_wait: float = 0.0
+
+
+def _retrying_kwargs(
+    policy: RetryPolicy, stats: RequestStats, retry_conflicts: bool
+) -> dict[str, Any]:
+    def should_retry(exc: BaseException) -> bool:
+        if isinstance(exc, ApiError) and exc.status.code == 429:
+            stats.server_throttled += 1
+        if not retry_conflicts and isinstance(exc, ApiError) and exc.status.code == 409:
+            return False
+        return _is_retriable_error(exc)
+
+    def wait(retry_state: RetryCallState) -> float:
+        outcome = retry_state.outcome
+        exc = outcome.exception() if outcome is not None else None
+        return policy.delay(retry_state.attempt_number, exc)
+
+    def before_sleep(_: RetryCallState) -> None:
+        stats.retries += 1
+
+    return {
+        "retry": retry_if_exception(should_retry),
+        "stop": stop_after_attempt(policy.attempts),
+        "wait": wait,
+        "before_sleep": before_sleep,
+        "reraise": True,
+    }
+
+
+def _record_throttle(stats: RequestStats, waited: float) -> None:
+    if waited:
+        stats.client_throttled += 1
+        stats.throttle_wait += waited
+
+
+def _with_retry[F: Callable[..., Any]](fn: F, retry_conflicts: bool) -> F:
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(manager: Any, *args: Any, **kwargs: Any) -> Any:
+            stats: RequestStats = manager._request_stats
+            retrying = AsyncRetrying(
+                **_retrying_kwargs(manager._retry_policy, stats, retry_conflicts)
+            )
+
+            async def attempt() -> Any:
+                count_attempt()
+                if manager._rate_limiter is not None:
+                    _record_throttle(stats, await manager._rate_limiter.acquire_async())
+                return await fn(manager, *args, **kwargs)
+
+            return await retrying(attempt)
+
+        return cast(F, async_wrapper)
+
+    @functools.wraps(fn)
+    def wrapper(manager: Any, *args: Any, **kwargs: Any) -> Any:
+        stats: RequestStats = manager._request_stats
+        retrying = Retrying(**_retrying_kwargs(manager._retry_policy, stats, retry_conflicts))
+
+        def attempt() -> Any:
+            count_attempt()
+            if manager._rate_limiter is not None:
+                _record_throttle(stats, manager._rate_limiter.acquire())
+            return fn(manager, *args, **kwargs)
+
+        return retrying(attempt)
+
+    return cast(F, wrapper)
+
+
+def retry_on_transient[F: Callable[..., Any]](fn: F) -> F:
+    """Rate-limit and retry a manager method per the manager's policy.
+
+    The wrapped method's first argument must be a manager with
+    `_retry_policy`, `_rate_limiter` and `_request_stats` attributes. Every
+    attempt takes a rate limiter token and is counted for `observed`.
+    """
+    return _with_retry(fn, retry_conflicts=True)
+
+
+def retry_unless_conflict[F: Callable[..., Any]](fn: F) -> F:
+    """Like `retry_on_transient`, but a 409 Conflict is raised at once.
+
+    For optimistic writes (create, replace by resourceVersion): a conflict
+    means another writer got there first, and resending the same body can't
+    succeed.
+    """
+    return _with_retry(fn, retry_conflicts=False)
@@ -0,0 +1,195 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Watch-based waiting for a single object to reach a condition.
+
+`wait_for` first GETs the object, then watches it (field selector on its
+name) from that resourceVersion, so changes are seen as they happen instead
+of on the next poll. Watches are re-opened from the last seen
+resourceVersion (bookmarks included) when the server closes them, and
+re-listed when the version has expired (410 Gone).
+
+lightkube's own watch reconnects internally without returning control, so
+it can't honor a deadline while the object is idle; watches are opened on
+the client's generic request layer with `timeoutSeconds` bounded by the
+remaining time instead. Clients without that layer, and watch failures
+(e.g. RBAC without the watch verb), fall back to polling.
+"""
+
+import json
+import math
+import time
+from collections.abc import Callable
+from typing import Any
+
+from lightkube import ApiError, AsyncClient, Client
+from lightkube.core.generic_client import BasicRequest, GenericAsyncClient, GenericSyncClient
+
+from charmarr_lib.krm._metadata import generic_client, stream_request
+
+Predicate = Callable[[Any], bool]
+
+
+class WatchUnsupportedError(Exception):
+    """The client can't open raw watch requests; callers fall back to polling."""
+
+
+def job_finished(job: Any) -> bool:
+    """True once a Job has completed or failed."""
+    status = job.status
+    if status is None:
+        return False
+    for condition in status.conditions or []:
+        if condition.type in ("Complete", "Failed") and condition.status == "True":
+            return True
+    return bool(status.succeeded) or bool(status.failed)
+
+
+def statefulset_rolled_out(sts: Any) -> bool:
+    """True once a StatefulSet's latest spec is rolled out and all replicas are ready."""
+    status = sts.status
+    if status is None:
+        return False
+    generation = sts.metadata.generation if sts.metadata is not None else None
+    if generation is not None and (status.observedGeneration or 0) < generation:
+        return False
+    replicas = sts.spec.replicas if sts.spec is not None and sts.spec.replicas is not None else 1
+    if status.updateRevision and status.currentRevision != status.updateRevision:
+        return False
+    return (status.updatedReplicas or 0) >= replicas and (status.readyReplicas or 0) >= replicas
+
+
+def _watch_request(
+    generic: GenericSyncClient | GenericAsyncClient,
+    resource_type: type[Any],
+    name: str,
+    namespace: str | None,
+    resource_version: str | None,
+    remaining: float,
+) -> BasicRequest:
+    return generic.prepare_request(
+        "list",
+        resource_type,
+        namespace=namespace,
+        watch=True,
+        params={
+            "fieldSelector": f"metadata.name={name}",
+            "resourceVersion": resource_version,
+            "timeoutSeconds": max(1, math.ceil(remaining)),
+            "allowWatchBookmarks": "true",
+        },
+    )
+
+
+class _Watch:
+    """Tracks the resourceVersion of one watch and evaluates its events."""
+
+    def __init__(self, resource_type: type[Any], predicate: Predicate, resource_version: str):
+        self.resource_type = resource_type
+        self.predicate = predicate
+        self.resource_version: str | None = resource_version
+
+    def event(self, line: str) -> Any:
+        """Process one watch line; returns the object if it satisfies the predicate."""
+        if not line:
+            return None
+        event = json.loads(line)
+        raw = event["object"]
+        if event["type"] == "ERROR":
+            raise ApiError(status=raw)
+        self.resource_version = raw["metadata"]["resourceVersion"]
+        if event["type"] not in ("ADDED", "MODIFIED"):
+            return None
+        obj = self.resource_type.from_dict(raw)
+        return obj if self.predicate(obj) else None
+
+    def relist(self, obj: Any) -> Any:
+        """Restart from a freshly read object after the version expired."""
+        self.resource_version = obj.metadata.resourceVersion
+        return obj if self.predicate(obj) else None
+
+
+def watch_until(
+    client: Client,
+    resource_type: type[Any],
+    name: str,
+    namespace: str | None,
+    predicate: Predicate,
+    resource_version: str,
+    deadline: float,
+) -> Any:
+    """Watch one object until it satisfies `predicate` or `deadline` passes.
+
+    Returns:
+        The matching object, or None at the deadline.
+
+    Raises:
+        WatchUnsupportedError: If the client can't open raw watches.
+        ApiError / httpx.HTTPError: If the watch fails.
+    """
+    generic = generic_client(client, GenericSyncClient)
+    if generic is None:
+        raise WatchUnsupportedError("client does not support watch requests")
+    watch = _Watch(resource_type, predicate, resource_version)
+    while (remaining := deadline - time.monotonic()) > 0:
+        request = _watch_request(
+            generic, resource_type, name, namespace, watch.resource_version, remaining
+        )
+        response = generic.send(stream_request(generic, request), stream=True)
+        try:
+            if response.is_error:
+                response.read()
+                generic.raise_for_status(response)
+            for line in response.iter_lines():
+                if (found := watch.event(line)) is not None:
+                    return found
+                if time.monotonic() >= deadline:
+                    return None
+        except ApiError as e:
+            if e.status.code != 410:
+                raise
+            obj = client.get(resource_type, name, namespace=namespace)  # type: ignore[arg-type]
+            if (found := watch.relist(obj)) is not None:
+                return found
+        finally:
+            response.close()
+    return None
+
+
+async def watch_until_async(
+    client: AsyncClient,
+    resource_type: type[Any],
+    name: str,
+    namespace: str | None,
+    predicate: Predicate,
+    resource_version: str,
+    deadline: float,
+) -> Any:
+    """Async counterpart of `watch_until`."""
+    generic = generic_client(client, GenericAsyncClient)
+    if generic is None:
+        raise WatchUnsupportedError("client does not support watch requests")
+    watch = _Watch(resource_type, predicate, resource_version)
+    while (remaining := deadline - time.monotonic()) > 0:
+        request = _watch_request(
+            generic, resource_type, name, namespace, watch.resource_version, remaining
+        )
+        response = await generic.send(stream_request(generic, request), stream=True)
+        try:
+            if response.is_error:
+                await response.aread()
+                generic.raise_for_status(response)
+            async for line in response.aiter_lines():
+                if (found := watch.event(line)) is not None:
+                    return found
+                if time.monotonic() >= deadline:
+                    return None
+        except ApiError as e:
+            if e.status.code != 410:
+                raise
+            obj = await client.get(resource_type, name, namespace=namespace)  # type: ignore[arg-type]
+            if (found := watch.relist(obj)) is not None:
+                return found
+        finally:
+            await response.aclose()
+    return None
@@ -0,0 +1,31 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""In-memory Kubernetes API for unit tests and benchmarks.
+
+Pass a `FakeK8sClient` as the client of a K8sResourceManager to run whole
+reconciles without a cluster or per-call mocks, and count the requests they
+make.
+
+Key components:
+- FakeK8sClient: In-memory lightkube Client (get/list/create/replace/patch/apply/delete)
+- FakeAsyncK8sClient: The same store behind lightkube's AsyncClient interface
+- Fault: A failure (409/429/5xx, optionally with Retry-After) injected into requests
+- FakeCall: One recorded request
+"""
+
+from charmarr_lib.krm.testing._client import (
+    FakeAsyncK8sClient,
+    FakeCall,
+    FakeK8sClient,
+    Fault,
+    api_error,
+)
+
+__all__ = [
+    "FakeAsyncK8sClient",
+    "FakeCall",
+    "FakeK8sClient",
+    "Fault",
+    "api_error",
+]
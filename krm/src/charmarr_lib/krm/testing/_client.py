@@ -0,0 +1,607 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""In-memory stand-in for lightkube's Client and AsyncClient."""
+
+import asyncio
+import copy
+import dataclasses
+import datetime
+import itertools
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Iterable, Iterator
+from typing import Any
+
+import httpx
+from lightkube import ApiError, operators
+from lightkube.core.resource import NamespacedResource, api_info
+from lightkube.types import PatchType
+
+from charmarr_lib.krm.testing._patch import (
+    ApplyConflictError,
+    PatchError,
+    Path,
+    field_set,
+    fields_v1,
+    get_field,
+    json_patch,
+    merge_patch,
+    server_side_apply,
+    strategic_merge,
+)
+
+_DEFAULT_FIELD_MANAGER = "fake-client"
+_REASONS = {
+    404: "NotFound",
+    409: "Conflict",
+    422: "Invalid",
+    429: "TooManyRequests",
+    500: "InternalError",
+    503: "ServiceUnavailable",
+}
+
+
+def api_error(code: int, message: str, retry_after: float | None = None) -> ApiError:
+    """Build the ApiError lightkube raises for a failed request."""
+    headers = {"Retry-After": f"{retry_after:g}"} if retry_after is not None else None
+    status = {
+        "kind": "Status",
+        "apiVersion": "v1",
+        "status": "Failure",
+        "message": message,
+        "reason": _REASONS.get(code, "Unknown"),
+        "code": code,
+    }
+    return ApiError(response=httpx.Response(code, json=status, headers=headers))
+
+
+@dataclasses.dataclass(frozen=True)
+class FakeCall:
+    """One request received by FakeK8sClient.
+
+    Attributes:
+        verb: get, list, create, replace, patch, apply or delete.
+        kind: Resource kind, e.g. "StatefulSet".
+        name: Object name (None for list).
+        namespace: Namespace of the request, if namespaced.
+        dry_run: Whether the request was a dry run.
+    """
+
+    verb: str
+    kind: str
+    name: str | None
+    namespace: str | None
+    dry_run: bool = False
+
+
+@dataclasses.dataclass
+class Fault:
+    """A failure injected into matching requests.
+
+    Attributes:
+        code: HTTP status of the injected ApiError (e.g. 409, 429, 500).
+        verb: Only fail this verb; None fails any verb.
+        kind: Only fail this kind; None fails any kind.
+        name: Only fail requests for this object name.
+        times: How many matching requests fail; None fails all of them.
+        retry_after: Retry-After seconds sent with the error.
+    """
+
+    code: int
+    verb: str | None = None
+    kind: str | None = None
+    name: str | None = None
+    times: int | None = 1
+    retry_after: float | None = None
+
+    def matches(self, call: FakeCall) -> bool:
+        """Whether this fault applies to `call`."""
+        return (
+            (self.times is None or self.times > 0)
+            and self.verb in (None, call.verb)
+            and self.kind in (None, call.kind)
+            and self.name in (None, call.name)
+        )
+
+
+@dataclasses.dataclass
+class _Stored:
+    obj: dict[str, Any]
+    owners: dict[str, dict[Path, Any]]
+    operations: dict[str, str]
+
+
+def _kind(resource_type: type[Any]) -> str:
+    return api_info(resource_type).resource.kind
+
+
+def _now() -> str:
+    return datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _spec_changed(old: dict[str, Any], new: dict[str, Any]) -> bool:
+    ignored = ("metadata", "status")
+    return {k: v for k, v in old.items() if k not in ignored} != {
+        k: v for k, v in new.items() if k not in ignored
+    }
+
+
+def _label_matches(labels: dict[str, str], key: str, value: Any) -> bool:
+    if value is None:
+        value = operators.exists()
+    elif isinstance(value, str):
+        value = operators.equal(value)
+    elif not isinstance(value, operators.Operator):
+        value = operators.in_(value)
+    match value.op_name:
+        case "exists":
+            return key in labels
+        case "not_exists":
+            return key not in labels
+        case "equal":
+            return labels.get(key) == value.value
+        case "not_equal":
+            return labels.get(key) != value.value
+        case "in_":
+            return labels.get(key) in value.value
+        case "not_in":
+            return labels.get(key) not in value.value
+    raise ValueError(f"unsupported selector operator {value.op_name!r}")
+
+
+def _selected(obj: dict[str, Any], labels: dict[str, Any] | None, fields: Any) -> bool:
+    metadata = obj["metadata"]
+    if labels and not all(
+        _label_matches(metadata.get("labels") or {}, k, v) for k, v in labels.items()
+    ):
+        return False
+    field_values = {
+        "metadata.name": metadata["name"],
+        "metadata.namespace": metadata.get("namespace"),
+    }
+    return not fields or all(
+        _label_matches({k: v for k, v in field_values.items() if v is not None}, k, v)
+        for k, v in dict(fields).items()
+    )
+
+
+class FakeK8sClient:
+    """In-memory Kubernetes API for unit tests and benchmarks.
+
+    Implements the lightkube `Client` methods the managers and reconcilers
+    use (get/list/create/replace/patch/apply/delete), so it can be passed as
+    `K8sResourceManager(client=FakeK8sClient())`. Objects are stored as
+    plain dicts with resourceVersion, generation and managedFields kept the
+    way the API server keeps them:
+
+    - replace/patch with a stale `metadata.resourceVersion` fail with 409
+    - strategic merge, merge and JSON patches are applied (see `_patch`)
+    - server-side apply tracks field ownership per field manager, fails
+      with 409 on conflicts unless forced, and honors dry runs
+    - writes that change nothing don't bump resourceVersion
+
+    Every request is recorded in `calls`, can be slowed down by `latency`
+    and can be failed with `inject`. Watches are not supported, so
+    `wait_for` falls back to polling.
+
+    Example:
+        client = FakeK8sClient(objects=[statefulset])
+        manager = K8sResourceManager(client=client)
+        reconcile_storage_volume(manager, "radarr", "media", "radarr", "media-pvc")
+        assert client.count("patch") == 1
+    """
+
+    def __init__(
+        self,
+        objects: Iterable[Any] = (),
+        namespace: str = "default",
+        latency: float = 0.0,
+    ) -> None:
+        """Initialize the fake API with some existing objects.
+
+        Args:
+            objects: lightkube objects to store, as if created beforehand.
+                Creating them isn't recorded in `calls`.
+            namespace: Namespace of requests that don't name one.
+            latency: Seconds every request takes.
+        """
+        self.namespace = namespace
+        self.latency = latency
+        self.calls: list[FakeCall] = []
+        self.faults: list[Fault] = []
+        self._store: dict[tuple[str, str, str | None, str], _Stored] = {}
+        self._versions = itertools.count(1)
+        self._lock = threading.Lock()
+        for obj in objects:
+            self.add(obj)
+
+    def add(self, obj: Any) -> Any:
+        """Store an object without recording a request; returns the stored object."""
+        with self._lock:
+            res = type(obj)
+            ns = self._namespace(res, obj.metadata.namespace)
+            return self._create(res, obj.to_dict(), ns, _DEFAULT_FIELD_MANAGER)
+
+    def inject(self, fault: Fault) -> Fault:
+        """Fail the next matching request(s); returns the fault for inspection."""
+        with self._lock:
+            self.faults.append(fault)
+        return fault
+
+    def count(self, verb: str | None = None, kind: str | None = None) -> int:
+        """Number of recorded requests, optionally of one verb and/or kind."""
+        return sum(1 for c in self.calls if verb in (None, c.verb) and kind in (None, c.kind))
+
+    def stats(self) -> Counter[str]:
+        """Recorded requests per verb, with dry runs counted as `<verb>:dry_run`."""
+        return Counter(f"{c.verb}:dry_run" if c.dry_run else c.verb for c in self.calls)
+
+    def reset_calls(self) -> None:
+        """Forget the recorded requests (e.g. after seeding a scenario)."""
+        self.calls.clear()
+
+    def get(self, res: type[Any], name: str, *, namespace: str | None = None) -> Any:
+        """Return a stored object. Raise ApiError(404) if it doesn't exist."""
+        ns = self._namespace(res, namespace)
+        self._request("get", res, name, ns)
+        with self._lock:
+            return res.from_dict(copy.deepcopy(self._lookup(res, name, ns).obj))
+
+    def list(
+        self,
+        res: type[Any],
+        *,
+        namespace: str | None = None,
+        chunk_size: int | None = None,
+        labels: dict[str, Any] | None = None,
+        fields: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """List stored objects of a kind; namespace "*" lists all namespaces."""
+        ns = self._namespace(res, namespace)
+        self._request("list", res, None, ns)
+        kind = _kind(res)
+        with self._lock:
+            found = [
+                res.from_dict(copy.deepcopy(stored.obj))
+                for (group, k, obj_ns, _), stored in sorted(self._store.items())
+                if (group, k) == (api_info(res).resource.group, kind)
+                and ns in ("*", obj_ns)
+                and _selected(stored.obj, labels, fields)
+            ]
+        return iter(found)
+
+    def create(
+        self,
+        obj: Any,
+        name: str | None = None,
+        *,
+        namespace: str | None = None,
+        field_manager: str | None = None,
+        dry_run: bool = False,
+    ) -> Any:
+        """Create an object. Raise ApiError(409) if it already exists."""
+        res = type(obj)
+        ns = self._namespace(res, namespace or obj.metadata.namespace)
+        self._request("create", res, obj.metadata.name, ns, dry_run)
+        with self._lock:
+            return self._create(res, obj.to_dict(), ns, field_manager, dry_run)
+
+    def replace(
+        self,
+        obj: Any,
+        name: str | None = None,
+        *,
+        namespace: str | None = None,
+        field_manager: str | None = None,
+        dry_run: bool = False,
+    ) -> Any:
+        """Replace an object; a set resourceVersion must match the live one."""
+        res = type(obj)
+        ns = self._namespace(res, namespace or obj.metadata.namespace)
+        self._request("replace", res, obj.metadata.name, ns, dry_run)
+        with self._lock:
+            stored = self._lookup(res, obj.metadata.name, ns)
+            new = obj.to_dict()
+            self._check_version(stored, new)
+            return self._update(res, stored, new, new, field_manager, dry_run)
+
+    def patch(
+        self,
+        res: type[Any],
+        name: str,
+        obj: Any,
+        *,
+        namespace: str | None = None,
+        patch_type: PatchType = PatchType.STRATEGIC,
+        field_manager: str | None = None,
+        force: bool = False,
+        dry_run: bool = False,
+    ) -> Any:
+        """Patch an object (strategic merge, merge, JSON patch or apply)."""
+        ns = self._namespace(res, namespace)
+        if patch_type == PatchType.APPLY:
+            self._request("apply", res, name, ns, dry_run)
+            body = obj.to_dict() if hasattr(obj, "to_dict") else obj
+            with self._lock:
+                return self._apply(res, body, ns, field_manager, force, dry_run)
+        self._request("patch", res, name, ns, dry_run)
+        body = obj.to_dict() if hasattr(obj, "to_dict") else obj
+        with self._lock:
+            stored = self._lookup(res, name, ns)
+            try:
+                if patch_type == PatchType.JSON:
+                    new = json_patch(stored.obj, body)
+                elif patch_type == PatchType.MERGE:
+                    new = merge_patch(stored.obj, body)
+                else:
+                    new = strategic_merge(stored.obj, body)
+            except PatchError as e:
+                raise api_error(422, str(e)) from e
+            self._check_version(stored, body if isinstance(body, dict) else {})
+            applied = body if isinstance(body, dict) else {}
+            return self._update(res, stored, new, applied, field_manager, dry_run)
+
+    def apply(
+        self,
+        obj: Any,
+        name: str | None = None,
+        *,
+        namespace: str | None = None,
+        field_manager: str | None = None,
+        force: bool = False,
+        dry_run: bool = False,
+    ) -> Any:
+        """Server-side apply an object, creating it if it doesn't exist."""
+        res = type(obj)
+        ns = self._namespace(res, namespace or obj.metadata.namespace)
+        self._request("apply", res, obj.metadata.name, ns, dry_run)
+        with self._lock:
+            return self._apply(res, obj.to_dict(), ns, field_manager, force, dry_run)
+
+    def delete(
+        self,
+        res: type[Any],
+        name: str,
+        *,
+        namespace: str | None = None,
+        grace_period: int | None = None,
+        cascade: Any = None,
+        dry_run: bool = False,
+    ) -> None:
+        """Delete an object. Raise ApiError(404) if it doesn't exist."""
+        ns = self._namespace(res, namespace)
+        self._request("delete", res, name, ns, dry_run)
+        with self._lock:
+            self._lookup(res, name, ns)
+            if not dry_run:
+                del self._store[self._key(res, name, ns)]
+
+    def _namespace(self, res: type[Any], namespace: str | None) -> str | None:
+        if not issubclass(res, NamespacedResource):
+            return None
+        return namespace or self.namespace
+
+    def _request(
+        self,
+        verb: str,
+        res: type[Any],
+        name: str | None,
+        namespace: str | None,
+        dry_run: bool = False,
+    ) -> None:
+        """Record a request, apply the latency and raise an injected fault."""
+        call = FakeCall(verb, _kind(res), name, namespace, dry_run)
+        with self._lock:
+            self.calls.append(call)
+            fault = next((f for f in self.faults if f.matches(call)), None)
+            if fault is not None and fault.times is not None:
+                fault.times -= 1
+        if self.latency:
+            time.sleep(self.latency)
+        if fault is not None:
+            raise api_error(fault.code, f"injected {fault.code}", fault.retry_after)
+
+    @staticmethod
+    def _key(res: type[Any], name: str, namespace: str | None) -> tuple[str, str, str | None, str]:
+        resource = api_info(res).resource
+        return (resource.group, resource.kind, namespace, name)
+
+    def _lookup(self, res: type[Any], name: str, namespace: str | None) -> _Stored:
+        stored = self._store.get(self._key(res, name, namespace))
+        if stored is None:
+            raise api_error(404, f'{api_info(res).plural} "{name}" not found')
+        return stored
+
+    @staticmethod
+    def _check_version(stored: _Stored, body: dict[str, Any]) -> None:
+        wanted = (body.get("metadata") or {}).get("resourceVersion")
+        if wanted and wanted != stored.obj["metadata"]["resourceVersion"]:
+            raise api_error(
+                409,
+                "Operation cannot be fulfilled: the object has been modified; "
+                "please apply your changes to the latest version and try again",
+            )
+
+    def _create(
+        self,
+        res: type[Any],
+        obj: dict[str, Any],
+        namespace: str | None,
+        field_manager: str | None,
+        dry_run: bool = False,
+        operation: str = "Update",
+        owners: dict[str, dict[Path, Any]] | None = None,
+    ) -> Any:
+        metadata = obj.setdefault("metadata", {})
+        if namespace is not None:
+            metadata["namespace"] = namespace
+        key = self._key(res, metadata["name"], namespace)
+        if key in self._store:
+            raise api_error(409, f'{api_info(res).plural} "{metadata["name"]}" already exists')
+        manager = field_manager or _DEFAULT_FIELD_MANAGER
+        metadata.update(
+            uid=str(uuid.uuid4()),
+            creationTimestamp=_now(),
+            generation=1,
+            resourceVersion=str(next(self._versions)),
+        )
+        metadata.pop("managedFields", None)
+        stored = _Stored(obj, {}, {})
+        stored.owners = owners if owners is not None else {manager: field_set(obj)}
+        stored.operations = dict.fromkeys(stored.owners, operation)
+        self._render_managed_fields(res, stored)
+        if not dry_run:
+            self._store[key] = stored
+        return res.from_dict(copy.deepcopy(obj))
+
+    def _apply(
+        self,
+        res: type[Any],
+        body: dict[str, Any],
+        namespace: str | None,
+        field_manager: str | None,
+        force: bool,
+        dry_run: bool,
+    ) -> Any:
+        if not field_manager:
+            raise api_error(422, "PATCH (apply) requires a field manager")
+        body.setdefault("metadata", {}).pop("managedFields", None)
+        stored = self._store.get(self._key(res, body["metadata"]["name"], namespace))
+        try:
+            merged, owners = server_side_apply(
+                stored.obj if stored is not None else None,
+                body,
+                stored.owners if stored is not None else {},
+                field_manager,
+                force,
+            )
+        except ApplyConflictError as e:
+            raise api_error(409, str(e)) from e
+        if stored is None:
+            return self._create(res, merged, namespace, field_manager, dry_run, "Apply", owners)
+        operations = {**stored.operations, field_manager: "Apply"}
+        return self._write(res, stored, merged, owners, operations, dry_run)
+
+    def _update(
+        self,
+        res: type[Any],
+        stored: _Stored,
+        new: dict[str, Any],
+        body: dict[str, Any],
+        field_manager: str | None,
+        dry_run: bool,
+    ) -> Any:
+        """Write a replace/patch result; its manager owns the fields it set."""
+        manager = field_manager or _DEFAULT_FIELD_MANAGER
+        owners = {m: dict(f) for m, f in stored.owners.items()}
+        owners[manager] = {**owners.get(manager, {}), **field_set(body)}
+        owners = {
+            m: {path: v for path, v in f.items() if get_field(new, path) is not None}
+            for m, f in owners.items()
+        }
+        operations = {**stored.operations, manager: "Update"}
+        return self._write(res, stored, new, owners, operations, dry_run)
+
+    def _write(
+        self,
+        res: type[Any],
+        stored: _Stored,
+        new: dict[str, Any],
+        owners: dict[str, dict[Path, Any]],
+        operations: dict[str, str],
+        dry_run: bool,
+    ) -> Any:
+        """Store an updated object, bumping resourceVersion only if it changed."""
+        metadata = new.setdefault("metadata", {})
+        for key in ("uid", "creationTimestamp", "generation", "resourceVersion", "namespace"):
+            if key in stored.obj["metadata"]:
+                metadata[key] = stored.obj["metadata"][key]
+        owners = {m: f for m, f in owners.items() if f}
+        updated = _Stored(new, owners, {m: operations[m] for m in owners})
+        self._render_managed_fields(res, updated)
+        if new == stored.obj:
+            return res.from_dict(copy.deepcopy(stored.obj))
+        if _spec_changed(stored.obj, new):
+            metadata["generation"] = stored.obj["metadata"].get("generation", 1) + 1
+        metadata["resourceVersion"] = str(next(self._versions))
+        if not dry_run:
+            stored.obj, stored.owners, stored.operations = (
+                updated.obj,
+                updated.owners,
+                updated.operations,
+            )
+        return res.from_dict(copy.deepcopy(new))
+
+    @staticmethod
+    def _render_managed_fields(res: type[Any], stored: _Stored) -> None:
+        api_version = stored.obj.get("apiVersion") or api_info(res).resource.version
+        stored.obj["metadata"]["managedFields"] = [
+            {
+                "manager": manager,
+                "operation": stored.operations.get(manager, "Update"),
+                "apiVersion": api_version,
+                "fieldsType": "FieldsV1",
+                "fieldsV1": fields_v1(fields),
+            }
+            for manager, fields in sorted(stored.owners.items())
+        ]
+
+
+class FakeAsyncK8sClient:
+    """Async view of a FakeK8sClient, for AsyncK8sResourceManager.
+
+    Requests are served by the wrapped FakeK8sClient (so both can share one
+    store) in worker threads, so concurrent requests overlap their latency
+    like they would against a real API server.
+
+    Example:
+        fake = FakeK8sClient(objects=[statefulset])
+        manager = AsyncK8sResourceManager(client=FakeAsyncK8sClient(fake))
+    """
+
+    def __init__(self, fake: FakeK8sClient | None = None) -> None:
+        """Initialize the async view.
+
+        Args:
+            fake: The fake API to serve requests from. Defaults to a new one.
+        """
+        self.fake = fake if fake is not None else FakeK8sClient()
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(getattr(self.fake, method), *args, **kwargs)
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        """See FakeK8sClient.get."""
+        return await self._call("get", *args, **kwargs)
+
+    def list(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """See FakeK8sClient.list."""
+
+        async def items() -> AsyncIterator[Any]:
+            for obj in await self._call("list", *args, **kwargs):
+                yield obj
+
+        return items()
+
+    async def create(self, *args: Any, **kwargs: Any) -> Any:
+        """See FakeK8sClient.create."""
+        return await self._call("create", *args, **kwargs)
+
+    async def replace(self, *args: Any, **kwargs: Any) -> Any:
+        """See FakeK8sClient.replace."""
+        return await self._call("replace", *args, **kwargs)
+
+    async def patch(self, *args: Any, **kwargs: Any) -> Any:
+        """See FakeK8sClient.patch."""
+        return await self._call("patch", *args, **kwargs)
+
+    async def apply(self, *args: Any, **kwargs: Any) -> Any:
+        """See FakeK8sClient.apply."""
+        return await self._call("apply", *args, **kwargs)
+
+    async def delete(self, *args: Any, **kwargs: Any) -> Any:
+        """See FakeK8sClient.delete."""
+        return await self._call("delete", *args, **kwargs)
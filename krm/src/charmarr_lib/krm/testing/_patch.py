@@ -0,0 +1,332 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Patch and server-side apply semantics on plain dicts, for FakeK8sClient.
+
+These follow the API server closely enough for the fields the charmarr
+reconcilers write (pod template containers, volumes, mounts, env, labels
+and annotations), not the full OpenAPI-driven merge strategy:
+
+- strategic merge patch merges the pod spec lists below by their merge key
+  and honors `$patch: delete` entries; every other list is replaced
+- server-side apply tracks the leaf fields each field manager set, merges
+  keyed lists the same way, removes fields a manager stops applying, and
+  reports conflicts with fields owned by other managers
+"""
+
+import copy
+import json
+from typing import Any
+
+# Merge keys of the pod spec lists, as in the Kubernetes OpenAPI schema.
+MERGE_KEYS = {
+    "containers": "name",
+    "initContainers": "name",
+    "ephemeralContainers": "name",
+    "volumes": "name",
+    "env": "name",
+    "imagePullSecrets": "name",
+    "volumeMounts": "mountPath",
+    "volumeDevices": "devicePath",
+    "ports": "containerPort",
+}
+
+# Metadata fields the server owns; never part of a manager's field set.
+_SERVER_METADATA = (
+    "name",
+    "namespace",
+    "uid",
+    "resourceVersion",
+    "generation",
+    "creationTimestamp",
+    "managedFields",
+)
+
+Path = tuple[Any, ...]
+
+
+class PatchError(ValueError):
+    """A patch that can't be applied to the object (422 Unprocessable Entity)."""
+
+
+class ApplyConflictError(ValueError):
+    """Applied fields are owned by other field managers (409 Conflict)."""
+
+    def __init__(self, conflicts: list[tuple[str, Path]]) -> None:
+        self.conflicts = conflicts
+        fields = ", ".join(f"{_render(path)} ({manager})" for manager, path in conflicts)
+        super().__init__(f"Apply failed with {len(conflicts)} conflict(s): {fields}")
+
+
+def _render(path: Path) -> str:
+    parts = []
+    for step in path:
+        if isinstance(step, tuple):
+            parts.append(f"[{step[0]}={step[1]}]")
+        else:
+            parts.append(f".{step}")
+    return "".join(parts)
+
+
+def strategic_merge(live: Any, patch: Any, key: str | None = None) -> Any:
+    """Apply a strategic merge patch to `live`, returning the merged value."""
+    if isinstance(patch, list):
+        merge_key = MERGE_KEYS.get(key or "")
+        if merge_key is None or not isinstance(live, list):
+            return [strategic_merge(None, item) for item in patch]
+        return _merge_keyed_list(live, patch, merge_key)
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    if patch.get("$patch") == "replace":
+        return {k: copy.deepcopy(v) for k, v in patch.items() if k != "$patch"}
+    merged = copy.deepcopy(live) if isinstance(live, dict) else {}
+    for field, value in patch.items():
+        if field.startswith("$"):
+            continue
+        value = strategic_merge(merged.get(field), value, field) if value is not None else None
+        # Like the API server, don't keep keyed lists emptied by `$patch: delete`.
+        if value is None or (value == [] and field in MERGE_KEYS):
+            merged.pop(field, None)
+        else:
+            merged[field] = value
+    return merged
+
+
+def _merge_keyed_list(live: list[Any], patch: list[Any], merge_key: str) -> list[Any]:
+    merged = [copy.deepcopy(item) for item in live]
+    for item in patch:
+        if not isinstance(item, dict) or merge_key not in item:
+            raise PatchError(f"list entry {item!r} has no merge key {merge_key!r}")
+        index = next(
+            (i for i, e in enumerate(merged) if e.get(merge_key) == item[merge_key]), None
+        )
+        if item.get("$patch") == "delete":
+            if index is not None:
+                del merged[index]
+        elif index is None:
+            merged.append(strategic_merge(None, item))
+        else:
+            merged[index] = strategic_merge(merged[index], item)
+    return merged
+
+
+def merge_patch(live: Any, patch: Any) -> Any:
+    """Apply an RFC 7386 JSON merge patch."""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    merged = copy.deepcopy(live) if isinstance(live, dict) else {}
+    for field, value in patch.items():
+        if value is None:
+            merged.pop(field, None)
+        else:
+            merged[field] = merge_patch(merged.get(field), value)
+    return merged
+
+
+def _pointer(path: str) -> list[str]:
+    if not path.startswith("/"):
+        raise PatchError(f"invalid JSON pointer {path!r}")
+    return [p.replace("~1", "/").replace("~0", "~") for p in path[1:].split("/")]
+
+
+def _resolve(doc: Any, tokens: list[str]) -> Any:
+    for token in tokens:
+        if isinstance(doc, dict) and token in doc:
+            doc = doc[token]
+        elif isinstance(doc, list) and token.isdigit() and int(token) < len(doc):
+            doc = doc[int(token)]
+        else:
+            raise PatchError(f"path /{'/'.join(tokens)} does not exist")
+    return doc
+
+
+def _remove(doc: Any, tokens: list[str]) -> Any:
+    parent, last = _resolve(doc, tokens[:-1]), tokens[-1]
+    if isinstance(parent, list):
+        if not last.isdigit() or int(last) >= len(parent):
+            raise PatchError(f"path /{'/'.join(tokens)} does not exist")
+        return parent.pop(int(last))
+    if not isinstance(parent, dict) or last not in parent:
+        raise PatchError(f"path /{'/'.join(tokens)} does not exist")
+    return parent.pop(last)
+
+
+def _add(doc: Any, tokens: list[str], value: Any, replace: bool = False) -> Any:
+    if not tokens:
+        return value
+    parent, last = _resolve(doc, tokens[:-1]), tokens[-1]
+    if isinstance(parent, list):
+        index = len(parent) if last == "-" else int(last) if last.isdigit() else -1
+        if not 0 <= index <= len(parent) - (1 if replace else 0):
+            raise PatchError(f"index {last} out of range at /{'/'.join(tokens)}")
+        if replace:
+            parent[index] = value
+        else:
+            parent.insert(index, value)
+    elif isinstance(parent, dict):
+        if replace and last not in parent:
+            raise PatchError(f"path /{'/'.join(tokens)} does not exist")
+        parent[last] = value
+    else:
+        raise PatchError(f"path /{'/'.join(tokens)} does not exist")
+    return doc
+
+
+def json_patch(live: dict[str, Any], operations: list[dict[str, Any]]) -> dict[str, Any]:
+    """Apply an RFC 6902 JSON patch; fails as a whole if any operation fails."""
+    doc = copy.deepcopy(live)
+    for op in operations:
+        tokens = _pointer(op["path"])
+        match op["op"]:
+            case "add":
+                doc = _add(doc, tokens, copy.deepcopy(op["value"]))
+            case "remove":
+                _remove(doc, tokens)
+            case "replace":
+                doc = _add(doc, tokens, copy.deepcopy(op["value"]), replace=True)
+            case "test":
+                if _resolve(doc, tokens) != op["value"]:
+                    raise PatchError(f"test failed at {op['path']}")
+            case "move":
+                value = _remove(doc, _pointer(op["from"]))
+                doc = _add(doc, tokens, value)
+            case "copy":
+                value = copy.deepcopy(_resolve(doc, _pointer(op["from"])))
+                doc = _add(doc, tokens, value)
+            case other:
+                raise PatchError(f"unknown JSON patch operation {other!r}")
+    return doc
+
+
+def field_set(obj: dict[str, Any]) -> dict[Path, Any]:
+    """Leaf fields of an applied object and their values.
+
+    Entries of keyed lists are addressed by `(merge_key, value)` steps, so a
+    manager owns individual containers/volumes rather than the whole list.
+    """
+    fields: dict[Path, Any] = {}
+    for key, value in obj.items():
+        if key in ("apiVersion", "kind", "status"):
+            continue
+        if key == "metadata":
+            value = {k: v for k, v in value.items() if k not in _SERVER_METADATA}
+        _collect(value, (key,), key, fields)
+    return fields
+
+
+def _collect(value: Any, path: Path, key: str, fields: dict[Path, Any]) -> None:
+    merge_key = MERGE_KEYS.get(key)
+    if isinstance(value, dict) and value:
+        for k, v in value.items():
+            if not k.startswith("$"):
+                _collect(v, (*path, k), k, fields)
+    elif (
+        isinstance(value, list)
+        and merge_key
+        and value
+        and all(isinstance(item, dict) and merge_key in item for item in value)
+    ):
+        for item in value:
+            _collect(item, (*path, (merge_key, item[merge_key])), "", fields)
+    else:
+        fields[path] = value
+
+
+def get_field(obj: Any, path: Path) -> Any:
+    """Value at `path` in a plain object, or None if absent."""
+    for step in path:
+        if isinstance(step, tuple):
+            if not isinstance(obj, list):
+                return None
+            obj = next((e for e in obj if isinstance(e, dict) and e.get(step[0]) == step[1]), None)
+        elif isinstance(obj, dict):
+            obj = obj.get(step)
+        else:
+            return None
+    return obj
+
+
+def remove_field(obj: Any, path: Path) -> None:
+    """Remove the field at `path`, pruning the maps and keyed list entries it empties."""
+    if not path:
+        return
+    head, rest = path[0], path[1:]
+    if isinstance(head, tuple):
+        if not isinstance(obj, list):
+            return
+        for index, entry in enumerate(obj):
+            if isinstance(entry, dict) and entry.get(head[0]) == head[1]:
+                if rest != (head[0],):
+                    remove_field(entry, rest)
+                if set(entry) <= {head[0]}:
+                    del obj[index]
+                return
+        return
+    if not isinstance(obj, dict) or head not in obj:
+        return
+    if rest:
+        remove_field(obj[head], rest)
+        if obj[head] in ({}, []):
+            del obj[head]
+    else:
+        del obj[head]
+
+
+def server_side_apply(
+    live: dict[str, Any] | None,
+    applied: dict[str, Any],
+    owners: dict[str, dict[Path, Any]],
+    manager: str,
+    force: bool,
+) -> tuple[dict[str, Any], dict[str, dict[Path, Any]]]:
+    """Merge an applied configuration into the live object.
+
+    Args:
+        live: The live object, or None to create it.
+        applied: The applied configuration (a full object from `to_dict()`).
+        owners: Field sets of every field manager of the live object.
+        manager: Field manager of this apply.
+        force: Take over conflicting fields instead of failing.
+
+    Returns:
+        The merged object and the updated field ownership.
+
+    Raises:
+        ApplyConflictError: If another manager owns a field set to a different
+            value, and `force` is False.
+    """
+    live = copy.deepcopy(live) if live is not None else {}
+    fields = field_set(applied)
+    owners = {m: dict(f) for m, f in owners.items()}
+    conflicts = [
+        (other, path)
+        for other, owned in owners.items()
+        if other != manager
+        for path in fields
+        if path in owned and get_field(live, path) != fields[path]
+    ]
+    if conflicts and not force:
+        raise ApplyConflictError(conflicts)
+    for other, path in conflicts:
+        owners[other].pop(path, None)
+    others = {path for m, owned in owners.items() if m != manager for path in owned}
+    for path in owners.get(manager, {}):
+        if path not in fields and path not in others:
+            remove_field(live, path)
+    merged = strategic_merge(live, {k: v for k, v in applied.items() if k != "status"})
+    owners[manager] = fields
+    return merged, {m: f for m, f in owners.items() if f}
+
+
+def fields_v1(fields: dict[Path, Any]) -> dict[str, Any]:
+    """Render a field set in the API server's FieldsV1 format."""
+    tree: dict[str, Any] = {}
+    for path in sorted(fields, key=repr):
+        node = tree
+        for step in path:
+            if isinstance(step, tuple):
+                name = "k:" + json.dumps({step[0]: step[1]}, separators=(",", ":"))
+                node = node.setdefault(name, {".": {}})
+            else:
+                node = node.setdefault(f"f:{step}", {})
+    return tree
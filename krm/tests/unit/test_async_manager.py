@@ -0,0 +1,134 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for AsyncK8sResourceManager."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+from lightkube import ApiError
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.core_v1 import ConfigMap
+
+from charmarr_lib.krm import (
+    AsyncK8sResourceManager,
+    DesiredPatch,
+    K8sCall,
+    RetryPolicy,
+    add_call_observer,
+    remove_call_observer,
+)
+from charmarr_lib.krm._diff import with_applied_hash
+from charmarr_lib.krm._inventory import stamp_ownership
+
+
+def _api_error(code: int) -> ApiError:
+    return ApiError(response=httpx.Response(code, json={"code": code, "message": "boom"}))
+
+
+def _client() -> MagicMock:
+    client = MagicMock()
+    for verb in ("get", "patch", "apply", "delete"):
+        setattr(client, verb, AsyncMock())
+    return client
+
+
+def test_async_manager_retries_and_reports_calls() -> None:
+    """Transient errors are retried like the sync manager and observers see one call."""
+    calls: list[K8sCall] = []
+    client = _client()
+    client.patch.side_effect = [_api_error(503), MagicMock()]
+    client.get.side_effect = _api_error(404)
+    manager = AsyncK8sResourceManager(client=client)
+
+    async def run() -> bool:
+        await manager.patch(StatefulSet, "radarr", {"spec": {}}, "media")
+        return await manager.exists(StatefulSet, "radarr", "media")
+
+    add_call_observer(calls.append)
+    try:
+        exists = asyncio.run(run())
+    finally:
+        remove_call_observer(calls.append)
+
+    assert exists is False
+    assert client.patch.await_count == 2
+    assert [(c.verb, c.kind, c.attempts) for c in calls] == [
+        ("patch", "StatefulSet", 2),
+        ("exists", "StatefulSet", 1),
+    ]
+
+
+def test_concurrent_calls_report_their_own_attempts() -> None:
+    """Attempts are counted per call, not per method, when calls overlap."""
+    calls: list[K8sCall] = []
+    failed: set[str] = set()
+
+    async def patch(_kind, name, *_, **__) -> MagicMock:
+        await asyncio.sleep(0.01 if name == "sonarr" else 0)
+        if name == "radarr" and name not in failed:
+            failed.add(name)
+            raise _api_error(503)
+        return MagicMock()
+
+    client = _client()
+    client.patch.side_effect = patch
+    manager = AsyncK8sResourceManager(
+        client=client, retry_policy=RetryPolicy(base_delay=0, jitter=0)
+    )
+
+    async def run() -> None:
+        await asyncio.gather(
+            manager.patch(StatefulSet, "radarr", {"spec": {}}, "media"),
+            manager.patch(StatefulSet, "sonarr", {"spec": {}}, "media"),
+        )
+
+    add_call_observer(calls.append)
+    try:
+        asyncio.run(run())
+    finally:
+        remove_call_observer(calls.append)
+
+    assert sorted(c.attempts for c in calls) == [1, 2]
+
+
+def test_async_delete_treats_404_as_absent() -> None:
+    """delete returns False for missing resources and raises other errors."""
+    client = _client()
+    client.delete.side_effect = _api_error(404)
+    manager = AsyncK8sResourceManager(client=client)
+
+    assert asyncio.run(manager.delete(ConfigMap, "settings", "media")) is False
+
+
+def test_async_reconcile_set_skips_noops() -> None:
+    """reconcile_set compares against live objects before writing."""
+    client = _client()
+    live_cm = with_applied_hash(
+        stamp_ownership(
+            ConfigMap(metadata=ObjectMeta(name="settings", namespace="media"), data={"a": "1"}),
+            "charmarr-lib",
+        )
+    )
+    live_sts = StatefulSet.from_dict(
+        {"metadata": {"name": "radarr", "namespace": "media"}, "spec": {"replicas": 1}}
+    )
+    client.get.side_effect = lambda kind, *_, **__: live_cm if kind is ConfigMap else live_sts
+    client.apply.return_value = live_cm
+    manager = AsyncK8sResourceManager(client=client)
+
+    results = asyncio.run(
+        manager.reconcile_set(
+            [
+                ConfigMap(
+                    metadata=ObjectMeta(name="settings", namespace="media"), data={"a": "1"}
+                ),
+                DesiredPatch(StatefulSet, "radarr", {"spec": {"replicas": 3}}, "media"),
+            ]
+        )
+    )
+
+    assert [r.changed for r in results] == [False, True]
+    client.patch.assert_awaited_once()
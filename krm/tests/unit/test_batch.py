@@ -0,0 +1,106 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for K8sResourceManager.apply_many / reconcile_set."""
+
+import threading
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from lightkube import ApiError
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.core_v1 import ConfigMap, Secret
+from lightkube.resources.networking_v1 import NetworkPolicy
+
+from charmarr_lib.krm import DesiredPatch, K8sResourceManager, raise_first_error
+from charmarr_lib.krm._diff import with_applied_hash
+from charmarr_lib.krm._inventory import stamp_ownership
+
+
+def _meta(name: str) -> ObjectMeta:
+    return ObjectMeta(name=name, namespace="media")
+
+
+def _api_error(code: int) -> ApiError:
+    return ApiError(response=httpx.Response(code, json={"code": code, "message": "boom"}))
+
+
+def test_apply_many_orders_tiers_and_keeps_input_order() -> None:
+    """Config objects are applied before workloads; results follow input order."""
+    applied: list[str] = []
+    client = MagicMock()
+    client.apply.side_effect = lambda res, **_: applied.append(type(res).__name__) or res
+    manager = K8sResourceManager(client=client)
+    resources = [
+        StatefulSet(metadata=_meta("radarr")),
+        ConfigMap(metadata=_meta("settings")),
+        NetworkPolicy(metadata=_meta("policy")),
+    ]
+
+    results = manager.apply_many(resources)
+
+    assert [(r.kind, r.name, r.changed) for r in results] == [
+        ("StatefulSet", "radarr", True),
+        ("ConfigMap", "settings", True),
+        ("NetworkPolicy", "policy", True),
+    ]
+    assert set(applied[:2]) == {"ConfigMap", "NetworkPolicy"}
+    assert applied[2] == "StatefulSet"
+
+
+def test_apply_many_runs_a_tier_concurrently() -> None:
+    """Independent resources of one tier are in flight at the same time."""
+    barrier = threading.Barrier(3, timeout=5)
+    client = MagicMock()
+    client.apply.side_effect = lambda res, **_: barrier.wait() and res
+    manager = K8sResourceManager(client=client)
+    resources = [ConfigMap(metadata=_meta("a")), Secret(metadata=_meta("b"))]
+    resources.append(NetworkPolicy(metadata=_meta("c")))
+
+    results = manager.apply_many(resources, max_workers=3)
+
+    assert all(r.ok for r in results)
+
+
+def test_apply_many_skips_later_tiers_after_failure() -> None:
+    """A failed ConfigMap stops the StatefulSet that depends on it."""
+    client = MagicMock()
+    client.apply.side_effect = _api_error(422)
+    manager = K8sResourceManager(client=client)
+
+    results = manager.apply_many(
+        [ConfigMap(metadata=_meta("settings")), StatefulSet(metadata=_meta("radarr"))]
+    )
+
+    assert isinstance(results[0].error, ApiError)
+    assert results[1].skipped is True
+    assert client.apply.call_count == 1
+    with pytest.raises(ApiError):
+        raise_first_error(results)
+
+
+def test_reconcile_set_reports_actual_changes() -> None:
+    """reconcile_set skips no-op patches and applies and reports them as unchanged."""
+    client = MagicMock()
+    live_cm = with_applied_hash(
+        stamp_ownership(ConfigMap(metadata=_meta("settings"), data={"a": "1"}), "charmarr-lib")
+    )
+    live_sts = StatefulSet.from_dict(
+        {"metadata": {"name": "radarr", "namespace": "media"}, "spec": {"replicas": 1}}
+    )
+    client.get.side_effect = lambda kind, *_, **__: live_cm if kind is ConfigMap else live_sts
+    client.apply.return_value = live_cm
+    manager = K8sResourceManager(client=client)
+
+    results = manager.reconcile_set(
+        [
+            ConfigMap(metadata=_meta("settings"), data={"a": "1"}),
+            DesiredPatch(StatefulSet, "radarr", {"spec": {"replicas": 1}}, "media"),
+            DesiredPatch(StatefulSet, "radarr", {"spec": {"replicas": 2}}, "media"),
+        ]
+    )
+
+    assert [r.changed for r in results] == [False, False, True]
+    client.patch.assert_called_once()
@@ -0,0 +1,128 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the K8sResourceManager object cache."""
+
+import threading
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from lightkube import ApiError
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.core_v1 import Service
+
+from charmarr_lib.krm import K8sResourceManager, ObjectCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _sts(version: str, replicas: int = 1) -> StatefulSet:
+    sts = StatefulSet(
+        metadata=ObjectMeta(name="radarr", namespace="media", resourceVersion=version)
+    )
+    sts.spec = MagicMock(replicas=replicas)
+    return sts
+
+
+def _not_found() -> ApiError:
+    return ApiError(response=httpx.Response(404, json={"code": 404, "message": "not found"}))
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def client() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture
+def manager(client: MagicMock, clock: FakeClock) -> K8sResourceManager:
+    cache = ObjectCache(default_ttl=10, ttl_by_kind={"Service": 0}, clock=clock)
+    return K8sResourceManager(client=client, cache=cache)
+
+
+def test_get_is_served_from_cache_until_ttl(
+    manager: K8sResourceManager, client: MagicMock, clock: FakeClock
+) -> None:
+    client.get.return_value = _sts("5")
+
+    first = manager.get(StatefulSet, "radarr", "media")
+    second = manager.get(StatefulSet, "radarr", "media")
+    clock.now = 11
+    manager.get(StatefulSet, "radarr", "media")
+
+    assert client.get.call_count == 2
+    assert first is not second
+    assert manager.cache is not None
+    assert (manager.cache.stats.hits, manager.cache.stats.misses) == (1, 2)
+    assert manager.cache.stats.expired == 1
+
+
+def test_kind_with_zero_ttl_is_not_cached(manager: K8sResourceManager, client: MagicMock) -> None:
+    client.get.return_value = Service(
+        metadata=ObjectMeta(name="kube-dns", namespace="kube-system")
+    )
+
+    manager.get(Service, "kube-dns", "kube-system")
+    manager.get(Service, "kube-dns", "kube-system")
+
+    assert client.get.call_count == 2
+
+
+def test_patch_result_updates_cache_and_older_versions_are_ignored(
+    manager: K8sResourceManager, client: MagicMock
+) -> None:
+    client.patch.return_value = _sts("7", replicas=2)
+    manager.patch(StatefulSet, "radarr", {"spec": {"replicas": 2}}, "media")
+    assert manager.cache is not None
+    manager.cache.store(_sts("6", replicas=1))
+
+    assert manager.get(StatefulSet, "radarr", "media").spec.replicas == 2
+    client.get.assert_not_called()
+
+
+def test_exists_caches_not_found_and_delete_invalidates(
+    manager: K8sResourceManager, client: MagicMock
+) -> None:
+    client.get.side_effect = [_not_found(), _sts("1")]
+
+    assert manager.exists(StatefulSet, "radarr", "media") is False
+    assert manager.exists(StatefulSet, "radarr", "media") is False
+    manager.delete(StatefulSet, "radarr", "media")
+    assert manager.exists(StatefulSet, "radarr", "media") is True
+
+    assert client.get.call_count == 2
+
+
+def test_watch_keeps_entries_fresh_while_running(client: MagicMock, clock: FakeClock) -> None:
+    cache = ObjectCache(default_ttl=1, clock=clock)
+    delivered, release = threading.Event(), threading.Event()
+
+    def events():
+        yield "ADDED", _sts("3")
+        yield "MODIFIED", _sts("4", replicas=3)
+        delivered.set()
+        release.wait(timeout=5)
+
+    client.watch.return_value = events()
+    thread = cache.watch(client, StatefulSet, "media", duration=60)
+    assert delivered.wait(timeout=5)
+    clock.now = 30
+
+    assert cache.lookup(StatefulSet, "radarr", "media").spec.replicas == 3
+    assert cache.stats.watch_events == 2
+
+    release.set()
+    thread.join(timeout=5)
+    assert cache.lookup(StatefulSet, "radarr", "media") is None
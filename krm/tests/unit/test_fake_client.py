@@ -0,0 +1,147 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for the in-memory FakeK8sClient."""
+
+import asyncio
+from typing import cast
+
+import pytest
+from lightkube import ApiError, AsyncClient, Client
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.core_v1 import ConfigMap
+from lightkube.types import PatchType
+
+from charmarr_lib.krm import AsyncK8sResourceManager, K8sResourceManager, RetryPolicy
+from charmarr_lib.krm.testing import FakeAsyncK8sClient, FakeK8sClient, Fault
+
+_NO_BACKOFF = RetryPolicy(base_delay=0, jitter=0)
+
+
+def _statefulset() -> StatefulSet:
+    return StatefulSet.from_dict(
+        {
+            "metadata": {"name": "radarr", "namespace": "media"},
+            "spec": {
+                "selector": {"matchLabels": {"app": "radarr"}},
+                "serviceName": "radarr",
+                "template": {
+                    "metadata": {"labels": {"app": "radarr"}},
+                    "spec": {"containers": [{"name": "radarr", "image": "radarr:5"}]},
+                },
+            },
+        }
+    )
+
+
+def _configmap(data: dict[str, str]) -> ConfigMap:
+    return ConfigMap(metadata=ObjectMeta(name="settings", namespace="media"), data=data)
+
+
+def test_strategic_merge_patch_merges_by_key_and_deletes() -> None:
+    """Containers/volumes merge by name, mounts by mountPath; `$patch: delete` removes."""
+    client = FakeK8sClient([_statefulset()])
+    add = {
+        "spec": {
+            "template": {
+                "spec": {
+                    "volumes": [{"name": "media", "persistentVolumeClaim": {"claimName": "pvc"}}],
+                    "containers": [
+                        {"name": "radarr", "volumeMounts": [{"name": "media", "mountPath": "/d"}]}
+                    ],
+                }
+            }
+        }
+    }
+    client.patch(StatefulSet, "radarr", add, namespace="media")
+    remove = {"spec": {"template": {"spec": {"volumes": [{"name": "media", "$patch": "delete"}]}}}}
+    sts = client.patch(StatefulSet, "radarr", remove, namespace="media")
+
+    container = sts.spec.template.spec.containers[0]
+    assert container.image == "radarr:5"
+    assert container.volumeMounts[0].mountPath == "/d"
+    assert sts.spec.template.spec.volumes is None
+    assert sts.metadata.generation == 3
+
+
+def test_json_patch_and_stale_resource_version() -> None:
+    """JSON patches apply as a whole; a stale resourceVersion is a 409 Conflict."""
+    client = FakeK8sClient([_statefulset()])
+    stale = client.get(StatefulSet, "radarr", namespace="media")
+    ops = [{"op": "replace", "path": "/spec/template/spec/containers/0/image", "value": "r:6"}]
+    client.patch(StatefulSet, "radarr", ops, namespace="media", patch_type=PatchType.JSON)
+
+    with pytest.raises(ApiError) as missing:
+        client.patch(
+            StatefulSet,
+            "radarr",
+            [{"op": "remove", "path": "/spec/template/spec/volumes/0"}],
+            namespace="media",
+            patch_type=PatchType.JSON,
+        )
+    with pytest.raises(ApiError) as conflict:
+        client.replace(stale)
+
+    assert missing.value.status.code == 422
+    assert conflict.value.status.code == 409
+    assert (
+        client.get(StatefulSet, "radarr", namespace="media").spec.template.spec.containers[0].image
+        == "r:6"
+    )
+
+
+def test_server_side_apply_tracks_field_managers() -> None:
+    """Applies are no-ops when unchanged, drop fields a manager stops setting, and conflict."""
+    client = FakeK8sClient(namespace="media")
+    manager = K8sResourceManager(client=cast(Client, client))
+
+    assert manager.apply_if_changed(_configmap({"a": "1", "b": "2"}))
+    version = client.get(ConfigMap, "settings").metadata.resourceVersion
+    assert not manager.apply_if_changed(_configmap({"a": "1", "b": "2"}))
+    assert manager.apply_if_changed(_configmap({"a": "1"}))
+    with pytest.raises(ApiError) as conflict:
+        client.apply(_configmap({"a": "9"}), field_manager="someone-else")
+    client.apply(_configmap({"a": "9"}), field_manager="someone-else", force=True)
+
+    live = client.get(ConfigMap, "settings")
+    assert conflict.value.status.code == 409
+    assert live.data == {"a": "9"}
+    assert live.metadata.resourceVersion != version
+    assert {f.manager for f in live.metadata.managedFields} == {"charmarr-lib", "someone-else"}
+    assert client.count("apply") == 4
+    assert client.stats()["apply:dry_run"] == 0
+
+
+def test_injected_faults_are_retried_by_the_manager() -> None:
+    """Faults fail matching requests the given number of times, with Retry-After."""
+    client = FakeK8sClient([_statefulset()])
+    fault = client.inject(Fault(429, verb="patch", times=2, retry_after=0))
+    manager = K8sResourceManager(client=cast(Client, client), retry_policy=_NO_BACKOFF)
+
+    manager.patch(StatefulSet, "radarr", {"metadata": {"labels": {"a": "b"}}}, "media")
+
+    assert fault.times == 0
+    assert client.count("patch") == 3
+    assert manager.request_stats.server_throttled == 2
+    assert client.get(StatefulSet, "radarr", namespace="media").metadata.labels == {"a": "b"}
+
+
+def test_async_view_shares_the_store() -> None:
+    """FakeAsyncK8sClient serves AsyncK8sResourceManager from the same objects."""
+    fake = FakeK8sClient([_statefulset()], latency=0.01)
+    manager = AsyncK8sResourceManager(client=cast(AsyncClient, FakeAsyncK8sClient(fake)))
+
+    async def read_twice() -> list[StatefulSet]:
+        return list(
+            await asyncio.gather(
+                manager.get(StatefulSet, "radarr", "media"),
+                manager.get(StatefulSet, "radarr", "media"),
+            )
+        )
+
+    assert [s.to_dict()["metadata"]["name"] for s in asyncio.run(read_twice())] == [
+        "radarr",
+        "radarr",
+    ]
+    assert fake.count("get", "StatefulSet") == 2
@@ -0,0 +1,106 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for ownership labels, inventory and prune."""
+
+from unittest.mock import MagicMock
+
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.core_v1 import ConfigMap, Secret
+
+from charmarr_lib.krm import (
+    APP_LABEL,
+    MANAGED_BY_LABEL,
+    VERSION_LABEL,
+    K8sResourceManager,
+    ownership_labels,
+)
+from charmarr_lib.krm._version import __version__
+
+
+def _meta(name: str, labels: dict[str, str] | None = None) -> ObjectMeta:
+    return ObjectMeta(name=name, namespace="media", labels=labels)
+
+
+def test_apply_stamps_ownership_labels_without_mutating_input() -> None:
+    """The applied copy carries managed-by and version labels; the caller's object is untouched."""
+    client = MagicMock()
+    manager = K8sResourceManager(client=client)
+    metadata = _meta("settings", ownership_labels("radarr", "config"))
+    resource = ConfigMap(metadata=metadata)
+
+    manager.apply(resource)
+
+    applied = client.apply.call_args[0][0]
+    assert applied.metadata.labels == {
+        MANAGED_BY_LABEL: "charmarr-lib",
+        APP_LABEL: "radarr",
+        "app.kubernetes.io/component": "config",
+        VERSION_LABEL: __version__,
+    }
+    assert metadata.labels == ownership_labels("radarr", "config")
+
+
+def test_create_and_replace_stamp_ownership_labels() -> None:
+    """Objects written with create/replace carry the same labels as applied ones."""
+    client = MagicMock()
+    manager = K8sResourceManager(client=client)
+
+    manager.create(ConfigMap(metadata=_meta("created")))
+    manager.replace(ConfigMap(metadata=_meta("replaced", {"keep": "me"})))
+
+    created = client.create.call_args[0][0]
+    replaced = client.replace.call_args[0][0]
+    assert created.metadata.labels == {
+        MANAGED_BY_LABEL: "charmarr-lib",
+        VERSION_LABEL: __version__,
+    }
+    assert replaced.metadata.labels["keep"] == "me"
+    assert replaced.metadata.labels[VERSION_LABEL] == __version__
+
+
+def test_inventory_lists_each_kind_once_by_label() -> None:
+    """One LIST per kind, selecting owned objects of the app."""
+    client = MagicMock()
+    client.list.side_effect = lambda kind, **_: [kind(metadata=_meta(f"{kind.__name__.lower()}"))]
+    manager = K8sResourceManager(client=client)
+
+    owned = manager.inventory([ConfigMap, Secret], "media", app="radarr")
+
+    assert [type(o) for o in owned] == [ConfigMap, Secret]
+    assert client.list.call_count == 2
+    selector = client.list.call_args.kwargs["labels"]
+    assert selector[APP_LABEL] == "radarr"
+    assert VERSION_LABEL in selector
+
+
+def test_prune_deletes_only_undesired_objects() -> None:
+    """Objects in the desired set survive; leftovers are deleted."""
+    client = MagicMock()
+    client.list.return_value = [
+        ConfigMap(metadata=_meta("settings")),
+        ConfigMap(metadata=_meta("settings-old")),
+    ]
+    manager = K8sResourceManager(client=client)
+
+    results = manager.prune(
+        [ConfigMap(metadata=_meta("settings"))], [ConfigMap], "media", app="radarr"
+    )
+
+    assert [(r.name, r.changed) for r in results] == [("settings-old", True)]
+    client.delete.assert_called_once()
+    assert client.delete.call_args[0][:2] == (ConfigMap, "settings-old")
+
+
+def test_prune_keeps_desired_objects_by_namespace() -> None:
+    """A desired object only keeps the same-named object in its own namespace."""
+    client = MagicMock()
+    client.list.return_value = [
+        ConfigMap(metadata=_meta("settings")),
+        ConfigMap(metadata=ObjectMeta(name="settings", namespace="downloads")),
+    ]
+    manager = K8sResourceManager(client=client)
+
+    results = manager.prune([ConfigMap(metadata=_meta("settings"))], [ConfigMap], app="radarr")
+
+    assert [(r.name, r.namespace) for r in results] == [("settings", "downloads")]
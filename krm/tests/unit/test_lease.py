@@ -0,0 +1,105 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for LeaseLock."""
+
+import datetime
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from lightkube import ApiError
+from lightkube.models.coordination_v1 import LeaseSpec
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.coordination_v1 import Lease
+
+from charmarr_lib.krm import K8sResourceManager, LeaseLock, RetryPolicy
+
+
+def _api_error(code: int) -> ApiError:
+    return ApiError(response=httpx.Response(code, json={"code": code, "message": "boom"}))
+
+
+def _lease(
+    holder: str | None, renewed_ago: float = 0.0, duration: int = 15, transitions: int = 0
+) -> Lease:
+    renewed = datetime.datetime.now(datetime.UTC) - datetime.timedelta(seconds=renewed_ago)
+    return Lease(
+        metadata=ObjectMeta(name="charmarr-statefulset-radarr", namespace="media"),
+        spec=LeaseSpec(
+            holderIdentity=holder,
+            renewTime=renewed,
+            leaseDurationSeconds=duration,
+            leaseTransitions=transitions,
+        ),
+    )
+
+
+def test_lock_creates_lease_and_releases_it() -> None:
+    """A missing Lease is created for us and its holder cleared on exit."""
+    client = MagicMock()
+    client.get.side_effect = _api_error(404)
+    client.create.side_effect = lambda lease: lease
+    manager = K8sResourceManager(client=client)
+
+    with LeaseLock(manager, StatefulSet, "radarr", "media", holder="unit-0") as lock:
+        assert lock.held
+        created = client.create.call_args[0][0]
+        assert created.metadata.name == "charmarr-statefulset-radarr"
+        assert created.spec.holderIdentity == "unit-0"
+
+    assert not lock.held
+    assert client.replace.call_args[0][0].spec.holderIdentity is None
+
+
+def test_lock_waits_for_release_then_takes_over() -> None:
+    """A held Lease is watched until it is released, then taken with a transition."""
+    client = MagicMock()
+    client.get.side_effect = [_lease("unit-1"), _lease(None), _lease(None)]
+    client.replace.side_effect = lambda lease: lease
+    manager = K8sResourceManager(client=client)
+
+    with LeaseLock(manager, StatefulSet, "radarr", "media", holder="unit-0"):
+        taken = client.replace.call_args[0][0]
+        assert taken.spec.holderIdentity == "unit-0"
+
+
+def test_lock_takes_over_expired_lease() -> None:
+    """A holder that stopped renewing loses the Lease after its duration."""
+    client = MagicMock()
+    client.get.return_value = _lease("unit-1", renewed_ago=30, transitions=2)
+    client.replace.side_effect = lambda lease: lease
+    manager = K8sResourceManager(client=client)
+
+    lock = LeaseLock(manager, StatefulSet, "radarr", "media", holder="unit-0")
+    lock.acquire()
+
+    assert client.replace.call_args[0][0].spec.leaseTransitions == 3
+
+
+def test_lock_times_out_while_held() -> None:
+    """Bounded waiting: TimeoutError when the holder keeps the Lease."""
+    client = MagicMock()
+    client.get.return_value = _lease("unit-1")
+    manager = K8sResourceManager(client=client)
+
+    lock = LeaseLock(manager, StatefulSet, "radarr", "media", holder="unit-0", timeout=0.1)
+    with pytest.raises(TimeoutError, match="charmarr-statefulset-radarr"):
+        lock.acquire()
+    client.replace.assert_not_called()
+
+
+def test_lock_goes_through_the_manager() -> None:
+    """Lease calls are retried and counted by the manager; a lost race is not retried."""
+    client = MagicMock()
+    client.get.side_effect = [_api_error(503), _api_error(404), _lease(None)]
+    client.create.side_effect = _api_error(409)
+    client.replace.side_effect = lambda lease: lease
+    manager = K8sResourceManager(client=client, retry_policy=RetryPolicy(base_delay=0, jitter=0))
+
+    with LeaseLock(manager, StatefulSet, "radarr", "media", holder="unit-0") as lock:
+        assert lock.held
+
+    assert client.create.call_count == 1
+    assert manager.request_stats.retries == 1
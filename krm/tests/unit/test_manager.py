@@ -3,7 +3,20 @@
 
 """Unit tests for K8sResourceManager."""
 
-from charmarr_lib.krm import K8sResourceManager, ReconcileResult
+import copy
+from unittest.mock import MagicMock
+
+import httpx
+from lightkube import ApiError
+from lightkube.resources.apps_v1 import StatefulSet
+
+from charmarr_lib.krm import (
+    K8sCall,
+    K8sResourceManager,
+    ReconcileResult,
+    add_call_observer,
+    remove_call_observer,
+)
 
 
 def test_reconcile_result_immutable() -> None:
@@ -16,3 +29,173 @@ def test_reconcile_result_immutable() -> None:
 def test_k8s_resource_manager_import() -> None:
     """K8sResourceManager should be importable."""
     assert K8sResourceManager is not None
+
+
+def _api_error(code: int) -> ApiError:
+    response = httpx.Response(code, json={"code": code, "message": "boom"})
+    return ApiError(response=response)
+
+
+def test_call_observers_see_verb_kind_attempts_and_errors() -> None:
+    """Observers get one K8sCall per manager call, covering retries."""
+    calls: list[K8sCall] = []
+    client = MagicMock()
+    client.get.side_effect = _api_error(404)
+    client.patch.side_effect = [_api_error(503), MagicMock()]
+    manager = K8sResourceManager(client=client)
+
+    add_call_observer(calls.append)
+    try:
+        assert manager.exists(StatefulSet, "radarr", "media") is False
+        manager.patch(StatefulSet, "radarr", {"spec": {}}, "media")
+    finally:
+        remove_call_observer(calls.append)
+    manager.exists(StatefulSet, "radarr", "media")
+
+    assert [(c.verb, c.kind, c.attempts, c.error) for c in calls] == [
+        ("exists", "StatefulSet", 1, None),
+        ("patch", "StatefulSet", 2, None),
+    ]
+    assert all(c.duration >= 0 for c in calls)
+
+
+def _statefulset(
+    containers: list[dict],
+    annotations: dict | None = None,
+    resource_version: str = "7",
+    managed_fields: list[dict] | None = None,
+) -> StatefulSet:
+    return StatefulSet.from_dict(
+        {
+            "metadata": {
+                "name": "radarr",
+                "namespace": "media",
+                "resourceVersion": resource_version,
+                "managedFields": managed_fields,
+            },
+            "spec": {
+                "selector": {"matchLabels": {"app": "radarr"}},
+                "serviceName": "radarr",
+                "template": {
+                    "metadata": {"annotations": annotations},
+                    "spec": {"containers": containers},
+                },
+            },
+        }
+    )
+
+
+def test_patch_if_changed_skips_strategic_noop() -> None:
+    """Strategic merge patches already reflected in the live object are not sent."""
+    client = MagicMock()
+    client.get.return_value = _statefulset(
+        [{"name": "radarr", "image": "radarr:5"}, {"name": "sidecar", "image": "gw:1"}],
+        annotations={"hash": "abc"},
+    )
+    manager = K8sResourceManager(client=client)
+    applied = {
+        "spec": {
+            "template": {
+                "metadata": {"annotations": {"hash": "abc", "gone": None}},
+                "spec": {"containers": [{"name": "sidecar", "image": "gw:1"}]},
+            }
+        }
+    }
+    removed = {
+        "spec": {"template": {"spec": {"containers": [{"$patch": "delete", "name": "other"}]}}}
+    }
+
+    assert manager.patch_if_changed(StatefulSet, "radarr", applied, "media") is False
+    assert manager.patch_if_changed(StatefulSet, "radarr", removed, "media") is False
+    client.patch.assert_not_called()
+
+
+def test_patch_if_changed_sends_real_changes() -> None:
+    """Changed values, new list entries and pending deletions are patched."""
+    client = MagicMock()
+    client.get.return_value = _statefulset(
+        [{"name": "radarr", "image": "radarr:5"}], annotations={"hash": "abc"}
+    )
+    manager = K8sResourceManager(client=client)
+    patches = [
+        {"spec": {"template": {"metadata": {"annotations": {"hash": "def"}}}}},
+        {"spec": {"template": {"metadata": {"annotations": {"hash": None}}}}},
+        {"spec": {"template": {"spec": {"containers": [{"name": "sidecar", "image": "gw"}]}}}},
+        {"spec": {"template": {"spec": {"containers": [{"$patch": "delete", "name": "radarr"}]}}}},
+    ]
+
+    assert all(manager.patch_if_changed(StatefulSet, "radarr", p, "media") for p in patches)
+    assert client.patch.call_count == len(patches)
+
+
+def test_apply_if_changed_compares_applied_hash_with_live() -> None:
+    """Apply is skipped when the live object holds the same applied configuration."""
+    client = MagicMock()
+    client.get.side_effect = _api_error(404)
+    manager = K8sResourceManager(client=client)
+    desired = _statefulset([{"name": "radarr", "image": "radarr:5"}], annotations={"a": "1"})
+    assert manager.apply_if_changed(desired) is True
+
+    live = copy.deepcopy(client.apply.call_args.args[0].to_dict())
+    live["metadata"]["resourceVersion"] = "8"
+    live["spec"]["template"]["spec"]["containers"][0]["imagePullPolicy"] = "IfNotPresent"
+    client.get.side_effect = None
+    client.get.return_value = StatefulSet.from_dict(live)
+    drifted = copy.deepcopy(live)
+    drifted["spec"]["template"]["spec"]["containers"][0]["image"] = "radarr:4"
+
+    assert manager.apply_if_changed(desired) is False
+    assert manager.apply_if_changed(_statefulset([{"name": "radarr"}], annotations={})) is True
+    client.get.return_value = StatefulSet.from_dict(drifted)
+    assert manager.apply_if_changed(desired) is True
+    assert client.apply.call_count == 3
+    assert all("dry_run" not in c.kwargs for c in client.apply.call_args_list)
+
+
+def test_apply_if_changed_ignores_live_status() -> None:
+    """A status written by the server does not turn an unchanged apply into a change."""
+    client = MagicMock()
+    client.get.side_effect = _api_error(404)
+    manager = K8sResourceManager(client=client)
+    desired = _statefulset([{"name": "radarr", "image": "radarr:5"}])
+    manager.apply_if_changed(desired)
+
+    live = copy.deepcopy(client.apply.call_args.args[0].to_dict())
+    live["status"] = {"replicas": 1, "readyReplicas": 1, "availableReplicas": 1}
+    client.get.side_effect = None
+    client.get.return_value = StatefulSet.from_dict(live)
+
+    assert manager.apply_if_changed(desired) is False
+    client.apply.assert_called_once()
+
+
+def test_patch_if_changed_matches_mounts_by_mount_path() -> None:
+    """volumeMounts are keyed by mountPath, like the API server merges them."""
+    mounts = [{"name": "media", "mountPath": "/data"}, {"name": "media", "mountPath": "/tv"}]
+    client = MagicMock()
+    client.get.return_value = _statefulset([{"name": "radarr", "volumeMounts": mounts}])
+    manager = K8sResourceManager(client=client)
+
+    def patch(mount: dict) -> dict:
+        container = {"name": "radarr", "volumeMounts": [mount]}
+        return {"spec": {"template": {"spec": {"containers": [container]}}}}
+
+    assert not manager.patch_if_changed(StatefulSet, "radarr", patch(mounts[1]), "media")
+    assert not manager.patch_if_changed(
+        StatefulSet, "radarr", patch({"mountPath": "/movies", "$patch": "delete"}), "media"
+    )
+    assert manager.patch_if_changed(
+        StatefulSet, "radarr", patch({"mountPath": "/tv", "$patch": "delete"}), "media"
+    )
+    client.patch.assert_called_once()
+
+
+def test_apply_if_changed_applies_missing_resource() -> None:
+    """A 404 on the live object goes straight to a real apply."""
+    client = MagicMock()
+    client.get.side_effect = _api_error(404)
+    manager = K8sResourceManager(client=client)
+
+    assert manager.apply_if_changed(_statefulset([])) is True
+    client.apply.assert_called_once()
+    assert "dry_run" not in client.apply.call_args.kwargs
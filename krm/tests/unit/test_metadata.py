@@ -0,0 +1,106 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for metadata-only reads."""
+
+import httpx
+from lightkube import Client
+from lightkube.config.kubeconfig import KubeConfig
+from lightkube.config.models import Cluster, User
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.core_v1 import ConfigMap
+
+from charmarr_lib.krm import K8sResourceManager
+
+
+def _manager(handler) -> K8sResourceManager:
+    client = Client(
+        config=KubeConfig.from_one(
+            cluster=Cluster(server="https://k8s.test"), user=User(token="t"), namespace="media"
+        ),
+        transport=httpx.MockTransport(handler),
+    )
+    return K8sResourceManager(client=client)
+
+
+def _partial(name: str, labels: dict[str, str] | None = None) -> dict:
+    return {
+        "apiVersion": "meta.k8s.io/v1",
+        "kind": "PartialObjectMetadata",
+        "metadata": {"name": name, "namespace": "media", "labels": labels or {}},
+    }
+
+
+def test_get_metadata_and_exists_request_partial_object_metadata() -> None:
+    """Existence and label reads ask for PartialObjectMetadata only."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/missing"):
+            return httpx.Response(404, json={"code": 404, "message": "not found"})
+        return httpx.Response(200, json=_partial("radarr", {"app": "radarr"}))
+
+    manager = _manager(handler)
+
+    metadata = manager.get_metadata(StatefulSet, "radarr", "media")
+    assert metadata.labels == {"app": "radarr"}
+    assert manager.exists(StatefulSet, "radarr", "media") is True
+    assert manager.exists(StatefulSet, "missing", "media") is False
+    assert all("as=PartialObjectMetadata;" in r.headers["accept"] for r in requests)
+    assert requests[0].url.path == "/apis/apps/v1/namespaces/media/statefulsets/radarr"
+
+
+def test_prune_lists_metadata_only() -> None:
+    """prune selects owned objects with a PartialObjectMetadataList LIST."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"kind": "Status", "status": "Success"})
+        items = [_partial("settings"), _partial("settings-old")]
+        return httpx.Response(200, json={"kind": "PartialObjectMetadataList", "items": items})
+
+    manager = _manager(handler)
+    keep = ConfigMap.from_dict({"metadata": {"name": "settings", "namespace": "media"}})
+
+    results = manager.prune([keep], [ConfigMap], "media", app="radarr")
+
+    assert [r.name for r in results] == ["settings-old"]
+    listing, delete = seen
+    assert "as=PartialObjectMetadataList;" in listing.headers["accept"]
+    assert "app.kubernetes.io/instance=radarr" in listing.url.params["labelSelector"]
+    assert delete.url.path.endswith("/configmaps/settings-old")
+
+
+def test_prune_follows_list_continue_tokens() -> None:
+    """Every page of the LIST is pruned, and items without a name are skipped."""
+    pages = {
+        None: ([_partial("settings-a")], "page-2"),
+        "page-2": ([_partial("settings-b"), {"metadata": {"namespace": "media"}}], ""),
+    }
+    tokens: list[str | None] = []
+    deleted: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "DELETE":
+            deleted.append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"kind": "Status", "status": "Success"})
+        token = request.url.params.get("continue")
+        tokens.append(token)
+        items, next_token = pages[token]
+        return httpx.Response(
+            200,
+            json={
+                "kind": "PartialObjectMetadataList",
+                "metadata": {"continue": next_token},
+                "items": items,
+            },
+        )
+
+    results = _manager(handler).prune([], [ConfigMap], "media", app="radarr")
+
+    assert tokens == [None, "page-2"]
+    assert deleted == ["settings-a", "settings-b"]
+    assert [r.name for r in results] == ["settings-a", "settings-b"]
@@ -0,0 +1,80 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for RetryPolicy, TokenBucket and request counters."""
+
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from lightkube import ApiError
+from lightkube.resources.apps_v1 import StatefulSet
+
+from charmarr_lib.krm import K8sResourceManager, RetryPolicy, TokenBucket
+
+
+def _api_error(code: int, headers: dict[str, str] | None = None) -> ApiError:
+    response = httpx.Response(code, json={"code": code, "message": "boom"}, headers=headers)
+    return ApiError(response=response)
+
+
+def test_delay_uses_retry_after_capped_at_max_delay() -> None:
+    """A Retry-After header replaces the computed backoff, bounded by max_delay."""
+    policy = RetryPolicy(max_delay=5.0, jitter=0)
+
+    assert policy.delay(1, _api_error(429, {"Retry-After": "2"})) == 2.0
+    assert policy.delay(1, _api_error(429, {"Retry-After": "60"})) == 5.0
+    assert policy.delay(3, _api_error(500)) == 2.0
+    assert RetryPolicy(honor_retry_after=False, jitter=0).delay(1, _api_error(429)) == 0.5
+
+
+def test_delay_adds_bounded_jitter() -> None:
+    """Jitter spreads retries without exceeding base + jitter."""
+    policy = RetryPolicy(base_delay=0.5, jitter=0.5)
+
+    delays = {policy.delay(1, _api_error(503)) for _ in range(20)}
+
+    assert all(0.5 <= d <= 1.0 for d in delays)
+    assert len(delays) > 1
+
+
+def test_manager_counts_retries_and_server_throttling() -> None:
+    """429s are retried after Retry-After and counted; attempts follow the policy."""
+    client = MagicMock()
+    client.patch.side_effect = [_api_error(429, {"Retry-After": "0"}), _api_error(409), "ok"]
+    manager = K8sResourceManager(client=client, retry_policy=RetryPolicy(base_delay=0, jitter=0))
+
+    assert manager.patch(StatefulSet, "radarr", {}, "media") == "ok"
+
+    stats = manager.request_stats
+    assert (stats.retries, stats.server_throttled) == (2, 1)
+
+
+def test_manager_gives_up_after_policy_attempts() -> None:
+    """The last error is re-raised once the attempts are used up."""
+    client = MagicMock()
+    client.delete.side_effect = _api_error(503)
+    manager = K8sResourceManager(
+        client=client, retry_policy=RetryPolicy(attempts=2, base_delay=0, jitter=0)
+    )
+
+    with pytest.raises(ApiError):
+        manager.delete(StatefulSet, "radarr", "media")
+    assert client.delete.call_count == 2
+
+
+def test_token_bucket_throttles_beyond_burst() -> None:
+    """Requests beyond the burst wait for tokens and are counted as throttled."""
+    client = MagicMock()
+    manager = K8sResourceManager(client=client, rate_limiter=TokenBucket(rate=50, burst=2))
+
+    started = time.monotonic()
+    for _ in range(4):
+        manager.get(StatefulSet, "radarr", "media")
+    elapsed = time.monotonic() - started
+
+    stats = manager.request_stats
+    assert stats.client_throttled == 2
+    assert elapsed >= 0.03
+    assert stats.throttle_wait == pytest.approx(0.04, abs=0.02)
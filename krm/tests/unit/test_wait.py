@@ -0,0 +1,130 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Unit tests for wait_for and its predicates."""
+
+import json
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from lightkube import Client
+from lightkube.config.kubeconfig import KubeConfig
+from lightkube.config.models import Cluster, User
+from lightkube.resources.apps_v1 import StatefulSet
+from lightkube.resources.batch_v1 import Job
+
+from charmarr_lib.krm import (
+    K8sCall,
+    K8sResourceManager,
+    add_call_observer,
+    job_finished,
+    remove_call_observer,
+    statefulset_rolled_out,
+)
+from charmarr_lib.krm._wait import WatchUnsupportedError, watch_until
+
+
+def _job(resource_version: str, succeeded: int | None = None) -> dict:
+    return {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": {"name": "check", "namespace": "media", "resourceVersion": resource_version},
+        "status": {"succeeded": succeeded} if succeeded else {},
+    }
+
+
+def _events(*events: tuple[str, dict]) -> bytes:
+    return b"".join(json.dumps({"type": t, "object": o}).encode() + b"\n" for t, o in events)
+
+
+def test_predicates() -> None:
+    """Job completion and StatefulSet rollout predicates."""
+    assert job_finished(Job.from_dict(_job("1", succeeded=1)))
+    assert not job_finished(Job.from_dict(_job("1")))
+    rolled_out = {
+        "metadata": {"name": "radarr", "generation": 2},
+        "spec": {"replicas": 1, "selector": {}, "template": {}},
+        "status": {
+            "replicas": 1,
+            "observedGeneration": 2,
+            "updatedReplicas": 1,
+            "readyReplicas": 1,
+            "currentRevision": "r2",
+            "updateRevision": "r2",
+        },
+    }
+    assert statefulset_rolled_out(StatefulSet.from_dict(rolled_out))
+    rolled_out["status"]["currentRevision"] = "r1"
+    assert not statefulset_rolled_out(StatefulSet.from_dict(rolled_out))
+
+
+def test_wait_for_watches_and_resumes_after_expired_version() -> None:
+    """The watch starts at the read's resourceVersion and re-lists on 410 Gone."""
+    watches: list[httpx.Request] = []
+    gets = iter([_job("1"), _job("5")])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("watch") != "true":
+            return httpx.Response(200, json=next(gets))
+        watches.append(request)
+        if len(watches) == 1:
+            gone = {"kind": "Status", "code": 410, "message": "too old"}
+            return httpx.Response(200, content=_events(("ERROR", gone)))
+        return httpx.Response(
+            200, content=_events(("MODIFIED", _job("6")), ("MODIFIED", _job("7", succeeded=1)))
+        )
+
+    client = Client(
+        config=KubeConfig.from_one(
+            cluster=Cluster(server="https://k8s.test"), user=User(token="t"), namespace="media"
+        ),
+        transport=httpx.MockTransport(handler),
+    )
+    manager = K8sResourceManager(client=client)
+
+    job = manager.wait_for(Job, "check", job_finished, "media", timeout=5)
+
+    assert job.status.succeeded == 1
+    assert [w.url.params["resourceVersion"] for w in watches] == ["1", "5"]
+    assert watches[0].url.params["fieldSelector"] == "metadata.name=check"
+
+
+def test_wait_for_falls_back_to_polling() -> None:
+    """Clients that can't watch are polled until the predicate holds."""
+    client = MagicMock()
+    client.get.side_effect = [Job.from_dict(_job("1")), Job.from_dict(_job("2", succeeded=1))]
+    manager = K8sResourceManager(client=client)
+
+    job = manager.wait_for(Job, "check", job_finished, "media", timeout=5, poll_interval=0.01)
+
+    assert job.metadata.resourceVersion == "2"
+    with pytest.raises(WatchUnsupportedError):
+        watch_until(client, Job, "check", "media", job_finished, "2", time.monotonic() + 1)
+
+
+def test_wait_for_reports_its_reads_not_the_wait() -> None:
+    """Only the GETs reach call observers; the wait itself isn't a timed request."""
+    calls: list[K8sCall] = []
+    client = MagicMock()
+    client.get.side_effect = [Job.from_dict(_job("1")), Job.from_dict(_job("2", succeeded=1))]
+    manager = K8sResourceManager(client=client)
+
+    add_call_observer(calls.append)
+    try:
+        manager.wait_for(Job, "check", job_finished, "media", timeout=5, poll_interval=0.01)
+    finally:
+        remove_call_observer(calls.append)
+
+    assert [(c.verb, c.kind) for c in calls] == [("get", "Job"), ("get", "Job")]
+
+
+def test_wait_for_times_out() -> None:
+    """TimeoutError once the deadline passes without the predicate holding."""
+    client = MagicMock()
+    client.get.return_value = Job.from_dict(_job("1"))
+    manager = K8sResourceManager(client=client)
+
+    with pytest.raises(TimeoutError, match="Job check"):
+        manager.wait_for(Job, "check", job_finished, "media", timeout=0.05, poll_interval=0.01)
@@ -4,9 +4,12 @@
 """VPN gateway charm library for Kubernetes."""
 
 from charmarr_lib.vpn._k8s import (
+    build_gateway_client_patch,
     get_cluster_dns_ip,
     reconcile_gateway,
+    reconcile_gateway_async,
     reconcile_gateway_client,
+    reconcile_gateway_client_async,
 )
 from charmarr_lib.vpn.constants import (
     CLIENT_INIT_CONTAINER_NAME,
@@ -38,7 +41,10 @@ __all__ = [
     "GATEWAY_SIDECAR_CONTAINER_NAME",
     "ISTIO_ZTUNNEL_LINK_LOCAL",
     "POD_GATEWAY_IMAGE",
+    "build_gateway_client_patch",
     "get_cluster_dns_ip",
     "reconcile_gateway",
+    "reconcile_gateway_async",
     "reconcile_gateway_client",
+    "reconcile_gateway_client_async",
 ]
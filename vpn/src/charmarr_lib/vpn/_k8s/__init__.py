@@ -20,11 +20,22 @@ See ADRs:
 - networking/adr-004-vpn-kill-switch.md
 """
 
-from charmarr_lib.vpn._k8s._gateway import get_cluster_dns_ip, reconcile_gateway
-from charmarr_lib.vpn._k8s._gateway_client import reconcile_gateway_client
+from charmarr_lib.vpn._k8s._gateway import (
+    get_cluster_dns_ip,
+    reconcile_gateway,
+    reconcile_gateway_async,
+)
+from charmarr_lib.vpn._k8s._gateway_client import (
+    build_gateway_client_patch,
+    reconcile_gateway_client,
+    reconcile_gateway_client_async,
+)
 
 __all__ = [
+    "build_gateway_client_patch",
     "get_cluster_dns_ip",
     "reconcile_gateway",
+    "reconcile_gateway_async",
     "reconcile_gateway_client",
+    "reconcile_gateway_client_async",
 ]
@@ -28,7 +28,14 @@ from lightkube.models.meta_v1 import ObjectMeta
 from lightkube.resources.apps_v1 import StatefulSet
 from lightkube.resources.core_v1 import ConfigMap, Service
 
-from charmarr_lib.krm import K8sResourceManager, ReconcileResult
+from charmarr_lib.krm import (
+    AsyncK8sResourceManager,
+    DesiredPatch,
+    K8sResourceManager,
+    ReconcileResult,
+    ownership_labels,
+    raise_first_error,
+)
 from charmarr_lib.vpn._k8s._utils import compute_config_hash
 from charmarr_lib.vpn.constants import (
     DEFAULT_VXLAN_GATEWAY_FIRST_DYNAMIC_IP,
@@ -119,22 +126,28 @@ def _build_gateway_configmap_data(data: VPNGatewayProviderData) -> dict[str, str
     }
 
 
-def _reconcile_gateway_configmap(
-    manager: K8sResourceManager,
-    configmap_name: str,
+_COMPONENT = "vpn-gateway"
+
+
+def _configmap_name(statefulset_name: str) -> str:
+    return f"{statefulset_name}-gateway-settings"
+
+
+def _build_gateway_configmap(
+    statefulset_name: str,
     namespace: str,
     data: VPNGatewayProviderData,
-) -> None:
-    """Reconcile ConfigMap for gateway pod-gateway settings."""
-    cm_data = _build_gateway_configmap_data(data)
-
-    configmap = ConfigMap(
-        metadata=ObjectMeta(name=configmap_name, namespace=namespace),
-        data=cm_data,
+) -> ConfigMap:
+    """Build ConfigMap for gateway pod-gateway settings."""
+    return ConfigMap(
+        metadata=ObjectMeta(
+            name=_configmap_name(statefulset_name),
+            namespace=namespace,
+            labels=ownership_labels(statefulset_name, _COMPONENT),
+        ),
+        data=_build_gateway_configmap_data(data),
     )
 
-    manager.apply(configmap)
-
 
 def _build_patch(
     configmap_name: str,
@@ -176,7 +189,9 @@ def reconcile_gateway(
     Ensures the VPN gateway StatefulSet has the required pod-gateway containers
     for VXLAN tunnel and DHCP/DNS services. Creates/updates a ConfigMap with
     pod-gateway settings and patches the StatefulSet with a config hash annotation
-    to trigger pod restart when settings change.
+    to trigger pod restart when settings change. The ConfigMap is written
+    before the StatefulSet that mounts it, and settings ConfigMaps left over
+    from older names are pruned.
 
     Args:
         manager: K8sResourceManager instance.
@@ -193,17 +208,63 @@ def reconcile_gateway(
     Raises:
         ApiError: If the StatefulSet doesn't exist or patch fails.
     """
-    configmap_name = f"{statefulset_name}-gateway-settings"
+    configmap_name = _configmap_name(statefulset_name)
     cm_data = _build_gateway_configmap_data(data)
     config_hash = compute_config_hash(cm_data)
 
-    _reconcile_gateway_configmap(manager, configmap_name, namespace, data)
+    configmap = _build_gateway_configmap(statefulset_name, namespace, data)
+    results = manager.reconcile_set(
+        [
+            configmap,
+            DesiredPatch(
+                StatefulSet,
+                statefulset_name,
+                _build_patch(configmap_name, input_cidrs, config_hash),
+                namespace,
+            ),
+        ]
+    )
+    raise_first_error(results)
+    results += manager.prune(
+        [configmap], [ConfigMap], namespace, app=statefulset_name, component=_COMPONENT
+    )
+
+    return ReconcileResult(
+        changed=any(r.changed for r in results),
+        message=f"Reconciled pod-gateway on {statefulset_name}",
+    )
+
 
-    patch = _build_patch(configmap_name, input_cidrs, config_hash)
-    manager.patch(StatefulSet, statefulset_name, patch, namespace)
+async def reconcile_gateway_async(
+    manager: AsyncK8sResourceManager,
+    statefulset_name: str,
+    namespace: str,
+    data: VPNGatewayProviderData,
+    input_cidrs: list[str],
+) -> ReconcileResult:
+    """Async version of `reconcile_gateway`, using AsyncK8sResourceManager."""
+    configmap_name = _configmap_name(statefulset_name)
+    config_hash = compute_config_hash(_build_gateway_configmap_data(data))
+
+    configmap = _build_gateway_configmap(statefulset_name, namespace, data)
+    results = await manager.reconcile_set(
+        [
+            configmap,
+            DesiredPatch(
+                StatefulSet,
+                statefulset_name,
+                _build_patch(configmap_name, input_cidrs, config_hash),
+                namespace,
+            ),
+        ]
+    )
+    raise_first_error(results)
+    results += await manager.prune(
+        [configmap], [ConfigMap], namespace, app=statefulset_name, component=_COMPONENT
+    )
 
     return ReconcileResult(
-        changed=True,
+        changed=any(r.changed for r in results),
         message=f"Reconciled pod-gateway on {statefulset_name}",
     )
 
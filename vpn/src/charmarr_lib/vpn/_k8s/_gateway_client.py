@@ -30,9 +30,23 @@ from lightkube.models.core_v1 import (
 from lightkube.models.meta_v1 import ObjectMeta
 from lightkube.resources.apps_v1 import StatefulSet
 from lightkube.resources.core_v1 import ConfigMap
-
-from charmarr_lib.krm import K8sResourceManager, ReconcileResult
-from charmarr_lib.vpn._k8s._kill_switch import KillSwitchConfig, reconcile_kill_switch
+from lightkube.resources.networking_v1 import NetworkPolicy
+
+from charmarr_lib.krm import (
+    ApplyResult,
+    AsyncK8sResourceManager,
+    DesiredPatch,
+    K8sResourceManager,
+    ReconcileResult,
+    ownership_labels,
+    raise_first_error,
+)
+from charmarr_lib.vpn._k8s._kill_switch import (
+    KILL_SWITCH_COMPONENT,
+    KillSwitchConfig,
+    build_kill_switch_policy,
+    kill_switch_policy_name,
+)
 from charmarr_lib.vpn._k8s._utils import compute_config_hash
 from charmarr_lib.vpn.constants import (
     CLIENT_INIT_CONTAINER_NAME,
@@ -44,6 +58,7 @@ from charmarr_lib.vpn.interfaces import VPNGatewayProviderData
 _CONFIG_VOLUME_NAME = "pod-gateway-config"
 _CONFIG_MOUNT_PATH = "/config"
 _CONFIG_HASH_ANNOTATION = "charmarr.io/gateway-client-config-hash"
+_COMPONENT = "vpn-gateway-client"
 
 
 def _build_gateway_client_init_container(gateway_dns_name: str) -> Container:
@@ -97,32 +112,105 @@ def _build_configmap_data(
     return {"settings.sh": settings}
 
 
-def _reconcile_configmap(
-    manager: K8sResourceManager,
-    configmap_name: str,
+def _build_configmap(
+    statefulset_name: str,
     namespace: str,
-    data: VPNGatewayProviderData | None,
-) -> None:
-    """Reconcile ConfigMap for gateway client pod-gateway settings.
-
-    When data is provided, creates or updates the ConfigMap. When data is None,
-    deletes the ConfigMap if it exists.
-    """
-    if data is None:
-        if manager.exists(ConfigMap, configmap_name, namespace):
-            manager.delete(ConfigMap, configmap_name, namespace)
-        return
-
+    data: VPNGatewayProviderData,
+) -> ConfigMap:
+    """Build ConfigMap for gateway client pod-gateway settings."""
     cm_data = _build_configmap_data(
         data.cluster_dns_ip, data.cluster_cidrs, data.vxlan_id, data.vxlan_ip_network
     )
-
-    configmap = ConfigMap(
-        metadata=ObjectMeta(name=configmap_name, namespace=namespace),
+    return ConfigMap(
+        metadata=ObjectMeta(
+            name=_configmap_name(statefulset_name),
+            namespace=namespace,
+            labels=ownership_labels(statefulset_name, _COMPONENT),
+        ),
         data=cm_data,
     )
 
-    manager.apply(configmap)
+
+def _owned_kinds(killswitch: bool) -> list[tuple[type[Any], str]]:
+    """Kinds of the objects this reconciler creates (and prunes), with their component."""
+    owned: list[tuple[type[Any], str]] = [(ConfigMap, _COMPONENT)]
+    if killswitch:
+        owned.append((NetworkPolicy, KILL_SWITCH_COMPONENT))
+    return owned
+
+
+def _prune(
+    manager: K8sResourceManager,
+    desired: list[Any],
+    statefulset_name: str,
+    namespace: str,
+    killswitch: bool,
+) -> list[ApplyResult]:
+    """Delete owned ConfigMaps/NetworkPolicies of this app that are not in `desired`.
+
+    Each kind is pruned within its own component, so objects of the same
+    kind created by other reconcilers of the app are kept.
+    """
+    results: list[ApplyResult] = []
+    for kind, component in _owned_kinds(killswitch):
+        results += manager.prune(
+            desired, [kind], namespace, app=statefulset_name, component=component
+        )
+    return results
+
+
+def _named_objects(statefulset_name: str, killswitch: bool) -> list[tuple[type[Any], str]]:
+    """The ConfigMap and kill switch this reconciler creates, by kind and name.
+
+    Older library versions created them without ownership labels, so cleanup
+    also deletes them by name.
+    """
+    named: list[tuple[type[Any], str]] = [(ConfigMap, _configmap_name(statefulset_name))]
+    if killswitch:
+        named.append((NetworkPolicy, kill_switch_policy_name(statefulset_name)))
+    return named
+
+
+async def _prune_async(
+    manager: AsyncK8sResourceManager,
+    desired: list[Any],
+    statefulset_name: str,
+    namespace: str,
+    killswitch: bool,
+) -> list[ApplyResult]:
+    """Async counterpart of `_prune`."""
+    results: list[ApplyResult] = []
+    for kind, component in _owned_kinds(killswitch):
+        results += await manager.prune(
+            desired, [kind], namespace, app=statefulset_name, component=component
+        )
+    return results
+
+
+def _cleanup_gateway_client(
+    manager: K8sResourceManager,
+    statefulset_name: str,
+    namespace: str,
+    *,
+    killswitch: bool,
+    patch_statefulset: bool,
+) -> bool:
+    """Remove the ConfigMap, client containers and kill switch; returns True if anything changed.
+
+    The ConfigMap and kill switch are found by their ownership labels, so
+    objects created under older names are removed too, and by name, so
+    objects created before they were labelled are removed as well.
+    """
+    pruned = _prune(manager, [], statefulset_name, namespace, killswitch)
+    changed = any(r.changed for r in pruned)
+    seen = {(r.kind, r.name) for r in pruned}
+    for kind, name in _named_objects(statefulset_name, killswitch):
+        if (kind.__name__, name) not in seen:
+            changed |= manager.delete(kind, name, namespace)
+    if patch_statefulset:
+        patch = _build_gateway_client_cleanup_patch()
+        changed |= manager.patch_if_changed(StatefulSet, statefulset_name, patch, namespace)
+    return changed
 
 
 def _build_patch(
@@ -173,6 +261,84 @@ def _build_gateway_client_cleanup_patch() -> dict[str, Any]:
     }
 
 
+async def _cleanup_gateway_client_async(
+    manager: AsyncK8sResourceManager,
+    statefulset_name: str,
+    namespace: str,
+    *,
+    killswitch: bool,
+    patch_statefulset: bool,
+) -> bool:
+    """Async counterpart of `_cleanup_gateway_client`."""
+    pruned = await _prune_async(manager, [], statefulset_name, namespace, killswitch)
+    changed = any(r.changed for r in pruned)
+    seen = {(r.kind, r.name) for r in pruned}
+    for kind, name in _named_objects(statefulset_name, killswitch):
+        if (kind.__name__, name) not in seen:
+            changed |= await manager.delete(kind, name, namespace)
+    if patch_statefulset:
+        patch = _build_gateway_client_cleanup_patch()
+        changed |= await manager.patch_if_changed(StatefulSet, statefulset_name, patch, namespace)
+    return changed
+
+
+def build_gateway_client_patch(
+    statefulset_name: str, data: VPNGatewayProviderData | None
+) -> dict[str, Any]:
+    """Build the StatefulSet strategic merge patch used by `reconcile_gateway_client`.
+
+    For charms that combine several pod template changes into one PATCH
+    (e.g. charmarr_lib.core's StatefulSetPatchPlan): merge this patch into
+    the plan and call `reconcile_gateway_client(..., patch_statefulset=False)`
+    for the ConfigMap and kill switch.
+
+    Args:
+        statefulset_name: Name of the StatefulSet (usually self.app.name).
+        data: VPN gateway provider data, or None for the cleanup patch.
+
+    Returns:
+        The patch adding (or, when data is None, removing) the client containers.
+    """
+    if data is None:
+        return _build_gateway_client_cleanup_patch()
+    configmap_name = _configmap_name(statefulset_name)
+    cm_data = _build_configmap_data(
+        data.cluster_dns_ip, data.cluster_cidrs, data.vxlan_id, data.vxlan_ip_network
+    )
+    return _build_patch(data, configmap_name, compute_config_hash(cm_data))
+
+
+def _configmap_name(statefulset_name: str) -> str:
+    return f"{statefulset_name}-gateway-client-config"
+
+
+def _desired_resources(
+    statefulset_name: str,
+    namespace: str,
+    data: VPNGatewayProviderData,
+    *,
+    killswitch: bool,
+    patch_statefulset: bool,
+) -> list[Any]:
+    """Resources and patches for `reconcile_set`.
+
+    The ConfigMap and kill switch are applied concurrently, then the StatefulSet.
+    """
+    desired: list[Any] = [_build_configmap(statefulset_name, namespace, data)]
+    if patch_statefulset:
+        patch = build_gateway_client_patch(statefulset_name, data)
+        desired.append(DesiredPatch(StatefulSet, statefulset_name, patch, namespace))
+    if killswitch:
+        cidrs = [c.strip() for c in data.cluster_cidrs.replace(",", " ").split()]
+        kill_config = KillSwitchConfig(
+            app_name=statefulset_name,
+            namespace=namespace,
+            cluster_cidrs=cidrs,
+        )
+        desired.append(build_kill_switch_policy(kill_config))
+    return desired
+
+
 def reconcile_gateway_client(
     manager: K8sResourceManager,
     statefulset_name: str,
@@ -180,6 +346,7 @@ def reconcile_gateway_client(
     data: VPNGatewayProviderData | None,
     *,
     killswitch: bool = False,
+    patch_statefulset: bool = True,
 ) -> ReconcileResult:
     """Reconcile pod-gateway client on a StatefulSet.
 
@@ -188,8 +355,9 @@ def reconcile_gateway_client(
     - StatefulSet patch with init container and sidecar
     - NetworkPolicy kill switch (optional)
 
-    When data is provided, creates/updates all resources. When data is None,
-    cleans up all resources.
+    When data is provided, creates/updates all resources and prunes owned
+    ConfigMaps/NetworkPolicies of this app that are no longer wanted. When
+    data is None, cleans up all resources.
 
     Args:
         manager: K8sResourceManager instance.
@@ -198,6 +366,8 @@ def reconcile_gateway_client(
         data: VPN gateway provider data from relation, or None to clean up.
         killswitch: If True, creates a NetworkPolicy that blocks egress except
             to cluster CIDRs. Prevents traffic leaks if VXLAN routing fails.
+        patch_statefulset: If False, leave the StatefulSet alone; the caller
+            sends `build_gateway_client_patch` as part of a combined patch.
 
     Returns:
         ReconcileResult indicating if changes were made.
@@ -205,34 +375,69 @@ def reconcile_gateway_client(
     Raises:
         ApiError: If the StatefulSet doesn't exist or patch fails.
     """
-    configmap_name = f"{statefulset_name}-gateway-client-config"
+    if data is None:
+        changed = _cleanup_gateway_client(
+            manager,
+            statefulset_name,
+            namespace,
+            killswitch=killswitch,
+            patch_statefulset=patch_statefulset,
+        )
+        return ReconcileResult(
+            changed=changed,
+            message=f"Reconciled pod-gateway client on {statefulset_name}",
+        )
 
-    _reconcile_configmap(manager, configmap_name, namespace, data)
+    desired = _desired_resources(
+        statefulset_name,
+        namespace,
+        data,
+        killswitch=killswitch,
+        patch_statefulset=patch_statefulset,
+    )
+    results = manager.reconcile_set(desired)
+    raise_first_error(results)
+    results += _prune(manager, desired, statefulset_name, namespace, killswitch)
+    changed = any(r.changed for r in results)
 
-    if data:
-        cm_data = _build_configmap_data(
-            data.cluster_dns_ip, data.cluster_cidrs, data.vxlan_id, data.vxlan_ip_network
-        )
-        config_hash = compute_config_hash(cm_data)
-        patch = _build_patch(data, configmap_name, config_hash)
-    else:
-        patch = _build_gateway_client_cleanup_patch()
+    return ReconcileResult(
+        changed=changed,
+        message=f"Reconciled pod-gateway client on {statefulset_name}",
+    )
 
-    manager.patch(StatefulSet, statefulset_name, patch, namespace)
 
-    if killswitch:
-        if data:
-            cidrs = [c.strip() for c in data.cluster_cidrs.replace(",", " ").split()]
-            kill_config = KillSwitchConfig(
-                app_name=statefulset_name,
-                namespace=namespace,
-                cluster_cidrs=cidrs,
-            )
-            reconcile_kill_switch(manager, statefulset_name, namespace, kill_config)
-        else:
-            reconcile_kill_switch(manager, statefulset_name, namespace, config=None)
+async def reconcile_gateway_client_async(
+    manager: AsyncK8sResourceManager,
+    statefulset_name: str,
+    namespace: str,
+    data: VPNGatewayProviderData | None,
+    *,
+    killswitch: bool = False,
+    patch_statefulset: bool = True,
+) -> ReconcileResult:
+    """Async version of `reconcile_gateway_client`, using AsyncK8sResourceManager."""
+    if data is None:
+        changed = await _cleanup_gateway_client_async(
+            manager,
+            statefulset_name,
+            namespace,
+            killswitch=killswitch,
+            patch_statefulset=patch_statefulset,
+        )
+    else:
+        desired = _desired_resources(
+            statefulset_name,
+            namespace,
+            data,
+            killswitch=killswitch,
+            patch_statefulset=patch_statefulset,
+        )
+        results = await manager.reconcile_set(desired)
+        raise_first_error(results)
+        results += await _prune_async(manager, desired, statefulset_name, namespace, killswitch)
+        changed = any(r.changed for r in results)
 
     return ReconcileResult(
-        changed=True,
+        changed=changed,
         message=f"Reconciled pod-gateway client on {statefulset_name}",
     )
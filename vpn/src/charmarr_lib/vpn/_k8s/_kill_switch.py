@@ -32,7 +32,14 @@ from lightkube.models.networking_v1 import (
 from lightkube.resources.networking_v1 import NetworkPolicy
 from pydantic import BaseModel, Field
 
-from charmarr_lib.krm import K8sResourceManager, ReconcileResult
+from charmarr_lib.krm import (
+    AsyncK8sResourceManager,
+    K8sResourceManager,
+    ReconcileResult,
+    ownership_labels,
+)
+
+KILL_SWITCH_COMPONENT = "vpn-kill-switch"
 
 
 class KillSwitchConfig(BaseModel):
@@ -53,12 +60,12 @@ class KillSwitchConfig(BaseModel):
     )
 
 
-def _policy_name(app_name: str) -> str:
+def kill_switch_policy_name(app_name: str) -> str:
     """Generate NetworkPolicy name for an application."""
     return f"{app_name}-vpn-killswitch"
 
 
-def _build_kill_switch_policy(config: KillSwitchConfig) -> NetworkPolicy:
+def build_kill_switch_policy(config: KillSwitchConfig) -> NetworkPolicy:
     """Build egress-only NetworkPolicy allowing cluster CIDRs and DNS to kube-system."""
     egress_rules: list[NetworkPolicyEgressRule] = []
 
@@ -87,8 +94,9 @@ def _build_kill_switch_policy(config: KillSwitchConfig) -> NetworkPolicy:
 
     return NetworkPolicy(
         metadata=ObjectMeta(
-            name=_policy_name(config.app_name),
+            name=kill_switch_policy_name(config.app_name),
             namespace=config.namespace,
+            labels=ownership_labels(config.app_name, KILL_SWITCH_COMPONENT),
         ),
         spec=NetworkPolicySpec(
             podSelector=LabelSelector(matchLabels={"app.kubernetes.io/name": config.app_name}),
@@ -134,7 +142,7 @@ def reconcile_kill_switch(
     Example - remove (when VPN relation is broken):
         result = reconcile_kill_switch(manager, "qbittorrent", "downloads", config=None)
     """
-    policy_name = _policy_name(app_name)
+    policy_name = kill_switch_policy_name(app_name)
 
     if config is None:
         if not manager.exists(NetworkPolicy, policy_name, namespace):
@@ -148,8 +156,45 @@ def reconcile_kill_switch(
             message=f"Deleted kill switch NetworkPolicy {policy_name}",
         )
 
-    policy = _build_kill_switch_policy(config)
-    manager.apply(policy)
+    policy = build_kill_switch_policy(config)
+    if not manager.apply_if_changed(policy):
+        return ReconcileResult(
+            changed=False,
+            message=f"Kill switch NetworkPolicy {policy_name} up to date",
+        )
+
+    return ReconcileResult(
+        changed=True,
+        message=f"Reconciled kill switch NetworkPolicy {policy_name}",
+    )
+
+
+async def reconcile_kill_switch_async(
+    manager: AsyncK8sResourceManager,
+    app_name: str,
+    namespace: str,
+    config: KillSwitchConfig | None = None,
+) -> ReconcileResult:
+    """Async version of `reconcile_kill_switch`, using AsyncK8sResourceManager."""
+    policy_name = kill_switch_policy_name(app_name)
+
+    if config is None:
+        if not await manager.exists(NetworkPolicy, policy_name, namespace):
+            return ReconcileResult(
+                changed=False,
+                message=f"Kill switch NetworkPolicy {policy_name} not present",
+            )
+        await manager.delete(NetworkPolicy, policy_name, namespace)
+        return ReconcileResult(
+            changed=True,
+            message=f"Deleted kill switch NetworkPolicy {policy_name}",
+        )
+
+    if not await manager.apply_if_changed(build_kill_switch_policy(config)):
+        return ReconcileResult(
+            changed=False,
+            message=f"Kill switch NetworkPolicy {policy_name} up to date",
+        )
 
     return ReconcileResult(
         changed=True,
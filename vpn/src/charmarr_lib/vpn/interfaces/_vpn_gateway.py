@@ -3,9 +3,10 @@
 
 """VPN gateway interface for VXLAN overlay routing through a VPN gateway."""
 
+import json
 from typing import Any
 
-from ops import EventBase, EventSource, Object, ObjectEvents
+from ops import Application, EventBase, EventSource, Object, ObjectEvents, Relation
 from pydantic import BaseModel, Field, ValidationError
 
 from charmarr_lib.vpn.constants import DEFAULT_VXLAN_ID, DEFAULT_VXLAN_IP_NETWORK
@@ -58,6 +59,20 @@ class VPNGatewayRequirerData(BaseModel):
     )
 
 
+def _canonical_json(data: BaseModel) -> str:
+    """Serialize deterministically so unchanged data is never rewritten."""
+    return json.dumps(data.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+
+
+def _write_config(relation: Relation, app: Application, payload: str) -> bool:
+    """Write `payload` as the app's `config` unless it is already there."""
+    databag = relation.data[app]
+    if databag.get("config") == payload:
+        return False
+    databag["config"] = payload
+    return True
+
+
 class VPNGatewayChangedEvent(EventBase):
     """Event emitted when vpn-gateway relation state changes."""
 
@@ -72,13 +87,14 @@ class VPNGatewayProvider(Object):
         self._charm = charm
         self._relation_name = relation_name
 
-    def publish_data(self, data: VPNGatewayProviderData) -> None:
-        """Publish provider data to all relations."""
+    def publish_data(self, data: VPNGatewayProviderData) -> int:
+        """Publish provider data to all relations; returns the number of databags written."""
         if not self._charm.unit.is_leader():
-            return
+            return 0
 
-        for relation in self._charm.model.relations.get(self._relation_name, []):
-            relation.data[self._charm.app]["config"] = data.model_dump_json()
+        payload = _canonical_json(data)
+        relations = self._charm.model.relations.get(self._relation_name, [])
+        return sum(_write_config(relation, self._charm.app, payload) for relation in relations)
 
     def get_connected_clients(self) -> list[str]:
         """Get list of connected requirer application names."""
@@ -120,14 +136,15 @@ class VPNGatewayRequirer(Object):
     def _emit_changed(self, event: EventBase) -> None:
         self.on.changed.emit()
 
-    def publish_data(self, data: VPNGatewayRequirerData) -> None:
-        """Publish requirer data to the relation."""
+    def publish_data(self, data: VPNGatewayRequirerData) -> int:
+        """Publish requirer data to the relation; returns the number of databags written."""
         if not self._charm.unit.is_leader():
-            return
+            return 0
 
         relation = self._charm.model.get_relation(self._relation_name)
-        if relation:
-            relation.data[self._charm.app]["config"] = data.model_dump_json()
+        if not relation:
+            return 0
+        return int(_write_config(relation, self._charm.app, _canonical_json(data)))
 
     def get_gateway(self) -> VPNGatewayProviderData | None:
         """Get gateway provider data if available."""
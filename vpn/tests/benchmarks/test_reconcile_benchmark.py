@@ -0,0 +1,79 @@
+# Copyright 2025 The Charmarr Project
+# See LICENSE file for licensing details.
+
+"""Benchmarks for the VPN gateway, gateway-client and kill-switch reconcilers.
+
+These reconcilers own several objects each (patched StatefulSets, generated
+NetworkPolicies) and prune the ones they no longer want. A second reconcile
+with unchanged inputs must report no change, and its reads, including the
+LIST calls of the prune, are pinned exactly.
+"""
+
+from typing import cast
+
+from lightkube import Client
+
+from charmarr_lib.krm import K8sResourceManager
+from charmarr_lib.krm.testing import FakeK8sClient
+from charmarr_lib.vpn import reconcile_gateway, reconcile_gateway_client
+from charmarr_lib.vpn._k8s._kill_switch import KillSwitchConfig, reconcile_kill_switch
+from charmarr_lib.vpn.interfaces import VPNGatewayProviderData
+
+LATENCY = 0.002
+NAMESPACE = "downloads"
+
+
+def _provider_data() -> VPNGatewayProviderData:
+    return VPNGatewayProviderData(
+        gateway_dns_name="gluetun.downloads.svc.cluster.local",
+        cluster_cidrs="10.1.0.0/16,10.152.183.0/24",
+        cluster_dns_ip="10.152.183.10",
+        vpn_connected=True,
+        instance_name="gluetun",
+    )
+
+
+def test_gateway_reconcile(make_statefulset, measure):
+    client = FakeK8sClient([make_statefulset("gluetun", NAMESPACE)], NAMESPACE, LATENCY)
+    manager = K8sResourceManager(client=cast(Client, client))
+
+    def reconcile():
+        return reconcile_gateway(manager, "gluetun", NAMESPACE, _provider_data(), ["10.1.0.0/16"])
+
+    (first, _), (steady, calls) = measure("gateway", client, [reconcile, reconcile])
+
+    assert first.changed and not steady.changed
+    assert calls == {"get": 2, "list": 1}
+
+
+def test_gateway_client_reconcile(make_statefulset, measure):
+    client = FakeK8sClient([make_statefulset("qbittorrent", NAMESPACE)], NAMESPACE, LATENCY)
+    manager = K8sResourceManager(client=cast(Client, client))
+
+    def reconcile():
+        return reconcile_gateway_client(
+            manager, "qbittorrent", NAMESPACE, _provider_data(), killswitch=True
+        )
+
+    (first, _), (steady, calls) = measure("gateway-client", client, [reconcile, reconcile])
+
+    assert first.changed and not steady.changed
+    assert calls == {"get": 3, "list": 2}
+
+
+def test_kill_switch_reconcile(measure):
+    client = FakeK8sClient(namespace=NAMESPACE, latency=LATENCY)
+    manager = K8sResourceManager(client=cast(Client, client))
+    config = KillSwitchConfig(
+        app_name="qbittorrent",
+        namespace=NAMESPACE,
+        cluster_cidrs=["10.1.0.0/16", "10.152.183.0/24"],
+    )
+
+    def reconcile():
+        return reconcile_kill_switch(manager, "qbittorrent", NAMESPACE, config)
+
+    (first, _), (steady, calls) = measure("kill-switch", client, [reconcile, reconcile])
+
+    assert first.changed and not steady.changed
+    assert calls == {"get": 1}
@@ -3,14 +3,14 @@
 
 """Shared fixtures for VPN K8s unit tests."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from lightkube.models.apps_v1 import StatefulSet, StatefulSetSpec
 from lightkube.models.core_v1 import Container, PodSpec, PodTemplateSpec
 from lightkube.models.meta_v1 import LabelSelector, ObjectMeta
 
-from charmarr_lib.krm import K8sResourceManager
+from charmarr_lib.krm import AsyncK8sResourceManager, K8sResourceManager
 from charmarr_lib.vpn.interfaces import VPNGatewayProviderData
 
 
@@ -26,6 +26,23 @@ def manager(mock_client):
     return K8sResourceManager(client=mock_client)
 
 
+@pytest.fixture
+def mock_async_client():
+    """Create a mock lightkube AsyncClient."""
+    return MagicMock(
+        get=AsyncMock(return_value=MagicMock()),
+        apply=AsyncMock(),
+        patch=AsyncMock(),
+        delete=AsyncMock(),
+    )
+
+
+@pytest.fixture
+def async_manager(mock_async_client):
+    """Create an AsyncK8sResourceManager with a mock async client."""
+    return AsyncK8sResourceManager(client=mock_async_client)
+
+
 @pytest.fixture
 def provider_data():
     """Create a VPN gateway provider data fixture."""
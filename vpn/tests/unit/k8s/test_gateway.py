@@ -3,6 +3,7 @@
 
 """Unit tests for gateway StatefulSet patching."""
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -14,6 +15,7 @@ from charmarr_lib.vpn import (
     POD_GATEWAY_IMAGE,
     get_cluster_dns_ip,
     reconcile_gateway,
+    reconcile_gateway_async,
 )
 from charmarr_lib.vpn._k8s._gateway import (
     _build_patch,  # pyright: ignore[reportPrivateUsage]
@@ -163,6 +165,35 @@ def test_reconcile_gateway_returns_message(manager, mock_client, provider_data):
     mock_client.patch.assert_called_once()
 
 
+# reconcile_gateway_async
+
+
+def test_reconcile_gateway_async_applies_configmap_and_patches(
+    async_manager, mock_async_client, provider_data
+):
+    """The async reconciler writes the same ConfigMap and patch through the async client."""
+    result = asyncio.run(
+        reconcile_gateway_async(
+            async_manager,
+            statefulset_name="gluetun",
+            namespace="vpn-gateway",
+            data=provider_data,
+            input_cidrs=["10.1.0.0/16"],
+        )
+    )
+
+    assert result.changed is True
+    assert "gluetun" in result.message
+    mock_async_client.apply.assert_awaited_once()
+    configmap = mock_async_client.apply.await_args[0][0]
+    assert configmap.metadata.name == "gluetun-gateway-settings"
+    assert 'VXLAN_ID="42"' in configmap.data["settings.sh"]
+    mock_async_client.patch.assert_awaited_once()
+    patch = mock_async_client.patch.await_args[0][2]
+    init = patch["spec"]["template"]["spec"]["initContainers"][0]
+    assert init["name"] == GATEWAY_INIT_CONTAINER_NAME
+
+
 # get_cluster_dns_ip
 
 
@@ -3,14 +3,27 @@
 
 """Unit tests for gateway client StatefulSet patching."""
 
+import asyncio
+from unittest.mock import ANY
+
+from httpx import Response
+from lightkube import ApiError
+from lightkube.models.meta_v1 import ObjectMeta
+from lightkube.resources.core_v1 import ConfigMap
+from lightkube.resources.networking_v1 import NetworkPolicy
+
+from charmarr_lib.krm import COMPONENT_LABEL
 from charmarr_lib.vpn import (
     CLIENT_INIT_CONTAINER_NAME,
     CLIENT_SIDECAR_CONTAINER_NAME,
     POD_GATEWAY_IMAGE,
+    build_gateway_client_patch,
     reconcile_gateway_client,
+    reconcile_gateway_client_async,
 )
 from charmarr_lib.vpn._k8s._gateway_client import (
     _build_configmap_data,  # pyright: ignore[reportPrivateUsage]
+    _build_gateway_client_cleanup_patch,  # pyright: ignore[reportPrivateUsage]
     _build_patch,  # pyright: ignore[reportPrivateUsage]
 )
 
@@ -146,9 +159,20 @@ def test_reconcile_gateway_client_returns_message(manager, mock_client, provider
     assert "qbittorrent" in result.message
 
 
+def _owned(kind, name):
+    return kind(metadata=ObjectMeta(name=name, namespace="downloads"))
+
+
+_NAMES = {
+    ConfigMap: "qbittorrent-gateway-client-config",
+    NetworkPolicy: "qbittorrent-vpn-killswitch",
+}
+
+
 def test_reconcile_gateway_client_cleanup_deletes_configmap(manager, mock_client):
-    """Deletes ConfigMap when data is None."""
+    """Deletes the owned ConfigMap found by label when data is None."""
     mock_client.get.return_value = object()
+    mock_client.list.return_value = [_owned(ConfigMap, "qbittorrent-gateway-client-config")]
 
     reconcile_gateway_client(
         manager,
@@ -178,6 +202,7 @@ def test_reconcile_gateway_client_with_killswitch_creates_policy(
 def test_reconcile_gateway_client_cleanup_with_killswitch_deletes_policy(manager, mock_client):
     """Deletes NetworkPolicy when data is None and killswitch=True."""
     mock_client.get.return_value = object()
+    mock_client.list.side_effect = lambda kind, **_: [_owned(kind, _NAMES[kind])]
 
     reconcile_gateway_client(
         manager,
@@ -188,3 +213,159 @@ def test_reconcile_gateway_client_cleanup_with_killswitch_deletes_policy(manager
     )
 
     assert mock_client.delete.call_count == 2
+    selector = mock_client.list.call_args.kwargs["labels"]
+    assert selector["app.kubernetes.io/instance"] == "qbittorrent"
+
+
+def test_reconcile_gateway_client_cleanup_keeps_other_components(manager, mock_client):
+    """Owned objects of the app created by other components are not deleted."""
+    stored = [
+        (_owned(ConfigMap, "qbittorrent-gateway-client-config"), "vpn-gateway-client"),
+        (_owned(ConfigMap, "qbittorrent-settings"), "qbittorrent-config"),
+        (_owned(NetworkPolicy, "qbittorrent-vpn-killswitch"), "vpn-kill-switch"),
+        (_owned(NetworkPolicy, "qbittorrent-ingress"), "qbittorrent-ingress"),
+    ]
+    # The API server filters by the label selector.
+    mock_client.list.side_effect = lambda kind, labels, **_: [
+        obj
+        for obj, component in stored
+        if isinstance(obj, kind) and labels[COMPONENT_LABEL] == component
+    ]
+
+    reconcile_gateway_client(
+        manager,
+        statefulset_name="qbittorrent",
+        namespace="downloads",
+        data=None,
+        killswitch=True,
+        patch_statefulset=False,
+    )
+
+    deleted = [c.args[:2] for c in mock_client.delete.call_args_list]
+    assert deleted == [
+        (ConfigMap, "qbittorrent-gateway-client-config"),
+        (NetworkPolicy, "qbittorrent-vpn-killswitch"),
+    ]
+
+
+def test_reconcile_gateway_client_cleanup_deletes_unlabelled_objects_by_name(manager, mock_client):
+    """Objects created before ownership labels existed are deleted by name."""
+    mock_client.list.return_value = []
+
+    result = reconcile_gateway_client(
+        manager,
+        statefulset_name="qbittorrent",
+        namespace="downloads",
+        data=None,
+        killswitch=True,
+        patch_statefulset=False,
+    )
+
+    assert result.changed is True
+    deleted = [c.args[:2] for c in mock_client.delete.call_args_list]
+    assert deleted == [
+        (ConfigMap, "qbittorrent-gateway-client-config"),
+        (NetworkPolicy, "qbittorrent-vpn-killswitch"),
+    ]
+
+
+def test_reconcile_gateway_client_cleanup_ignores_missing_objects(manager, mock_client):
+    """Nothing to delete by label or by name is not a change."""
+    mock_client.list.return_value = []
+    mock_client.delete.side_effect = ApiError(response=Response(404, json={"code": 404}))
+
+    result = reconcile_gateway_client(
+        manager,
+        statefulset_name="qbittorrent",
+        namespace="downloads",
+        data=None,
+        killswitch=True,
+        patch_statefulset=False,
+    )
+
+    assert result.changed is False
+    assert mock_client.delete.call_count == 2
+
+
+def test_reconcile_gateway_client_prunes_renamed_configmap(manager, mock_client, provider_data):
+    """Owned ConfigMaps that are not desired anymore (e.g. old names) are deleted."""
+    mock_client.list.return_value = [
+        _owned(ConfigMap, "qbittorrent-gateway-client-config"),
+        _owned(ConfigMap, "qbittorrent-vpn-config"),
+    ]
+
+    result = reconcile_gateway_client(
+        manager,
+        statefulset_name="qbittorrent",
+        namespace="downloads",
+        data=provider_data,
+    )
+
+    assert result.changed is True
+    mock_client.list.assert_called_once()
+    mock_client.delete.assert_called_once_with(
+        ConfigMap, "qbittorrent-vpn-config", namespace="downloads", cascade=ANY
+    )
+
+
+def test_reconcile_gateway_client_without_statefulset_patch(manager, mock_client, provider_data):
+    """patch_statefulset=False leaves the StatefulSet to a combined patch."""
+    reconcile_gateway_client(
+        manager,
+        statefulset_name="qbittorrent",
+        namespace="downloads",
+        data=provider_data,
+        patch_statefulset=False,
+    )
+
+    mock_client.patch.assert_not_called()
+    patch = build_gateway_client_patch("qbittorrent", provider_data)
+    volumes = patch["spec"]["template"]["spec"]["volumes"]
+    assert volumes[0]["configMap"]["name"] == "qbittorrent-gateway-client-config"
+    assert build_gateway_client_patch("qbittorrent", None) == _build_gateway_client_cleanup_patch()
+
+
+# reconcile_gateway_client_async
+
+
+async def _listing(*items):
+    for item in items:
+        yield item
+
+
+def test_reconcile_gateway_client_async_applies_and_patches(
+    async_manager, mock_async_client, provider_data
+):
+    """The async reconciler applies the ConfigMap and kill switch and patches the StatefulSet."""
+    result = asyncio.run(
+        reconcile_gateway_client_async(
+            async_manager,
+            statefulset_name="qbittorrent",
+            namespace="downloads",
+            data=provider_data,
+            killswitch=True,
+        )
+    )
+
+    assert result.changed is True
+    assert "qbittorrent" in result.message
+    assert mock_async_client.apply.await_count == 2
+    mock_async_client.patch.assert_awaited_once()
+
+
+def test_reconcile_gateway_client_async_cleanup_deletes_owned(async_manager, mock_async_client):
+    """Deletes the owned ConfigMap and NetworkPolicy found by label when data is None."""
+    mock_async_client.list.side_effect = lambda kind, **_: _listing(_owned(kind, _NAMES[kind]))
+
+    result = asyncio.run(
+        reconcile_gateway_client_async(
+            async_manager,
+            statefulset_name="qbittorrent",
+            namespace="downloads",
+            data=None,
+            killswitch=True,
+        )
+    )
+
+    assert result.changed is True
+    assert mock_async_client.delete.await_count == 2
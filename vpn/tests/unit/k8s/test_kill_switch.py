@@ -3,6 +3,7 @@
 
 """Unit tests for VPN kill switch NetworkPolicy."""
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -12,9 +13,10 @@ from lightkube.core.exceptions import ApiError
 from charmarr_lib.krm import K8sResourceManager
 from charmarr_lib.vpn._k8s._kill_switch import (
     KillSwitchConfig,
-    _build_kill_switch_policy,  # pyright: ignore[reportPrivateUsage]
-    _policy_name,  # pyright: ignore[reportPrivateUsage]
+    build_kill_switch_policy,
+    kill_switch_policy_name,
     reconcile_kill_switch,
+    reconcile_kill_switch_async,
 )
 
 
@@ -38,12 +40,12 @@ def config():
 
 
 def test_policy_name():
-    assert _policy_name("qbittorrent") == "qbittorrent-vpn-killswitch"
+    assert kill_switch_policy_name("qbittorrent") == "qbittorrent-vpn-killswitch"
 
 
 def test_build_policy_structure(config):
     """Policy has correct metadata, selector, and egress rules."""
-    policy = _build_kill_switch_policy(config)
+    policy = build_kill_switch_policy(config)
 
     assert policy.metadata is not None
     assert policy.metadata.name == "qbittorrent-vpn-killswitch"
@@ -58,7 +60,7 @@ def test_build_policy_structure(config):
 
 def test_build_policy_egress_cidrs(config):
     """Egress rules include each cluster CIDR."""
-    policy = _build_kill_switch_policy(config)
+    policy = build_kill_switch_policy(config)
     assert policy.spec is not None
     assert policy.spec.egress is not None
     cidr_rules = [r for r in policy.spec.egress if r.ports is None]
@@ -69,7 +71,7 @@ def test_build_policy_egress_cidrs(config):
 
 def test_build_policy_egress_dns(config):
     """Egress rules include DNS to kube-system on port 53."""
-    policy = _build_kill_switch_policy(config)
+    policy = build_kill_switch_policy(config)
     assert policy.spec is not None
     assert policy.spec.egress is not None
     dns_rules = [r for r in policy.spec.egress if r.ports is not None]
@@ -94,6 +96,17 @@ def test_reconcile_applies_policy(manager, mock_client, config):
     mock_client.apply.assert_called_once()
 
 
+def test_reconcile_skips_apply_when_live_policy_matches(manager, mock_client, config):
+    """No write when the live policy is the one applied last time."""
+    reconcile_kill_switch(manager, "qbittorrent", "downloads", config)
+    mock_client.get.return_value = mock_client.apply.call_args.args[0]
+
+    result = reconcile_kill_switch(manager, "qbittorrent", "downloads", config)
+
+    assert result.changed is False
+    mock_client.apply.assert_called_once()
+
+
 def test_reconcile_deletes_policy_when_config_none(manager, mock_client):
     """Deletes policy when config is None and it exists."""
     mock_client.get.return_value = MagicMock()
@@ -115,3 +128,55 @@ def test_reconcile_noop_when_config_none_and_not_exists(manager, mock_client):
 
     assert result.changed is False
     mock_client.delete.assert_not_called()
+
+
+def test_reconcile_async_applies_policy(async_manager, mock_async_client, config):
+    """The async reconciler applies the same policy through the async client."""
+    result = asyncio.run(
+        reconcile_kill_switch_async(async_manager, "qbittorrent", "downloads", config)
+    )
+
+    assert result.changed is True
+    mock_async_client.apply.assert_awaited_once()
+    assert mock_async_client.apply.await_args.args[0].metadata.name == kill_switch_policy_name(
+        "qbittorrent"
+    )
+
+
+def test_reconcile_async_skips_apply_when_live_policy_matches(
+    async_manager, mock_async_client, config
+):
+    """No write when the live policy is the one applied last time."""
+    asyncio.run(reconcile_kill_switch_async(async_manager, "qbittorrent", "downloads", config))
+    mock_async_client.get.return_value = mock_async_client.apply.await_args.args[0]
+
+    result = asyncio.run(
+        reconcile_kill_switch_async(async_manager, "qbittorrent", "downloads", config)
+    )
+
+    assert result.changed is False
+    mock_async_client.apply.assert_awaited_once()
+
+
+def test_reconcile_async_deletes_policy_when_config_none(async_manager, mock_async_client):
+    """Deletes policy when config is None and it exists."""
+    result = asyncio.run(
+        reconcile_kill_switch_async(async_manager, "qbittorrent", "downloads", config=None)
+    )
+
+    assert result.changed is True
+    mock_async_client.delete.assert_awaited_once()
+
+
+def test_reconcile_async_noop_when_config_none_and_not_exists(async_manager, mock_async_client):
+    """No-op when config is None and policy doesn't exist."""
+    mock_async_client.get.side_effect = ApiError(
+        response=Response(404, json={"code": 404, "message": "not found"})
+    )
+
+    result = asyncio.run(
+        reconcile_kill_switch_async(async_manager, "qbittorrent", "downloads", config=None)
+    )
+
+    assert result.changed is False
+    mock_async_client.delete.assert_not_awaited()
@@ -207,3 +207,15 @@ def test_provider_is_ready_without_relations():
 
     with ctx(ctx.on.start(), state_in) as mgr:
         assert mgr.charm.provider.is_ready() is False
+
+
+def test_publish_data_skips_identical_writes():
+    """Republishing unchanged data does not rewrite the databag."""
+    ctx = Context(RequirerCharm, meta=RequirerCharm.META)
+    relation = Relation(endpoint="vpn-gateway", interface="vpn_gateway")
+    data = VPNGatewayRequirerData(instance_name="qbittorrent")
+
+    with ctx(ctx.on.start(), State(leader=True, relations=[relation])) as mgr:
+        assert mgr.charm.requirer.publish_data(data) == 1
+        assert mgr.charm.requirer.publish_data(data) == 0
+        assert mgr.charm.requirer.publish_data(data.model_copy(update={"instance_name": "x"})) == 1